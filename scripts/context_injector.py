@@ -12,6 +12,16 @@ relevant information from:
 The gathered context is formatted for injection into Claude's system prompt,
 enabling the AI to provide informed, contextual responses.
 
+Sources are queried concurrently: blocking sources run on a shared thread
+pool, async ones on the event loop. Each source has a deadline; a source that
+misses it is reported as timed out and the rest of the context is returned
+without it.
+
+Per-source results are kept in a process-wide TTL cache (ContextCache) keyed
+by normalized query, so follow-up questions in the same thread are answered
+from memory. When the query embedding is already available, near-duplicate
+phrasings also hit the cache.
+
 Usage:
     from scripts.context_injector import ContextInjector
 
@@ -33,17 +43,19 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, Optional
 
-# Add project root to path
+# Add project root to path (tool modules are imported as tool_modules.*, so
+# tool_modules/ itself stays off sys.path and can't shadow scripts/common)
 PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
-if str(PROJECT_ROOT / "tool_modules") not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT / "tool_modules"))
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +66,45 @@ RESPONSE_MAX_LENGTH = 1000  # Characters for LLM responses
 PATTERN_DISPLAY_LENGTH = 100  # Characters for pattern/fix display
 CONTEXT_TIMEOUT_SECS = 30  # Timeout for context gathering operations
 
+# Per-source deadlines (seconds). A source that misses its deadline is
+# dropped from the gathered context instead of delaying the reply.
+SOURCE_DEADLINES_SECS: dict[str, float] = {
+    "slack": 8.0,
+    "code": 8.0,
+    "jira": 12.0,
+    "memory": 3.0,
+    "inscope": CONTEXT_TIMEOUT_SECS,
+}
+
+# Shared pool for blocking sources (vector searches, rh-issue subprocesses)
+_GATHER_MAX_WORKERS = 16
+# Cross-query context cache
+CONTEXT_CACHE_MAX_ENTRIES = 256  # Distinct (scope, query) entries kept
+CONTEXT_CACHE_TTL_SECS: dict[str, float] = {
+    "slack": 300.0,
+    "code": 600.0,  # Also dropped when the code index is rebuilt
+    "jira": 120.0,  # Issue status changes during an incident
+    "memory": 30.0,
+    "inscope": 900.0,
+}
+NEAR_DUPLICATE_SIMILARITY = 0.92  # Cosine similarity for a near-duplicate hit
+
+_gather_executor: Optional[ThreadPoolExecutor] = None
+_gather_executor_lock = threading.Lock()
+
+
+def _get_gather_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for blocking context sources."""
+    global _gather_executor
+    if _gather_executor is None:
+        with _gather_executor_lock:
+            if _gather_executor is None:
+                _gather_executor = ThreadPoolExecutor(
+                    max_workers=_GATHER_MAX_WORKERS,
+                    thread_name_prefix="context-gather",
+                )
+    return _gather_executor
+
 
 @dataclass
 class ContextSource:
@@ -65,6 +116,8 @@ class ContextSource:
     results: list[dict[str, Any]]
     error: Optional[str] = None
     latency_ms: float = 0.0
+    timed_out: bool = False  # Missed its deadline; results are empty
+    cached: bool = False  # Served from the context cache
 
 
 @dataclass
@@ -89,6 +142,211 @@ class GatheredContext:
         return None
 
 
+def _normalize_query(query: str) -> str:
+    """Normalize a query for exact cache lookups."""
+    return " ".join(re.sub(r"[^\w\s-]", " ", query.lower()).split())
+
+
+def _unit_vector(vector: list[float]) -> Optional[tuple[float, ...]]:
+    """Scale a vector to unit length (None for a zero vector)."""
+    norm = sum(x * x for x in vector) ** 0.5
+    if not norm:
+        return None
+    return tuple(x / norm for x in vector)
+
+
+@dataclass
+class _CachedQuery:
+    """Cached per-source results for one normalized query."""
+
+    jira_keys: frozenset[str]
+    embedding: Optional[tuple[float, ...]] = None
+    sources: dict[str, tuple[ContextSource, float, Any]] = field(
+        default_factory=dict
+    )  # source -> (result, stored_at, source version)
+
+
+class ContextCache:
+    """
+    Bounded TTL cache of per-source context results, shared across injectors.
+
+    Entries are keyed by (scope, normalized query), where the scope captures
+    the project and result limits. A lookup that misses exactly can still hit
+    an entry whose query embedding is within NEAR_DUPLICATE_SIMILARITY,
+    provided it mentions the same Jira keys. Each source has its own TTL and
+    can carry a version (e.g. the code index build time) so results are
+    dropped as soon as the underlying data changes.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CONTEXT_CACHE_MAX_ENTRIES,
+        ttl_secs: Optional[dict[str, float]] = None,
+        similarity: float = NEAR_DUPLICATE_SIMILARITY,
+    ):
+        self.max_entries = max_entries
+        self.ttl_secs = {**CONTEXT_CACHE_TTL_SECS, **(ttl_secs or {})}
+        self.similarity = similarity
+        self._entries: OrderedDict[tuple[str, str], _CachedQuery] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: dict[str, int] = {}
+        self._near_hits: dict[str, int] = {}
+        self._misses: dict[str, int] = {}
+
+    def lookup(
+        self,
+        scope: str,
+        query: str,
+        sources: list[str],
+        jira_keys: frozenset[str] = frozenset(),
+        embedding: Optional[list[float]] = None,
+        versions: Optional[dict[str, Any]] = None,
+    ) -> dict[str, ContextSource]:
+        """Return fresh cached results for the requested sources."""
+        versions = versions or {}
+        now = time.time()
+        with self._lock:
+            key = (scope, _normalize_query(query))
+            entry = self._entries.get(key)
+            near = False
+            if entry is None and embedding is not None:
+                entry = self._nearest(scope, jira_keys, embedding)
+                near = entry is not None
+            elif entry is not None:
+                self._entries.move_to_end(key)
+
+            found: dict[str, ContextSource] = {}
+            for name in sources:
+                cached = entry.sources.get(name) if entry else None
+                if cached is not None:
+                    result, stored_at, version = cached
+                    fresh = now - stored_at <= self.ttl_secs.get(name, 0)
+                    if fresh and version == versions.get(name):
+                        found[name] = replace(result, latency_ms=0.0, cached=True)
+                        counter = self._near_hits if near else self._hits
+                        counter[name] = counter.get(name, 0) + 1
+                        continue
+                    del entry.sources[name]
+                self._misses[name] = self._misses.get(name, 0) + 1
+            return found
+
+    def store(
+        self,
+        scope: str,
+        query: str,
+        results: list[ContextSource],
+        jira_keys: frozenset[str] = frozenset(),
+        embedding: Optional[list[float]] = None,
+        versions: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Cache successful per-source results for a query."""
+        versions = versions or {}
+        results = [r for r in results if r.error is None and not r.cached]
+        if not results:
+            return
+        now = time.time()
+        with self._lock:
+            key = (scope, _normalize_query(query))
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _CachedQuery(jira_keys=jira_keys)
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if embedding is not None and entry.embedding is None:
+                entry.embedding = _unit_vector(embedding)
+            for result in results:
+                entry.sources[result.source] = (
+                    result,
+                    now,
+                    versions.get(result.source),
+                )
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, source: Optional[str] = None) -> int:
+        """Drop cached results for one source (or everything).
+
+        Returns:
+            Number of cached source results removed
+        """
+        with self._lock:
+            if source is None:
+                removed = sum(len(e.sources) for e in self._entries.values())
+                self._entries.clear()
+                return removed
+            removed = 0
+            for key in list(self._entries):
+                entry = self._entries[key]
+                if entry.sources.pop(source, None) is not None:
+                    removed += 1
+                if not entry.sources:
+                    del self._entries[key]
+            return removed
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters per source and overall."""
+        with self._lock:
+            per_source = {}
+            for name in sorted({*self._hits, *self._near_hits, *self._misses}):
+                hits = self._hits.get(name, 0)
+                near = self._near_hits.get(name, 0)
+                misses = self._misses.get(name, 0)
+                total = hits + near + misses
+                per_source[name] = {
+                    "hits": hits,
+                    "near_hits": near,
+                    "misses": misses,
+                    "hit_rate": round((hits + near) / total, 3) if total else 0.0,
+                }
+            hits = sum(self._hits.values()) + sum(self._near_hits.values())
+            total = hits + sum(self._misses.values())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": round(hits / total, 3) if total else 0.0,
+                "sources": per_source,
+            }
+
+    def _nearest(
+        self, scope: str, jira_keys: frozenset[str], embedding: list[float]
+    ) -> Optional[_CachedQuery]:
+        """Most similar cached query above the threshold (lock held)."""
+        target = _unit_vector(embedding)
+        if target is None:
+            return None
+        best, best_score = None, self.similarity
+        for (entry_scope, _), entry in self._entries.items():
+            if (
+                entry_scope != scope
+                or entry.embedding is None
+                or entry.jira_keys != jira_keys
+            ):
+                continue
+            score = sum(a * b for a, b in zip(target, entry.embedding))
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+
+_context_cache: Optional[ContextCache] = None
+_context_cache_lock = threading.Lock()
+
+
+def get_context_cache() -> ContextCache:
+    """Get the process-wide context cache."""
+    global _context_cache
+    if _context_cache is None:
+        with _context_cache_lock:
+            if _context_cache is None:
+                _context_cache = ContextCache()
+    return _context_cache
+
+
+def invalidate_context_cache(source: Optional[str] = None) -> int:
+    """Drop cached context for one source, e.g. after rebuilding the code index."""
+    return get_context_cache().invalidate(source)
+
+
 class ContextInjector:
     """
     Gathers context from multiple sources for AI persona responses.
@@ -106,13 +364,28 @@ class ContextInjector:
         jira_limit: int = 3,
         memory_limit: int = 3,
         inscope_limit: int = 1,
+        source_deadlines: Optional[dict[str, float]] = None,
+        deadline_secs: float = CONTEXT_TIMEOUT_SECS,
+        cache: Optional[ContextCache] = None,
+        use_cache: bool = True,
     ):
+        """
+        Args:
+            source_deadlines: Per-source deadline overrides in seconds,
+                merged over SOURCE_DEADLINES_SECS
+            deadline_secs: Overall cap on any single source's deadline
+            cache: Context cache to use (defaults to the process-wide one)
+            use_cache: Set False to always query every source
+        """
         self.project = project
         self.slack_limit = slack_limit
         self.code_limit = code_limit
         self.jira_limit = jira_limit
         self.memory_limit = memory_limit
         self.inscope_limit = inscope_limit
+        self.source_deadlines = {**SOURCE_DEADLINES_SECS, **(source_deadlines or {})}
+        self.deadline_secs = deadline_secs
+        self.cache = (cache or get_context_cache()) if use_cache else None
 
         # Track what's available
         self._slack_available: Optional[bool] = None
@@ -150,20 +423,18 @@ class ContextInjector:
             logger.debug("Code search module not available")
         return self._code_available
 
-    def _check_inscope_available(self) -> bool:
+    async def _check_inscope_available(self) -> bool:
         """Check if InScope AI assistant is available."""
         if self._inscope_available is not None:
             return self._inscope_available
         try:
             # Also check if we have auth configured
-            import asyncio
-
             from tool_modules.aa_inscope.src.tools_basic import (  # noqa: F401
                 _get_auth_token,
                 _inscope_ask_impl,
             )
 
-            token = asyncio.get_event_loop().run_until_complete(_get_auth_token())
+            token = await _get_auth_token()
             self._inscope_available = token is not None
             if not self._inscope_available:
                 logger.debug("InScope available but not authenticated")
@@ -327,8 +598,18 @@ class ContextInjector:
         pattern = r"\b([A-Z]{2,10}-\d+)\b"
         return list(set(re.findall(pattern, text)))
 
-    def _search_jira(self, query: str, issue_keys: list[str]) -> ContextSource:
-        """Get Jira context for detected issue keys."""
+    def _search_jira(
+        self,
+        query: str,
+        issue_keys: list[str],
+        deadline_at: Optional[float] = None,
+    ) -> ContextSource:
+        """Get Jira context for detected issue keys.
+
+        Args:
+            deadline_at: time.monotonic() after which no lookup may still be
+                running; a rh-issue process still running then is killed
+        """
         start = time.time()
 
         if not issue_keys:
@@ -347,6 +628,12 @@ class ContextInjector:
             results = []
 
             for key in issue_keys[: self.jira_limit]:
+                timeout = 10.0
+                if deadline_at is not None:
+                    timeout = min(timeout, deadline_at - time.monotonic())
+                    if timeout <= 0:
+                        results.append({"key": key, "status": "timeout"})
+                        continue
                 try:
                     # Clear virtualenv to allow pipenv commands
                     env = os.environ.copy()
@@ -358,7 +645,7 @@ class ContextInjector:
                         [rh_issue, "view", key, "--format", "json"],
                         capture_output=True,
                         text=True,
-                        timeout=10,
+                        timeout=timeout,
                         env=env,
                     )
 
@@ -506,7 +793,7 @@ class ContextInjector:
                 latency_ms=(time.time() - start) * 1000,
             )
 
-    def _search_inscope(self, query: str) -> ContextSource:
+    async def _search_inscope(self, query: str) -> ContextSource:
         """Query InScope AI assistants for domain-specific knowledge.
 
         InScope provides AI assistants trained on Red Hat internal documentation
@@ -514,7 +801,7 @@ class ContextInjector:
         """
         start = time.time()
 
-        if not self._check_inscope_available():
+        if not await self._check_inscope_available():
             return ContextSource(
                 source="inscope",
                 found=False,
@@ -525,23 +812,13 @@ class ContextInjector:
             )
 
         try:
-            import asyncio
-
             from tool_modules.aa_inscope.src.tools_basic import _inscope_ask_impl
 
-            # Run the async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result_json = loop.run_until_complete(
-                    _inscope_ask_impl(
-                        query=query,
-                        timeout_secs=CONTEXT_TIMEOUT_SECS,
-                        include_sources=True,
-                    )
-                )
-            finally:
-                loop.close()
+            result_json = await _inscope_ask_impl(
+                query=query,
+                timeout_secs=CONTEXT_TIMEOUT_SECS,
+                include_sources=True,
+            )
 
             result = json.loads(result_json)
 
@@ -697,6 +974,9 @@ class ContextInjector:
         """
         Gather context from all enabled sources.
 
+        Blocking wrapper around gather_context_async(); sources are still
+        queried concurrently.
+
         Args:
             query: The user's question/message
             include_slack: Search Slack persona vector DB
@@ -708,29 +988,237 @@ class ContextInjector:
         Returns:
             GatheredContext with all results and formatted prompt section
         """
+        coro = self.gather_context_async(
+            query,
+            include_slack=include_slack,
+            include_code=include_code,
+            include_jira=include_jira,
+            include_memory=include_memory,
+            include_inscope=include_inscope,
+        )
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called synchronously from inside an event loop: run on a
+        # separate thread with its own loop rather than nesting loops
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, coro).result()
+
+    async def gather_context_async(
+        self,
+        query: str,
+        include_slack: bool = True,
+        include_code: bool = True,
+        include_jira: bool = True,
+        include_memory: bool = True,
+        include_inscope: bool = True,
+        thread_context: list[dict] | None = None,
+    ) -> GatheredContext:
+        """
+        Gather context from all enabled sources concurrently.
+
+        Blocking sources run on a shared thread pool and async sources on
+        the event loop. Each source gets the deadline from
+        ``source_deadlines`` (capped at ``deadline_secs``); a source that
+        misses it is returned with ``timed_out=True`` and no results, so the
+        total latency is that of the slowest source that made its deadline.
+
+        Args:
+            query: The user's question/message
+            include_slack: Search Slack persona vector DB
+            include_code: Search code vector DB
+            include_jira: Look up detected Jira issue keys
+            include_memory: Check memory for current work context
+            include_inscope: Query InScope AI assistants for documentation
+            thread_context: Optional list of previous messages in thread (for Slack)
+        """
         start = time.time()
-        sources = []
 
         # Extract Jira keys early (needed for Jira lookup)
         jira_keys = self._extract_jira_keys(query)
 
-        # Gather from each source
-        if include_slack:
-            sources.append(self._search_slack(query))
+        requested = [
+            name
+            for name, enabled in (
+                ("slack", include_slack),
+                ("code", include_code),
+                ("jira", include_jira),
+                ("memory", include_memory),
+                ("inscope", include_inscope),
+            )
+            if enabled
+        ]
+
+        cached: dict[str, ContextSource] = {}
+        versions: dict[str, Any] = {}
+        embedding: Optional[list[float]] = None
+        if self.cache is not None:
+            versions = self._source_versions(requested)
+            # Encoding runs the embedding model; keep it off the event loop
+            embedding = await asyncio.to_thread(self._query_embedding, query)
+            cached = self.cache.lookup(
+                self._cache_scope(),
+                query,
+                requested,
+                jira_keys=frozenset(jira_keys),
+                embedding=embedding,
+                versions=versions,
+            )
+        include_slack = include_slack and "slack" not in cached
+        include_code = include_code and "code" not in cached
+        include_jira = include_jira and "jira" not in cached
+        include_memory = include_memory and "memory" not in cached
+        include_inscope = include_inscope and "inscope" not in cached
 
-        if include_code:
-            sources.append(self._search_code(query))
+        loop = asyncio.get_running_loop()
+        executor = _get_gather_executor()
+        pending: list[tuple[str, Any]] = []
 
+        if include_slack:
+            pending.append(
+                ("slack", loop.run_in_executor(executor, self._search_slack, query))
+            )
+        if include_code:
+            pending.append(
+                ("code", loop.run_in_executor(executor, self._search_code, query))
+            )
         if include_jira:
-            sources.append(self._search_jira(query, jira_keys))
-
+            # The lookup's subprocesses are bounded by the source's deadline,
+            # so a timed-out lookup doesn't keep holding a pool thread
+            jira_deadline_at = time.monotonic() + self._source_deadline("jira")
+            pending.append(
+                (
+                    "jira",
+                    loop.run_in_executor(
+                        executor,
+                        self._search_jira,
+                        query,
+                        jira_keys,
+                        jira_deadline_at,
+                    ),
+                )
+            )
         if include_memory:
-            sources.append(self._search_memory(query))
-
+            pending.append(
+                ("memory", loop.run_in_executor(executor, self._search_memory, query))
+            )
         if include_inscope:
-            sources.append(self._search_inscope(query))
+            pending.append(("inscope", self._search_inscope(query)))
 
-        # Build result
+        fetched = await asyncio.gather(
+            *(self._run_source(name, aw) for name, aw in pending)
+        )
+
+        if self.cache is not None and fetched:
+            if embedding is None and include_code:
+                # The code search just loaded the model and cached this
+                # query's embedding
+                embedding = await asyncio.to_thread(self._query_embedding, query)
+            self.cache.store(
+                self._cache_scope(),
+                query,
+                list(fetched),
+                jira_keys=frozenset(jira_keys),
+                embedding=embedding,
+                versions=versions,
+            )
+
+        by_name = {**cached, **{s.source: s for s in fetched}}
+        sources = [by_name[name] for name in requested]
+        return self._build_context(query, sources, start)
+
+    def _cache_scope(self) -> str:
+        """Cache namespace: results depend on the project and limits."""
+        return (
+            f"{self.project}:{self.slack_limit}:{self.code_limit}:"
+            f"{self.jira_limit}:{self.memory_limit}:{self.inscope_limit}"
+        )
+
+    def _source_versions(self, sources: list[str]) -> dict[str, Any]:
+        """Versions of the data behind each source, where one is known.
+
+        A cached result whose version differs is treated as a miss, so a
+        rebuilt code index (possibly by another process) is picked up at once.
+        """
+        versions: dict[str, Any] = {}
+        if "code" in sources and self._check_code_available():
+            try:
+                from tool_modules.aa_code_search.src.tools_basic import VECTOR_DB_PATH
+
+                metadata = VECTOR_DB_PATH / self.project / "metadata.json"
+                versions["code"] = metadata.stat().st_mtime_ns
+            except (ImportError, OSError):
+                versions["code"] = None
+        return versions
+
+    def _query_embedding(self, query: str) -> Optional[list[float]]:
+        """Query embedding from the code search model, if already loaded.
+
+        Code search caches query embeddings, so after a code lookup this is
+        a dictionary hit. The model is never loaded just for a cache lookup.
+        """
+        if not self._check_code_available():
+            return None
+        try:
+            from tool_modules.aa_code_search.src import tools_basic as code_search
+
+            if (
+                code_search._sentence_transformer is None
+                and code_search._openvino_model is None
+            ):
+                return None
+            return code_search._get_cached_embedding(
+                query, code_search._get_embedding_model()
+            )
+        except Exception as e:
+            logger.debug(f"Query embedding unavailable: {e}")
+            return None
+
+    def _source_deadline(self, name: str) -> float:
+        """Deadline in seconds for one source."""
+        return min(
+            self.source_deadlines.get(name, self.deadline_secs), self.deadline_secs
+        )
+
+    async def _run_source(self, name: str, awaitable: Any) -> ContextSource:
+        """Await one source, giving up (and cancelling it) at its deadline.
+
+        Cancelling a thread-pool source only stops it if it hasn't started;
+        a running one can't be interrupted, so blocking sources that spawn
+        processes (Jira) are given the same deadline and kill them at it.
+        """
+        deadline = self._source_deadline(name)
+        start = time.time()
+        try:
+            return await asyncio.wait_for(awaitable, timeout=deadline)
+        except asyncio.TimeoutError:
+            logger.info(f"Context source '{name}' missed its {deadline:.1f}s deadline")
+            return ContextSource(
+                source=name,
+                found=False,
+                count=0,
+                results=[],
+                error=f"Timed out after {deadline:.1f}s",
+                latency_ms=(time.time() - start) * 1000,
+                timed_out=True,
+            )
+        except Exception as e:
+            logger.warning(f"Context source '{name}' failed: {e}")
+            return ContextSource(
+                source=name,
+                found=False,
+                count=0,
+                results=[],
+                error=str(e),
+                latency_ms=(time.time() - start) * 1000,
+            )
+
+    def _build_context(
+        self, query: str, sources: list[ContextSource], start: float
+    ) -> GatheredContext:
+        """Assemble and format gathered sources."""
         total_results = sum(s.count for s in sources)
         total_latency = (time.time() - start) * 1000
 
@@ -744,49 +1232,21 @@ class ContextInjector:
         # Format for injection
         context.formatted = self._format_context(context)
 
+        timed_out = [s.source for s in sources if s.timed_out]
+        cached = [s.source for s in sources if s.cached]
         logger.info(
             f"Context gathered: {total_results} results from "
             f"{len([s for s in sources if s.found])} sources in {total_latency:.0f}ms"
+            + (f" (cached: {', '.join(cached)})" if cached else "")
+            + (f" (timed out: {', '.join(timed_out)})" if timed_out else "")
+        )
+        logger.debug(
+            "Context source latency: "
+            + ", ".join(f"{s.source}={s.latency_ms:.0f}ms" for s in sources)
         )
 
         return context
 
-    async def gather_context_async(
-        self,
-        query: str,
-        include_slack: bool = True,
-        include_code: bool = True,
-        include_jira: bool = True,
-        include_memory: bool = True,
-        include_inscope: bool = True,
-        thread_context: list[dict] | None = None,
-    ) -> GatheredContext:
-        """
-        Async version of gather_context.
-
-        Runs searches in parallel for better performance.
-
-        Args:
-            query: The user's question/message
-            include_slack: Search Slack persona vector DB
-            include_code: Search code vector DB
-            include_jira: Look up detected Jira issue keys
-            include_memory: Check memory for current work context
-            include_inscope: Query InScope AI assistants for documentation
-            thread_context: Optional list of previous messages in thread (for Slack)
-        """
-        # For now, just wrap the sync version
-        # TODO: Make individual searches async for true parallelism
-        return await asyncio.to_thread(
-            self.gather_context,
-            query,
-            include_slack,
-            include_code,
-            include_jira,
-            include_memory,
-            include_inscope,
-        )
-
     async def gather_context_unified(
         self,
         query: str,
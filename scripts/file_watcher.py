@@ -0,0 +1,236 @@
+"""
+Event-driven file watching for the hot-reload tools.
+
+Shared by scripts/mcp_proxy.py and services/extension_watcher. Watched
+directories are monitored with inotify (via watchfiles), so an idle tree costs
+nothing instead of an os.walk + stat of every file each poll tick. Loose files
+(e.g. config.json) are stat-ed on each wakeup, which also survives editors that
+save by renaming over the original.
+
+When watchfiles is not installed (the proxy may run under a bare system
+python) or inotify cannot be set up, the watcher falls back to mtime polling
+with the same skip rules.
+
+Usage:
+    watcher = FileWatcher(["server/", "tool_modules/"], {".py"}, debounce=3.0)
+    for changes in watcher.watch(stop_event):
+        for change_type, path in changes:  # "new" | "modified" | "deleted"
+            ...
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Directories never descended into (any path component below a watched root)
+SKIP_DIRS = frozenset(
+    {
+        "node_modules",
+        "__pycache__",
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".venv",
+        ".tox",
+        "dist",
+        "build",
+        ".eggs",
+    }
+)
+
+# How often the watcher wakes up to check loose files, debounce and stop
+POLL_INTERVAL = 0.5
+
+Change = tuple[str, Path]  # (change type, path)
+
+
+def is_skipped_dir(name: str, skip_dirs: Iterable[str] = SKIP_DIRS) -> bool:
+    """Check whether a directory name is excluded from watching."""
+    return name in skip_dirs or name.endswith(".egg-info")
+
+
+def tool_module_for(path: Path, root: Path) -> str | None:
+    """Name of the tool module (``aa_*``) a changed file belongs to.
+
+    Returns None for files outside ``tool_modules/aa_*/``.
+    """
+    try:
+        parts = Path(path).relative_to(Path(root) / "tool_modules").parts
+    except ValueError:
+        return None
+    if len(parts) >= 2 and parts[0].startswith("aa_"):
+        return parts[0]
+    return None
+
+
+class FileWatcher:
+    """Debounced change notifications for a set of directories and files."""
+
+    def __init__(
+        self,
+        paths: Iterable[Path | str],
+        extensions: Iterable[str],
+        debounce: float,
+        skip_dirs: Iterable[str] = SKIP_DIRS,
+        force_polling: bool = False,
+    ):
+        """
+        Args:
+            paths: Directories (watched recursively) and individual files
+            extensions: File suffixes to report, e.g. {".py", ".yaml"}
+            debounce: Seconds without changes before a batch is reported
+            skip_dirs: Directory names never watched
+            force_polling: Use mtime polling even if watchfiles is available
+        """
+        self.paths = [Path(p) for p in paths]
+        self.extensions = set(extensions)
+        self.debounce = debounce
+        self.skip_dirs = frozenset(skip_dirs)
+        self.force_polling = force_polling
+        self.backend = "polling"
+
+    def _wanted(self, path: Path) -> bool:
+        """Check whether a changed path should be reported."""
+        if path.suffix not in self.extensions:
+            return False
+        for root in self.paths:
+            try:
+                relative = path.relative_to(root)
+            except ValueError:
+                continue
+            # Only components below the watched root count
+            return not any(
+                is_skipped_dir(part, self.skip_dirs) for part in relative.parts[:-1]
+            )
+        return True
+
+    def _loose_files(self) -> list[Path]:
+        """Watched paths that are files rather than directories."""
+        return [p for p in self.paths if not p.is_dir()]
+
+    def snapshot(self) -> dict[Path, float]:
+        """Modification times of all watched files (full tree walk)."""
+        mtimes: dict[Path, float] = {}
+        for watch_path in self.paths:
+            if not watch_path.is_dir():
+                mtimes.update(self._stat_files([watch_path]))
+                continue
+            # Prune directories in place so skipped subtrees are never opened
+            for dirpath, dirnames, filenames in os.walk(watch_path):
+                dirnames[:] = [
+                    d for d in dirnames if not is_skipped_dir(d, self.skip_dirs)
+                ]
+                for filename in filenames:
+                    filepath = Path(dirpath) / filename
+                    if filepath.suffix in self.extensions:
+                        try:
+                            mtimes[filepath] = filepath.stat().st_mtime
+                        except OSError:
+                            pass
+        return mtimes
+
+    def _stat_files(self, files: list[Path]) -> dict[Path, float]:
+        """Modification times of individual files that exist."""
+        mtimes = {}
+        for path in files:
+            if path.suffix not in self.extensions:
+                continue
+            try:
+                mtimes[path] = path.stat().st_mtime
+            except OSError:
+                pass
+        return mtimes
+
+    @staticmethod
+    def _diff(before: dict[Path, float], after: dict[Path, float]) -> list[Change]:
+        """Changes between two mtime snapshots."""
+        changes: list[Change] = []
+        for path, mtime in after.items():
+            if path not in before:
+                changes.append(("new", path))
+            elif before[path] != mtime:
+                changes.append(("modified", path))
+        changes.extend(("deleted", path) for path in before if path not in after)
+        return changes
+
+    def watch(self, stop_event: threading.Event) -> Iterator[list[Change]]:
+        """Yield batches of changes once ``debounce`` seconds pass without one.
+
+        Runs until ``stop_event`` is set.
+        """
+        pending: dict[Path, str] = {}
+        last_change = 0.0
+
+        for changes in self._raw_changes(stop_event):
+            if changes:
+                for change_type, path in changes:
+                    pending[path] = change_type
+                last_change = time.monotonic()
+            if pending and time.monotonic() - last_change > self.debounce:
+                batch = [(change_type, path) for path, change_type in pending.items()]
+                pending.clear()
+                yield batch
+
+    def _raw_changes(self, stop_event: threading.Event) -> Iterator[list[Change]]:
+        """Undebounced changes, yielded at least every POLL_INTERVAL."""
+        directories = [p for p in self.paths if p.is_dir()]
+        if directories and not self.force_polling:
+            try:
+                import watchfiles  # noqa: F401
+            except ImportError:
+                logger.info("watchfiles not installed - polling for file changes")
+            else:
+                try:
+                    yield from self._inotify_changes(directories, stop_event)
+                    return
+                except Exception as e:
+                    if stop_event.is_set():
+                        return
+                    logger.warning(f"inotify watch failed, polling instead: {e}")
+
+        self.backend = "polling"
+        last = self.snapshot()
+        while not stop_event.wait(POLL_INTERVAL):
+            current = self.snapshot()
+            changes = self._diff(last, current)
+            last = current
+            yield changes
+
+    def _inotify_changes(
+        self, directories: list[Path], stop_event: threading.Event
+    ) -> Iterator[list[Change]]:
+        """Changes from inotify for directories, plus stat of loose files."""
+        from watchfiles import Change as FsChange
+        from watchfiles import watch
+
+        change_types = {
+            FsChange.added: "new",
+            FsChange.modified: "modified",
+            FsChange.deleted: "deleted",
+        }
+        loose = self._loose_files()
+        loose_mtimes = self._stat_files(loose)
+        interval_ms = int(POLL_INTERVAL * 1000)
+
+        self.backend = "inotify"
+        for raw in watch(
+            *directories,
+            watch_filter=lambda _change, path: self._wanted(Path(path)),
+            debounce=interval_ms,
+            rust_timeout=interval_ms,
+            yield_on_timeout=True,
+            stop_event=stop_event,
+            raise_interrupt=False,
+        ):
+            changes = [(change_types[change], Path(path)) for change, path in raw]
+            if loose:
+                current = self._stat_files(loose)
+                changes.extend(self._diff(loose_mtimes, current))
+                loose_mtimes = current
+            yield changes
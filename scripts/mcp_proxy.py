@@ -15,7 +15,10 @@ Architecture:
 Features:
 - Spawns the real MCP server as a subprocess
 - Forwards stdin/stdout bidirectionally
-- Watches for file changes and restarts the subprocess
+- Watches for file changes (inotify, falling back to polling) and restarts
+  the subprocess
+- Reloads changed tool_modules/aa_* packages inside the running server
+  instead of restarting it (see server/hot_reload.py)
 - Restarts dependent daemons (cron, slack, meet) on reload
 - Handles MCP protocol initialization on restart (waits for re-init)
 - Sends tools/list_changed notification to trigger Cursor refresh
@@ -51,6 +54,7 @@ Environment variables:
     MCP_PROXY_NO_WATCH=1        Disable file watching (just proxy)
     MCP_PROXY_DEBOUNCE=3.0      Debounce time in seconds (default: 3.0)
     MCP_PROXY_RESTART_DAEMONS=1 Restart daemons on reload (disabled by default)
+    MCP_PROXY_FULL_RESTART=1    Always restart the server (no in-process reload)
 """
 
 import json
@@ -59,10 +63,16 @@ import os
 import signal
 import subprocess
 import sys
+import tempfile
 import threading
 import time
 from pathlib import Path
 
+try:
+    from scripts.file_watcher import FileWatcher, tool_module_for
+except ImportError:  # Run as a script: scripts/ itself is on sys.path
+    from file_watcher import FileWatcher, tool_module_for
+
 logger = logging.getLogger(__name__)
 
 # Configuration - watch all important project directories
@@ -101,6 +111,15 @@ DEBOUNCE_SECONDS = float(os.environ.get("MCP_PROXY_DEBOUNCE", "3.0"))
 # Debug and feature flags
 DEBUG = os.environ.get("MCP_PROXY_DEBUG", "").lower() in ("1", "true", "yes")
 NO_WATCH = os.environ.get("MCP_PROXY_NO_WATCH", "").lower() in ("1", "true", "yes")
+FULL_RESTART = os.environ.get("MCP_PROXY_FULL_RESTART", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# In-process module reload protocol (must match server/hot_reload.py)
+RELOAD_REQUEST_ENV = "MCP_RELOAD_REQUEST_FILE"
+IN_PROCESS_RELOAD_TIMEOUT = 10.0  # Fall back to a full restart after this
 # NO_DAEMONS is now True by default - daemons run independently and don't need restart
 # Set MCP_PROXY_RESTART_DAEMONS=1 to re-enable daemon restarts
 NO_DAEMONS = os.environ.get("MCP_PROXY_RESTART_DAEMONS", "").lower() not in (
@@ -192,9 +211,16 @@ class HotReloadProxy:
         self.restart_lock = threading.Lock()
         self.pending_input: list[bytes] = []
         self.shutting_down = False
-        self.last_mtimes: dict[Path, float] = {}
+        self.stop_event = threading.Event()  # Set on shutdown; stops the watcher
+        self.watcher = FileWatcher(self.watch_paths, WATCH_EXTENSIONS, DEBOUNCE_SECONDS)
         self.restart_count = 0
 
+        # In-process reload: request file shared with the server
+        self.reload_request_file = (
+            Path(tempfile.gettempdir()) / f"mcp-proxy-{os.getpid()}-reload.json"
+        )
+        self.reload_count = 0
+
         # MCP session state tracking
         self.session_initialized = False
         self.awaiting_reinit = False  # True after restart, waiting for new initialize
@@ -250,6 +276,9 @@ class HotReloadProxy:
             if restart_daemons_too:
                 restart_daemons()
 
+            # The new server announces itself once it accepts reload requests
+            self._remove_reload_files()
+
             # Start new process
             log(f"Starting server: {' '.join(self.server_cmd)}")
             try:
@@ -260,6 +289,10 @@ class HotReloadProxy:
                     stderr=sys.stderr,  # Pass through stderr for debugging
                     cwd=self.working_dir,
                     bufsize=0,  # Unbuffered
+                    env={
+                        **os.environ,
+                        RELOAD_REQUEST_ENV: str(self.reload_request_file),
+                    },
                 )
                 self.restart_count += 1
                 log(
@@ -575,127 +608,136 @@ class HotReloadProxy:
 
         log("stdout forwarder stopped")
 
+    def _reload_file(self, suffix: str) -> Path:
+        """Companion file of the reload request (".ready" or ".result")."""
+        request = self.reload_request_file
+        return request.with_name(request.name + suffix)
+
+    def _remove_reload_files(self) -> None:
+        """Remove the request, ready and result files."""
+        for path in (
+            self.reload_request_file,
+            self._reload_file(".ready"),
+            self._reload_file(".result"),
+        ):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def reload_modules_in_process(self, packages: set[str]) -> bool:
+        """Ask the running server to reload tool packages without restarting.
+
+        Returns:
+            True if the server reloaded them; False means a full restart is
+            needed (disabled, server not ready, failure or timeout)
+        """
+        if FULL_RESTART or not hasattr(signal, "SIGUSR1"):
+            return False
+        if not self.process or self.process.poll() is not None:
+            return False
+
+        try:
+            ready = json.loads(self._reload_file(".ready").read_text())
+            server_pid = int(ready["pid"])
+        except (OSError, ValueError, KeyError, TypeError):
+            log("Server does not accept in-process reloads, restarting instead")
+            return False
+
+        self.reload_count += 1
+        request_id = self.reload_count
+        result_file = self._reload_file(".result")
+        start = time.time()
+        try:
+            result_file.unlink(missing_ok=True)
+            tmp = self.reload_request_file.with_name(
+                self.reload_request_file.name + ".tmp"
+            )
+            tmp.write_text(json.dumps({"id": request_id, "packages": sorted(packages)}))
+            tmp.replace(self.reload_request_file)
+            os.kill(server_pid, signal.SIGUSR1)
+        except OSError as e:
+            log(f"Could not request in-process reload: {e}", force=True)
+            return False
+
+        while time.time() - start < IN_PROCESS_RELOAD_TIMEOUT:
+            if self.shutting_down:
+                return False
+            try:
+                result = json.loads(result_file.read_text())
+            except (OSError, ValueError):
+                result = None
+            if result and result.get("id") == request_id:
+                if not result.get("success"):
+                    log(
+                        f"In-process reload failed: {result.get('errors')}",
+                        force=True,
+                    )
+                    return False
+                log(
+                    f"Reloaded {result.get('reloaded')} in place in "
+                    f"{(time.time() - start) * 1000:.0f}ms",
+                    force=True,
+                )
+                return True
+            time.sleep(0.05)
+
+        log("In-process reload timed out, restarting instead", force=True)
+        return False
+
     def get_file_mtimes(self) -> dict[Path, float]:
         """Get modification times of all watched files."""
-        # Directories to skip entirely (don't even traverse into them)
-        skip_dirs = {
-            "node_modules",
-            "__pycache__",
-            ".git",
-            ".mypy_cache",
-            ".pytest_cache",
-            ".ruff_cache",
-            ".venv",
-            ".tox",
-            "dist",
-            "build",
-            ".eggs",
-        }
-
-        mtimes = {}
-        for watch_path in self.watch_paths:
-            if not watch_path.exists():
-                continue
-            if watch_path.is_file():
-                # Direct file watch (e.g., config.json)
-                try:
-                    if watch_path.suffix in WATCH_EXTENSIONS:
-                        mtimes[watch_path] = watch_path.stat().st_mtime
-                except OSError:
-                    pass
-            else:
-                # Directory watch - use os.walk with directory pruning
-                # This is MUCH faster than rglob because we skip entire subtrees
-                for dirpath, dirnames, filenames in os.walk(watch_path):
-                    # Prune directories IN PLACE to prevent descending into them
-                    # This is the key optimization - we never even open these dirs
-                    dirnames[:] = [
-                        d
-                        for d in dirnames
-                        if d not in skip_dirs and not d.endswith(".egg-info")
-                    ]
-
-                    # Check files in this directory
-                    for filename in filenames:
-                        filepath = Path(dirpath) / filename
-                        if filepath.suffix in WATCH_EXTENSIONS:
-                            try:
-                                mtimes[filepath] = filepath.stat().st_mtime
-                            except OSError:
-                                pass
-        return mtimes
+        return self.watcher.snapshot()
 
     def watch_files(self):
-        """Poll for file changes and restart server when detected."""
+        """Watch for file changes and restart server when detected."""
         if NO_WATCH:
             log("File watching disabled")
             return
 
         log(f"File watcher started (watching {len(self.watch_paths)} paths)")
-        self.last_mtimes = self.get_file_mtimes()
-        log(f"Tracking {len(self.last_mtimes)} files")
         log(f"Debounce: {DEBOUNCE_SECONDS}s")
 
-        last_change_time = 0.0
-        needs_restart = False
-        changed_files_batch: list[tuple[str, Path]] = []
-
-        while not self.shutting_down:
-            time.sleep(0.5)  # Poll every 500ms
-
-            current_mtimes = self.get_file_mtimes()
-
-            # Check for changes
-            changed_files = []
-
-            # Check modified files
-            for path, mtime in current_mtimes.items():
-                if path not in self.last_mtimes:
-                    changed_files.append(("new", path))
-                elif self.last_mtimes[path] != mtime:
-                    changed_files.append(("modified", path))
-
-            # Check deleted files
-            for path in self.last_mtimes:
-                if path not in current_mtimes:
-                    changed_files.append(("deleted", path))
+        for changed_files in self.watcher.watch(self.stop_event):
+            if self.shutting_down:
+                break
 
-            if changed_files:
-                for change_type, f in changed_files:
-                    try:
-                        rel_path = f.relative_to(self.working_dir)
-                    except ValueError:
-                        rel_path = f
-                    log(f"File {change_type}: {rel_path}", force=True)
-                    changed_files_batch.append((change_type, f))
-                last_change_time = time.time()
-                needs_restart = True
-                self.last_mtimes = current_mtimes
-
-            # Debounce: restart after DEBOUNCE_SECONDS of no changes
-            if needs_restart and (time.time() - last_change_time) > DEBOUNCE_SECONDS:
-                log(
-                    f"Reloading after {len(changed_files_batch)} file change(s)...",
-                    force=True,
-                )
-                self.start_server(restart_daemons_too=True)
-                needs_restart = False
-                changed_files_batch.clear()
+            modules = set()
+            for change_type, f in changed_files:
+                try:
+                    rel_path = f.relative_to(self.working_dir)
+                except ValueError:
+                    rel_path = f
+                log(f"File {change_type}: {rel_path}", force=True)
+                modules.add(tool_module_for(f, Path(self.working_dir)))
+
+            if None not in modules:
+                # Every change is inside tool_modules/aa_*/: swap just those
+                log(f"Affected tool modules: {', '.join(sorted(modules))}", force=True)
+                if self.reload_modules_in_process(modules):
+                    self._notify_tools_changed()
+                    continue
+
+            log(
+                f"Reloading after {len(changed_files)} file change(s)...",
+                force=True,
+            )
+            self.start_server(restart_daemons_too=True)
 
-                # Give server a moment to start and be ready for initialize
-                time.sleep(0.5)
+            # Give server a moment to start and be ready for initialize
+            time.sleep(0.5)
 
-                # Send tools_changed notification to prompt Cursor to refresh
-                # Note: This only works if Cursor has an active session.
-                # If the session is broken, Cursor may need to be manually refreshed.
-                self._notify_tools_changed()
+            # Send tools_changed notification to prompt Cursor to refresh
+            # Note: This only works if Cursor has an active session.
+            # If the session is broken, Cursor may need to be manually refreshed.
+            self._notify_tools_changed()
 
-                log(
-                    "Server reloaded ✓ - Cursor may need manual refresh if tools don't appear",
-                    force=True,
-                )
+            log(
+                "Server reloaded ✓ - Cursor may need manual refresh if tools don't appear",
+                force=True,
+            )
 
-        log("File watcher stopped")
+        log(f"File watcher stopped ({self.watcher.backend})")
 
     def run(self):
         """Main entry point - start proxy and run until shutdown."""
@@ -704,6 +746,7 @@ class HotReloadProxy:
         def shutdown(sig, frame):
             log(f"Received signal {sig}, shutting down...")
             self.shutting_down = True
+            self.stop_event.set()
             if self.process:
                 try:
                     self.process.terminate()
@@ -744,6 +787,7 @@ class HotReloadProxy:
 
         log("Shutting down...")
         self.shutting_down = True
+        self.stop_event.set()
 
         # Clean up
         if self.process:
@@ -755,6 +799,7 @@ class HotReloadProxy:
                 if self.process:
                     self.process.kill()
 
+        self._remove_reload_files()
         log("Proxy stopped")
 
 
@@ -797,6 +842,10 @@ def main():
                 global NO_WATCH
                 NO_WATCH = True
                 i += 1
+            elif proxy_args[i] == "--full-restart":
+                global FULL_RESTART
+                FULL_RESTART = True
+                i += 1
             elif proxy_args[i] == "--restart-daemons":
                 global NO_DAEMONS
                 NO_DAEMONS = False  # Enable daemon restarts
@@ -831,6 +880,10 @@ def main():
         )
         print("  --debug           Enable debug logging", file=sys.stderr)
         print("  --no-watch        Disable file watching", file=sys.stderr)
+        print(
+            "  --full-restart    Restart the server for every change (no in-process reload)",
+            file=sys.stderr,
+        )
         print(
             "  --restart-daemons Restart daemons on reload (disabled by default)",
             file=sys.stderr,
@@ -4,6 +4,7 @@ Provides:
 - @debuggable decorator to capture source info and add debug hints on failure
 - Tool registry mapping tool names to source files
 - debug_tool() function for Claude to inspect and fix broken tools
+- Runtime status providers (cache state etc.) shown by debug_tool()
 
 Usage:
     from .debuggable import debuggable, register_debug_tool
@@ -41,6 +42,36 @@ logger = logging.getLogger(__name__)
 # Global registry of tools and their source locations
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
+# Runtime status providers by name: (tool name prefixes, provider)
+STATUS_PROVIDERS: dict[str, tuple[tuple[str, ...], Callable[[], str]]] = {}
+
+
+def register_status_provider(
+    name: str, provider: Callable[[], str], tool_prefixes: tuple[str, ...] = ()
+) -> None:
+    """Show a subsystem's runtime status in debug_tool().
+
+    Args:
+        name: Provider name; ``debug_tool(name)`` shows just this status
+        provider: Returns a markdown status section
+        tool_prefixes: Also show the status when debugging tools whose
+            names start with one of these
+    """
+    STATUS_PROVIDERS[name] = (tool_prefixes, provider)
+
+
+def get_runtime_status(tool_name: str) -> list[str]:
+    """Status sections of the providers relevant to a tool."""
+    sections = []
+    for name, (prefixes, provider) in STATUS_PROVIDERS.items():
+        if tool_name != name and not (prefixes and tool_name.startswith(prefixes)):
+            continue
+        try:
+            sections.append(provider())
+        except Exception as e:
+            sections.append(f"**{name}:** status unavailable ({e})")
+    return sections
+
 
 def debuggable(func: Callable) -> Callable:
     """
@@ -256,12 +287,20 @@ def register_debug_tool(server) -> None:
         User confirms before any changes are applied.
 
         Args:
-            tool_name: Name of the tool that failed (e.g., 'bonfire_namespace_release')
+            tool_name: Name of the tool that failed (e.g., 'bonfire_namespace_release'),
+                or of a status provider (e.g., 'k8s_informers')
             error_message: The error message from the failure (optional but helpful)
 
         Returns:
             Source code and instructions for Claude to diagnose and fix.
         """
+        if tool_name in STATUS_PROVIDERS:
+            return [
+                TextContent(
+                    type="text", text="\n\n".join(get_runtime_status(tool_name))
+                )
+            ]
+
         source_file, func_source, start_line, end_line = get_tool_source(tool_name)
 
         if not source_file:
@@ -305,6 +344,15 @@ If the tool exists but isn't registered, it may not have the @debuggable decorat
                 func_source,
                 "```",
                 "",
+            ]
+        )
+
+        runtime_status = get_runtime_status(tool_name)
+        if runtime_status:
+            lines.extend(["**Runtime status:**", "", *runtime_status, ""])
+
+        lines.extend(
+            [
                 "---",
                 "",
                 "## Instructions for Claude",
@@ -380,7 +428,7 @@ def wrap_all_tools(server, tools_module) -> int:
     return count
 
 
-def wrap_server_tools_runtime(server) -> int:
+def wrap_server_tools_runtime(server, tool_names: set[str] | None = None) -> int:
     """
     Wrap all registered server tools with debug hint functionality at runtime.
 
@@ -397,6 +445,11 @@ def wrap_server_tools_runtime(server) -> int:
     TODO: When FastMCP provides a public API for tool handler modification,
     migrate to that approach.
 
+    Args:
+        server: FastMCP server instance
+        tool_names: Only wrap these tools (e.g. after reloading one module,
+            so already-wrapped tools are not wrapped twice). None wraps all.
+
     Returns:
         Number of tools wrapped.
     """
@@ -418,6 +471,8 @@ def wrap_server_tools_runtime(server) -> int:
 
             if tool_name.startswith("_") or tool_name == "debug_tool":
                 continue
+            if tool_names is not None and tool_name not in tool_names:
+                continue
 
             # Get the original handler - FastMCP v3 uses 'fn' attribute
             original_handler = tool_info.fn if hasattr(tool_info, "fn") else None
@@ -0,0 +1,114 @@
+"""In-process tool module reload, requested by scripts/mcp_proxy.py.
+
+When the hot-reload proxy sees changes confined to ``tool_modules/aa_*``
+packages it asks the running server to reload just those packages instead of
+restarting it:
+
+1. The proxy starts the server with MCP_RELOAD_REQUEST_FILE set.
+2. Once the SIGUSR1 handler is installed, the server writes ``<file>.ready``
+   containing its PID. The proxy only signals a server that announced itself,
+   because SIGUSR1 would otherwise terminate it.
+3. The proxy writes ``{"id": n, "packages": [...]}`` to the request file and
+   sends SIGUSR1.
+4. The server reloads the packages through PersonaLoader and writes
+   ``{"id": n, "success": ..., ...}`` to ``<file>.result``.
+5. On success the proxy sends tools/list_changed to the client. On failure
+   or timeout it falls back to a full restart.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+RELOAD_REQUEST_ENV = "MCP_RELOAD_REQUEST_FILE"
+
+_reload_lock: asyncio.Lock | None = None
+
+
+def ready_path(request_file: Path) -> Path:
+    """File announcing that the server accepts reload requests."""
+    return request_file.with_name(request_file.name + ".ready")
+
+
+def result_path(request_file: Path) -> Path:
+    """File the server writes the reload result to."""
+    return request_file.with_name(request_file.name + ".result")
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(data), encoding="utf-8")
+    tmp.replace(path)
+
+
+async def handle_reload_request(request_file: Path) -> dict:
+    """Read a reload request, reload the packages, and write the result."""
+    global _reload_lock
+    if _reload_lock is None:
+        _reload_lock = asyncio.Lock()
+
+    async with _reload_lock:
+        request_id = None
+        try:
+            request = json.loads(request_file.read_text(encoding="utf-8"))
+            request_id = request.get("id")
+            packages = set(request.get("packages", []))
+
+            from .persona_loader import get_loader
+
+            loader = get_loader()
+            if loader is None:
+                result = {
+                    "success": False,
+                    "reloaded": {},
+                    "errors": ["persona loader not initialized"],
+                }
+            else:
+                loop = asyncio.get_running_loop()
+                start = loop.time()
+                result = await loader.reload_tool_packages(packages)
+                result["elapsed_ms"] = round((loop.time() - start) * 1000, 1)
+        except Exception as e:
+            logger.error(f"In-process reload failed: {e}")
+            result = {"success": False, "reloaded": {}, "errors": [str(e)]}
+
+        result["id"] = request_id
+        try:
+            _write_json_atomic(result_path(request_file), result)
+        except OSError as e:
+            logger.warning(f"Could not write reload result: {e}")
+        logger.info(f"In-process reload: {result}")
+        return result
+
+
+def install_reload_handler() -> bool:
+    """Accept reload requests from the proxy (call from the running loop).
+
+    Returns:
+        True if the handler was installed, False when not running under the
+        proxy or the platform has no SIGUSR1
+    """
+    request_env = os.environ.get(RELOAD_REQUEST_ENV)
+    if not request_env or not hasattr(signal, "SIGUSR1"):
+        return False
+
+    request_file = Path(request_env)
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(
+            signal.SIGUSR1,
+            lambda: loop.create_task(handle_reload_request(request_file)),
+        )
+        _write_json_atomic(ready_path(request_file), {"pid": os.getpid()})
+    except (NotImplementedError, RuntimeError, OSError) as e:
+        logger.warning(f"In-process reload unavailable: {e}")
+        return False
+
+    logger.info("In-process tool module reload enabled")
+    return True
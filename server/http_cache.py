@@ -0,0 +1,261 @@
+"""On-disk HTTP response cache with conditional revalidation.
+
+Read-only API tools (Prometheus, Alertmanager, Grafana, Kibana, Quay) are
+polled by skills and cron jobs that mostly see the same payload again. When
+a GET response carries an ``ETag`` or ``Last-Modified`` validator, the body
+is kept on disk; the next identical request sends ``If-None-Match`` /
+``If-Modified-Since`` and a ``304 Not Modified`` is answered from the cache.
+Callers that can tolerate slightly old data pass ``max_stale`` to skip the
+round trip entirely while the entry is younger than that.
+
+Usage:
+    from server.http_cache import get_response_cache
+
+    client = APIClient(base_url=url, response_cache=get_response_cache())
+    success, data = await client.get("/api/v1/repository", max_stale=60)
+
+Each entry is two files under ``HTTP_CACHE_DIR``: ``<key>.json`` with the
+validators and ``<key>.body``. Least recently used entries are evicted once
+the bodies exceed ``max_bytes``. Bodies can hold private API data, so the
+directory is created 0700 and entries are written 0600.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from server.paths import HTTP_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Total size of cached bodies before evicting least recently used entries
+MAX_CACHE_BYTES = 100 * 1024 * 1024
+
+# Responses bigger than this fraction of the cap are not cached
+MAX_ENTRY_FRACTION = 0.25
+
+
+@dataclass
+class CachedResponse:
+    """Validators and metadata of a cached response (the body lives alongside)."""
+
+    url: str
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    validated_at: float
+
+    def age(self) -> float:
+        """Seconds since the server last confirmed this response."""
+        return time.time() - self.validated_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server for a 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def is_cacheable(response: httpx.Response) -> bool:
+    """Whether a response can be stored and revalidated later."""
+    if response.request.method != "GET" or response.status_code != 200:
+        return False
+    if "no-store" in response.headers.get("cache-control", "").lower():
+        return False
+    return bool(response.headers.get("etag") or response.headers.get("last-modified"))
+
+
+class ResponseCache:
+    """Cached GET responses keyed by URL, credentials and Accept header."""
+
+    def __init__(
+        self, directory: Path = HTTP_CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # key -> body size, least recently used first (loaded lazily)
+        self._sizes: OrderedDict[str, int] | None = None
+        self._directory_ready = False
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, identity: str = "", accept: str = "") -> str:
+        """Cache key for a GET of a full URL (including query) by a credential."""
+        return hashlib.sha256("\0".join((url, identity, accept)).encode()).hexdigest()
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _body_path(self, key: str) -> Path:
+        return self.directory / f"{key}.body"
+
+    def _index(self) -> OrderedDict[str, int]:
+        if self._sizes is None:
+            bodies = []
+            try:
+                for path in self.directory.glob("*.body"):
+                    stat = path.stat()
+                    bodies.append((stat.st_mtime, path.stem, stat.st_size))
+            except OSError:
+                pass
+            self._sizes = OrderedDict((key, size) for _, key, size in sorted(bodies))
+        return self._sizes
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self._index().values())
+
+    def get(self, key: str) -> tuple[CachedResponse, bytes] | None:
+        """Cached response and body for a key, or None."""
+        try:
+            meta = CachedResponse(**json.loads(self._meta_path(key).read_text()))
+            body = self._body_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Dropping unreadable HTTP cache entry {key}: {e}")
+            self.delete(key)
+            return None
+        index = self._index()
+        if key in index:
+            index.move_to_end(key)
+        try:
+            os.utime(self._body_path(key))
+        except OSError:
+            pass
+        return meta, body
+
+    def store(self, key: str, response: httpx.Response) -> bool:
+        """Store a response if it is cacheable and fits.
+
+        Returns:
+            True if the response was stored
+        """
+        if not is_cacheable(response):
+            return False
+        body = response.content
+        if len(body) > self.max_bytes * MAX_ENTRY_FRACTION:
+            return False
+        meta = CachedResponse(
+            url=str(response.request.url),
+            content_type=response.headers.get("content-type", ""),
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            validated_at=time.time(),
+        )
+        try:
+            self._make_directory()
+            self._write(self._body_path(key), body)
+            self._write(self._meta_path(key), json.dumps(asdict(meta)).encode())
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry: {e}")
+            return False
+        index = self._index()
+        index[key] = len(body)
+        index.move_to_end(key)
+        self._evict()
+        return True
+
+    def refresh(self, key: str, meta: CachedResponse, response: httpx.Response) -> None:
+        """Record a 304 for an entry (new validators replace the old ones)."""
+        meta.validated_at = time.time()
+        meta.etag = response.headers.get("etag") or meta.etag
+        meta.last_modified = response.headers.get("last-modified") or meta.last_modified
+        try:
+            self._write(self._meta_path(key), json.dumps(asdict(meta)).encode())
+        except OSError as e:
+            logger.debug(f"Could not refresh HTTP cache entry: {e}")
+
+    def _make_directory(self) -> None:
+        """Create the cache directory, private to the user."""
+        if self._directory_ready:
+            return
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkdir's mode is masked by the umask and ignored for an existing dir
+        os.chmod(self.directory, 0o700)
+        self._directory_ready = True
+
+    @staticmethod
+    def _write(path: Path, data: bytes) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        # O_CREAT keeps the mode of a leftover file, so start from scratch
+        tmp.unlink(missing_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        tmp.replace(path)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry."""
+        for path in (self._meta_path(key), self._body_path(key)):
+            path.unlink(missing_ok=True)
+        self._index().pop(key, None)
+
+    def _evict(self) -> None:
+        index = self._index()
+        total = sum(index.values())
+        while total > self.max_bytes and index:
+            key, size = next(iter(index.items()))
+            self.delete(key)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for key in list(self._index()):
+            self.delete(key)
+
+    def stats(self) -> dict:
+        """Hit/revalidation/miss counters and size."""
+        lookups = self.hits + self.revalidated + self.misses
+        return {
+            "entries": len(self._index()),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "hit_rate": (
+                round((self.hits + self.revalidated) / lookups, 3) if lookups else 0.0
+            ),
+        }
+
+
+def cached_response(
+    meta: CachedResponse, body: bytes, request: httpx.Request | None = None
+) -> httpx.Response:
+    """Rebuild an httpx response from a cache entry."""
+    headers = {"content-type": meta.content_type} if meta.content_type else {}
+    return httpx.Response(200, headers=headers, content=body, request=request)
+
+
+_cache: ResponseCache | None = None
+_cache_loaded = False
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Process-wide response cache, or None when disabled in config.
+
+    Configured by ``http_cache.enabled`` (default true) and
+    ``http_cache.max_mb`` in config.json.
+    """
+    global _cache, _cache_loaded
+    if not _cache_loaded:
+        _cache_loaded = True
+        from server.utils import load_config
+
+        settings = load_config().get("http_cache", {})
+        if settings.get("enabled", True):
+            max_mb = settings.get("max_mb", MAX_CACHE_BYTES // (1024 * 1024))
+            _cache = ResponseCache(max_bytes=int(max_mb * 1024 * 1024))
+    return _cache
@@ -2,15 +2,281 @@
 
 Provides a consistent interface for making authenticated HTTP requests
 to services like Prometheus, Alertmanager, Kibana, and Quay.
+
+Connections are pooled process-wide: ``get_shared_client()`` hands out one
+``httpx.AsyncClient`` per (origin, auth identity), so short tool calls to the
+same host reuse keep-alive connections (HTTP/2 when ``h2`` is installed)
+instead of paying DNS, TCP and TLS setup each time. Clients unused for
+``IDLE_SECONDS`` are closed. Per-host request and latency counters are
+available from ``get_host_stats()`` and ``debug_tool('http_clients')``.
+
+Clients created with a ``response_cache`` (the service factories below use
+``get_response_cache()``) revalidate repeated GETs with ``ETag`` /
+``Last-Modified`` instead of downloading them again; see server/http_cache.py.
 """
 
+import hashlib
+import importlib.util
+import ssl
+import time
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
 import httpx
 
+from server.debuggable import register_status_provider
+from server.http_cache import (
+    CachedResponse,
+    ResponseCache,
+    cached_response,
+    get_response_cache,
+)
+from server.loop_local import per_loop
+
 Method = Literal["GET", "POST", "DELETE", "PUT", "PATCH"]
 
+# Multiplex requests over one connection when h2 is available
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Connections per pooled client (one client per origin and identity)
+MAX_CONNECTIONS_PER_HOST = 10
+
+# Seconds an idle keep-alive connection stays open (httpx default: 5)
+KEEPALIVE_EXPIRY = 60.0
+
+# Seconds before an unused pooled client is closed
+IDLE_SECONDS = 300.0
+
+
+@dataclass
+class HostStats:
+    """Request counters for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Mean time to response headers in milliseconds."""
+        return self.total_seconds / self.requests * 1000 if self.requests else 0.0
+
+
+# Counters by host, across all pooled clients
+_host_stats: dict[str, HostStats] = {}
+
+
+def get_host_stats() -> dict[str, HostStats]:
+    """Request counters by host for the shared clients."""
+    return dict(_host_stats)
+
+
+def auth_identity(*secrets: str | None) -> str:
+    """Stable, non-reversible identity for the credentials of a client."""
+    if not any(secrets):
+        return ""
+    digest = hashlib.sha256("\0".join(s or "" for s in secrets).encode())
+    return digest.hexdigest()[:16]
+
+
+def _origin(url: str) -> str:
+    parsed = httpx.URL(url)
+    return f"{parsed.scheme}://{parsed.netloc.decode()}"
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """Records per-host counters and activity around a pooled transport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, on_use: Callable[[], None]):
+        self._transport = transport
+        self._on_use = on_use
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self._on_use()
+        stats = _host_stats.setdefault(request.url.host, HostStats())
+        start = time.monotonic()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            stats.requests += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            self._on_use()
+        if response.status_code >= 500:
+            stats.errors += 1
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    last_used: float = field(default_factory=time.monotonic)
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+
+class ClientRegistry:
+    """Pooled httpx clients by (origin, auth identity, TLS verification)."""
+
+    def __init__(
+        self,
+        idle_seconds: float = IDLE_SECONDS,
+        max_connections: int = MAX_CONNECTIONS_PER_HOST,
+        keepalive_expiry: float = KEEPALIVE_EXPIRY,
+    ):
+        self.idle_seconds = idle_seconds
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._clients: dict[tuple[str, str, bool], _PooledClient] = {}
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def _verify(self, verify: bool) -> ssl.SSLContext | bool:
+        # Loading the CA bundle is the slow part of a context; do it once
+        if not verify:
+            return False
+        if self._ssl_context is None:
+            self._ssl_context = httpx.create_ssl_context()
+        return self._ssl_context
+
+    async def get(
+        self,
+        base_url: str,
+        identity: str = "",
+        verify: bool = True,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        timeout: float = 30.0,
+    ) -> httpx.AsyncClient:
+        """Shared client for an origin and identity, created on first use.
+
+        Args:
+            base_url: Any URL on the origin (scheme, host and port are used)
+            identity: Identifies the credentials (see auth_identity()); clients
+                keep cookies, so different identities never share one
+            verify: Verify TLS certificates
+            headers: Default headers (first caller for a key wins)
+            cookies: Default cookies (first caller for a key wins)
+            timeout: Default timeout (first caller for a key wins)
+        """
+        await self.reap_idle()
+        key = (_origin(base_url), identity, verify)
+        entry = self._clients.get(key)
+        if entry is None or entry.client.is_closed:
+            transport = httpx.AsyncHTTPTransport(
+                verify=self._verify(verify), http2=HTTP2, limits=self.limits
+            )
+            client = httpx.AsyncClient(
+                transport=_CountingTransport(transport, lambda: self._touch(key)),
+                headers=headers,
+                cookies=cookies,
+                timeout=timeout,
+            )
+            entry = self._clients[key] = _PooledClient(client)
+        entry.touch()
+        return entry.client
+
+    def _touch(self, key: tuple[str, str, bool]) -> None:
+        entry = self._clients.get(key)
+        if entry is not None:
+            entry.touch()
+
+    async def reap_idle(self) -> int:
+        """Close clients unused for idle_seconds.
+
+        Returns:
+            Number of clients closed
+        """
+        now = time.monotonic()
+        idle = [
+            key
+            for key, entry in self._clients.items()
+            if now - entry.last_used > self.idle_seconds
+        ]
+        for key in idle:
+            await self._clients.pop(key).client.aclose()
+        return len(idle)
+
+    async def close(self) -> None:
+        """Close every client."""
+        clients, self._clients = self._clients, {}
+        for entry in clients.values():
+            await entry.client.aclose()
+
+
+_registries = per_loop(ClientRegistry)
+
+
+def get_client_registry() -> ClientRegistry:
+    """Client registry of the running event loop."""
+    return _registries()
+
+
+async def get_shared_client(base_url: str, **kwargs: Any) -> httpx.AsyncClient:
+    """Shared pooled client (see ClientRegistry.get)."""
+    return await get_client_registry().get(base_url, **kwargs)
+
+
+async def close_shared_clients() -> None:
+    """Close the shared clients of the running event loop (on shutdown)."""
+    registry = _registries.pop()
+    if registry is not None:
+        await registry.close()
+
+
+def http_client_status() -> str:
+    """Markdown status of the shared clients, for debug_tool()."""
+    lines = [
+        "### Shared HTTP clients",
+        "",
+        f"- Pooled clients: {sum(len(r) for r in _registries.values())}",
+        f"- HTTP/2: {'yes' if HTTP2 else 'no (install h2)'}",
+    ]
+    stats = get_host_stats()
+    if stats:
+        lines.extend(
+            [
+                "",
+                "| Host | Requests | Errors | Avg ms | Max ms |",
+                "|---|---|---|---|---|",
+            ]
+        )
+        for host, host_stats in sorted(stats.items()):
+            lines.append(
+                f"| {host} | {host_stats.requests} | {host_stats.errors} "
+                f"| {host_stats.avg_ms:.0f} | {host_stats.max_seconds * 1000:.0f} |"
+            )
+    cache = get_response_cache()
+    if cache is not None:
+        stats = cache.stats()
+        lines.extend(
+            [
+                "",
+                f"- Response cache: {stats['entries']} entries, "
+                f"{stats['bytes'] / 1024 / 1024:.1f} MB, "
+                f"{stats['hits']} fresh hits, {stats['revalidated']} revalidated, "
+                f"{stats['misses']} downloads",
+            ]
+        )
+    return "\n".join(lines)
+
+
+register_status_provider("http_clients", http_client_status)
+
 
 @dataclass
 class APIClient:
@@ -23,6 +289,11 @@ class APIClient:
         # Or with context manager for proper cleanup
         async with APIClient(base_url=url, bearer_token=token) as client:
             success, result = await client.get("/api/v1/query")
+
+        # With a response cache, repeated GETs are revalidated (304) and
+        # max_stale skips the request while the cached copy is young enough
+        client = APIClient(base_url=url, response_cache=get_response_cache())
+        success, result = await client.get("/api/v1/repository", max_stale=60)
     """
 
     base_url: str = ""
@@ -36,7 +307,10 @@ class APIClient:
     auth_error_msg: str = "Authentication required. Refresh your cluster credentials."
     not_found_msg: str = "Not found"
 
-    # Internal client (created lazily)
+    # Conditional-request cache for GETs (None: always download)
+    response_cache: ResponseCache | None = field(default=None, repr=False)
+
+    # Shared pooled client (fetched lazily)
     _client: httpx.AsyncClient | None = field(default=None, repr=False)
 
     def _build_headers(self) -> dict[str, str]:
@@ -58,20 +332,21 @@ class APIClient:
         return f"{base}{endpoint}"
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the shared pooled client for this base URL and token."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
-                follow_redirects=self.follow_redirects,
+            self._client = await get_shared_client(
+                self.base_url,
+                identity=auth_identity(self.bearer_token),
                 verify=self.verify_ssl,
             )
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client.
+
+        The pooled connections stay open for other callers until idle.
+        """
+        self._client = None
 
     async def __aenter__(self) -> "APIClient":
         """Async context manager entry."""
@@ -103,6 +378,7 @@ class APIClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        max_stale: float | None = None,
     ) -> tuple[bool, dict | str]:
         """Make an HTTP request.
 
@@ -112,6 +388,8 @@ class APIClient:
             params: Query parameters
             json: JSON body for POST/PUT/PATCH
             headers: Additional headers (merged with defaults)
+            max_stale: For cached GETs, seconds a cached response may be
+                served without asking the server (default: always revalidate)
 
         Returns:
             Tuple of (success, response_data_or_error_message)
@@ -121,6 +399,22 @@ class APIClient:
         if headers:
             request_headers.update(headers)
 
+        cache_key = None
+        cached = None
+        if self.response_cache is not None and method == "GET":
+            cache_key = self.response_cache.key(
+                str(httpx.URL(url, params=params)),
+                auth_identity(request_headers.get("Authorization")),
+                request_headers.get("Accept", ""),
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                meta, body = cached
+                if max_stale is not None and meta.age() <= max_stale:
+                    self.response_cache.hits += 1
+                    return self._handle_response(cached_response(meta, body))
+                request_headers.update(meta.conditional_headers())
+
         try:
             client = await self._get_client()
             response = await client.request(
@@ -129,7 +423,11 @@ class APIClient:
                 headers=request_headers,
                 params=params,
                 json=json,
+                timeout=self.timeout,
+                follow_redirects=self.follow_redirects,
             )
+            if cache_key is not None:
+                response = self._update_cache(cache_key, cached, response)
             return self._handle_response(response)
         except httpx.TimeoutException:
             return False, f"Request timed out after {self.timeout}s"
@@ -140,14 +438,35 @@ class APIClient:
         except httpx.RequestError as e:
             return False, f"Request error: {e}"
 
+    def _update_cache(
+        self,
+        key: str,
+        cached: tuple[CachedResponse, bytes] | None,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Serve a 304 from the cache, or store a fresh response."""
+        cache = self.response_cache
+        if response.status_code == 304 and cached is not None:
+            meta, body = cached
+            cache.refresh(key, meta, response)
+            cache.revalidated += 1
+            return cached_response(meta, body, response.request)
+        if response.status_code == 200:
+            cache.misses += 1
+            cache.store(key, response)
+        return response
+
     async def get(
         self,
         endpoint: str,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        max_stale: float | None = None,
     ) -> tuple[bool, dict | str]:
-        """Make a GET request."""
-        return await self.request("GET", endpoint, params=params, headers=headers)
+        """Make a GET request (max_stale: see request())."""
+        return await self.request(
+            "GET", endpoint, params=params, headers=headers, max_stale=max_stale
+        )
 
     async def post(
         self,
@@ -198,6 +517,7 @@ def prometheus_client(
         bearer_token=token,
         timeout=timeout,
         auth_error_msg="Authentication required. Run: kube s (or kube p) to authenticate.",
+        response_cache=get_response_cache(),
     )
 
 
@@ -220,6 +540,7 @@ def alertmanager_client(
         bearer_token=token,
         timeout=timeout,
         auth_error_msg="Authentication required. Refresh cluster credentials.",
+        response_cache=get_response_cache(),
     )
 
 
@@ -241,6 +562,7 @@ def kibana_client(
         timeout=timeout,
         extra_headers={"kbn-xsrf": "true"},
         auth_error_msg="Unauthorized - run 'kube s' or 'kube p' to authenticate",
+        response_cache=get_response_cache(),
     )
 
 
@@ -259,6 +581,7 @@ def grafana_client(
         bearer_token=token,
         timeout=timeout,
         auth_error_msg="Authentication required. Run: kube s (or kube p) to authenticate.",
+        response_cache=get_response_cache(),
     )
 
 
@@ -278,4 +601,5 @@ def quay_client(
         base_url=base_url,
         bearer_token=token,
         timeout=timeout,
+        response_cache=get_response_cache(),
     )
@@ -0,0 +1,50 @@
+"""Per-event-loop singletons.
+
+Futures, semaphores, tasks and httpx connection pools belong to the event
+loop that created them, so shared objects built from them are kept one per
+loop. Entries go away with their loop.
+
+Usage:
+    from server.loop_local import per_loop
+
+    _pools = per_loop(ProcessPool)
+
+    def get_process_pool() -> ProcessPool:
+        return _pools()
+"""
+
+import asyncio
+import weakref
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class PerLoop(Generic[T]):
+    """One lazily created object per running event loop."""
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._objects: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __call__(self) -> T:
+        """The running loop's object, created on first use."""
+        loop = asyncio.get_running_loop()
+        if loop not in self._objects:
+            self._objects[loop] = self._factory()
+        return self._objects[loop]
+
+    def pop(self) -> T | None:
+        """Forget the running loop's object and return it (None if unset)."""
+        return self._objects.pop(asyncio.get_running_loop(), None)
+
+    def values(self) -> list[T]:
+        """Objects of all live loops (for status reports)."""
+        return list(self._objects.values())
+
+
+def per_loop(factory: Callable[[], T]) -> PerLoop[T]:
+    """Getter for one ``factory()`` object per running event loop."""
+    return PerLoop(factory)
@@ -526,6 +526,14 @@ async def run_mcp_server(server: FastMCP, enable_scheduler: bool = True):
     except Exception as e:
         logger.warning(f"Failed to initialize memory abstraction: {e}")
 
+    # Let the hot-reload proxy swap changed tool modules without a restart
+    try:
+        from .hot_reload import install_reload_handler
+
+        install_reload_handler()
+    except Exception as e:
+        logger.warning(f"Failed to enable in-process reload: {e}")
+
     try:
         await server.run_stdio_async()
     finally:
@@ -543,6 +551,14 @@ async def run_mcp_server(server: FastMCP, enable_scheduler: bool = True):
         if scheduler_started:
             await stop_scheduler()
 
+        # Close pooled HTTP connections
+        try:
+            from .http_client import close_shared_clients
+
+            await close_shared_clients()
+        except Exception as e:
+            logger.warning(f"Error closing HTTP clients: {e}")
+
 
 def main():
     """Main entry point with tool selection."""
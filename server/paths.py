@@ -41,6 +41,9 @@ WORKSPACE_STATES_FILE = AA_CONFIG_DIR / "workspace_states.json"
 # Cache for expensive sync operations
 SYNC_CACHE_FILE = AA_CONFIG_DIR / "sync_cache.json"
 
+# Conditional-request cache of API responses (server/http_cache.py)
+HTTP_CACHE_DIR = AA_CONFIG_DIR / "http_cache"
+
 # =============================================================================
 # Per-Service State Files (NEW - each service owns its own file)
 # =============================================================================
@@ -19,6 +19,8 @@ Usage:
 import asyncio
 import importlib.util
 import logging
+import sys
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import yaml
@@ -40,6 +42,7 @@ from .tool_paths import (  # noqa: E402
     TOOLS_EXTRA_FILE,
     TOOLS_FILE,
     TOOLS_STYLE_FILE,
+    get_module_dir,
     get_tools_file_path,
 )
 
@@ -139,6 +142,33 @@ CORE_TOOLS = {
     "memory_list_adapters",
 }
 
+# Tool packages that are never reloaded in place: they hold server-wide state
+# (scheduler, workspace registry, persona tools) that a second copy of the
+# module would split. Changes to them need a full server restart.
+IN_PROCESS_RELOAD_EXCLUDED = {"aa_workflow"}
+
+
+def _purge_package_modules(package_dir: Path) -> int:
+    """Drop cached imports from a tool package so a reload re-executes them.
+
+    Returns:
+        Number of sys.modules entries removed
+    """
+    package_dir = package_dir.resolve()
+    stale = []
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if not module_file:
+            continue
+        try:
+            Path(module_file).resolve().relative_to(package_dir)
+        except ValueError:
+            continue
+        stale.append(name)
+    for name in stale:
+        sys.modules.pop(name, None)
+    return len(stale)
+
 
 class PersonaLoader:
     """Manages dynamic persona/tool loading."""
@@ -239,6 +269,61 @@ class PersonaLoader:
 
         return len(tools_to_remove)
 
+    async def reload_tool_packages(self, packages: set[str]) -> dict:
+        """
+        Reload the loaded tool modules of changed packages in place.
+
+        Each loaded module (e.g. ``git_basic``) whose package (``aa_git``) is
+        in ``packages`` has its tools removed and re-registered from fresh
+        source. Cached imports from the package are purged first so helper
+        modules are re-executed too. The caller is responsible for telling
+        the client that the tool list changed.
+
+        Args:
+            packages: Tool package directory names, e.g. {"aa_git"}
+
+        Returns:
+            dict with success, reloaded ({module: tool count}) and errors
+        """
+        excluded = sorted(packages & IN_PROCESS_RELOAD_EXCLUDED)
+        if excluded:
+            return {
+                "success": False,
+                "reloaded": {},
+                "errors": [f"{p} cannot be reloaded in place" for p in excluded],
+            }
+
+        modules = sorted(
+            m for m in self.loaded_modules if get_module_dir(m).name in packages
+        )
+        for package in packages:
+            purged = _purge_package_modules(TOOL_MODULES_DIR / package)
+            logger.debug(f"Purged {purged} cached module(s) from {package}")
+
+        reloaded: dict[str, int] = {}
+        errors: list[str] = []
+        new_tools: set[str] = set()
+        for module_name in modules:
+            removed = await self._unload_module_tools(module_name)
+            tools = await self._load_tool_module(module_name)
+            if not tools:
+                errors.append(f"{module_name} registered no tools after reload")
+            reloaded[module_name] = len(tools)
+            new_tools.update(tools)
+            logger.info(
+                f"Reloaded {module_name} in place: {removed} -> {len(tools)} tools"
+            )
+
+        if new_tools:
+            try:
+                from .debuggable import wrap_server_tools_runtime
+
+                wrap_server_tools_runtime(self.server, tool_names=new_tools)
+            except Exception as e:
+                logger.warning(f"Could not wrap reloaded tools: {e}")
+
+        return {"success": not errors, "reloaded": reloaded, "errors": errors}
+
     async def _clear_non_core_tools(self) -> int:
         """Remove all tools except core ones."""
         all_tools = list(await self.server.list_tools())
@@ -0,0 +1,306 @@
+"""Asyncio subprocess runner with streaming output and a bounded process pool.
+
+run_cmd() and friends used ``asyncio.to_thread(subprocess.run, ...)``: each
+command held a default-executor thread for its whole lifetime, buffered all
+output in memory and nothing limited how many processes ran at once. This
+runner uses ``asyncio.create_subprocess_exec`` instead:
+
+- stdout/stderr are read incrementally and can be streamed line by line to
+  a callback (``kubectl logs``, ``bonfire deploy``, ``podman build``)
+- each stream keeps at most ``max_output`` bytes in memory; past that the
+  full output spills to a temp file and only the tail is kept
+- a global limit and per-binary limits bound concurrent processes
+- commands start in their own process group, so a timeout kills the whole
+  tree (SIGTERM, then SIGKILL after a grace period)
+
+Usage:
+    from server.process_runner import run_process
+
+    result = await run_process(["kubectl", "logs", "-f", pod], timeout=300,
+                               on_output=lambda stream, line: print(line))
+    if result.ok:
+        ...
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import signal
+import tempfile
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from server.loop_local import per_loop
+
+logger = logging.getLogger(__name__)
+
+# Concurrent processes across the whole server
+MAX_PROCESSES = 16
+
+# Concurrent processes per binary, for binaries not listed below
+DEFAULT_PER_BINARY = 8
+
+# Heavy binaries get tighter limits
+PER_BINARY_LIMITS = {
+    "podman": 2,
+    "docker": 2,
+    "bonfire": 4,
+}
+
+# Bytes of each stream kept in memory before spilling to a file
+MAX_OUTPUT_BYTES = 8 * 1024 * 1024
+
+# Seconds between SIGTERM and SIGKILL on timeout
+KILL_GRACE_SECONDS = 2.0
+
+_READ_CHUNK = 64 * 1024
+
+OutputCallback = Callable[[str, str], Any]
+
+
+@dataclass
+class ProcessResult:
+    """Outcome of one command."""
+
+    returncode: int | None
+    stdout: str
+    stderr: str
+    timed_out: bool = False
+    stdout_file: str | None = None
+    stderr_file: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the command finished with exit code 0."""
+        return self.returncode == 0 and not self.timed_out
+
+
+class _OutputBuffer:
+    """Collects one stream, spilling to a temp file past the cap."""
+
+    def __init__(self, name: str, max_bytes: int):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.path: str | None = None
+        self._chunks: deque[bytes] = deque()
+        self._size = 0
+        self._total = 0
+        self._file = None
+
+    def write(self, data: bytes) -> None:
+        self._total += len(data)
+        if self._file is None and self._size + len(data) > self.max_bytes:
+            self._spill()
+        if self._file is not None:
+            self._file.write(data)
+
+        self._chunks.append(data)
+        self._size += len(data)
+        if self._file is not None:
+            # The file has everything; keep only the recent tail in memory
+            while self._size - len(self._chunks[0]) >= self.max_bytes:
+                self._size -= len(self._chunks.popleft())
+
+    def _spill(self) -> None:
+        self._file = tempfile.NamedTemporaryFile(
+            prefix=f"aa-cmd-{self.name}-", suffix=".log", delete=False
+        )
+        self.path = self._file.name
+        for chunk in self._chunks:
+            self._file.write(chunk)
+
+    def text(self) -> str:
+        data = b"".join(self._chunks)
+        if self._file is None:
+            return data.decode(errors="replace")
+
+        self._file.close()
+        tail = data[-self.max_bytes :]
+        omitted = self._total - len(tail)
+        return (
+            f"[... {omitted} bytes omitted, full output in {self.path}]\n"
+            + tail.decode(errors="replace")
+        )
+
+
+class ProcessPool:
+    """Global and per-binary concurrency limits for subprocesses."""
+
+    def __init__(
+        self,
+        max_processes: int = MAX_PROCESSES,
+        per_binary: dict[str, int] | None = None,
+        default_per_binary: int = DEFAULT_PER_BINARY,
+    ):
+        self.max_processes = max_processes
+        self.per_binary = PER_BINARY_LIMITS if per_binary is None else per_binary
+        self.default_per_binary = default_per_binary
+        self._global = asyncio.Semaphore(max_processes)
+        self._binaries: dict[str, asyncio.Semaphore] = {}
+        self.running = 0
+
+    def _binary_semaphore(self, binary: str) -> asyncio.Semaphore:
+        if binary not in self._binaries:
+            limit = self.per_binary.get(binary, self.default_per_binary)
+            self._binaries[binary] = asyncio.Semaphore(limit)
+        return self._binaries[binary]
+
+    async def run(
+        self,
+        argv: list[str],
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+        timeout: float | None = None,
+        on_output: OutputCallback | None = None,
+        max_output: int = MAX_OUTPUT_BYTES,
+        stdin: bytes | None = None,
+    ) -> ProcessResult:
+        """Run a command once a slot is free.
+
+        Args:
+            argv: Command and arguments
+            cwd: Working directory
+            env: Full environment (default: inherit)
+            timeout: Seconds before the process group is killed; waiting
+                for a slot does not count
+            on_output: Called with ("stdout" | "stderr", line) as output
+                arrives; may be a coroutine function
+            max_output: Bytes of each stream kept in memory
+            stdin: Data written to the process's stdin
+
+        Returns:
+            ProcessResult
+
+        Raises:
+            FileNotFoundError: The binary (or cwd) does not exist
+        """
+        binary = os.path.basename(argv[0])
+        # Wait for the binary's slot first, so callers queued behind a per-binary
+        # limit don't hold global slots other commands could use
+        async with self._binary_semaphore(binary), self._global:
+            self.running += 1
+            try:
+                return await self._run(
+                    argv, cwd, env, timeout, on_output, max_output, stdin
+                )
+            finally:
+                self.running -= 1
+
+    async def _run(
+        self,
+        argv: list[str],
+        cwd: str | None,
+        env: dict[str, str] | None,
+        timeout: float | None,
+        on_output: OutputCallback | None,
+        max_output: int,
+        stdin: bytes | None,
+    ) -> ProcessResult:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            cwd=cwd,
+            env=env,
+            stdin=(
+                asyncio.subprocess.PIPE
+                if stdin is not None
+                else asyncio.subprocess.DEVNULL
+            ),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            start_new_session=True,
+        )
+        stdout = _OutputBuffer("stdout", max_output)
+        stderr = _OutputBuffer("stderr", max_output)
+
+        async def communicate() -> None:
+            if stdin is not None:
+                proc.stdin.write(stdin)
+                await proc.stdin.drain()
+                proc.stdin.close()
+            await asyncio.gather(
+                _pump(proc.stdout, stdout, on_output),
+                _pump(proc.stderr, stderr, on_output),
+            )
+            await proc.wait()
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(communicate(), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await _kill_group(proc)
+        except BaseException:
+            # Cancelled: don't leave the process tree running
+            await _kill_group(proc)
+            raise
+
+        return ProcessResult(
+            returncode=proc.returncode,
+            stdout=stdout.text(),
+            stderr=stderr.text(),
+            timed_out=timed_out,
+            stdout_file=stdout.path,
+            stderr_file=stderr.path,
+        )
+
+
+async def _pump(
+    stream: asyncio.StreamReader,
+    buffer: _OutputBuffer,
+    on_output: OutputCallback | None,
+) -> None:
+    """Copy a stream into its buffer, emitting complete lines."""
+    pending = b""
+    while True:
+        data = await stream.read(_READ_CHUNK)
+        if not data:
+            break
+        buffer.write(data)
+        if on_output is None:
+            continue
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            await _emit(on_output, buffer.name, line)
+    if on_output is not None and pending:
+        await _emit(on_output, buffer.name, pending)
+
+
+async def _emit(on_output: OutputCallback, name: str, line: bytes) -> None:
+    try:
+        result = on_output(name, line.decode(errors="replace"))
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        logger.debug(f"Output callback failed: {e}")
+
+
+async def _kill_group(proc: asyncio.subprocess.Process) -> None:
+    """SIGTERM the process group, then SIGKILL if it does not exit."""
+    if proc.returncode is not None:
+        return
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            return
+        try:
+            await asyncio.wait_for(proc.wait(), KILL_GRACE_SECONDS)
+            return
+        except asyncio.TimeoutError:
+            continue
+
+
+_pools = per_loop(ProcessPool)
+
+
+def get_process_pool() -> ProcessPool:
+    """Get the process pool of the running event loop."""
+    return _pools()
+
+
+async def run_process(argv: list[str], **kwargs: Any) -> ProcessResult:
+    """Run a command on the shared process pool (see ProcessPool.run)."""
+    return await get_process_pool().run(argv, **kwargs)
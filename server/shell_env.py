@@ -0,0 +1,200 @@
+"""Cached login-shell environment for command execution.
+
+run_cmd() used to wrap every command in ``bash -c "source ~/.bashrc; ..."``,
+so each git/kubectl/glab call re-ran the user's whole shell init first. This
+module runs the init once, captures the resulting environment and the names
+of the shell functions it defines, and caches the snapshot until one of the
+rc files changes (or the snapshot gets old).
+
+Commands that resolve to a binary on the snapshot's PATH are then exec'd
+directly with the snapshot's environment; only shell functions (``kube``,
+``kube-clean``) and builtins still need bash with the rc files sourced.
+
+Usage:
+    from server.shell_env import ShellEnvironment
+
+    shell_env = ShellEnvironment(home, sources=..., base_env=...)
+    snapshot = shell_env.get()
+    if snapshot and snapshot.can_exec(cmd[0]):
+        subprocess.run(cmd, env=snapshot.env)
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Recapture at least this often, for rc files that read other files
+SNAPSHOT_MAX_AGE = 900
+
+# Capturing runs the full shell init once
+CAPTURE_TIMEOUT = 30
+
+# Set by bash itself, not by the rc files
+_SHELL_VARIABLES = ("_", "SHLVL", "PWD", "OLDPWD")
+
+_ENV_MARKER = b"__AA_SHELL_ENV__\0"
+_FUNCS_MARKER = b"__AA_SHELL_FUNCS__\0"
+
+
+@dataclass
+class ShellSnapshot:
+    """Environment and functions of a sourced shell."""
+
+    env: dict[str, str]
+    functions: frozenset[str]
+    signature: tuple
+    captured_at: float = field(default_factory=time.monotonic)
+    _which: dict[str, str | None] = field(default_factory=dict, repr=False)
+
+    def which(self, name: str) -> str | None:
+        """Resolve a command on the snapshot's PATH (memoized)."""
+        if name not in self._which:
+            self._which[name] = shutil.which(name, path=self.env.get("PATH"))
+        return self._which[name]
+
+    def can_exec(self, name: str) -> bool:
+        """True if a command can run without bash (a binary, not a function)."""
+        return name not in self.functions and self.which(name) is not None
+
+
+class ShellEnvironment:
+    """Captures and caches the environment of the user's shell init."""
+
+    def __init__(
+        self,
+        home: Path,
+        sources: Callable[[Path], list[str]],
+        base_env: Callable[[Path], dict[str, str]],
+        max_age: float = SNAPSHOT_MAX_AGE,
+    ):
+        """Initialize the service.
+
+        Args:
+            home: User home directory
+            sources: Builds the ``source ...`` commands for the rc files
+            base_env: Builds the environment the shell starts with
+            max_age: Seconds before a snapshot is recaptured regardless
+        """
+        self.home = home
+        self._sources = sources
+        self._base_env = base_env
+        self.max_age = max_age
+        self._snapshot: ShellSnapshot | None = None
+        self._failed_signature: tuple | None = None
+        self._lock = threading.Lock()
+
+    def rc_files(self) -> list[Path]:
+        """Files whose changes invalidate the snapshot."""
+        files = [self.home / ".bashrc", self.home / ".bashrc.d"]
+        bashrc_d = self.home / ".bashrc.d"
+        if bashrc_d.is_dir():
+            files.extend(sorted(bashrc_d.rglob("*")))
+        return files
+
+    def signature(self) -> tuple:
+        """Stat of the rc files plus the process environment."""
+        stats = []
+        for path in self.rc_files():
+            try:
+                st = path.stat()
+                stats.append((str(path), st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append((str(path), None, None))
+        return (tuple(stats), hash(frozenset(os.environ.items())))
+
+    def _is_fresh(self, snapshot: ShellSnapshot | None, signature: tuple) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.signature == signature
+            and time.monotonic() - snapshot.captured_at <= self.max_age
+        )
+
+    def is_stale(self) -> bool:
+        """True if the next ``get()`` has to (re)capture the shell."""
+        return not self._is_fresh(self._snapshot, self.signature())
+
+    def get(self) -> ShellSnapshot | None:
+        """Current snapshot, capturing the shell if needed.
+
+        Returns:
+            Snapshot, or None if the shell could not be captured (callers
+            then fall back to sourcing the rc files per command)
+        """
+        signature = self.signature()
+        if self._is_fresh(self._snapshot, signature):
+            return self._snapshot
+        if signature == self._failed_signature:
+            return None
+
+        with self._lock:
+            # Another thread may have captured it while we waited
+            if self._is_fresh(self._snapshot, signature):
+                return self._snapshot
+            self._snapshot = self._capture(signature)
+            self._failed_signature = None if self._snapshot else signature
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the snapshot so the next command recaptures the shell."""
+        self._snapshot = None
+        self._failed_signature = None
+
+    def _capture(self, signature: tuple) -> ShellSnapshot | None:
+        """Source the rc files in bash and read back env and functions."""
+        script = "; ".join(
+            [
+                *self._sources(self.home),
+                f"printf '%s\\0' {_ENV_MARKER[:-1].decode()}",
+                "env -0",
+                f"printf '%s\\0' {_FUNCS_MARKER[:-1].decode()}",
+                "declare -F",
+            ]
+        )
+        start = time.monotonic()
+        try:
+            result = subprocess.run(
+                ["bash", "-c", script],
+                capture_output=True,
+                timeout=CAPTURE_TIMEOUT,
+                env=self._base_env(self.home),
+                stdin=subprocess.DEVNULL,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Could not capture shell environment: {e}")
+            return None
+
+        # rc files may print to stdout, so only read after the marker
+        _, found, output = result.stdout.partition(_ENV_MARKER)
+        env_part, found_funcs, funcs_part = output.partition(_FUNCS_MARKER)
+        if not found or not found_funcs:
+            logger.warning(
+                "Could not capture shell environment: "
+                f"{result.stderr.decode(errors='replace')[-200:]}"
+            )
+            return None
+
+        env = {}
+        for entry in env_part.split(b"\0"):
+            name, sep, value = entry.decode(errors="surrogateescape").partition("=")
+            if sep and name not in _SHELL_VARIABLES:
+                env[name] = value
+
+        functions = frozenset(
+            line.split()[-1]
+            for line in funcs_part.decode(errors="replace").splitlines()
+            if line.startswith("declare -f")
+        )
+
+        logger.info(
+            f"Captured shell environment: {len(env)} variables, "
+            f"{len(functions)} functions in {time.monotonic() - start:.2f}s"
+        )
+        return ShellSnapshot(env=env, functions=functions, signature=signature)
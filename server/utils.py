@@ -8,10 +8,14 @@ import asyncio
 import logging
 import os
 import subprocess
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import Awaitable, Callable, TypeVar, cast
 
 from server.error_patterns import AUTH_PATTERNS
+from server.process_runner import OutputCallback, run_process
+from server.shell_env import ShellEnvironment, ShellSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -277,11 +281,102 @@ def get_cluster_short_name(environment: str) -> str:
     return KUBECONFIG_MAP.get(environment.lower(), environment.lower())
 
 
-async def check_cluster_auth(environment: str) -> bool:
+# Seconds a successful auth probe is trusted (unless the kubeconfig changes
+# or a command reports an auth error first)
+AUTH_CACHE_TTL = 300
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _AuthState:
+    """A successful auth probe for one kubeconfig."""
+
+    mtime_ns: int
+    valid_until: float
+
+
+# Auth state by kubeconfig path
+_auth_cache: dict[str, _AuthState] = {}
+
+# In-flight probes/refreshes, so concurrent callers share one
+_auth_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+
+def _kubeconfig_mtime(kubeconfig: str) -> int | None:
+    try:
+        return os.stat(kubeconfig).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _remember_auth(kubeconfig: str) -> None:
+    """Trust the kubeconfig's current credentials for AUTH_CACHE_TTL."""
+    mtime_ns = _kubeconfig_mtime(kubeconfig)
+    if mtime_ns is not None:
+        _auth_cache[kubeconfig] = _AuthState(
+            mtime_ns, time.monotonic() + AUTH_CACHE_TTL
+        )
+
+
+def _auth_cached(kubeconfig: str) -> bool:
+    """True if a recent probe of this kubeconfig (unchanged since) succeeded."""
+    state = _auth_cache.get(kubeconfig)
+    if state is None:
+        return False
+    if (
+        time.monotonic() > state.valid_until
+        or _kubeconfig_mtime(kubeconfig) != state.mtime_ns
+    ):
+        _auth_cache.pop(kubeconfig, None)
+        return False
+    return True
+
+
+def invalidate_cluster_auth(
+    environment: str | None = None, kubeconfig: str | None = None
+) -> None:
+    """Forget cached auth, e.g. after a command failed with an auth error.
+
+    Args:
+        environment: Environment whose kubeconfig to forget
+        kubeconfig: Kubeconfig path to forget (all if neither is given)
+    """
+    if kubeconfig is None and environment is None:
+        _auth_cache.clear()
+        return
+    if kubeconfig is None:
+        kubeconfig = get_kubeconfig(cast(str, environment))
+    _auth_cache.pop(kubeconfig, None)
+
+
+async def _single_flight(
+    key: tuple[str, str], factory: Callable[[], Awaitable[_T]]
+) -> _T:
+    """Run factory() once for concurrent callers with the same key."""
+    task = _auth_inflight.get(key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(factory())
+        _auth_inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if _auth_inflight.get(key) is finished:
+                del _auth_inflight[key]
+
+        task.add_done_callback(_done)
+    # Shield so one cancelled caller does not cancel the others
+    return await asyncio.shield(task)
+
+
+async def check_cluster_auth(environment: str, use_cache: bool = True) -> bool:
     """Check if cluster authentication is valid.
 
+    A successful probe is trusted for AUTH_CACHE_TTL seconds while the
+    kubeconfig is unchanged; concurrent checks share one probe.
+
     Args:
         environment: Environment name (stage, production, ephemeral, etc.)
+        use_cache: If False, always probe the cluster
 
     Returns:
         True if auth is valid, False otherwise.
@@ -290,20 +385,29 @@ async def check_cluster_auth(environment: str) -> bool:
 
     if not os.path.exists(kubeconfig):
         logger.info(f"Kubeconfig not found: {kubeconfig}")
+        _auth_cache.pop(kubeconfig, None)
         return False
 
+    if use_cache and _auth_cached(kubeconfig):
+        return True
+
+    return await _single_flight(
+        ("probe", kubeconfig), lambda: _probe_cluster_auth(environment, kubeconfig)
+    )
+
+
+async def _probe_cluster_auth(environment: str, kubeconfig: str) -> bool:
+    """Probe the cluster with ``oc whoami`` and cache a success."""
     # Quick auth check using oc whoami
     try:
-        result = await asyncio.to_thread(
-            subprocess.run,
+        result = await run_process(
             ["oc", "whoami"],
-            capture_output=True,
-            text=True,
             timeout=10,
             env={**os.environ, "KUBECONFIG": kubeconfig},
         )
-        if result.returncode == 0:
+        if result.ok:
             logger.info(f"Auth valid for {environment}: {result.stdout.strip()}")
+            _remember_auth(kubeconfig)
             return True
         else:
             logger.info(f"Auth check failed for {environment}: {result.stderr.strip()}")
@@ -352,6 +456,8 @@ async def ensure_cluster_auth(
 ) -> tuple[bool, str]:
     """Ensure cluster authentication is valid, optionally refreshing if needed.
 
+    Concurrent callers needing a refresh share one ``kube`` login.
+
     Args:
         environment: Environment name (stage, production, ephemeral, etc.)
         auto_refresh: If True, automatically refresh auth if expired (default: True)
@@ -365,8 +471,19 @@ async def ensure_cluster_auth(
     if not auto_refresh:
         return False, f"Authentication expired for {environment} cluster."
 
-    logger.info(f"Auth expired for {environment}, attempting refresh...")
-    if await refresh_cluster_auth(environment):
+    kubeconfig = get_kubeconfig(environment)
+
+    async def refresh() -> bool:
+        # Another caller's refresh may have finished while we probed
+        if _auth_cached(kubeconfig):
+            return True
+        logger.info(f"Auth expired for {environment}, attempting refresh...")
+        if await refresh_cluster_auth(environment):
+            _remember_auth(kubeconfig)
+            return True
+        return False
+
+    if await _single_flight(("refresh", kubeconfig), refresh):
         return True, ""
 
     short_name = get_cluster_short_name(environment)
@@ -499,6 +616,7 @@ async def run_cmd(
     timeout: int = 60,
     check: bool = False,
     use_shell: bool = True,
+    on_output: OutputCallback | None = None,
 ) -> tuple[bool, str]:
     """Run a command asynchronously through user's shell environment.
 
@@ -507,14 +625,20 @@ async def run_cmd(
     - Proper PATH with ~/bin
     - GUI access (DISPLAY, XAUTHORITY) for browser-based auth
 
+    The shell environment is captured once and cached (see server/shell_env.py),
+    so binaries run directly with it; only shell functions such as ``kube``
+    are run through bash with the configs sourced.
+
     Args:
         cmd: Command and arguments as list
         cwd: Working directory
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
         check: Raise exception on non-zero exit
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the user's shell environment.
                    Set to False only for simple commands that don't need shell env.
+        on_output: Called with ("stdout" | "stderr", line) as output arrives,
+                   for long-running commands like ``kubectl logs -f``
 
     Returns:
         Tuple of (success, output) - stderr is merged with stdout on failure
@@ -532,43 +656,19 @@ async def run_cmd(
         # Simple command that doesn't need shell (rare)
         success, output = await run_cmd(["git", "status"], use_shell=False)
     """
-    import shlex
-
     try:
-        home = Path.home()
-
-        if use_shell:
-            # Build command string with proper quoting
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            # Source shell configs
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None  # cwd is handled in the command string
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
+        snapshot = await _get_shell_snapshot() if use_shell else None
+        shell_cmd, run_env, run_cwd = _build_invocation(cmd, cwd, use_shell, snapshot)
 
         # Merge any additional env vars
         if env:
             run_env.update(env)
 
-        result = await asyncio.to_thread(
-            subprocess.run,
-            shell_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=run_cwd,
-            env=run_env,
+        result = await run_process(
+            shell_cmd, cwd=run_cwd, env=run_env, timeout=timeout, on_output=on_output
         )
+        if result.timed_out:
+            return False, f"Command timed out after {timeout}s"
 
         output = result.stdout
         if result.returncode != 0:
@@ -578,10 +678,8 @@ async def run_cmd(
             return False, output
 
         return True, output
-    except subprocess.TimeoutExpired:
-        return False, f"Command timed out after {timeout}s"
     except FileNotFoundError:
-        return False, f"Command not found: {cmd[0]}"
+        return False, _not_found_message(cmd, cwd)
     except subprocess.CalledProcessError:
         raise
     except Exception as e:
@@ -594,6 +692,7 @@ async def run_cmd_full(
     env: dict[str, str] | None = None,
     timeout: int = 300,
     use_shell: bool = True,
+    on_output: OutputCallback | None = None,
 ) -> tuple[bool, str, str]:
     """Run a command asynchronously with separate stdout/stderr.
 
@@ -604,51 +703,28 @@ async def run_cmd_full(
         cwd: Working directory
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the user's shell environment.
+        on_output: Called with ("stdout" | "stderr", line) as output arrives
 
     Returns:
         Tuple of (success, stdout, stderr)
     """
-    import shlex
-
     try:
-        home = Path.home()
-
-        if use_shell:
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
+        snapshot = await _get_shell_snapshot() if use_shell else None
+        shell_cmd, run_env, run_cwd = _build_invocation(cmd, cwd, use_shell, snapshot)
 
         if env:
             run_env.update(env)
 
-        result = await asyncio.to_thread(
-            subprocess.run,
-            shell_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=run_cwd,
-            env=run_env,
+        result = await run_process(
+            shell_cmd, cwd=run_cwd, env=run_env, timeout=timeout, on_output=on_output
         )
+        if result.timed_out:
+            return False, result.stdout, f"Command timed out after {timeout}s"
 
-        return result.returncode == 0, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return False, "", f"Command timed out after {timeout}s"
+        return result.ok, result.stdout, result.stderr
     except FileNotFoundError:
-        return False, "", f"Command not found: {cmd[0]}"
+        return False, "", _not_found_message(cmd, cwd)
     except Exception as e:
         return False, "", str(e)
 
@@ -669,32 +745,14 @@ def run_cmd_sync(
         cwd: Working directory
         env: Additional environment variables (merged with shell env)
         timeout: Timeout in seconds
-        use_shell: If True (default), run through bash with sourced configs.
+        use_shell: If True (default), run with the user's shell environment.
 
     Returns:
         Tuple of (success, output) - stderr is merged with stdout on failure
     """
-    import shlex
-
     try:
-        home = Path.home()
-
-        if use_shell:
-            cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
-            if cwd:
-                cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
-
-            sources = _build_shell_sources(home)
-            if sources:
-                cmd_str = f"{'; '.join(sources)}; {cmd_str}"
-
-            shell_cmd = ["bash", "-c", cmd_str]
-            run_env = _prepare_shell_environment(home)
-            run_cwd = None
-        else:
-            shell_cmd = cmd
-            run_env = os.environ.copy()
-            run_cwd = cwd
+        snapshot = get_shell_environment().get() if use_shell else None
+        shell_cmd, run_env, run_cwd = _build_invocation(cmd, cwd, use_shell, snapshot)
 
         if env:
             run_env.update(env)
@@ -717,11 +775,85 @@ def run_cmd_sync(
     except subprocess.TimeoutExpired:
         return False, f"Command timed out after {timeout}s"
     except FileNotFoundError:
-        return False, f"Command not found: {cmd[0]}"
+        return False, _not_found_message(cmd, cwd)
     except Exception as e:
         return False, str(e)
 
 
+# Shell environment snapshots, by home directory
+_shell_environments: dict[Path, ShellEnvironment] = {}
+
+
+def get_shell_environment() -> ShellEnvironment:
+    """Get the cached shell environment service for the current user."""
+    home = Path.home()
+    if home not in _shell_environments:
+        _shell_environments[home] = ShellEnvironment(
+            home,
+            sources=_build_shell_sources,
+            base_env=_prepare_shell_environment,
+        )
+    return _shell_environments[home]
+
+
+async def _get_shell_snapshot() -> ShellSnapshot | None:
+    """Shell snapshot for async callers (captures off the event loop)."""
+    shell_env = get_shell_environment()
+    if shell_env.is_stale():
+        return await asyncio.to_thread(shell_env.get)
+    return shell_env.get()
+
+
+def _build_invocation(
+    cmd: list[str],
+    cwd: str | None,
+    use_shell: bool,
+    snapshot: ShellSnapshot | None,
+) -> tuple[list[str], dict[str, str], str | None]:
+    """Build argv, environment and cwd for running a command.
+
+    In shell mode, commands that resolve to a binary are exec'd directly
+    with the cached shell environment. Shell functions (e.g. ``kube``),
+    builtins and anything when no snapshot is available go through bash
+    with the rc files sourced.
+
+    Returns:
+        Tuple of (argv, env, cwd)
+    """
+    import shlex
+
+    if not use_shell:
+        return cmd, os.environ.copy(), cwd
+
+    if snapshot is not None and cmd and snapshot.can_exec(cmd[0]):
+        run_env = dict(snapshot.env)
+        if cwd:
+            run_env["PWD"] = cwd
+        return cmd, run_env, cwd
+
+    home = Path.home()
+
+    # Build command string with proper quoting
+    cmd_str = " ".join(shlex.quote(arg) for arg in cmd)
+    if cwd:
+        cmd_str = f"cd {shlex.quote(cwd)} && {cmd_str}"
+
+    # Source shell configs
+    sources = _build_shell_sources(home)
+    if sources:
+        cmd_str = f"{'; '.join(sources)}; {cmd_str}"
+
+    # cwd is handled in the command string
+    return ["bash", "-c", cmd_str], _prepare_shell_environment(home), None
+
+
+def _not_found_message(cmd: list[str], cwd: str | None) -> str:
+    """Error for FileNotFoundError, which also covers a missing cwd."""
+    if cwd and not os.path.isdir(cwd):
+        return f"Directory not found: {cwd}"
+    return f"Command not found: {cmd[0]}"
+
+
 def _build_shell_sources(home: Path) -> list[str]:
     """Build list of shell config source commands.
 
@@ -907,9 +1039,12 @@ async def run_kubectl(
     success, output = await run_cmd(cmd, timeout=timeout)
 
     # Add hint on auth failures (even though we pre-checked, token could expire mid-operation)
-    if not success and is_auth_error(output) and resolved_env:
-        hint = get_auth_hint(resolved_env)
-        output = f"{output}\n\n{hint}"
+    if not success and is_auth_error(output):
+        invalidate_cluster_auth(kubeconfig=kubeconfig)
+        if resolved_env:
+            invalidate_cluster_auth(resolved_env)
+            hint = get_auth_hint(resolved_env)
+            output = f"{output}\n\n{hint}"
 
     return success, output
 
@@ -937,7 +1072,10 @@ async def run_oc(
     if namespace:
         cmd.extend(["-n", namespace])
 
-    return await run_cmd(cmd, timeout=timeout)
+    success, output = await run_cmd(cmd, timeout=timeout)
+    if not success and is_auth_error(output):
+        invalidate_cluster_auth(kubeconfig=kubeconfig)
+    return success, output
 
 
 # ==================== User Config ====================
@@ -26,6 +26,7 @@ import logging
 import os
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -33,6 +34,11 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scripts.file_watcher import FileWatcher  # noqa: E402
+
 EXTENSION_DIR = PROJECT_ROOT / "extensions" / "aa_workflow_vscode"
 EXTENSION_SRC = EXTENSION_DIR / "src"
 WATCH_EXTENSIONS = {".ts", ".json"}
@@ -92,27 +98,13 @@ def compile_extension() -> bool:
         return False
 
 
-def get_file_mtimes() -> dict[Path, float]:
-    """Get modification times of watched files."""
-    mtimes = {}
-
-    # Watch src/*.ts files
-    for ext in WATCH_EXTENSIONS:
-        for f in EXTENSION_SRC.rglob(f"*{ext}"):
-            try:
-                mtimes[f] = f.stat().st_mtime
-            except OSError as exc:
-                logger.debug("OS operation failed: %s", exc)
-
-    # Also watch package.json
-    package_json = EXTENSION_DIR / "package.json"
-    if package_json.exists():
-        try:
-            mtimes[package_json] = package_json.stat().st_mtime
-        except OSError as exc:
-            logger.debug("OS operation failed: %s", exc)
-
-    return mtimes
+def create_watcher() -> FileWatcher:
+    """Watcher for src/ (*.ts, *.json) and package.json."""
+    return FileWatcher(
+        [EXTENSION_SRC, EXTENSION_DIR / "package.json"],
+        WATCH_EXTENSIONS,
+        DEBOUNCE_SECONDS,
+    )
 
 
 def main():
@@ -124,60 +116,37 @@ def main():
     log("Press Ctrl+C to stop")
     log("-" * 40)
 
-    last_mtimes = get_file_mtimes()
-    log(f"Tracking {len(last_mtimes)} files")
-
-    last_change_time = 0.0
-    needs_compile = False
-    changed_files: list[Path] = []
+    watcher = create_watcher()
+    log(f"Tracking {len(watcher.snapshot())} files")
 
     try:
-        while True:
-            time.sleep(0.5)
-
-            current_mtimes = get_file_mtimes()
-
-            # Check for changes
-            new_changed = []
-            for path, mtime in current_mtimes.items():
-                if path not in last_mtimes or last_mtimes[path] != mtime:
-                    new_changed.append(path)
-
-            if new_changed:
-                for f in new_changed:
-                    rel_path = f.relative_to(PROJECT_ROOT)
-                    log(f"Changed: {rel_path}")
-                    changed_files.append(f)
-                last_change_time = time.time()
-                needs_compile = True
-                last_mtimes = current_mtimes
-
-            # Debounce: compile after DEBOUNCE_SECONDS of no changes
-            if needs_compile and (time.time() - last_change_time) > DEBOUNCE_SECONDS:
-                log(f"Compiling after {len(changed_files)} file change(s)...")
-                success = compile_extension()
-
-                if success:
-                    send_notification(
-                        "Extension Recompiled",
-                        "Reload Cursor window to apply changes\n(Cmd+Shift+P → Reload Window)",
-                    )
-                    log("")
-                    log("╔════════════════════════════════════════════╗")
-                    log("║  Extension recompiled! Reload Cursor:      ║")
-                    log("║  Cmd+Shift+P → 'Developer: Reload Window'  ║")
-                    log("╚════════════════════════════════════════════╝")
-                    log("")
-                else:
-                    send_notification(
-                        "Extension Compile Failed", "Check terminal for errors"
-                    )
-
-                needs_compile = False
-                changed_files.clear()
+        for changed_files in watcher.watch(threading.Event()):
+            for _change_type, f in changed_files:
+                rel_path = f.relative_to(PROJECT_ROOT)
+                log(f"Changed: {rel_path}")
+
+            log(f"Compiling after {len(changed_files)} file change(s)...")
+            success = compile_extension()
+
+            if success:
+                send_notification(
+                    "Extension Recompiled",
+                    "Reload Cursor window to apply changes\n(Cmd+Shift+P → Reload Window)",
+                )
+                log("")
+                log("╔════════════════════════════════════════════╗")
+                log("║  Extension recompiled! Reload Cursor:      ║")
+                log("║  Cmd+Shift+P → 'Developer: Reload Window'  ║")
+                log("╚════════════════════════════════════════════╝")
+                log("")
+            else:
+                send_notification(
+                    "Extension Compile Failed", "Check terminal for errors"
+                )
 
     except KeyboardInterrupt:
-        log("\nStopped")
+        pass
+    log("\nStopped")
 
 
 if __name__ == "__main__":
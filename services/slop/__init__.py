@@ -8,6 +8,8 @@ Components:
 - SlopDaemon: Main daemon with file watcher and D-Bus interface
 - SlopOrchestrator: Manages parallel loop execution (max 3 concurrent)
 - AnalysisLoop: Named loops (LEAKY, ZOMBIE, RACER, etc.)
+- LoopScheduler: Runs loop file batches on a shared worker pool
+- FileSnapshot: Per-scan file snapshot shared by all loops
 - SlopDatabase: SQLite storage for findings
 - ExternalTools: Wrappers for fast analysis tools
 
@@ -22,16 +24,27 @@ Usage:
 from services.slop.daemon import SlopDaemon
 from services.slop.database import SlopDatabase
 from services.slop.external_tools import ExternalTools, Finding
-from services.slop.loops import LOOP_CONFIGS, PRIORITY_ORDER, AnalysisLoop, LoopResult
+from services.slop.loops import (
+    LOOP_CONFIGS,
+    PRIORITY_ORDER,
+    AnalysisLoop,
+    LoopMetrics,
+    LoopResult,
+)
 from services.slop.orchestrator import SlopOrchestrator
+from services.slop.scheduler import LoopScheduler
+from services.slop.snapshot import FileSnapshot
 
 __all__ = [
     "SlopDaemon",
     "SlopOrchestrator",
     "SlopDatabase",
     "AnalysisLoop",
+    "LoopScheduler",
+    "FileSnapshot",
     "ExternalTools",
     "Finding",
+    "LoopMetrics",
     "LoopResult",
     "LOOP_CONFIGS",
     "PRIORITY_ORDER",
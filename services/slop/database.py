@@ -29,10 +29,17 @@ Usage:
 
     # Update status
     await db.update_status(finding_id, "acknowledged")
+
+Findings are deduplicated on a fingerprint of (file, line, category,
+normalized description), so rescans refresh last_seen_at instead of adding
+rows. Per-loop/category/severity/status counts are kept in finding_counts by
+triggers, so get_stats() never scans the findings table.
 """
 
+import hashlib
 import json
 import logging
+import re
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -44,12 +51,41 @@ from server.paths import AA_CONFIG_DIR
 
 logger = logging.getLogger(__name__)
 
+# Bumped when _migrate() has a new step for existing databases
+SCHEMA_VERSION = 1
+
+# SQLite's default limit on host parameters per statement is 999 (< 3.32)
+_MAX_SQL_PARAMS = 900
+
+# Columns with a maintained count in finding_counts
+_COUNTED_COLUMNS = ("loop", "category", "severity", "status")
+
+
+def finding_fingerprint(finding: dict) -> str:
+    """
+    Stable identity of a finding across scans.
+
+    The description is whitespace/case-normalized so re-worded-only
+    duplicates from repeated scans collapse into one row.
+    """
+    description = re.sub(r"\s+", " ", str(finding.get("description", ""))).strip()
+    key = "\0".join(
+        (
+            str(finding.get("file", "")),
+            str(finding.get("line", 0) or 0),
+            str(finding.get("category", "unknown")),
+            description.lower(),
+        )
+    )
+    return hashlib.sha1(key.encode()).hexdigest()
+
 
 class SlopDatabase:
     """SQLite database for slop findings."""
 
     SCHEMA = """
     -- Findings table with unique constraint to prevent duplicates
+    -- (fingerprint has its own unique index, created by _migrate())
     CREATE TABLE IF NOT EXISTS findings (
         id TEXT PRIMARY KEY,
         loop TEXT NOT NULL,
@@ -67,19 +103,74 @@ class SlopDatabase:
         acknowledged_at TIMESTAMP,
         fixed_at TIMESTAMP,
         git_commit TEXT,
+        fingerprint TEXT,
         -- Prevent duplicate findings for same file/line/category/description
         UNIQUE(file, line, category, description)
     );
 
-    -- Indexes for common queries
-    CREATE INDEX IF NOT EXISTS idx_findings_loop ON findings(loop);
-    CREATE INDEX IF NOT EXISTS idx_findings_file ON findings(file);
-    CREATE INDEX IF NOT EXISTS idx_findings_category ON findings(category);
+    -- Indexes for common queries: filter column + detected_at, so filtered
+    -- "ORDER BY detected_at DESC LIMIT n" pages walk the index without sorting
+    CREATE INDEX IF NOT EXISTS idx_findings_loop_detected
+        ON findings(loop, detected_at);
+    CREATE INDEX IF NOT EXISTS idx_findings_file_line ON findings(file, line);
+    CREATE INDEX IF NOT EXISTS idx_findings_category_detected
+        ON findings(category, detected_at);
     CREATE INDEX IF NOT EXISTS idx_findings_severity ON findings(severity);
-    CREATE INDEX IF NOT EXISTS idx_findings_status ON findings(status);
+    CREATE INDEX IF NOT EXISTS idx_findings_status_detected
+        ON findings(status, detected_at);
     CREATE INDEX IF NOT EXISTS idx_findings_detected ON findings(detected_at);
     CREATE INDEX IF NOT EXISTS idx_findings_last_seen ON findings(last_seen_at);
 
+    -- Counts per loop/category/severity/status (dimension 'total' has one
+    -- row with value ''), maintained by the triggers below
+    CREATE TABLE IF NOT EXISTS finding_counts (
+        dimension TEXT NOT NULL,
+        value TEXT NOT NULL,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, value)
+    ) WITHOUT ROWID;
+
+    CREATE TRIGGER IF NOT EXISTS findings_counts_insert
+    AFTER INSERT ON findings
+    BEGIN
+        INSERT INTO finding_counts (dimension, value, count) VALUES
+            ('total', '', 1),
+            ('loop', NEW.loop, 1),
+            ('category', NEW.category, 1),
+            ('severity', NEW.severity, 1),
+            ('status', NEW.status, 1)
+        ON CONFLICT(dimension, value) DO UPDATE SET count = count + 1;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS findings_counts_delete
+    AFTER DELETE ON findings
+    BEGIN
+        UPDATE finding_counts SET count = count - 1
+        WHERE (dimension, value) IN (
+            VALUES ('total', ''), ('loop', OLD.loop),
+                   ('category', OLD.category), ('severity', OLD.severity),
+                   ('status', OLD.status)
+        );
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS findings_counts_update
+    AFTER UPDATE OF loop, category, severity, status ON findings
+    WHEN OLD.loop IS NOT NEW.loop OR OLD.category IS NOT NEW.category
+      OR OLD.severity IS NOT NEW.severity OR OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE finding_counts SET count = count - 1
+        WHERE (dimension, value) IN (
+            VALUES ('loop', OLD.loop), ('category', OLD.category),
+                   ('severity', OLD.severity), ('status', OLD.status)
+        );
+        INSERT INTO finding_counts (dimension, value, count) VALUES
+            ('loop', NEW.loop, 1),
+            ('category', NEW.category, 1),
+            ('severity', NEW.severity, 1),
+            ('status', NEW.status, 1)
+        ON CONFLICT(dimension, value) DO UPDATE SET count = count + 1;
+    END;
+
     -- Scan history table
     CREATE TABLE IF NOT EXISTS scan_history (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -133,14 +224,77 @@ class SlopDatabase:
 
         self._db = await aiosqlite.connect(str(self.db_path))
         self._db.row_factory = aiosqlite.Row
+        # WAL + NORMAL: bulk upserts commit without an fsync per transaction
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
 
         # Create tables
         await self._db.executescript(self.SCHEMA)
+        await self._migrate()
         await self._db.commit()
 
         self._initialized = True
         logger.info("Slop database initialized")
 
+    async def _migrate(self):
+        """Bring databases created by older versions up to SCHEMA_VERSION."""
+        async with self._db.execute("PRAGMA user_version") as cursor:
+            version = (await cursor.fetchone())[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        logger.info(f"Migrating slop database from version {version}")
+
+        async with self._db.execute("PRAGMA table_info(findings)") as cursor:
+            columns = {row["name"] for row in await cursor.fetchall()}
+        if "fingerprint" not in columns:
+            await self._db.execute("ALTER TABLE findings ADD COLUMN fingerprint TEXT")
+
+        async with self._db.execute(
+            "SELECT rowid, file, line, category, description FROM findings"
+            " WHERE fingerprint IS NULL"
+        ) as cursor:
+            rows = await cursor.fetchall()
+        await self._db.executemany(
+            "UPDATE findings SET fingerprint = ? WHERE rowid = ?",
+            [(finding_fingerprint(dict(row)), row["rowid"]) for row in rows],
+        )
+        # Rows that only differed in description whitespace/case collapse
+        await self._db.execute(
+            "DELETE FROM findings WHERE rowid NOT IN"
+            " (SELECT MIN(rowid) FROM findings GROUP BY fingerprint)"
+        )
+        await self._db.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_findings_fingerprint"
+            " ON findings(fingerprint)"
+        )
+
+        # Superseded by the (column, detected_at) indexes in SCHEMA
+        for index in (
+            "idx_findings_loop",
+            "idx_findings_file",
+            "idx_findings_category",
+            "idx_findings_status",
+        ):
+            await self._db.execute(f"DROP INDEX IF EXISTS {index}")
+
+        await self._rebuild_counts()
+        await self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    async def _rebuild_counts(self):
+        """Recompute finding_counts from the findings table."""
+        await self._db.execute("DELETE FROM finding_counts")
+        await self._db.execute(
+            "INSERT INTO finding_counts (dimension, value, count)"
+            " SELECT 'total', '', COUNT(*) FROM findings"
+        )
+        for column in _COUNTED_COLUMNS:
+            await self._db.execute(
+                f"INSERT INTO finding_counts (dimension, value, count)"
+                f" SELECT '{column}', {column}, COUNT(*) FROM findings"
+                f" GROUP BY {column}"
+            )
+
     async def close(self):
         """Close the database connection."""
         if self._db:
@@ -163,57 +317,88 @@ class SlopDatabase:
         Returns:
             Finding ID
         """
+        ids = await self.add_findings([finding])
+        return ids[0]
+
+    async def add_findings(self, findings: list[dict]) -> list[str]:
+        """
+        Add multiple findings in one transaction.
+
+        Findings already stored (same fingerprint) get last_seen_at, severity
+        and suggestion refreshed instead of a new row.
+
+        Args:
+            findings: Finding dicts (see add_finding)
+
+        Returns:
+            Stored finding IDs, in input order (the existing ID for findings
+            that were already stored)
+        """
         if not self._initialized:
             await self.initialize()
 
-        finding_id = finding.get("id") or f"slop-{uuid.uuid4().hex[:12]}"
-
-        raw_output = finding.get("raw_output", {})
-        if isinstance(raw_output, dict):
-            raw_output = json.dumps(raw_output)
+        if not findings:
+            return []
 
         now = datetime.now().isoformat()
+        rows = []
+        fingerprints = []
+        for finding in findings:
+            raw_output = finding.get("raw_output", {})
+            if isinstance(raw_output, dict):
+                raw_output = json.dumps(raw_output)
+            fingerprint = finding_fingerprint(finding)
+            fingerprints.append(fingerprint)
+            rows.append(
+                (
+                    finding.get("id") or f"slop-{uuid.uuid4().hex[:12]}",
+                    finding.get("loop", "unknown"),
+                    finding.get("file", ""),
+                    finding.get("line", 0),
+                    finding.get("category", "unknown"),
+                    finding.get("severity", "medium"),
+                    finding.get("description", ""),
+                    finding.get("suggestion", ""),
+                    finding.get("tool", ""),
+                    raw_output,
+                    now,
+                    now,
+                    "open",
+                    fingerprint,
+                )
+            )
 
-        # Use INSERT OR IGNORE to skip duplicates, then update last_seen_at
-        # The UNIQUE constraint on (file, line, category, description) prevents duplicates
-        await self._db.execute(
+        await self._db.executemany(
             """
             INSERT INTO findings
             (id, loop, file, line, category, severity, description,
-             suggestion, tool, raw_output, detected_at, last_seen_at, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(file, line, category, description) DO UPDATE SET
+             suggestion, tool, raw_output, detected_at, last_seen_at, status,
+             fingerprint)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(fingerprint) DO UPDATE SET
                 last_seen_at = excluded.last_seen_at,
                 severity = excluded.severity,
                 suggestion = excluded.suggestion
             """,
-            (
-                finding_id,
-                finding.get("loop", "unknown"),
-                finding.get("file", ""),
-                finding.get("line", 0),
-                finding.get("category", "unknown"),
-                finding.get("severity", "medium"),
-                finding.get("description", ""),
-                finding.get("suggestion", ""),
-                finding.get("tool", ""),
-                raw_output,
-                now,
-                now,
-                "open",
-            ),
+            rows,
         )
         await self._db.commit()
 
-        return finding_id
-
-    async def add_findings(self, findings: list[dict]) -> list[str]:
-        """Add multiple findings at once."""
-        ids = []
-        for finding in findings:
-            finding_id = await self.add_finding(finding)
-            ids.append(finding_id)
-        return ids
+        # Map back to the stored IDs (existing rows keep their original ID)
+        stored: dict[str, str] = {}
+        unique = list(dict.fromkeys(fingerprints))
+        for start in range(0, len(unique), _MAX_SQL_PARAMS):
+            chunk = unique[start : start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            async with self._db.execute(
+                f"SELECT id, fingerprint FROM findings"
+                f" WHERE fingerprint IN ({placeholders})",
+                chunk,
+            ) as cursor:
+                async for row in cursor:
+                    stored[row["fingerprint"]] = row["id"]
+
+        return [stored[fingerprint] for fingerprint in fingerprints]
 
     async def get_findings(
         self,
@@ -369,38 +554,15 @@ class SlopDatabase:
             "by_status": {},
         }
 
-        # Total count
-        async with self._db.execute("SELECT COUNT(*) as count FROM findings") as cursor:
-            row = await cursor.fetchone()
-            stats["total"] = row["count"]
-
-        # By loop
-        async with self._db.execute(
-            "SELECT loop, COUNT(*) as count FROM findings GROUP BY loop"
-        ) as cursor:
-            async for row in cursor:
-                stats["by_loop"][row["loop"]] = row["count"]
-
-        # By category
-        async with self._db.execute(
-            "SELECT category, COUNT(*) as count FROM findings GROUP BY category"
-        ) as cursor:
-            async for row in cursor:
-                stats["by_category"][row["category"]] = row["count"]
-
-        # By severity
-        async with self._db.execute(
-            "SELECT severity, COUNT(*) as count FROM findings GROUP BY severity"
-        ) as cursor:
-            async for row in cursor:
-                stats["by_severity"][row["severity"]] = row["count"]
-
-        # By status
+        # Counts are maintained by triggers, so this reads a handful of rows
         async with self._db.execute(
-            "SELECT status, COUNT(*) as count FROM findings GROUP BY status"
+            "SELECT dimension, value, count FROM finding_counts WHERE count > 0"
         ) as cursor:
             async for row in cursor:
-                stats["by_status"][row["status"]] = row["count"]
+                if row["dimension"] == "total":
+                    stats["total"] = row["count"]
+                else:
+                    stats[f"by_{row['dimension']}"][row["value"]] = row["count"]
 
         return stats
 
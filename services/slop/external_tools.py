@@ -28,13 +28,28 @@ Usage:
 
     # Get tools for a file type
     applicable = tools.get_tools_for_file("server/main.py")
+
+    # Cached, batched run over many files (only changed files are re-analyzed)
+    findings = await tools.run_tool_on_files("ruff", ["server/main.py", ...])
+
+Result caching:
+    Parsed findings are cached by (tool, tool version, path, content hash).
+    Tools marked ``per_file`` (radon, bandit, ruff) report on each file
+    independently, so they are cached per file and only files whose content
+    changed since the last run are passed to the tool, batched up to
+    ``batch_size`` files per invocation. Cross-file tools (vulture, mypy,
+    jscpd, slop-detector) are cached for the whole target, keyed by a
+    fingerprint of every file they would read.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
 import shutil
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -42,6 +57,29 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Directories never analyzed when expanding or fingerprinting a tree
+SKIP_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        "node_modules",
+        ".venv",
+        "venv",
+        ".tox",
+        "dist",
+        "build",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+# Files per invocation for per-file tools without their own batch_size
+DEFAULT_BATCH_SIZE = 50
+
+# Cached (tool, version, path, hash) results kept before evicting the oldest
+TOOL_CACHE_MAX_ENTRIES = 20000
+
 
 @dataclass
 class Finding:
@@ -73,6 +111,102 @@ class Finding:
             "detected_at": self.detected_at.isoformat(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "Finding":
+        """Rebuild a finding from to_dict() output."""
+        data = dict(data)
+        detected_at = data.pop("detected_at", None)
+        return cls(
+            **data,
+            detected_at=(
+                datetime.fromisoformat(detected_at) if detected_at else datetime.now()
+            ),
+        )
+
+
+class ToolResultCache:
+    """
+    Parsed tool findings keyed by tool, tool version, path and content hash.
+
+    Entries are evicted least-recently-used beyond ``max_entries``. With a
+    ``path`` the cache is loaded lazily from and saved to a JSON file, so
+    unchanged files stay cached across daemon restarts.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_entries: int = TOOL_CACHE_MAX_ENTRIES,
+    ):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, list[dict]] = OrderedDict()
+        self._loaded = self.path is None
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(tool: str, version: str, target: str, digest: str) -> str:
+        """Cache key for one tool run over a target with the given content."""
+        return "|".join((tool, version, target, digest))
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self._entries.update(data.get("entries", {}))
+            logger.debug(f"Loaded {len(self._entries)} cached tool results")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable tool result cache {self.path}: {e}")
+
+    def get(self, key: str) -> Optional[list[dict]]:
+        """Cached findings (as dicts) for a key, or None."""
+        self._ensure_loaded()
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, findings: list[dict]) -> None:
+        """Store findings (as dicts) for a key."""
+        self._ensure_loaded()
+        self._entries[key] = findings
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed since the last save."""
+        if not self.path or not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(json.dumps({"entries": self._entries}), encoding="utf-8")
+            tmp.replace(self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save tool result cache: {e}")
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
 
 class ExternalTools:
     """Wrapper for external code analysis tools."""
@@ -121,6 +255,8 @@ class ExternalTools:
             "tier": 2,
             "languages": ["python"],
             "timeout": 60,
+            "per_file": True,
+            "batch_size": 100,
         },
         "vulture": {
             "cmd": ["vulture", "--min-confidence", "80"],
@@ -148,6 +284,8 @@ class ExternalTools:
             "tier": 2,
             "languages": ["python"],
             "timeout": 60,
+            "per_file": True,
+            "batch_size": 50,
         },
         "ruff": {
             "cmd": ["ruff", "check", "--output-format", "json"],
@@ -157,6 +295,8 @@ class ExternalTools:
             "tier": 2,
             "languages": ["python"],
             "timeout": 30,
+            "per_file": True,
+            "batch_size": 200,
         },
     }
 
@@ -169,15 +309,35 @@ class ExternalTools:
         ".jsx": "jsx",
     }
 
-    def __init__(self):
-        """Initialize the external tools wrapper."""
+    def __init__(
+        self,
+        cache_path: Optional[Path] = None,
+        max_concurrent: Optional[int] = None,
+    ):
+        """
+        Initialize the external tools wrapper.
+
+        Args:
+            cache_path: JSON file persisting the tool result cache
+                (default: in-memory only)
+            max_concurrent: Maximum tool subprocesses running at once
+                (default: CPU count)
+        """
         self._availability_cache: dict[str, bool] = {}
+        self._tool_versions: dict[str, str] = {}
         self._cache_time: Optional[datetime] = None
         self._cache_ttl_seconds = 300  # 5 minutes
         self._finding_counter = 0
         # Get venv bin path for tools installed in the virtual environment
         self._venv_bin = Path(__file__).parent.parent.parent / ".venv" / "bin"
 
+        self.result_cache = ToolResultCache(cache_path)
+        self._run_semaphore = asyncio.Semaphore(max_concurrent or os.cpu_count() or 4)
+        # abspath -> (st_mtime_ns, st_size, sha256) so unchanged files are not re-read
+        self._hashes: dict[str, tuple[int, int, str]] = {}
+        # Identical cross-file runs requested concurrently by several loops
+        self._inflight: dict[str, asyncio.Future] = {}
+
     def _generate_finding_id(self, tool: str) -> str:
         """Generate a unique finding ID."""
         self._finding_counter += 1
@@ -224,10 +384,14 @@ class ExternalTools:
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
                 )
-                _, _ = await asyncio.wait_for(proc.communicate(), timeout=15)
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=15)
 
                 available = proc.returncode == 0
                 if available:
+                    # Part of the result cache key, so upgrading a tool
+                    # invalidates its cached findings
+                    lines = stdout.decode(errors="replace").strip().splitlines()
+                    self._tool_versions[name] = lines[0] if lines else ""
                     logger.debug(f"{name}: available")
                 else:
                     logger.debug(f"{name}: check failed (exit code {proc.returncode})")
@@ -314,8 +478,206 @@ class ExternalTools:
             logger.debug(f"Skipping {tool} - not available")
             return []
 
+        output = await self._execute(tool, [path])
+        if output is None:
+            return []
+        return self._parse(tool, output, path)
+
+    def is_per_file(self, tool: str) -> bool:
+        """Whether a tool's findings for a file depend only on that file."""
+        return bool(self.TOOLS.get(tool, {}).get("per_file"))
+
+    async def run_tool_on_files(self, tool: str, paths: list[str]) -> list[Finding]:
+        """
+        Run a tool over files and directories, reusing cached results.
+
+        Per-file tools only analyze files whose content changed since they
+        were last analyzed; the rest come from the result cache. Changed
+        files are split into batches of the tool's ``batch_size`` and the
+        batches run concurrently. Cross-file tools run once over all paths
+        unless nothing they read has changed.
+
+        Args:
+            tool: Tool name
+            paths: Files and/or directories to analyze
+
+        Returns:
+            List of Finding objects
+        """
+        if tool not in self.TOOLS:
+            logger.error(f"Unknown tool: {tool}")
+            return []
+
+        availability = await self.check_availability()
+        if not availability.get(tool, False):
+            logger.debug(f"Skipping {tool} - not available")
+            return []
+
+        if not self.is_per_file(tool):
+            return await self._run_cross_file(tool, paths)
+
+        version = self._tool_versions.get(tool, "")
+        files = self._expand_files(tool, paths)
+        digests = await asyncio.to_thread(self._hash_files, files)
+
+        findings: list[Finding] = []
+        stale: list[tuple[str, Optional[str]]] = []
+        for file in files:
+            digest = digests.get(file)
+            cached = None
+            if digest:
+                cached = self.result_cache.get(
+                    ToolResultCache.key(tool, version, file, digest)
+                )
+            if cached is None:
+                stale.append((file, digest))
+            else:
+                findings.extend(self._restore(tool, cached))
+
+        logger.info(
+            f"{tool}: {len(files) - len(stale)} files cached, {len(stale)} to analyze"
+        )
+        if stale:
+            size = self.TOOLS[tool].get("batch_size", DEFAULT_BATCH_SIZE)
+            batches = [stale[i : i + size] for i in range(0, len(stale), size)]
+            results = await asyncio.gather(
+                *(self._run_batch(tool, version, batch) for batch in batches)
+            )
+            for batch_findings in results:
+                findings.extend(batch_findings)
+
+        return findings
+
+    async def _run_batch(
+        self, tool: str, version: str, batch: list[tuple[str, Optional[str]]]
+    ) -> list[Finding]:
+        """Run a per-file tool on one batch and cache the findings per file."""
+        files = [file for file, _ in batch]
+        output = await self._execute(tool, files)
+        # No output means the tool failed; don't cache that as "no findings"
+        if output is None or not output.strip():
+            return []
+
+        findings = self._parse(tool, output, files[0])
+        by_file: dict[str, list[dict]] = {os.path.abspath(f): [] for f in files}
+        for finding in findings:
+            entry = by_file.get(os.path.abspath(finding.file))
+            if entry is not None:
+                entry.append(finding.to_dict())
+
+        for file, digest in batch:
+            if digest:
+                self.result_cache.put(
+                    ToolResultCache.key(tool, version, file, digest),
+                    by_file[os.path.abspath(file)],
+                )
+        return findings
+
+    async def _run_cross_file(self, tool: str, paths: list[str]) -> list[Finding]:
+        """Run a cross-file tool once over all paths, cached by their content."""
+        version = self._tool_versions.get(tool, "")
+        digest = await asyncio.to_thread(self._fingerprint, tool, paths)
+        key = ToolResultCache.key(tool, version, "\n".join(sorted(paths)), digest)
+
+        cached = self.result_cache.get(key)
+        if cached is not None:
+            logger.info(f"{tool}: unchanged since last run, using cached results")
+            return self._restore(tool, cached)
+
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run_and_cache(tool, paths, key))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one cancelled caller doesn't cancel the run for the others
+        return list(await asyncio.shield(future))
+
+    async def _run_and_cache(self, tool: str, paths: list[str], key: str) -> list:
+        output = await self._execute(tool, paths)
+        if output is None:
+            return []
+        findings = self._parse(tool, output, paths[0] if paths else ".")
+        if output.strip():
+            self.result_cache.put(key, [f.to_dict() for f in findings])
+        return findings
+
+    def _restore(self, tool: str, cached: list[dict]) -> list[Finding]:
+        """Findings from cached dicts, with fresh IDs."""
+        findings = []
+        for data in cached:
+            finding = Finding.from_dict(data)
+            finding.id = self._generate_finding_id(tool)
+            findings.append(finding)
+        return findings
+
+    def save_cache(self) -> None:
+        """Persist the tool result cache (if it has a path)."""
+        self.result_cache.save()
+
+    def _tool_extensions(self, tool: str) -> Optional[set[str]]:
+        """File extensions a tool analyzes (None = all files)."""
+        languages = self.TOOLS[tool].get("languages")
+        if languages is None:
+            return None
+        return {ext for ext, lang in self.EXTENSION_MAP.items() if lang in languages}
+
+    def _expand_files(self, tool: str, paths: list[str]) -> list[str]:
+        """Files a tool would analyze for the given files and directories."""
+        extensions = self._tool_extensions(tool)
+        files: list[str] = []
+        for path in paths:
+            if os.path.isdir(path):
+                files.extend(_walk_files(path, extensions))
+            elif extensions is None or Path(path).suffix.lower() in extensions:
+                files.append(path)
+        return files
+
+    def _hash_files(self, files: list[str]) -> dict[str, Optional[str]]:
+        """Content hashes for files (None for unreadable files)."""
+        return {file: self.content_hash(file) for file in files}
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """SHA-256 of a file, re-read only when its mtime or size changed."""
+        abspath = os.path.abspath(path)
+        try:
+            st = os.stat(abspath)
+            memo = self._hashes.get(abspath)
+            if memo and memo[0] == st.st_mtime_ns and memo[1] == st.st_size:
+                return memo[2]
+            with open(abspath, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+        self._hashes[abspath] = (st.st_mtime_ns, st.st_size, digest)
+        return digest
+
+    def _fingerprint(self, tool: str, paths: list[str]) -> str:
+        """Hash over the content of every file a tool would read."""
+        combined = hashlib.sha256()
+        for file in sorted(self._expand_files(tool, paths)):
+            combined.update(file.encode())
+            combined.update((self.content_hash(file) or "").encode())
+        return combined.hexdigest()
+
+    def _parse(self, tool: str, output: str, path: str) -> list[Finding]:
+        """Parse tool output with the tool's ``_parse_*`` method."""
+        parser = getattr(self, f"_parse_{tool.replace('-', '_')}", None)
+        if parser:
+            return parser(output, path)
+        logger.warning(f"No parser for {tool}, returning raw output")
+        return []
+
+    async def _execute(self, tool: str, paths: list[str]) -> Optional[str]:
+        """
+        Run a tool subprocess over paths.
+
+        At most ``max_concurrent`` tool subprocesses run at once.
+
+        Returns:
+            The tool's stdout, or None if it timed out or failed to run
+        """
         config = self.TOOLS[tool]
-        cmd = list(config["cmd"]) + [path]  # Make a copy
+        cmd = list(config["cmd"]) + list(paths)  # Make a copy
         timeout = config.get("timeout", 60)
 
         # Resolve command path (check venv if not in system PATH)
@@ -325,45 +687,39 @@ class ExternalTools:
             if venv_path.exists():
                 cmd[0] = str(venv_path)
 
-        logger.info(f"Running {tool} on {path}")
+        target = paths[0] if len(paths) == 1 else f"{len(paths)} files"
+        logger.info(f"Running {tool} on {target}")
 
-        proc = None
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+        async with self._run_semaphore:
+            proc = None
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
 
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(),
-                timeout=timeout,
-            )
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(),
+                    timeout=timeout,
+                )
 
-            output = stdout.decode()
+                return stdout.decode()
 
-            # Parse based on tool
-            parser = getattr(self, f"_parse_{tool.replace('-', '_')}", None)
-            if parser:
-                return parser(output, path)
-            else:
-                logger.warning(f"No parser for {tool}, returning raw output")
-                return []
-
-        except asyncio.TimeoutError:
-            # Kill the subprocess on timeout to prevent zombie processes
-            if proc is not None:
-                proc.kill()
-                await proc.wait()
-            logger.error(f"{tool} timed out after {timeout}s")
-            return []
-        except Exception as e:
-            # Ensure cleanup on any error
-            if proc is not None and proc.returncode is None:
-                proc.kill()
-                await proc.wait()
-            logger.exception(f"{tool} error: {e}")
-            return []
+            except asyncio.TimeoutError:
+                # Kill the subprocess on timeout to prevent zombie processes
+                if proc is not None:
+                    proc.kill()
+                    await proc.wait()
+                logger.error(f"{tool} timed out after {timeout}s")
+                return None
+            except Exception as e:
+                # Ensure cleanup on any error
+                if proc is not None and proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                logger.exception(f"{tool} error: {e}")
+                return None
 
     def _parse_radon(self, output: str, path: str) -> list[Finding]:
         """Parse radon cyclomatic complexity output."""
@@ -676,35 +1032,46 @@ class ExternalTools:
 
         return findings
 
-    async def run_all_applicable(self, path: str) -> list[Finding]:
+    async def run_all_applicable(
+        self, path: str, files: Optional[list[str]] = None
+    ) -> list[Finding]:
         """
         Run all applicable and available tools on a path.
 
+        Results are cached, so files unchanged since the last run are not
+        re-analyzed (see run_tool_on_files).
+
         Args:
             path: Path to analyze
+            files: Files to analyze instead of ``path`` itself; each tool is
+                run on the files it applies to
 
         Returns:
             Combined list of findings from all tools
         """
-        # Get applicable tools for this path
-        applicable = self.get_tools_for_file(path)
+        targets = files if files is not None else [path]
 
         # Check availability
         availability = await self.check_availability()
 
-        # Filter to available tools
-        tools_to_run = [t for t in applicable if availability.get(t)]
+        # Group targets by the available tools that apply to them
+        tool_targets: dict[str, list[str]] = {}
+        for target in targets:
+            for tool in self.get_tools_for_file(target):
+                if availability.get(tool):
+                    tool_targets.setdefault(tool, []).append(target)
 
-        if not tools_to_run:
+        if not tool_targets:
             logger.warning(f"No tools available for {path}")
             return []
 
         # Run tools in parallel
-        async def run_and_collect(tool: str) -> list[Finding]:
-            return await self.run_tool(tool, path)
-
-        tasks = [run_and_collect(tool) for tool in tools_to_run]
+        tasks = [
+            self.run_tool_on_files(tool, tool_paths)
+            for tool, tool_paths in tool_targets.items()
+        ]
         results = await asyncio.gather(*tasks)
+        self.save_cache()
 
         # Flatten results
         all_findings = []
@@ -712,3 +1079,16 @@ class ExternalTools:
             all_findings.extend(findings)
 
         return all_findings
+
+
+def _walk_files(root: str, extensions: Optional[set[str]]) -> list[str]:
+    """Files under root with the given extensions (None = all), skipping SKIP_DIRS."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames if d not in SKIP_DIRS and not d.endswith(".egg-info")
+        ]
+        for filename in filenames:
+            if extensions is None or Path(filename).suffix.lower() in extensions:
+                files.append(os.path.join(dirpath, filename))
+    return files
@@ -28,19 +28,28 @@ Usage:
 
     await loop.run()
     print(f"Found {loop.findings_count} issues")
+
+    # Or batch by batch (as LoopScheduler does)
+    files = await loop.start(snapshot=snapshot)
+    for batch in snapshot.batches(files, max_tokens=30_000):
+        await loop.run_batch(batch)
+    result = await loop.finish()
 """
 
 import json
 import logging
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, field
 from datetime import datetime
-from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
+from services.slop.snapshot import discover_files, estimate_tokens
+
 if TYPE_CHECKING:
     from services.base.ai_router import AIModelRouter
     from services.slop.database import SlopDatabase
     from services.slop.external_tools import ExternalTools
+    from services.slop.snapshot import FileSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -280,6 +289,52 @@ PRIORITY_ORDER = [
 ]
 
 
+@dataclass
+class LoopMetrics:
+    """Throughput and token usage of a loop (one scan, or accumulated)."""
+
+    batches: int = 0
+    files: int = 0
+    iterations: int = 0
+    findings: int = 0
+    prompt_tokens: int = 0  # Estimated, the CLI backends don't report usage
+    response_tokens: int = 0
+    llm_ms: int = 0
+
+    def add(self, other: "LoopMetrics") -> None:
+        """Accumulate another run's metrics into this one."""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    @property
+    def findings_per_kilotoken(self) -> float:
+        """Findings produced per 1000 prompt tokens."""
+        if not self.prompt_tokens:
+            return 0.0
+        return self.findings * 1000 / self.prompt_tokens
+
+    @property
+    def files_per_minute(self) -> float:
+        """Files analyzed per minute of LLM time."""
+        if not self.llm_ms:
+            return 0.0
+        return self.files * 60_000 / self.llm_ms
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "batches": self.batches,
+            "files": self.files,
+            "iterations": self.iterations,
+            "findings": self.findings,
+            "prompt_tokens": self.prompt_tokens,
+            "response_tokens": self.response_tokens,
+            "llm_ms": self.llm_ms,
+            "findings_per_kilotoken": round(self.findings_per_kilotoken, 3),
+            "files_per_minute": round(self.files_per_minute, 1),
+        }
+
+
 @dataclass
 class LoopResult:
     """Result of an analysis loop run."""
@@ -291,6 +346,7 @@ class LoopResult:
     findings_count: int
     duration_ms: int
     error: Optional[str] = None
+    metrics: dict = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -302,6 +358,7 @@ class LoopResult:
             "findings_count": self.findings_count,
             "duration_ms": self.duration_ms,
             "error": self.error,
+            "metrics": self.metrics,
         }
 
 
@@ -310,7 +367,9 @@ class AnalysisLoop:
     A named analysis loop that focuses on one code smell type.
 
     Ralph-style iteration: keeps analyzing until LLM says "done"
-    or max iterations reached.
+    or max iterations reached. The files can be split into batches
+    (see run_batch), each iterated separately; batches of one loop may
+    run concurrently.
     """
 
     def __init__(
@@ -355,6 +414,11 @@ class AnalysisLoop:
         self._findings: list[dict] = []
         self._stop_requested = False
         self._start_time: Optional[datetime] = None
+        self._files: list[str] = []
+        self._fast_hints: list[dict] = []
+        self._unstarted_batches = 0
+        self._error: Optional[str] = None
+        self.metrics = LoopMetrics()
 
     @property
     def status(self) -> str:
@@ -371,6 +435,11 @@ class AnalysisLoop:
         """Number of findings so far."""
         return len(self._findings)
 
+    @property
+    def stop_requested(self) -> bool:
+        """Whether stop() was called during this run."""
+        return self._stop_requested
+
     def get_status_dict(self) -> dict:
         """Get status as dictionary for D-Bus/UI."""
         return {
@@ -381,6 +450,7 @@ class AnalysisLoop:
             "max_iterations": self.max_iterations,
             "findings_count": len(self._findings),
             "description": self.description,
+            "metrics": self.metrics.to_dict(),
         }
 
     async def stop(self):
@@ -389,7 +459,10 @@ class AnalysisLoop:
         self._stop_requested = True
 
     async def run(
-        self, files: Optional[list[str]] = None, codebase_path: Optional[str] = None
+        self,
+        files: Optional[list[str]] = None,
+        codebase_path: Optional[str] = None,
+        snapshot: Optional["FileSnapshot"] = None,
     ) -> LoopResult:
         """
         Run the analysis loop until done or max iterations.
@@ -397,99 +470,190 @@ class AnalysisLoop:
         Args:
             files: List of files to analyze (or None for whole codebase)
             codebase_path: Path to codebase root
+            snapshot: Shared scan snapshot to take the files from
 
         Returns:
             LoopResult with summary
         """
+        try:
+            files = await self.start(files, codebase_path, snapshot)
+            if files:
+                await self.run_batch(files)
+        except Exception as e:
+            self.fail(e)
+        return await self.finish()
+
+    async def start(
+        self,
+        files: Optional[list[str]] = None,
+        codebase_path: Optional[str] = None,
+        snapshot: Optional["FileSnapshot"] = None,
+    ) -> list[str]:
+        """
+        Reset state, resolve the files and run the fast tools.
+
+        Args:
+            files: List of files to analyze (default: snapshot or codebase)
+            codebase_path: Path to codebase root
+            snapshot: Shared scan snapshot to take the files from
+
+        Returns:
+            The files to analyze
+        """
         self._status = "running"
         self._current_iteration = 0
         self._findings = []
+        self._fast_hints = []
+        self._unstarted_batches = 0
         self._stop_requested = False
+        self._error = None
         self._start_time = datetime.now()
+        self.metrics = LoopMetrics()
 
         logger.info(f"Starting loop {self.name}: {self.description}")
 
-        try:
-            # 1. Get files to analyze
-            if files is None:
+        # 1. Get files to analyze
+        if files is None:
+            if snapshot is not None:
+                files = snapshot.paths
+            else:
                 files = await self._get_relevant_files(codebase_path)
+        self._files = files
 
-            if not files:
-                logger.warning(f"No files to analyze for loop {self.name}")
-                self._status = "done"
-                return self._create_result()
-
-            # 2. Run fast tools first (if any)
-            fast_hints = []
-            if self.fast_tools and self._external_tools:
-                fast_hints = await self._run_fast_tools(files, codebase_path)
-                logger.info(f"Fast tools found {len(fast_hints)} hints for {self.name}")
-
-            # 3. Ralph-style iteration
-            while (
-                self._current_iteration < self.max_iterations
-                and not self._stop_requested
-            ):
-                self._current_iteration += 1
+        if not files:
+            logger.warning(f"No files to analyze for loop {self.name}")
+            return []
+
+        # 2. Run fast tools first (if any)
+        if self.fast_tools and self._external_tools:
+            self._fast_hints = await self._run_fast_tools(files, codebase_path)
+            logger.info(
+                f"Fast tools found {len(self._fast_hints)} hints for {self.name}"
+            )
+
+        return files
+
+    def plan_batches(self, count: int) -> None:
+        """Reserve one iteration for each of ``count`` batches still to run.
+
+        ``max_iterations`` is the budget of the whole run, shared by its
+        batches; reserved iterations keep an early batch from using up the
+        budget before later ones have had their first.
+        """
+        self._unstarted_batches = count
+
+    async def run_batch(self, files: list[str]) -> int:
+        """
+        Ralph-style iteration over one batch of the files from start().
+
+        Iterations count against the run's ``max_iterations`` budget, which
+        all batches share (see plan_batches).
+
+        Args:
+            files: Batch of files to analyze
+
+        Returns:
+            Number of findings added
+        """
+        hints = self._hints_for(files)
+        batch_findings: list[dict] = []
+        iteration = 0
+        self.metrics.batches += 1
+        self.metrics.files += len(files)
+        self._unstarted_batches = max(self._unstarted_batches - 1, 0)
+
+        while (
+            self._current_iteration + self._unstarted_batches < self.max_iterations
+            and not self._stop_requested
+        ):
+            iteration += 1
+            self._current_iteration += 1
+            self.metrics.iterations += 1
+            logger.info(
+                f"Loop {self.name} iteration "
+                f"{self._current_iteration}/{self.max_iterations}"
+                f" ({len(files)} files, batch iteration {iteration})"
+            )
+
+            # Build focused prompt
+            prompt = self._build_prompt(
+                files, hints, self._current_iteration, batch_findings
+            )
+            self.metrics.prompt_tokens += estimate_tokens(prompt)
+
+            # Call LLM
+            response = await self._ai_router.analyze(prompt, task=self.task)
+            self.metrics.llm_ms += response.latency_ms
+            self.metrics.response_tokens += estimate_tokens(response.text)
+
+            if not response.success:
+                logger.error(f"LLM analysis failed for {self.name}: {response.error}")
+                # Continue to next iteration, might recover
+                continue
+
+            # Process findings
+            new_findings = response.findings
+            if new_findings:
+                logger.info(f"Loop {self.name} found {len(new_findings)} new issues")
+                for finding in new_findings:
+                    finding["loop"] = self.name
+                    # Validate and default category
+                    finding_category = finding.get("category", "")
+                    if finding_category not in self.allowed_categories:
+                        # Default to primary category if invalid/missing
+                        logger.debug(
+                            f"Finding category '{finding_category}' not in allowed "
+                            f"{self.allowed_categories}, defaulting to '{self.primary_category}'"
+                        )
+                        finding["category"] = self.primary_category
+                    batch_findings.append(finding)
+
+            # Check if done
+            if response.done:
                 logger.info(
-                    f"Loop {self.name} iteration {self._current_iteration}/{self.max_iterations}"
+                    f"Loop {self.name} reports done after {iteration} iterations"
                 )
+                break
 
-                # Build focused prompt
-                prompt = self._build_prompt(files, fast_hints)
-
-                # Call LLM
-                response = await self._ai_router.analyze(prompt, task=self.task)
-
-                if not response.success:
-                    logger.error(
-                        f"LLM analysis failed for {self.name}: {response.error}"
-                    )
-                    # Continue to next iteration, might recover
-                    continue
-
-                # Process findings
-                new_findings = response.findings
-                if new_findings:
-                    logger.info(
-                        f"Loop {self.name} found {len(new_findings)} new issues"
-                    )
-                    for finding in new_findings:
-                        finding["loop"] = self.name
-                        # Validate and default category
-                        finding_category = finding.get("category", "")
-                        if finding_category not in self.allowed_categories:
-                            # Default to primary category if invalid/missing
-                            logger.debug(
-                                f"Finding category '{finding_category}' not in allowed "
-                                f"{self.allowed_categories}, defaulting to '{self.primary_category}'"
-                            )
-                            finding["category"] = self.primary_category
-                        self._findings.append(finding)
-
-                # Check if done
-                if response.done:
-                    logger.info(
-                        f"Loop {self.name} reports done after {self._current_iteration} iterations"
-                    )
-                    break
-
-            # 4. Store findings in database
-            for finding in self._findings:
-                await self._db.add_finding(finding)
-
-            self._status = "done" if not self._stop_requested else "stopped"
+        self._findings.extend(batch_findings)
+        self.metrics.findings += len(batch_findings)
+        return len(batch_findings)
 
-        except Exception as e:
-            logger.exception(f"Loop {self.name} error: {e}")
-            self._status = "error"
+    def fail(self, error: BaseException) -> None:
+        """Mark the loop as failed."""
+        logger.error(f"Loop {self.name} error: {error}", exc_info=error)
+        self._status = "error"
+        self._error = str(error) or type(error).__name__
+
+    async def finish(self) -> LoopResult:
+        """Store the findings and complete the run."""
+        if self._status == "running":
+            try:
+                # 4. Store findings in database
+                await self._db.add_findings(self._findings)
+                self._status = "done" if not self._stop_requested else "stopped"
+            except Exception as e:
+                self.fail(e)
 
         result = self._create_result()
         logger.info(
-            f"Loop {self.name} completed: {result.findings_count} findings in {result.duration_ms}ms"
+            f"Loop {self.name} completed: {result.findings_count} findings in "
+            f"{result.duration_ms}ms ({self.metrics.batches} batches, "
+            f"~{self.metrics.prompt_tokens} prompt tokens)"
         )
         return result
 
+    def _hints_for(self, files: list[str]) -> list[dict]:
+        """Fast tool hints for a batch (all hints when it covers every file)."""
+        if len(files) >= len(self._files):
+            return self._fast_hints
+        wanted = {os.path.abspath(f) for f in files}
+        return [
+            hint
+            for hint in self._fast_hints
+            if os.path.abspath(hint.get("file", "")) in wanted
+        ]
+
     def _create_result(self) -> LoopResult:
         """Create a LoopResult from current state."""
         duration_ms = 0
@@ -505,47 +669,27 @@ class AnalysisLoop:
             max_iterations=self.max_iterations,
             findings_count=len(self._findings),
             duration_ms=duration_ms,
-            error=None if self._status != "error" else "Analysis error",
+            error=None if self._status != "error" else self._error,
+            metrics=self.metrics.to_dict(),
         )
 
     async def _get_relevant_files(
         self, codebase_path: Optional[str] = None
     ) -> list[str]:
         """Get list of files to analyze."""
-        if not codebase_path:
-            codebase_path = "."
-
-        path = Path(codebase_path)
-        files = []
-
-        # Get Python files (primary focus)
-        for pattern in ["**/*.py"]:
-            for file_path in path.glob(pattern):
-                # Skip common exclusions
-                str_path = str(file_path)
-                if any(
-                    excl in str_path
-                    for excl in [
-                        "__pycache__",
-                        ".git",
-                        "node_modules",
-                        ".venv",
-                        "venv",
-                        ".tox",
-                        "dist",
-                        "build",
-                        ".egg",
-                    ]
-                ):
-                    continue
-                files.append(str(file_path))
-
-        return files[:100]  # Limit to 100 files per loop
+        return discover_files(codebase_path)
 
     async def _run_fast_tools(
         self, files: list[str], codebase_path: Optional[str]
     ) -> list[dict]:
-        """Run fast tools for pre-filtering."""
+        """
+        Run fast tools for pre-filtering.
+
+        Per-file tools run on this loop's files, cross-file tools on the whole
+        codebase. Both go through the shared result cache, so files unchanged
+        since the last scan (or already analyzed by another loop) are not
+        re-analyzed.
+        """
         if not self._external_tools:
             return []
 
@@ -554,7 +698,8 @@ class AnalysisLoop:
 
         for tool in self.fast_tools:
             try:
-                findings = await self._external_tools.run_tool(tool, target)
+                paths = files if self._external_tools.is_per_file(tool) else [target]
+                findings = await self._external_tools.run_tool_on_files(tool, paths)
                 for finding in findings:
                     hints.append(finding.to_dict())
             except Exception as e:
@@ -562,8 +707,22 @@ class AnalysisLoop:
 
         return hints
 
-    def _build_prompt(self, files: list[str], fast_hints: list[dict]) -> str:
-        """Build focused prompt for this specific task."""
+    def _build_prompt(
+        self,
+        files: list[str],
+        fast_hints: list[dict],
+        iteration: Optional[int] = None,
+        previous: Optional[list[dict]] = None,
+    ) -> str:
+        """
+        Build focused prompt for this specific task.
+
+        ``iteration`` and ``previous`` default to the loop-wide counters;
+        batches pass their own.
+        """
+        iteration = self._current_iteration if iteration is None else iteration
+        previous = self._findings if previous is None else previous
+
         # Format files list (truncate if too long)
         files_text = "\n".join(files[:50])
         if len(files) > 50:
@@ -578,11 +737,11 @@ class AnalysisLoop:
 
         # Format previous findings
         prev_findings_text = "None"
-        if self._findings:
-            prev_findings_text = json.dumps(self._findings[-10:], indent=2)
-            if len(self._findings) > 10:
+        if previous:
+            prev_findings_text = json.dumps(previous[-10:], indent=2)
+            if len(previous) > 10:
                 prev_findings_text = (
-                    f"... {len(self._findings) - 10} earlier findings ...\n"
+                    f"... {len(previous) - 10} earlier findings ...\n"
                     + prev_findings_text
                 )
 
@@ -596,7 +755,7 @@ class AnalysisLoop:
 ## Scope
 
 Analyze the ENTIRE codebase for this ONE issue type.
-Iteration: {self._current_iteration}/{self.max_iterations}
+Iteration: {iteration}/{self.max_iterations}
 
 ## Files to Analyze
 
@@ -2,8 +2,10 @@
 Slop Orchestrator - Manages Parallel Analysis Loops.
 
 Coordinates multiple named analysis loops with:
-- Semaphore limiting max concurrent loops (default: 3)
-- Priority-based execution order
+- One file snapshot per scan, shared by all loops
+- LoopScheduler running loop file batches on max_parallel workers
+  (default: 3), best cost/benefit first
+- Per-loop throughput and token metrics, accumulated across scans
 - Status tracking for UI display
 - Start/stop control for individual loops
 
@@ -30,7 +32,15 @@ from typing import Optional
 from services.base.ai_router import get_ai_router
 from services.slop.database import SlopDatabase
 from services.slop.external_tools import ExternalTools
-from services.slop.loops import LOOP_CONFIGS, PRIORITY_ORDER, AnalysisLoop, LoopResult
+from services.slop.loops import (
+    LOOP_CONFIGS,
+    PRIORITY_ORDER,
+    AnalysisLoop,
+    LoopMetrics,
+    LoopResult,
+)
+from services.slop.scheduler import LoopScheduler
+from services.slop.snapshot import FileSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -61,10 +71,13 @@ class SlopOrchestrator:
         self.max_parallel = max_parallel
         self.codebase_path = codebase_path or "."
 
-        self._semaphore = asyncio.Semaphore(max_parallel)
         self._db = SlopDatabase(db_path)
         self._ai_router = get_ai_router(preferred_backend)
-        self._external_tools = ExternalTools()
+        # Tool results are cached next to the findings database so unchanged
+        # files are not re-analyzed on the next scan
+        self._external_tools = ExternalTools(
+            cache_path=self._db.db_path.with_name("slop_tool_cache.json")
+        )
 
         # Initialize loops
         self._loops: dict[str, AnalysisLoop] = {}
@@ -72,6 +85,11 @@ class SlopOrchestrator:
         self._running = False
         self._initialized = False
 
+        # Previous scan's snapshot (for change detection) and metrics
+        # accumulated over all scans (for scheduling)
+        self._snapshot: Optional[FileSnapshot] = None
+        self._metrics: dict[str, LoopMetrics] = {}
+
     async def initialize(self):
         """Initialize the orchestrator and database."""
         if self._initialized:
@@ -129,48 +147,12 @@ class SlopOrchestrator:
         )
 
         try:
-            if parallel:
-                # Run with semaphore limiting concurrency
-                tasks = []
-                for name in PRIORITY_ORDER:
-                    if name in self._loops:
-                        task = asyncio.create_task(
-                            self._run_with_semaphore(name),
-                            name=f"loop-{name}",
-                        )
-                        tasks.append(task)
-
-                # Wait for all to complete
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Process results
-                for i, name in enumerate(PRIORITY_ORDER):
-                    if name in self._loops:
-                        result = results[i] if i < len(results) else None
-                        if isinstance(result, Exception):
-                            logger.error(f"Loop {name} raised exception: {result}")
-                            self._loop_results[name] = LoopResult(
-                                loop_name=name,
-                                status="error",
-                                iterations=0,
-                                max_iterations=self._loops[name].max_iterations,
-                                findings_count=0,
-                                duration_ms=0,
-                                error=str(result),
-                            )
-                        elif isinstance(result, LoopResult):
-                            self._loop_results[name] = result
-            else:
-                # Sequential execution
-                for name in PRIORITY_ORDER:
-                    if name in self._loops:
-                        result = await self._loops[name].run(
-                            codebase_path=self.codebase_path
-                        )
-                        self._loop_results[name] = result
+            names = [name for name in PRIORITY_ORDER if name in self._loops]
+            self._loop_results = await self._run_loops(names, parallel)
 
         finally:
             self._running = False
+            self._external_tools.save_cache()
 
         # Log summary
         total_findings = sum(r.findings_count for r in self._loop_results.values())
@@ -178,13 +160,36 @@ class SlopOrchestrator:
 
         return self._loop_results
 
-    async def _run_with_semaphore(self, loop_name: str) -> LoopResult:
-        """Run a single loop, respecting semaphore."""
-        async with self._semaphore:
-            logger.debug(f"Acquired semaphore for loop {loop_name}")
-            result = await self._loops[loop_name].run(codebase_path=self.codebase_path)
-            logger.debug(f"Released semaphore for loop {loop_name}")
-            return result
+    async def _run_loops(
+        self, loop_names: list[str], parallel: bool
+    ) -> dict[str, LoopResult]:
+        """Snapshot the codebase once and run the loops over it."""
+        snapshot = await asyncio.to_thread(
+            FileSnapshot.build,
+            self.codebase_path,
+            previous=self._snapshot,
+            hasher=self._external_tools.content_hash,
+        )
+        self._snapshot = snapshot
+        loops = {name: self._loops[name] for name in loop_names}
+
+        if parallel:
+            scheduler = LoopScheduler(
+                max_workers=self.max_parallel,
+                history=self._metrics,
+            )
+            results = await scheduler.run(loops, snapshot, self.codebase_path)
+        else:
+            # Sequential execution
+            results = {}
+            for name, loop in loops.items():
+                results[name] = await loop.run(
+                    codebase_path=self.codebase_path, snapshot=snapshot
+                )
+
+        for name, loop in loops.items():
+            self._metrics.setdefault(name, LoopMetrics()).add(loop.metrics)
+        return results
 
     async def run_specific(
         self, loop_names: list[str], parallel: bool = True
@@ -214,35 +219,11 @@ class SlopOrchestrator:
         logger.info(f"Starting loops: {valid_names}")
 
         try:
-            if parallel:
-                tasks = [
-                    asyncio.create_task(self._run_with_semaphore(name))
-                    for name in valid_names
-                ]
-                task_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for i, name in enumerate(valid_names):
-                    result = task_results[i]
-                    if isinstance(result, Exception):
-                        results[name] = LoopResult(
-                            loop_name=name,
-                            status="error",
-                            iterations=0,
-                            max_iterations=self._loops[name].max_iterations,
-                            findings_count=0,
-                            duration_ms=0,
-                            error=str(result),
-                        )
-                    else:
-                        results[name] = result
-            else:
-                for name in valid_names:
-                    results[name] = await self._loops[name].run(
-                        codebase_path=self.codebase_path
-                    )
+            results = await self._run_loops(valid_names, parallel)
 
         finally:
             self._running = False
+            self._external_tools.save_cache()
 
         # Update stored results
         self._loop_results.update(results)
@@ -293,6 +274,7 @@ class SlopOrchestrator:
             "max_parallel": self.max_parallel,
             "loops": loops_status,
             "priority_order": PRIORITY_ORDER,
+            "metrics": {name: m.to_dict() for name, m in self._metrics.items()},
         }
 
     def get_loop_status(self, loop_name: str) -> Optional[dict]:
@@ -0,0 +1,213 @@
+"""
+Loop Scheduler for Slop Bot.
+
+Splits each loop's files into batches and runs them on a fixed pool of
+workers. All pending batches from all loops sit in one priority queue, so a
+worker that finishes early takes the next batch of whichever loop still has
+work instead of idling while one long loop runs on.
+
+Batches are ordered by estimated benefit per cost:
+
+    benefit = loop weight (PRIORITY_ORDER) * (1 + findings per 1k tokens)
+              * (1 + share of files changed since the last scan)
+    cost    = estimated prompt tokens of the batch (in 1k tokens)
+
+Findings per 1k tokens comes from the loop's metrics in previous scans plus
+the batches already finished in this one, so scores are refreshed after
+every batch.
+
+A loop's ``max_iterations`` is the LLM call budget of its whole run, not of
+each batch, so a loop is never split into more batches than it has
+iterations.
+
+Usage:
+    from services.slop.scheduler import LoopScheduler
+
+    scheduler = LoopScheduler(max_workers=3, history=metrics_by_loop)
+    results = await scheduler.run(loops, snapshot, codebase_path=".")
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+from services.slop.loops import PRIORITY_ORDER, AnalysisLoop, LoopMetrics, LoopResult
+from services.slop.snapshot import FileSnapshot
+
+logger = logging.getLogger(__name__)
+
+# Batch limits (estimated prompt tokens of the files / file count)
+BATCH_TOKENS = 30_000
+BATCH_FILES = 25
+
+
+@dataclass(order=True)
+class WorkItem:
+    """One batch of files for one loop, ordered best-first."""
+
+    sort_key: float
+    seq: int
+    loop_name: str = field(compare=False)
+    files: list[str] = field(compare=False)
+
+
+class LoopScheduler:
+    """Runs loop batches on a worker pool, best cost/benefit first."""
+
+    def __init__(
+        self,
+        max_workers: int = 3,
+        batch_tokens: int = BATCH_TOKENS,
+        batch_files: int = BATCH_FILES,
+        history: Optional[dict[str, LoopMetrics]] = None,
+        priority: Optional[list[str]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_workers: Batches analyzed concurrently
+            batch_tokens: Maximum estimated tokens of files per batch
+            batch_files: Maximum files per batch
+            history: Accumulated metrics of earlier scans, by loop name
+            priority: Loop names, most important first
+        """
+        self.max_workers = max_workers
+        self.batch_tokens = batch_tokens
+        self.batch_files = batch_files
+        self.history = history or {}
+        self.priority = priority or PRIORITY_ORDER
+        self._seq = itertools.count()
+
+    def weight(self, loop_name: str) -> float:
+        """Importance of a loop from its place in the priority order."""
+        if loop_name not in self.priority:
+            return 1.0
+        return float(len(self.priority) - self.priority.index(loop_name))
+
+    def score(
+        self, loop: AnalysisLoop, files: list[str], snapshot: FileSnapshot
+    ) -> float:
+        """Estimated benefit per 1k prompt tokens of analyzing a batch."""
+        metrics = LoopMetrics()
+        if loop.name in self.history:
+            metrics.add(self.history[loop.name])
+        metrics.add(loop.metrics)
+
+        changed = len(snapshot.changed_paths(files)) / len(files) if files else 0.0
+        benefit = (
+            self.weight(loop.name)
+            * (1 + metrics.findings_per_kilotoken)
+            * (1 + changed)
+        )
+        cost = max(snapshot.tokens(files), 1) / 1000
+        return benefit / cost
+
+    def batches(
+        self, loop: AnalysisLoop, files: list[str], snapshot: FileSnapshot
+    ) -> list[list[str]]:
+        """Split a loop's files into batches, at most one per iteration."""
+        batches = snapshot.batches(files, self.batch_tokens, self.batch_files)
+        if len(batches) > loop.max_iterations > 0:
+            # The iteration budget wins over the batch size limits
+            per_batch = math.ceil(len(files) / loop.max_iterations)
+            batches = [
+                files[i : i + per_batch] for i in range(0, len(files), per_batch)
+            ]
+        return batches
+
+    def _item(
+        self, loop: AnalysisLoop, files: list[str], snapshot: FileSnapshot
+    ) -> WorkItem:
+        # heapq pops the smallest key, so negate the score
+        return WorkItem(
+            -self.score(loop, files, snapshot), next(self._seq), loop.name, files
+        )
+
+    async def run(
+        self,
+        loops: dict[str, AnalysisLoop],
+        snapshot: FileSnapshot,
+        codebase_path: Optional[str] = None,
+    ) -> dict[str, LoopResult]:
+        """
+        Run loops over a snapshot and return their results.
+
+        Args:
+            loops: Loops to run, by name
+            snapshot: Shared scan snapshot
+            codebase_path: Path to codebase root (for cross-file fast tools)
+
+        Returns:
+            Dict mapping loop name to result
+        """
+        # Fast tools for every loop up front; they are cached and bounded by
+        # ExternalTools, and loops without batches finish right away
+        started = await asyncio.gather(
+            *(
+                loop.start(codebase_path=codebase_path, snapshot=snapshot)
+                for loop in loops.values()
+            ),
+            return_exceptions=True,
+        )
+
+        queue: list[WorkItem] = []
+        remaining: dict[str, int] = {}
+        results: dict[str, LoopResult] = {}
+        for (name, loop), files in zip(loops.items(), started):
+            if isinstance(files, BaseException):
+                loop.fail(files)
+                files = []
+            batches = self.batches(loop, files, snapshot)
+            loop.plan_batches(len(batches))
+            remaining[name] = len(batches)
+            for batch in batches:
+                queue.append(self._item(loop, batch, snapshot))
+            if not batches:
+                results[name] = await loop.finish()
+        heapq.heapify(queue)
+
+        logger.info(
+            f"Scheduling {len(queue)} batches for {len(loops)} loops "
+            f"on {self.max_workers} workers"
+        )
+
+        async def worker() -> None:
+            while queue:
+                item = heapq.heappop(queue)
+                loop = loops[item.loop_name]
+                if loop.status == "running" and not loop.stop_requested:
+                    try:
+                        await loop.run_batch(item.files)
+                    except Exception as e:
+                        loop.fail(e)
+                    self._rescore(queue, loops, snapshot)
+
+                remaining[item.loop_name] -= 1
+                if remaining[item.loop_name] == 0:
+                    results[item.loop_name] = await loop.finish()
+
+        workers = min(self.max_workers, len(queue))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        return {name: results[name] for name in loops}
+
+    def _rescore(
+        self,
+        queue: list[WorkItem],
+        loops: dict[str, AnalysisLoop],
+        snapshot: FileSnapshot,
+    ) -> None:
+        """Refresh queued scores with the metrics gathered so far."""
+        for i, item in enumerate(queue):
+            queue[i] = WorkItem(
+                -self.score(loops[item.loop_name], item.files, snapshot),
+                item.seq,
+                item.loop_name,
+                item.files,
+            )
+        heapq.heapify(queue)
@@ -0,0 +1,191 @@
+"""
+Per-scan File Snapshot for Slop Bot.
+
+Built once per scan by SlopOrchestrator and handed to every analysis loop, so
+the codebase is walked and each file read once per scan instead of once per
+loop. Each file records its language, size, content hash and whether it
+changed since the previous scan's snapshot; the scheduler uses these to size
+batches and to favour recently changed code.
+
+Usage:
+    from services.slop.snapshot import FileSnapshot
+
+    snapshot = FileSnapshot.build(".", previous=last_snapshot)
+    for batch in snapshot.batches(snapshot.paths, max_tokens=30_000):
+        ...
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+from services.slop.external_tools import ExternalTools
+
+logger = logging.getLogger(__name__)
+
+# Path substrings excluded from analysis
+EXCLUDED_PATTERNS = [
+    "__pycache__",
+    ".git",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".tox",
+    "dist",
+    "build",
+    ".egg",
+]
+
+# Files analyzed per scan (keeps each loop's LLM work bounded)
+MAX_FILES = 100
+
+# Same rough heuristic as server/session_builder.estimate_tokens
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of a prompt or response."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def discover_files(
+    codebase_path: Optional[str] = None, max_files: int = MAX_FILES
+) -> list[str]:
+    """Python files to analyze under a codebase, minus excluded paths."""
+    path = Path(codebase_path or ".")
+    files = []
+    for file_path in path.glob("**/*.py"):
+        # Only match below the root, so a checkout under e.g. ~/build works
+        relative = str(file_path.relative_to(path))
+        if any(excl in relative for excl in EXCLUDED_PATTERNS):
+            continue
+        files.append(str(file_path))
+    return files[:max_files]
+
+
+def _sha256(path: str) -> Optional[str]:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """One file in a scan snapshot."""
+
+    path: str
+    language: str
+    size: int
+    digest: Optional[str]
+    changed: bool
+
+    @property
+    def tokens(self) -> int:
+        """Estimated tokens for the file's content."""
+        return max(1, self.size // CHARS_PER_TOKEN)
+
+
+class FileSnapshot:
+    """The files of one scan, shared by all loops."""
+
+    def __init__(self, root: str, files: dict[str, FileInfo]):
+        self.root = root
+        self.files = files
+        self.created_at = datetime.now()
+
+    @classmethod
+    def build(
+        cls,
+        codebase_path: Optional[str] = None,
+        previous: Optional["FileSnapshot"] = None,
+        hasher: Optional[Callable[[str], Optional[str]]] = None,
+        max_files: int = MAX_FILES,
+    ) -> "FileSnapshot":
+        """
+        Walk the codebase and hash every file once.
+
+        Args:
+            codebase_path: Codebase root
+            previous: Snapshot of the previous scan, for change detection
+            hasher: Content hash function (e.g. ExternalTools.content_hash,
+                which memoizes by mtime so the tools don't re-read files)
+            max_files: Maximum files in the snapshot
+
+        Returns:
+            FileSnapshot
+        """
+        hasher = hasher or _sha256
+        root = codebase_path or "."
+        files = {}
+        for path in discover_files(root, max_files):
+            try:
+                size = Path(path).stat().st_size
+            except OSError:
+                continue
+            digest = hasher(path)
+            before = previous.get(path) if previous else None
+            files[path] = FileInfo(
+                path=path,
+                language=ExternalTools.EXTENSION_MAP.get(
+                    Path(path).suffix.lower(), "unknown"
+                ),
+                size=size,
+                digest=digest,
+                changed=before is None or before.digest != digest,
+            )
+
+        snapshot = cls(root, files)
+        logger.info(
+            f"Snapshot of {root}: {len(files)} files, "
+            f"{len(snapshot.changed_paths())} changed since last scan"
+        )
+        return snapshot
+
+    @property
+    def paths(self) -> list[str]:
+        """All file paths in the snapshot."""
+        return list(self.files)
+
+    def get(self, path: str) -> Optional[FileInfo]:
+        """Info for one file, or None if it is not in the snapshot."""
+        return self.files.get(path)
+
+    def changed_paths(self, paths: Optional[list[str]] = None) -> list[str]:
+        """Paths that are new or changed since the previous snapshot."""
+        candidates = self.paths if paths is None else paths
+        return [p for p in candidates if p in self.files and self.files[p].changed]
+
+    def tokens(self, paths: list[str]) -> int:
+        """Estimated tokens for a set of files (unknown files count as 1)."""
+        return sum(self.files[p].tokens if p in self.files else 1 for p in paths)
+
+    def batches(
+        self, paths: list[str], max_tokens: int, max_files: int = 25
+    ) -> list[list[str]]:
+        """
+        Split files into batches of bounded size, keeping input order.
+
+        A batch closes when adding the next file would exceed ``max_tokens``
+        or it holds ``max_files`` files; a single oversized file gets its own
+        batch.
+        """
+        batches: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for path in paths:
+            tokens = self.tokens([path])
+            if current and (
+                current_tokens + tokens > max_tokens or len(current) >= max_files
+            ):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(path)
+            current_tokens += tokens
+        if current:
+            batches.append(current)
+        return batches
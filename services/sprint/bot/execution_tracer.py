@@ -22,15 +22,29 @@ Usage:
     # Transition state
     tracer.transition("analyzing", "classifying", trigger="issue_loaded")
 
-    # Save trace
+    # Save trace (appends new events to the issue's log)
     tracer.save()
 
     # Generate Mermaid diagram
     mermaid = tracer.to_mermaid()
+
+Storage:
+    Each issue has an append-only event log, ``TRACES_DIR/<issue_key>.jsonl``:
+    ``save()`` appends only the steps, transitions and trace metadata that
+    changed since the last save (a re-saved step supersedes its earlier
+    record). A SQLite index (``TRACES_DIR/index.db``) holds one summary row
+    per issue (state, timestamps, step counts), so ``list_traces()`` never
+    reads the logs. ``ExecutionTracer.load()`` starts from the index row and
+    replays the log only when steps or transitions are first needed (e.g.
+    ``to_mermaid()`` or ``to_timeline_html()``). Traces saved as YAML by
+    earlier versions are migrated on first use.
 """
 
+import json
 import logging
+import sqlite3
 import time
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -45,6 +59,9 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 TRACES_DIR = PROJECT_ROOT / "memory" / "state" / "sprint_traces"
 
+# Summary index over the per-issue event logs
+TRACE_INDEX_FILE = "index.db"
+
 
 class StepStatus(str, Enum):
     """Status of an execution step."""
@@ -126,6 +143,25 @@ class StepTrace:
             d["chat_id"] = self.chat_id
         return d
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "StepTrace":
+        """Rebuild a step from its serialized form."""
+        return cls(
+            step_id=data["step_id"],
+            name=data["name"],
+            timestamp=data["timestamp"],
+            duration_ms=data.get("duration_ms"),
+            status=StepStatus(data.get("status", "success")),
+            inputs=data.get("inputs", {}),
+            outputs=data.get("outputs", {}),
+            decision=data.get("decision"),
+            reason=data.get("reason"),
+            error=data.get("error"),
+            skill_name=data.get("skill_name"),
+            tool_name=data.get("tool_name"),
+            chat_id=data.get("chat_id"),
+        )
+
 
 @dataclass
 class StateTransition:
@@ -150,6 +186,17 @@ class StateTransition:
             d["data"] = self.data
         return d
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "StateTransition":
+        """Rebuild a transition from its serialized form."""
+        return cls(
+            from_state=data["from_state"],
+            to_state=data["to_state"],
+            timestamp=data["timestamp"],
+            trigger=data.get("trigger"),
+            data=data.get("data", {}),
+        )
+
 
 class ExecutionTracer:
     """
@@ -160,7 +207,7 @@ class ExecutionTracer:
     - State machine transition tracking
     - Decision point recording with reasoning
     - Mermaid diagram generation
-    - Persistence to YAML files
+    - Persistence to an append-only event log plus a summary index
     """
 
     # State machine definition - valid transitions
@@ -285,20 +332,49 @@ class ExecutionTracer:
         self.completed_at: Optional[str] = None
 
         self.current_state = WorkflowState.IDLE
-        self.steps: list[StepTrace] = []
-        self.transitions: list[StateTransition] = []
+        # None until replayed from the event log (see load())
+        self._steps: Optional[list[StepTrace]] = []
+        self._transitions: Optional[list[StateTransition]] = []
+        self._summary: dict = {}
 
         self._step_counter = 0
         self._step_start_time: Optional[float] = None
         self._current_step: Optional[StepTrace] = None
 
+        # What the event log already holds, so save() appends only changes
+        self._saved_meta: Optional[dict] = None
+        self._saved_steps: dict[str, dict] = {}
+        self._saved_transitions = 0
+
         # Ensure traces directory exists
         TRACES_DIR.mkdir(parents=True, exist_ok=True)
 
     @property
     def trace_path(self) -> Path:
-        """Path to the trace file for this issue."""
-        return TRACES_DIR / f"{self.issue_key}.yaml"
+        """Path to the event log for this issue."""
+        return _log_path(self.issue_key)
+
+    @property
+    def steps(self) -> list[StepTrace]:
+        """Execution steps (replayed from the event log on first access)."""
+        if self._steps is None:
+            self._materialize()
+        return self._steps
+
+    @property
+    def transitions(self) -> list[StateTransition]:
+        """State transitions (replayed from the event log on first access)."""
+        if self._transitions is None:
+            self._materialize()
+        return self._transitions
+
+    def _materialize(self) -> None:
+        """Replay this issue's event log into steps and transitions."""
+        _, steps, transitions = _read_log(self.trace_path)
+        self._steps = [StepTrace.from_dict(d) for d in steps.values()]
+        self._transitions = [StateTransition.from_dict(d) for d in transitions]
+        self._saved_steps = steps
+        self._saved_transitions = len(transitions)
 
     def start_step(
         self,
@@ -554,14 +630,50 @@ class ExecutionTracer:
             "final_state": self.current_state.value,
         }
 
+    def _meta(self) -> dict:
+        return {
+            "issue_key": self.issue_key,
+            "workflow_type": self.workflow_type,
+            "execution_mode": self.execution_mode,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
+            "current_state": self.current_state.value,
+        }
+
+    def _pending_events(self) -> list[dict]:
+        """Log records for everything changed since the last save."""
+        events = []
+        meta = self._meta()
+        if meta != self._saved_meta:
+            events.append({"type": "trace", **meta})
+        if self._steps is not None:
+            for step in self._steps:
+                data = step.to_dict()
+                if self._saved_steps.get(step.step_id) != data:
+                    events.append({"type": "step", **data})
+        if self._transitions is not None:
+            for transition in self._transitions[self._saved_transitions :]:
+                events.append({"type": "transition", **transition.to_dict()})
+        return events
+
     def save(self) -> Path:
-        """Save trace to YAML file."""
+        """Append changes to the event log and update the summary index."""
         try:
-            data = self.to_dict()
-            self.trace_path.write_text(
-                yaml.dump(data, default_flow_style=False, sort_keys=False)
-            )
-            logger.info(f"[Tracer] Saved trace to {self.trace_path}")
+            events = self._pending_events()
+            if not events:
+                return self.trace_path
+            with open(self.trace_path, "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(e, default=str) + "\n" for e in events))
+
+            self._saved_meta = self._meta()
+            if self._steps is not None:
+                self._saved_steps = {s.step_id: s.to_dict() for s in self._steps}
+                self._summary = self._generate_summary()
+            if self._transitions is not None:
+                self._saved_transitions = len(self._transitions)
+            _index_trace(self._saved_meta, self._summary)
+
+            logger.debug(f"[Tracer] Appended {len(events)} events to {self.trace_path}")
             return self.trace_path
         except Exception as e:
             logger.error(f"[Tracer] Failed to save trace: {e}")
@@ -569,66 +681,79 @@ class ExecutionTracer:
 
     @classmethod
     def load(cls, issue_key: str) -> Optional["ExecutionTracer"]:
-        """Load an existing trace from file."""
-        trace_path = TRACES_DIR / f"{issue_key}.yaml"
-        if not trace_path.exists():
-            return None
+        """Load an existing trace.
 
-        try:
-            data = yaml.safe_load(trace_path.read_text())
+        Metadata comes from the summary index; steps and transitions are
+        replayed from the event log when first accessed. If the index can't
+        be read (e.g. a locked index.db) the log is replayed instead, so
+        None always means there is no trace to continue.
 
-            tracer = cls(
-                issue_key=data["issue_key"],
-                workflow_type=data.get("workflow_type"),
-                execution_mode=data.get("execution_mode", "foreground"),
-            )
-
-            tracer.started_at = data.get("started_at", tracer.started_at)
-            tracer.completed_at = data.get("completed_at")
-
-            # Restore state
-            try:
-                tracer.current_state = WorkflowState(data.get("current_state", "idle"))
-            except ValueError:
-                tracer.current_state = WorkflowState.IDLE
-
-            # Restore steps
-            for step_data in data.get("steps", []):
-                step = StepTrace(
-                    step_id=step_data["step_id"],
-                    name=step_data["name"],
-                    timestamp=step_data["timestamp"],
-                    duration_ms=step_data.get("duration_ms"),
-                    status=StepStatus(step_data.get("status", "success")),
-                    inputs=step_data.get("inputs", {}),
-                    outputs=step_data.get("outputs", {}),
-                    decision=step_data.get("decision"),
-                    reason=step_data.get("reason"),
-                    error=step_data.get("error"),
-                    skill_name=step_data.get("skill_name"),
-                    tool_name=step_data.get("tool_name"),
-                    chat_id=step_data.get("chat_id"),
-                )
-                tracer.steps.append(step)
-
-            # Restore transitions
-            for trans_data in data.get("transitions", []):
-                trans = StateTransition(
-                    from_state=trans_data["from_state"],
-                    to_state=trans_data["to_state"],
-                    timestamp=trans_data["timestamp"],
-                    trigger=trans_data.get("trigger"),
-                    data=trans_data.get("data", {}),
-                )
-                tracer.transitions.append(trans)
+        Raises:
+            OSError: The event log exists but can't be read
+        """
+        log_path = _log_path(issue_key)
+        yaml_path = TRACES_DIR / f"{issue_key}.yaml"
+        if not log_path.exists() and yaml_path.exists():
+            # Not migrated yet (the index may be unreadable): do it now
+            _migrate_yaml(yaml_path)
+        if not log_path.exists():
+            return None
+        try:
+            row = _index_row(issue_key)
+            index_ok = True
+        except sqlite3.Error as e:
+            logger.warning(f"[Tracer] Trace index unavailable, replaying log: {e}")
+            row, index_ok = None, False
+
+        if row is None:
+            # Log without a readable index row: replay it now
+            meta, steps, transitions = _read_log(log_path)
+            tracer = cls._from_meta(meta or {"issue_key": issue_key})
+            tracer._steps = [StepTrace.from_dict(d) for d in steps.values()]
+            tracer._transitions = [StateTransition.from_dict(d) for d in transitions]
+            tracer._summary = tracer._generate_summary()
+            tracer._step_counter = len(tracer._steps)
+            if index_ok:
+                try:
+                    _index_trace(tracer._meta(), tracer._summary)
+                except sqlite3.Error as e:
+                    logger.warning(f"[Tracer] Failed to index {issue_key}: {e}")
+        else:
+            tracer = cls._from_meta(row)
+            tracer._summary = row["summary"]
+            tracer._steps = None
+            tracer._transitions = None
+            tracer._step_counter = tracer._summary.get("total_steps", 0)
+        tracer._saved_meta = tracer._meta()
+        return tracer
 
-            tracer._step_counter = len(tracer.steps)
+    @classmethod
+    def _from_meta(cls, meta: dict) -> "ExecutionTracer":
+        tracer = cls(
+            issue_key=meta["issue_key"],
+            workflow_type=meta.get("workflow_type"),
+            execution_mode=meta.get("execution_mode") or "foreground",
+        )
+        tracer.started_at = meta.get("started_at") or tracer.started_at
+        tracer.completed_at = meta.get("completed_at")
 
-            return tracer
+        # Restore state
+        try:
+            tracer.current_state = WorkflowState(meta.get("current_state", "idle"))
+        except ValueError:
+            tracer.current_state = WorkflowState.IDLE
+        return tracer
 
-        except Exception as e:
-            logger.error(f"[Tracer] Failed to load trace: {e}")
-            return None
+    @classmethod
+    def _from_dict(cls, data: dict) -> "ExecutionTracer":
+        """Build a fully materialized tracer from a to_dict() snapshot."""
+        tracer = cls._from_meta(data)
+        tracer._steps = [StepTrace.from_dict(d) for d in data.get("steps", [])]
+        tracer._transitions = [
+            StateTransition.from_dict(d) for d in data.get("transitions", [])
+        ]
+        tracer._step_counter = len(tracer._steps)
+        return tracer
 
     def to_mermaid(self, highlight_path: bool = True) -> str:
         """
@@ -834,52 +959,193 @@ class ExecutionTracer:
         return "\n".join(html_parts)
 
 
-def list_traces() -> list[dict]:
-    """List all available traces with summary info."""
-    traces = []
+def _log_path(issue_key: str) -> Path:
+    return TRACES_DIR / f"{issue_key}.jsonl"
+
 
-    if not TRACES_DIR.exists():
-        return traces
+def _read_log(path: Path) -> tuple[dict, dict[str, dict], list[dict]]:
+    """Replay an event log.
 
-    for trace_file in TRACES_DIR.glob("*.yaml"):
+    Returns:
+        Tuple of (latest trace metadata, steps by step_id in first-seen
+        order with the latest record winning, transitions in order)
+    """
+    meta: dict = {}
+    steps: dict[str, dict] = {}
+    transitions: list[dict] = []
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return meta, steps, transitions
+    for line in lines:
         try:
-            data = yaml.safe_load(trace_file.read_text())
-            traces.append(
-                {
-                    "issue_key": data.get("issue_key"),
-                    "workflow_type": data.get("workflow_type"),
-                    "current_state": data.get("current_state"),
-                    "started_at": data.get("started_at"),
-                    "completed_at": data.get("completed_at"),
-                    "summary": data.get("summary", {}),
-                }
-            )
-        except Exception as e:
-            logger.warning(f"Failed to read trace {trace_file}: {e}")
+            event = json.loads(line)
+            kind = event.pop("type")
+        except (ValueError, KeyError, AttributeError):
+            # A write cut short by a crash leaves a partial last line
+            logger.debug(f"Skipping unreadable trace event in {path}")
+            continue
+        if kind == "trace":
+            meta = event
+        elif kind == "step":
+            steps[event["step_id"]] = event
+        elif kind == "transition":
+            transitions.append(event)
+    return meta, steps, transitions
+
+
+_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS traces (
+    issue_key TEXT PRIMARY KEY,
+    workflow_type TEXT,
+    execution_mode TEXT,
+    state TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    total_steps INTEGER DEFAULT 0,
+    successful_steps INTEGER DEFAULT 0,
+    failed_steps INTEGER DEFAULT 0,
+    total_duration_ms INTEGER DEFAULT 0,
+    total_transitions INTEGER DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS traces_started_at ON traces (started_at);
+"""
 
-    # Sort by started_at descending
-    traces.sort(key=lambda t: t.get("started_at", ""), reverse=True)
+_SUMMARY_COLUMNS = (
+    "total_steps",
+    "successful_steps",
+    "failed_steps",
+    "total_duration_ms",
+    "total_transitions",
+)
+
+# Trace directories whose index has been caught up with the logs this process
+_prepared_dirs: set[Path] = set()
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the summary index, creating and backfilling it on first use."""
+    TRACES_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(TRACES_DIR / TRACE_INDEX_FILE), timeout=10)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_INDEX_SCHEMA)
+    if TRACES_DIR not in _prepared_dirs:
+        _prepared_dirs.add(TRACES_DIR)
+        _backfill_index(conn)
+    return conn
+
+
+def _migrate_yaml(yaml_path: Path) -> None:
+    """Rewrite a YAML trace from earlier versions as an event log."""
+    if _log_path(yaml_path.stem).exists():
+        return
+    try:
+        data = yaml.safe_load(yaml_path.read_text())
+        tracer = ExecutionTracer._from_dict(data)
+        events = tracer._pending_events()
+        tracer.trace_path.write_text(
+            "".join(json.dumps(e, default=str) + "\n" for e in events),
+            encoding="utf-8",
+        )
+        yaml_path.unlink()
+        logger.info(f"[Tracer] Migrated {yaml_path.name} to an event log")
+    except Exception as e:
+        logger.warning(f"Failed to migrate trace {yaml_path}: {e}")
+
+
+def _backfill_index(conn: sqlite3.Connection) -> None:
+    """Migrate YAML traces and index logs the index doesn't know about."""
+    for yaml_path in TRACES_DIR.glob("*.yaml"):
+        _migrate_yaml(yaml_path)
+
+    indexed = {row[0] for row in conn.execute("SELECT issue_key FROM traces")}
+    for log_path in TRACES_DIR.glob("*.jsonl"):
+        if log_path.stem in indexed:
+            continue
+        meta, steps, transitions = _read_log(log_path)
+        if not meta:
+            continue
+        tracer = ExecutionTracer._from_meta(meta)
+        tracer._steps = [StepTrace.from_dict(d) for d in steps.values()]
+        tracer._transitions = [StateTransition.from_dict(d) for d in transitions]
+        _write_index_row(conn, tracer._meta(), tracer._generate_summary())
+    conn.commit()
+
+
+def _write_index_row(conn: sqlite3.Connection, meta: dict, summary: dict) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO traces (issue_key, workflow_type, execution_mode,"
+        " state, started_at, completed_at, total_steps, successful_steps,"
+        " failed_steps, total_duration_ms, total_transitions)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            meta["issue_key"],
+            meta.get("workflow_type"),
+            meta.get("execution_mode"),
+            meta.get("current_state"),
+            meta.get("started_at"),
+            meta.get("completed_at"),
+            *(summary.get(column, 0) for column in _SUMMARY_COLUMNS),
+        ),
+    )
 
-    return traces
 
+def _index_trace(meta: dict, summary: dict) -> None:
+    """Record a trace's summary row."""
+    with closing(_connect()) as conn, conn:
+        _write_index_row(conn, meta, summary)
 
-def get_trace(issue_key: str) -> Optional[dict]:
-    """Get a trace by issue key."""
-    trace_path = TRACES_DIR / f"{issue_key}.yaml"
-    if not trace_path.exists():
+
+def _row_to_trace(row: sqlite3.Row) -> dict:
+    summary = {column: row[column] or 0 for column in _SUMMARY_COLUMNS}
+    summary["final_state"] = row["state"]
+    return {
+        "issue_key": row["issue_key"],
+        "workflow_type": row["workflow_type"],
+        "execution_mode": row["execution_mode"],
+        "current_state": row["state"],
+        "started_at": row["started_at"],
+        "completed_at": row["completed_at"],
+        "summary": summary,
+    }
+
+
+def _index_row(issue_key: str) -> Optional[dict]:
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT * FROM traces WHERE issue_key = ?", (issue_key,)
+        ).fetchone()
+    if row is None or not _log_path(issue_key).exists():
         return None
+    return _row_to_trace(row)
 
+
+def list_traces() -> list[dict]:
+    """List all available traces with summary info (newest first)."""
     try:
-        return yaml.safe_load(trace_path.read_text())
-    except Exception as e:
-        logger.error(f"Failed to load trace for {issue_key}: {e}")
-        return None
+        with closing(_connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM traces ORDER BY started_at DESC"
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to read trace index: {e}")
+        return []
+    return [_row_to_trace(row) for row in rows]
+
+
+def get_trace(issue_key: str) -> Optional[dict]:
+    """Get a full trace by issue key."""
+    tracer = ExecutionTracer.load(issue_key)
+    return tracer.to_dict() if tracer else None
 
 
 def delete_trace(issue_key: str) -> bool:
-    """Delete a trace file."""
-    trace_path = TRACES_DIR / f"{issue_key}.yaml"
-    if trace_path.exists():
-        trace_path.unlink()
-        return True
-    return False
+    """Delete a trace's event log and index row."""
+    deleted = False
+    for path in (_log_path(issue_key), TRACES_DIR / f"{issue_key}.yaml"):
+        if path.exists():
+            path.unlink()
+            deleted = True
+    with closing(_connect()) as conn, conn:
+        conn.execute("DELETE FROM traces WHERE issue_key = ?", (issue_key,))
+    return deleted
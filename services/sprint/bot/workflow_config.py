@@ -24,11 +24,13 @@ Usage:
 """
 
 import logging
+import re
 from typing import Any, Optional
 
 # Import the centralized ConfigManager and StateManager
 from server.config_manager import config as config_manager
 from server.state_manager import state as state_manager
+from services.sprint.review_checker import compile_hold_patterns
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +46,7 @@ class WorkflowConfig:
         """Initialize the workflow config from ConfigManager."""
         self._config: dict = {}
         self._status_to_stage: dict[str, str] = {}
+        self._merge_hold_regex: Optional[re.Pattern] = None
         self._load_config()
 
     def _load_config(self) -> None:
@@ -56,6 +59,9 @@ class WorkflowConfig:
         if sprint_config and isinstance(sprint_config, dict):
             self._config = sprint_config
             self._build_status_mapping()
+            self._merge_hold_regex = compile_hold_patterns(
+                sprint_config.get("merge_hold_patterns", [])
+            )
             logger.debug("Loaded sprint workflow config from config.json")
         else:
             raise RuntimeError(
@@ -279,13 +285,14 @@ class WorkflowConfig:
         Returns:
             Tuple of (has_hold, matching_pattern)
         """
-        patterns = self._config.get("merge_hold_patterns", [])
+        if self._merge_hold_regex is None:
+            return False, None
 
+        patterns = {p.lower(): p for p in self.get_merge_hold_patterns()}
         for comment in comments:
-            comment_lower = comment.lower()
-            for pattern in patterns:
-                if pattern.lower() in comment_lower:
-                    return True, pattern
+            match = self._merge_hold_regex.search(comment)
+            if match:
+                return True, patterns.get(match.group(0).lower(), match.group(0))
 
         return False, None
 
@@ -293,6 +300,10 @@ class WorkflowConfig:
         """Get list of merge hold patterns."""
         return self._config.get("merge_hold_patterns", [])
 
+    def get_merge_hold_regex(self) -> Optional[re.Pattern]:
+        """Merge hold patterns compiled into one whole-word regex (None if unset)."""
+        return self._merge_hold_regex
+
     # ==================== SCHEDULING ====================
 
     def get_scheduling_config(self) -> dict:
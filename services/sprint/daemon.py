@@ -36,6 +36,7 @@ import asyncio
 import json
 import logging
 import os
+import re
 from datetime import datetime, time
 from pathlib import Path
 
@@ -48,6 +49,8 @@ from services.sprint.bot.execution_tracer import (
     ExecutionTracer,
     StepStatus,
     WorkflowState,
+    get_trace,
+    list_traces,
 )
 from services.sprint.bot.workflow_config import (
     COMPLETED_STATUSES,
@@ -55,6 +58,20 @@ from services.sprint.bot.workflow_config import (
     WorkflowConfig,
     get_workflow_config,
 )
+from services.sprint.review_checker import (
+    APPROVED_WITH_HOLD,
+    CHANGES_REQUESTED,
+    CI_FAILING,
+    DEFAULT_HOLD_PATTERNS,
+    NO_MR,
+    READY_TO_MERGE,
+    REVIEW_CHECK_CONCURRENCY,
+    REVIEW_PROJECT,
+    ReviewChecker,
+    ReviewDataUnavailable,
+    ReviewResult,
+    compile_hold_patterns,
+)
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 SPRINT_STATE_FILE = SPRINT_STATE_FILE_V2
@@ -568,17 +585,10 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
             return {"success": False, "error": "issue_key required"}
 
         try:
-            traces_dir = PROJECT_ROOT / "memory" / "state" / "sprint_traces"
-            trace_file = traces_dir / f"{issue_key}.yaml"
-
-            if not trace_file.exists():
+            trace = get_trace(issue_key)
+            if trace is None:
                 return {"success": False, "error": f"No trace found for {issue_key}"}
 
-            import yaml
-
-            with open(trace_file, encoding="utf-8") as f:
-                trace = yaml.safe_load(f)
-
             return {"success": True, "trace": trace}
         except Exception as e:
             logger.error(f"Failed to get trace for {issue_key}: {e}")
@@ -587,34 +597,18 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
     async def _handle_list_traces(self, **kwargs) -> dict:
         """List all available execution traces.
 
-        Returns a list of trace summaries (issue key, state, started_at).
+        Returns a list of trace summaries (issue key, state, started_at),
+        read from the trace index rather than the traces themselves.
         """
         try:
-            traces_dir = PROJECT_ROOT / "memory" / "state" / "sprint_traces"
-            traces = []
-
-            if traces_dir.exists():
-                import yaml
-
-                for trace_file in traces_dir.glob("*.yaml"):
-                    try:
-                        with open(trace_file, encoding="utf-8") as f:
-                            trace = yaml.safe_load(f)
-                        if trace:
-                            traces.append(
-                                {
-                                    "issue_key": trace.get(
-                                        "issue_key", trace_file.stem
-                                    ),
-                                    "state": trace.get("current_state", "unknown"),
-                                    "started_at": trace.get("started_at", ""),
-                                }
-                            )
-                    except Exception as e:
-                        logger.warning(f"Failed to parse trace {trace_file}: {e}")
-
-            # Sort by started_at descending
-            traces.sort(key=lambda t: t.get("started_at", ""), reverse=True)
+            traces = [
+                {
+                    "issue_key": trace["issue_key"],
+                    "state": trace["current_state"] or "unknown",
+                    "started_at": trace["started_at"] or "",
+                }
+                for trace in list_traces()
+            ]
             return {"success": True, "traces": traces}
         except Exception as e:
             logger.error(f"Failed to list traces: {e}")
@@ -1182,8 +1176,10 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
             else:
                 logger.warning(f"Could not get active sprint info: {sprint_info}")
 
-            # Fetch issues from Jira (async)
-            jira_issues = await fetch_sprint_issues(config)
+            # Fetch issues from Jira (async), reusing the sprint looked up above
+            jira_issues = await fetch_sprint_issues(
+                config, sprint_info=sprint_info if current_sprint else None
+            )
 
             if not jira_issues:
                 logger.warning("No issues fetched from Jira, keeping existing state")
@@ -1317,6 +1313,11 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
         3. Check for "don't merge" comments
         4. Merge the MR and transition to Done if ready
 
+        MR data for all review issues is prefetched from GitLab in parallel
+        (falling back to concurrent Claude checks without glab), merges run
+        with the same bounded concurrency, and every issue's outcome is
+        applied to freshly loaded state before a single save.
+
         This automates the final step of the workflow.
         """
         logger.info("Checking issues in Review for merge readiness...")
@@ -1336,40 +1337,167 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
 
         logger.info(f"Found {len(review_issues)} issues in Review")
 
-        # Patterns that indicate "don't merge yet"
-        dont_merge_patterns = [
-            "don't merge",
-            "do not merge",
-            "dont merge",
-            "hold off",
-            "hold merge",
-            "wait until",
-            "don't merge until",
-            "do not merge until",
-            "needs more work",
-            "wip",
-            "work in progress",
+        # One bulk Jira query drops issues that already left Review
+        jira_statuses = await self._fetch_review_statuses(review_issues)
+        review_keys = [
+            issue["key"]
+            for issue in review_issues
+            if issue.get("key")
+            and jira_statuses.get(issue["key"], issue["jiraStatus"]).lower()
+            in REVIEW_STATUSES
         ]
 
-        for issue in review_issues:
-            issue_key = issue.get("key")
-            if not issue_key:
-                continue
+        results = await self._review_results(review_keys)
+        slots = asyncio.Semaphore(REVIEW_CHECK_CONCURRENCY)
 
-            try:
-                await self._check_single_review_issue(issue, dont_merge_patterns, state)
-            except Exception as e:
-                logger.error(f"Error checking review issue {issue_key}: {e}")
-                continue
+        async def merge(result: ReviewResult) -> tuple[str, tuple | None]:
+            async with slots:
+                return result.issue_key, await self._merge_and_close(
+                    result.issue_key, result.mr_id
+                )
 
-        # Save any state changes
+        merges = dict(
+            await asyncio.gather(
+                *(
+                    merge(result)
+                    for result in results.values()
+                    if result.status == READY_TO_MERGE and result.mr_id
+                )
+            )
+        )
+
+        # The checks took a while; apply the outcomes to current state
+        state = self._load_state()
+        for issue in state.get("issues", []):
+            key = issue.get("key")
+            if key in jira_statuses:
+                issue["jiraStatus"] = jira_statuses[key]
+            if key in results:
+                self._apply_review_result(issue, results[key], merges.get(key))
         self._save_state(state)
 
-    async def _check_single_review_issue(
-        self, issue: dict, dont_merge_patterns: list, state: dict
+    async def _fetch_review_statuses(self, review_issues: list[dict]) -> dict[str, str]:
+        """Current Jira status of review issues, from one bulk fetch.
+
+        Returns:
+            Status by issue key (empty if Jira can't be reached)
+        """
+        from tool_modules.aa_jira.src.jira_data import JiraUnavailable, get_jira_data
+
+        keys = [issue["key"] for issue in review_issues if issue.get("key")]
+        try:
+            current = await get_jira_data().get_issues(keys, fields=("status",))
+        except JiraUnavailable as e:
+            logger.debug(f"Skipping Jira status refresh: {e}")
+            return {}
+
+        statuses = {}
+        for key, fresh in current.items():
+            status = (fresh.get("fields", {}).get("status") or {}).get("name")
+            if status:
+                statuses[key] = status
+                if status.lower() not in REVIEW_STATUSES:
+                    logger.info(f"{key} is now {status}, skipping review check")
+        return statuses
+
+    def _merge_hold_regex(self) -> re.Pattern | None:
+        """Merge hold patterns from config (built-in list if none configured)."""
+        return self.workflow_config.get_merge_hold_regex() or compile_hold_patterns(
+            DEFAULT_HOLD_PATTERNS
+        )
+
+    async def _review_results(self, keys: list[str]) -> dict[str, ReviewResult]:
+        """Review outcome per issue: GitLab prefetch, else concurrent Claude checks."""
+        if not keys:
+            return {}
+        hold_regex = self._merge_hold_regex()
+        try:
+            return await ReviewChecker(hold_regex=hold_regex).check(keys)
+        except ReviewDataUnavailable as e:
+            logger.info(f"GitLab prefetch unavailable, asking Claude instead: {e}")
+
+        slots = asyncio.Semaphore(REVIEW_CHECK_CONCURRENCY)
+        patterns = self.workflow_config.get_merge_hold_patterns() or list(
+            DEFAULT_HOLD_PATTERNS
+        )
+
+        async def check(key: str) -> ReviewResult | None:
+            async with slots:
+                try:
+                    return await self._check_single_review_issue(key, patterns)
+                except Exception as e:
+                    logger.error(f"Error checking review issue {key}: {e}")
+                    return None
+
+        checked = await asyncio.gather(*(check(key) for key in keys))
+        return {result.issue_key: result for result in checked if result}
+
+    def _apply_review_result(
+        self,
+        issue: dict,
+        result: ReviewResult,
+        merge: tuple[bool, str | None] | None,
     ) -> None:
-        """Check a single issue in Review and try to merge/close if ready."""
-        issue_key = issue.get("key")
+        """Record a review check (and merge attempt) on an issue."""
+        issue_key = result.issue_key
+        logger.info(f"{issue_key}: MR status = {result.status}, MR ID = {result.mr_id}")
+
+        if result.status == READY_TO_MERGE and merge is not None:
+            merged, error = merge
+            if merged:
+                issue["jiraStatus"] = self.JIRA_STATUS_DONE
+                issue["approvalStatus"] = "completed"
+                _add_timeline_event(
+                    issue,
+                    {
+                        "timestamp": datetime.now().isoformat(),
+                        "action": "merged_and_closed",
+                        "description": f"MR !{result.mr_id} merged, issue closed",
+                        "jiraTransition": self.JIRA_STATUS_DONE,
+                    },
+                )
+                self._issues_completed += 1
+            else:
+                _add_timeline_event(
+                    issue,
+                    {
+                        "timestamp": datetime.now().isoformat(),
+                        "action": "merge_failed",
+                        "description": f"Failed to merge/close: {error}",
+                    },
+                )
+
+        elif result.status == APPROVED_WITH_HOLD:
+            # Log but don't merge
+            logger.info(f"{issue_key}: MR approved but on hold: {result.hold_reason}")
+            _add_timeline_event(
+                issue,
+                {
+                    "timestamp": datetime.now().isoformat(),
+                    "action": "review_hold",
+                    "description": f"MR approved but merge on hold: {result.hold_reason}",
+                },
+            )
+
+        elif result.status == CHANGES_REQUESTED:
+            logger.info(f"{issue_key}: Changes requested on MR")
+            # Could notify or take action here
+
+        elif result.status == CI_FAILING:
+            logger.info(f"{issue_key}: CI is failing")
+            # Could notify or take action here
+
+        elif result.status == NO_MR:
+            logger.warning(f"{issue_key}: No MR found but issue is in Review")
+
+    async def _check_single_review_issue(
+        self, issue_key: str, dont_merge_patterns: list
+    ) -> ReviewResult | None:
+        """Ask Claude for the MR status of one issue in Review.
+
+        Returns:
+            The parsed status, or None if Claude is unavailable or unclear
+        """
         logger.info(f"Checking review status for {issue_key}")
 
         try:
@@ -1378,20 +1506,20 @@ class SprintDaemon(SleepWakeAwareDaemon, DaemonDBusBase, BaseDaemon):
             claude_path = shutil.which("claude")
             if not claude_path:
                 logger.warning("Claude CLI not found, skipping review check")
-                return
+                return None
 
             # Build prompt to check MR status
             prompt = f"""Check the merge request status for Jira issue {issue_key}.
 
 1. First, find the MR for this issue:
    ```
-   gitlab_mr_list(project="automation-analytics/automation-analytics-backend", search="{issue_key}")
+   gitlab_mr_list(project="{REVIEW_PROJECT}", search="{issue_key}")
    ```
 
 2. If an MR exists, check its status:
    - Is it approved?
    - Has the pipeline passed?
-   - Are there any comments containing: {', '.join(dont_merge_patterns[:5])}
+   - Are there any comments containing: {', '.join(dont_merge_patterns)}
 
 3. Report the status in this exact format:
    [MR_STATUS: READY_TO_MERGE] - MR is approved, CI passed, no hold comments
@@ -1423,13 +1551,11 @@ Also output the MR ID if found: [MR_ID: <number>]
                 process.kill()
                 await process.wait()
                 logger.warning(f"Review check timed out for {issue_key}")
-                return
+                return None
 
             output = stdout.decode("utf-8", errors="replace") if stdout else ""
 
             # Parse the status
-            import re
-
             status_match = re.search(
                 r"\[MR_STATUS:\s*(\w+(?:_\w+)*)\](?:\s*reason:\s*(.+))?",
                 output,
@@ -1439,50 +1565,30 @@ Also output the MR ID if found: [MR_ID: <number>]
 
             if not status_match:
                 logger.warning(f"Could not parse MR status for {issue_key}")
-                return
+                return None
 
-            mr_status = status_match.group(1).upper()
-            hold_reason = (
-                status_match.group(2).strip() if status_match.group(2) else None
+            return ReviewResult(
+                issue_key=issue_key,
+                status=status_match.group(1).upper(),
+                mr_id=int(mr_id_match.group(1)) if mr_id_match else None,
+                hold_reason=(
+                    status_match.group(2).strip() if status_match.group(2) else None
+                ),
             )
-            mr_id = int(mr_id_match.group(1)) if mr_id_match else None
-
-            logger.info(f"{issue_key}: MR status = {mr_status}, MR ID = {mr_id}")
-
-            if mr_status == "READY_TO_MERGE" and mr_id:
-                # Merge the MR and transition to Done
-                await self._merge_and_close(issue_key, mr_id, issue, state)
-
-            elif mr_status == "APPROVED_WITH_HOLD":
-                # Log but don't merge
-                logger.info(f"{issue_key}: MR approved but on hold: {hold_reason}")
-                _add_timeline_event(
-                    issue,
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "action": "review_hold",
-                        "description": f"MR approved but merge on hold: {hold_reason}",
-                    },
-                )
-
-            elif mr_status == "CHANGES_REQUESTED":
-                logger.info(f"{issue_key}: Changes requested on MR")
-                # Could notify or take action here
-
-            elif mr_status == "CI_FAILING":
-                logger.info(f"{issue_key}: CI is failing")
-                # Could notify or take action here
-
-            elif mr_status == "NO_MR":
-                logger.warning(f"{issue_key}: No MR found but issue is in Review")
 
         except Exception as e:
             logger.error(f"Error checking MR status for {issue_key}: {e}")
+            return None
 
     async def _merge_and_close(
-        self, issue_key: str, mr_id: int, issue: dict, state: dict
-    ) -> None:
-        """Merge an MR and transition the Jira issue to Done."""
+        self, issue_key: str, mr_id: int
+    ) -> tuple[bool, str | None] | None:
+        """Merge an MR and transition the Jira issue to Done.
+
+        Returns:
+            (merged, error), or None if nothing was attempted or the
+            result couldn't be read
+        """
         logger.info(f"Merging MR !{mr_id} and closing {issue_key}")
 
         try:
@@ -1491,14 +1597,14 @@ Also output the MR ID if found: [MR_ID: <number>]
             claude_path = shutil.which("claude")
             if not claude_path:
                 logger.warning("Claude CLI not found, cannot merge")
-                return
+                return None
 
             # Build prompt to merge and close
             prompt = f"""Merge the MR and close the Jira issue:
 
 1. Merge the MR:
    ```
-   gitlab_mr_merge(project="automation-analytics/automation-analytics-backend",
+   gitlab_mr_merge(project="{REVIEW_PROJECT}",
        mr_id={mr_id}, when_pipeline_succeeds=true)
    ```
 
@@ -1532,54 +1638,30 @@ Also output the MR ID if found: [MR_ID: <number>]
                 process.kill()
                 await process.wait()
                 logger.warning(f"Merge/close timed out for {issue_key}")
-                return
+                return None
 
             output = stdout.decode("utf-8", errors="replace") if stdout else ""
 
             # Parse the result
-            import re
-
             result_match = re.search(
                 r"\[MERGE_RESULT:\s*(\w+)\](?:\s*error:\s*(.+))?", output, re.IGNORECASE
             )
 
-            if result_match:
-                result = result_match.group(1).upper()
-                error = result_match.group(2).strip() if result_match.group(2) else None
-
-                if result == "SUCCESS":
-                    logger.info(
-                        f"Successfully merged MR !{mr_id} and closed {issue_key}"
-                    )
-
-                    # Update local state
-                    issue["jiraStatus"] = self.JIRA_STATUS_DONE
-                    issue["approvalStatus"] = "completed"
-                    _add_timeline_event(
-                        issue,
-                        {
-                            "timestamp": datetime.now().isoformat(),
-                            "action": "merged_and_closed",
-                            "description": f"MR !{mr_id} merged, issue closed",
-                            "jiraTransition": self.JIRA_STATUS_DONE,
-                        },
-                    )
-                    self._issues_completed += 1
-                else:
-                    logger.warning(f"Merge/close failed for {issue_key}: {error}")
-                    _add_timeline_event(
-                        issue,
-                        {
-                            "timestamp": datetime.now().isoformat(),
-                            "action": "merge_failed",
-                            "description": f"Failed to merge/close: {error}",
-                        },
-                    )
-            else:
+            if not result_match:
                 logger.warning(f"Could not parse merge result for {issue_key}")
+                return None
+
+            result = result_match.group(1).upper()
+            error = result_match.group(2).strip() if result_match.group(2) else None
+            if result == "SUCCESS":
+                logger.info(f"Successfully merged MR !{mr_id} and closed {issue_key}")
+                return True, None
+            logger.warning(f"Merge/close failed for {issue_key}: {error}")
+            return False, error
 
         except Exception as e:
             logger.error(f"Error merging/closing {issue_key}: {e}")
+            return None
 
     # ==================== Issue Processing ====================
 
@@ -0,0 +1,254 @@
+"""
+Review-readiness checks for sprint issues in Review.
+
+Instead of one Claude session per issue, the MR data for every review issue
+is prefetched from the GitLab API in parallel: one (paginated) request lists
+the project's open MRs, then details (pipeline, merge status), approvals and
+comments are fetched for the matched MRs with bounded concurrency. Each
+issue is then classified locally; comments are scanned with the merge hold
+patterns compiled into one regex.
+
+Usage:
+    from services.sprint.review_checker import ReviewChecker
+
+    checker = ReviewChecker(project, hold_regex)
+    results = await checker.check(["AAP-1", "AAP-2"])
+    for key, result in results.items():
+        print(key, result.status, result.mr_id)
+
+``check()`` raises ``ReviewDataUnavailable`` when GitLab can't be queried
+(no glab, not logged in); callers then fall back to the Claude check.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable
+from urllib.parse import quote
+
+logger = logging.getLogger(__name__)
+
+# GitLab project whose MRs implement sprint issues
+REVIEW_PROJECT = "automation-analytics/automation-analytics-backend"
+
+# Issues checked (GitLab requests or Claude sessions) at the same time
+REVIEW_CHECK_CONCURRENCY = 4
+
+# Used when config.json has no sprint.merge_hold_patterns
+DEFAULT_HOLD_PATTERNS = [
+    "don't merge",
+    "do not merge",
+    "dont merge",
+    "hold off",
+    "hold merge",
+    "wait until",
+    "don't merge until",
+    "do not merge until",
+    "needs more work",
+    "wip",
+    "work in progress",
+]
+
+# Review outcomes (same vocabulary as the Claude check's [MR_STATUS: ...])
+READY_TO_MERGE = "READY_TO_MERGE"
+APPROVED_WITH_HOLD = "APPROVED_WITH_HOLD"
+NEEDS_APPROVAL = "NEEDS_APPROVAL"
+CI_FAILING = "CI_FAILING"
+CI_PENDING = "CI_PENDING"
+NO_MR = "NO_MR"
+CHANGES_REQUESTED = "CHANGES_REQUESTED"
+
+
+class ReviewDataUnavailable(Exception):
+    """GitLab could not be queried for review data."""
+
+
+def compile_hold_patterns(patterns: Iterable[str]) -> re.Pattern | None:
+    """Compile merge hold phrases into one case-insensitive regex.
+
+    Phrases match as whole words, so "wip" holds "WIP: fix" but not "wipe".
+    Longer phrases are tried first so the reported match is the most specific.
+
+    Returns:
+        The regex, or None when there are no patterns
+    """
+    phrases = sorted({p.strip() for p in patterns if p.strip()}, key=len, reverse=True)
+    if not phrases:
+        return None
+    alternation = "|".join(re.escape(p) for p in phrases)
+    return re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+
+
+def find_hold(texts: Iterable[str], hold_regex: re.Pattern | None) -> str | None:
+    """First text matching a merge hold pattern (trimmed), or None."""
+    if hold_regex is None:
+        return None
+    for text in texts:
+        if text and hold_regex.search(text):
+            return " ".join(text.split())[:200]
+    return None
+
+
+@dataclass
+class ReviewResult:
+    """Outcome of a review-readiness check for one issue."""
+
+    issue_key: str
+    status: str
+    mr_id: int | None = None
+    hold_reason: str | None = None
+
+
+@dataclass
+class MergeRequestData:
+    """What the review decision needs to know about an MR."""
+
+    iid: int
+    title: str
+    draft: bool = False
+    pipeline_status: str | None = None
+    merge_status: str = ""
+    approved: bool = False
+    comments: tuple[str, ...] = ()
+
+
+def classify(
+    issue_key: str, mr: MergeRequestData | None, hold_regex: re.Pattern | None
+) -> ReviewResult:
+    """Decide whether an issue's MR can be merged."""
+    if mr is None:
+        return ReviewResult(issue_key, NO_MR)
+    if mr.pipeline_status in ("failed", "canceled"):
+        return ReviewResult(issue_key, CI_FAILING, mr.iid)
+    if mr.merge_status == "requested_changes":
+        return ReviewResult(issue_key, CHANGES_REQUESTED, mr.iid)
+    if not mr.approved:
+        return ReviewResult(issue_key, NEEDS_APPROVAL, mr.iid)
+    hold = "MR is a draft" if mr.draft else find_hold(mr.comments, hold_regex)
+    if hold:
+        return ReviewResult(issue_key, APPROVED_WITH_HOLD, mr.iid, hold)
+    if mr.pipeline_status not in (None, "success", "skipped"):
+        return ReviewResult(issue_key, CI_PENDING, mr.iid)
+    return ReviewResult(issue_key, READY_TO_MERGE, mr.iid)
+
+
+def _join_pages(output: str) -> list:
+    """Items of ``glab api --paginate`` output: one JSON array per page.
+
+    Raises:
+        ValueError: The output is not a sequence of JSON arrays
+    """
+    decoder = json.JSONDecoder()
+    items: list = []
+    pos = 0
+    while True:
+        while pos < len(output) and output[pos].isspace():
+            pos += 1
+        if pos == len(output):
+            return items
+        page, pos = decoder.raw_decode(output, pos)
+        if not isinstance(page, list):
+            raise ValueError(f"expected a list page, got {type(page).__name__}")
+        items.extend(page)
+
+
+class ReviewChecker:
+    """Prefetches GitLab MR data for review issues and classifies them."""
+
+    def __init__(
+        self,
+        project: str = REVIEW_PROJECT,
+        hold_regex: re.Pattern | None = None,
+        concurrency: int = REVIEW_CHECK_CONCURRENCY,
+    ):
+        self.project = project
+        self.hold_regex = hold_regex
+        self._slots = asyncio.Semaphore(concurrency)
+
+    async def _api(self, path: str, paginate: bool = False) -> Any:
+        """GET a GitLab API path through glab (auth and host come from glab).
+
+        With ``paginate``, glab follows the next-page links and the pages of
+        the list are joined into one.
+        """
+        from server.utils import get_gitlab_host, run_cmd_full
+
+        cmd = ["glab", "api", path]
+        if paginate:
+            cmd.append("--paginate")
+        async with self._slots:
+            success, stdout, stderr = await run_cmd_full(
+                cmd,
+                env={"GITLAB_HOST": get_gitlab_host()},
+                timeout=60,
+            )
+        if not success:
+            raise ReviewDataUnavailable(f"glab api {path}: {(stderr or stdout)[:300]}")
+        try:
+            return _join_pages(stdout) if paginate else json.loads(stdout)
+        except ValueError as e:
+            raise ReviewDataUnavailable(f"glab api {path}: bad JSON: {e}") from e
+
+    def _project_path(self) -> str:
+        return f"projects/{quote(self.project, safe='')}"
+
+    @staticmethod
+    def match_mrs(keys: Iterable[str], open_mrs: list[dict]) -> dict[str, dict]:
+        """Open MR for each issue key (by title or branch; newest first wins)."""
+        matched = {}
+        for key in keys:
+            key_re = re.compile(rf"(?<![A-Za-z0-9]){re.escape(key)}(?!\d)", re.I)
+            for mr in open_mrs:
+                text = f"{mr.get('title', '')} {mr.get('source_branch', '')}"
+                if key_re.search(text):
+                    matched[key] = mr
+                    break
+        return matched
+
+    async def _mr_data(self, mr: dict) -> MergeRequestData:
+        base = f"{self._project_path()}/merge_requests/{mr['iid']}"
+        details, approvals, notes = await asyncio.gather(
+            self._api(base),
+            self._api(f"{base}/approvals"),
+            self._api(f"{base}/notes?per_page=100&sort=desc", paginate=True),
+        )
+        pipeline = details.get("head_pipeline") or {}
+        return MergeRequestData(
+            iid=int(mr["iid"]),
+            title=details.get("title", mr.get("title", "")),
+            draft=bool(details.get("draft") or details.get("work_in_progress")),
+            pipeline_status=pipeline.get("status"),
+            merge_status=details.get("detailed_merge_status", ""),
+            approved=bool(approvals.get("approved")),
+            comments=tuple(
+                note.get("body", "") for note in notes if not note.get("system")
+            ),
+        )
+
+    async def check(self, keys: list[str]) -> dict[str, ReviewResult]:
+        """Review results for issue keys.
+
+        Raises:
+            ReviewDataUnavailable: The open MR list could not be fetched
+        """
+        open_mrs = await self._api(
+            f"{self._project_path()}/merge_requests?state=opened&per_page=100",
+            paginate=True,
+        )
+        matched = self.match_mrs(keys, open_mrs)
+        fetched = await asyncio.gather(
+            *(self._mr_data(mr) for mr in matched.values()), return_exceptions=True
+        )
+        data = dict(zip(matched, fetched))
+
+        results = {}
+        for key in keys:
+            mr = data.get(key)
+            if isinstance(mr, Exception):
+                # One MR failing shouldn't hold back the others; retry next run
+                logger.warning(f"Could not fetch MR data for {key}: {mr}")
+                continue
+            results[key] = classify(key, mr, self.hold_regex)
+        return results
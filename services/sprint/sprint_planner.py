@@ -161,8 +161,10 @@ class SprintPlanner:
             else:
                 logger.warning(f"Could not get active sprint info: {sprint_info}")
 
-            # Fetch issues from Jira (async)
-            jira_issues = await fetch_sprint_issues(config)
+            # Fetch issues from Jira (async), reusing the sprint looked up above
+            jira_issues = await fetch_sprint_issues(
+                config, sprint_info=sprint_info if current_sprint else None
+            )
 
             if not jira_issues:
                 logger.warning("No issues fetched from Jira, keeping existing state")
@@ -3,7 +3,8 @@
 Stats Daemon - Serves agent statistics via D-Bus
 
 This daemon provides D-Bus access to agent statistics files:
-- agent_stats.json: Tool calls, skill executions, memory ops
+- agent_stats.json + agent_stats.journal: Tool calls, skill executions,
+  memory ops (read through agent_stats.query_agent_stats)
 - inference_stats.json: LLM inference statistics
 - skill_execution.json: Current skill execution state
 
@@ -145,7 +146,7 @@ class StatsDaemon(DaemonDBusBase, BaseDaemon):
         return {
             "success": True,
             "state": {
-                "agent_stats": self._load_file(AGENT_STATS_FILE),
+                "agent_stats": self._load_agent_stats(),
                 "inference_stats": self._load_file(INFERENCE_STATS_FILE),
                 "skill_execution": self._load_file(SKILL_EXECUTION_FILE),
                 "performance": performance_data,
@@ -155,7 +156,7 @@ class StatsDaemon(DaemonDBusBase, BaseDaemon):
 
     async def _handle_get_agent_stats(self, **kwargs) -> dict:
         """Get agent statistics (tool calls, skill executions, etc.)."""
-        stats = self._load_file(AGENT_STATS_FILE)
+        stats = self._load_agent_stats()
         if stats is None:
             return {"success": False, "error": "Agent stats file not found"}
         return {"success": True, "stats": stats}
@@ -176,6 +177,23 @@ class StatsDaemon(DaemonDBusBase, BaseDaemon):
 
     # ==================== File Loading ====================
 
+    def _load_agent_stats(self) -> dict | None:
+        """Load agent stats through the agent_stats query API.
+
+        agent_stats.json is only rewritten on journal roll-up, so reading it
+        directly would miss recent events. Falls back to the file if the
+        query API can't be imported.
+        """
+        try:
+            from tool_modules.aa_workflow.src.agent_stats import query_agent_stats
+        except ImportError:
+            return self._load_file(AGENT_STATS_FILE)
+        try:
+            return query_agent_stats()
+        except Exception as e:
+            logger.error(f"Failed to query agent stats: {e}")
+            return self._load_file(AGENT_STATS_FILE)
+
     def _load_file(self, filepath: Path) -> dict | None:
         """Load and cache a JSON file."""
         key = str(filepath)
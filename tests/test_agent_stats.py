@@ -1,11 +1,14 @@
 """Tests for tool_modules.aa_workflow.src.agent_stats."""
 
 import json
+import multiprocessing
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -714,3 +717,101 @@ def test_load_stats_corrupt_file(tmp_path):
                 assert instance._stats["lifetime"]["tool_calls"] == 0
     finally:
         _cleanup()
+
+
+# -----------------------------------------------------------------------
+# Journal (multi-process aggregation)
+# -----------------------------------------------------------------------
+
+
+@pytest.fixture
+def journal_env(tmp_path, monkeypatch):
+    """Enable disk persistence against a temporary stats file."""
+    monkeypatch.delenv("TESTING", raising=False)
+    monkeypatch.setattr(agent_stats, "STATS_FILE", tmp_path / "agent_stats.json")
+    monkeypatch.setattr(agent_stats, "STATS_DIR", tmp_path)
+    monkeypatch.setattr(agent_stats, "ROLLUP_INTERVAL_SECONDS", 3600)
+    yield tmp_path
+    _cleanup()
+
+
+def _new_process_instance():
+    """A separate AgentStats, as another process would have."""
+    agent_stats.AgentStats._instance = None
+    return agent_stats.AgentStats()
+
+
+def test_record_appends_journal_without_rewriting_summary(journal_env):
+    s = _new_process_instance()
+    s.record_tool_call("tool_a", True, 5)
+    s.record_memory_read()
+
+    lines = (journal_env / "agent_stats.journal").read_text().splitlines()
+    assert [json.loads(line)["e"] for line in lines] == ["tool", "mem_r"]
+    assert not (journal_env / "agent_stats.json").exists()
+    assert s.get_lifetime_stats()["tool_calls"] == 1
+
+
+def test_other_process_events_are_visible(journal_env):
+    first = _new_process_instance()
+    second = _new_process_instance()
+
+    first.record_tool_call("tool_a", True, 5)
+    second.record_tool_call("tool_b", False, 7)
+
+    for s in (first, second):
+        lifetime = s.get_lifetime_stats()
+        assert lifetime["tool_calls"] == 2
+        assert lifetime["tool_failures"] == 1
+        assert lifetime["tool_duration_ms"] == 12
+
+
+def test_rollup_writes_summary_and_truncates_journal(journal_env):
+    first = _new_process_instance()
+    second = _new_process_instance()
+    first.record_skill_execution("deploy", True, 100)
+    second.record_skill_execution("deploy", True, 50)
+
+    first.flush()
+
+    assert (journal_env / "agent_stats.journal").read_bytes() == b""
+    summary = json.loads((journal_env / "agent_stats.json").read_text())
+    assert summary["skills"]["deploy"]["executions"] == 2
+
+    # The other process reloads the summary instead of double counting
+    second.record_skill_execution("deploy", False, 10)
+    for s in (first, second):
+        assert s.get_top_skills() == [("deploy", 3)]
+
+
+def test_query_agent_stats_includes_unrolled_events(journal_env):
+    writer = _new_process_instance()
+    writer.record_lines_written(42)
+
+    agent_stats.AgentStats._instance = None
+    agent_stats._stats = None
+    stats = agent_stats.query_agent_stats()
+
+    assert stats["lifetime"]["lines_written"] == 42
+
+
+def _record_in_child(n):
+    agent_stats.AgentStats._instance = None
+    s = agent_stats.AgentStats()
+    for _ in range(n):
+        s.record_tool_call("parallel_tool", True, 1)
+    s.flush()
+
+
+def test_concurrent_processes_lose_no_events(journal_env, monkeypatch):
+    monkeypatch.setattr(agent_stats, "ROLLUP_MAX_BYTES", 2048)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_record_in_child, args=(50,)) for _ in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(30)
+        assert p.exitcode == 0
+
+    s = _new_process_instance()
+    assert s.get_lifetime_stats()["tool_calls"] == 200
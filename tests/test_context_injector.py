@@ -0,0 +1,259 @@
+"""Tests for scripts/context_injector.py - concurrent context gathering."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scripts.context_injector import ContextCache, ContextInjector, ContextSource
+
+
+def _source(name: str, count: int = 1) -> ContextSource:
+    return ContextSource(
+        source=name,
+        found=count > 0,
+        count=count,
+        results=[{"text": f"{name} result"}] * count,
+    )
+
+
+def _slow(name: str, delay: float):
+    def search(*args):
+        time.sleep(delay)
+        return _source(name)
+
+    return search
+
+
+@pytest.fixture
+def injector(monkeypatch):
+    inj = ContextInjector(project="test", cache=ContextCache())
+    monkeypatch.setattr(inj, "_search_slack", _slow("slack", 0.2))
+    monkeypatch.setattr(inj, "_search_code", _slow("code", 0.2))
+    monkeypatch.setattr(inj, "_search_jira", _slow("jira", 0.2))
+    monkeypatch.setattr(inj, "_search_memory", _slow("memory", 0.2))
+
+    async def inscope(query):
+        await asyncio.sleep(0.2)
+        return _source("inscope")
+
+    monkeypatch.setattr(inj, "_search_inscope", inscope)
+    return inj
+
+
+class TestConcurrentGather:
+    """Sources are queried concurrently."""
+
+    async def test_sources_run_in_parallel(self, injector):
+        start = time.monotonic()
+        ctx = await injector.gather_context_async("how do I deploy?")
+        elapsed = time.monotonic() - start
+
+        assert [s.source for s in ctx.sources] == [
+            "slack",
+            "code",
+            "jira",
+            "memory",
+            "inscope",
+        ]
+        assert ctx.total_results == 5
+        assert elapsed < 0.6  # sequential would be ~1s
+
+    async def test_disabled_sources_are_skipped(self, injector):
+        ctx = await injector.gather_context_async(
+            "q", include_code=False, include_inscope=False
+        )
+        assert [s.source for s in ctx.sources] == ["slack", "jira", "memory"]
+
+    def test_sync_wrapper(self, injector):
+        ctx = injector.gather_context("q", include_inscope=False)
+        assert ctx.total_results == 4
+        assert ctx.formatted
+
+    async def test_sync_wrapper_inside_running_loop(self, injector):
+        ctx = injector.gather_context("q", include_inscope=False)
+        assert ctx.total_results == 4
+
+
+class TestSourceDeadlines:
+    """A slow source is dropped instead of delaying the reply."""
+
+    async def test_slow_source_times_out(self, injector, monkeypatch):
+        monkeypatch.setattr(injector, "_search_code", _slow("code", 1.0))
+        injector.source_deadlines["code"] = 0.1
+
+        start = time.monotonic()
+        ctx = await injector.gather_context_async("q", include_inscope=False)
+        elapsed = time.monotonic() - start
+
+        code = next(s for s in ctx.sources if s.source == "code")
+        assert code.timed_out
+        assert not code.found
+        assert "Timed out" in code.error
+        assert ctx.total_results == 3
+        assert elapsed < 0.6
+
+    async def test_async_source_is_cancelled(self, injector, monkeypatch):
+        cancelled = asyncio.Event()
+
+        async def hang(query):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        monkeypatch.setattr(injector, "_search_inscope", hang)
+        injector.source_deadlines["inscope"] = 0.05
+
+        ctx = await injector.gather_context_async("q")
+
+        assert next(s for s in ctx.sources if s.source == "inscope").timed_out
+        assert cancelled.is_set()
+
+    async def test_jira_subprocess_killed_at_deadline(self, tmp_path, monkeypatch):
+        cli = tmp_path / "rh-issue"
+        cli.write_text("#!/bin/sh\nsleep 5\n")
+        cli.chmod(0o755)
+        monkeypatch.setenv("RH_ISSUE_CLI", str(cli))
+        inj = ContextInjector()
+
+        start = time.monotonic()
+        source = inj._search_jira("q", ["AAP-1", "AAP-2"], time.monotonic() + 0.2)
+
+        assert time.monotonic() - start < 1.0
+        assert [r["status"] for r in source.results] == ["timeout", "timeout"]
+
+    async def test_overall_deadline_caps_sources(self):
+        inj = ContextInjector(source_deadlines={"slack": 60}, deadline_secs=5)
+        assert inj._source_deadline("slack") == 5
+        assert inj._source_deadline("memory") == 3
+
+    async def test_source_exception_is_reported(self, injector, monkeypatch):
+        def boom(query):
+            raise RuntimeError("vector db down")
+
+        monkeypatch.setattr(injector, "_search_slack", boom)
+
+        ctx = await injector.gather_context_async("q", include_inscope=False)
+
+        slack = next(s for s in ctx.sources if s.source == "slack")
+        assert slack.error == "vector db down"
+        assert not slack.timed_out
+        assert ctx.total_results == 3
+
+
+class TestContextCache:
+    """Cross-query caching of per-source results."""
+
+    async def test_repeat_query_is_served_from_cache(self, injector, monkeypatch):
+        await injector.gather_context_async("What broke in AAP-123?")
+        for name in ("_search_slack", "_search_code", "_search_jira", "_search_memory"):
+            monkeypatch.setattr(injector, name, _slow(name, 5.0))
+
+        start = time.monotonic()
+        ctx = await injector.gather_context_async("what broke in aap-123")
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.1
+        assert all(s.cached for s in ctx.sources)
+        assert ctx.total_results == 5
+        assert injector.cache.stats()["hit_rate"] == 0.5
+
+    async def test_errors_are_not_cached(self, injector, monkeypatch):
+        def boom(query):
+            raise RuntimeError("vector db down")
+
+        monkeypatch.setattr(injector, "_search_slack", boom)
+        await injector.gather_context_async("q", include_inscope=False)
+        monkeypatch.setattr(injector, "_search_slack", _slow("slack", 0))
+
+        ctx = await injector.gather_context_async("q", include_inscope=False)
+
+        assert not ctx.get_source("slack").cached
+        assert ctx.get_source("code").cached
+
+    async def test_invalidate_one_source(self, injector):
+        await injector.gather_context_async("q", include_inscope=False)
+
+        assert injector.cache.invalidate("code") == 1
+        ctx = await injector.gather_context_async("q", include_inscope=False)
+
+        assert not ctx.get_source("code").cached
+        assert ctx.get_source("slack").cached
+
+    async def test_version_change_is_a_miss(self, injector, monkeypatch):
+        version = {"code": 1}
+        monkeypatch.setattr(injector, "_source_versions", lambda names: dict(version))
+        await injector.gather_context_async("q", include_inscope=False)
+
+        version["code"] = 2
+        ctx = await injector.gather_context_async("q", include_inscope=False)
+
+        assert not ctx.get_source("code").cached
+        assert ctx.get_source("slack").cached
+
+    async def test_query_embedded_once_off_the_loop(self, injector, monkeypatch):
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def embed(query):
+            calls.append(threading.get_ident())
+            return [1.0, 0.0]
+
+        monkeypatch.setattr(injector, "_query_embedding", embed)
+
+        await injector.gather_context_async("q", include_inscope=False)
+
+        assert len(calls) == 1
+        assert calls[0] != loop_thread
+
+    def test_ttl_expiry(self, monkeypatch):
+        cache = ContextCache(ttl_secs={"memory": 30})
+        cache.store("s", "q", [_source("memory")])
+        now = time.time()
+
+        monkeypatch.setattr(time, "time", lambda: now + 10)
+        assert "memory" in cache.lookup("s", "q", ["memory"])
+        monkeypatch.setattr(time, "time", lambda: now + 60)
+        assert cache.lookup("s", "q", ["memory"]) == {}
+
+    def test_near_duplicate_embedding_hit(self):
+        cache = ContextCache(similarity=0.9)
+        cache.store("s", "how do I deploy", [_source("code")], embedding=[1.0, 0.1])
+
+        hit = cache.lookup("s", "how can I deploy", ["code"], embedding=[1.0, 0.12])
+        miss = cache.lookup("s", "unrelated", ["code"], embedding=[0.0, 1.0])
+
+        assert hit["code"].cached
+        assert miss == {}
+        assert cache.stats()["sources"]["code"]["near_hits"] == 1
+
+    def test_near_duplicate_requires_same_jira_keys(self):
+        cache = ContextCache(similarity=0.9)
+        cache.store(
+            "s",
+            "status of AAP-1",
+            [_source("jira")],
+            jira_keys=frozenset({"AAP-1"}),
+            embedding=[1.0, 0.0],
+        )
+
+        result = cache.lookup(
+            "s",
+            "status of AAP-2",
+            ["jira"],
+            jira_keys=frozenset({"AAP-2"}),
+            embedding=[1.0, 0.0],
+        )
+
+        assert result == {}
+
+    def test_bounded(self):
+        cache = ContextCache(max_entries=2)
+        for query in ("a", "b", "c"):
+            cache.store("s", query, [_source("slack")])
+
+        assert cache.stats()["entries"] == 2
+        assert cache.lookup("s", "a", ["slack"]) == {}
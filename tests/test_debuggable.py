@@ -9,6 +9,7 @@ from fastmcp import FastMCP
 from mcp.types import TextContent
 
 from server.debuggable import (
+    STATUS_PROVIDERS,
     TOOL_REGISTRY,
     _create_debug_wrapper,
     _extract_function,
@@ -17,6 +18,7 @@ from server.debuggable import (
     debuggable,
     get_tool_source,
     register_debug_tool,
+    register_status_provider,
     wrap_all_tools,
     wrap_server_tools_runtime,
 )
@@ -460,6 +462,41 @@ class TestRegisterDebugTool:
         text = result[0].text
         assert "Instructions" in text
 
+    @pytest.mark.asyncio
+    async def test_debug_tool_shows_runtime_status(self):
+        """Status providers show for matching tools and by name."""
+        TOOL_REGISTRY["cache_get_items"] = {
+            "source_file": __file__,
+            "start_line": 1,
+            "end_line": 5,
+            "func_name": "cache_get_items",
+        }
+        register_status_provider(
+            "test_cache", lambda: "### Cache\n- Hit ratio: 90%", ("cache_",)
+        )
+
+        mock_server = MagicMock(spec=FastMCP)
+        registered_fn = None
+
+        def capture(fn):
+            nonlocal registered_fn
+            registered_fn = fn
+            return fn
+
+        mock_server.tool.return_value = capture
+        register_debug_tool(mock_server)
+
+        try:
+            text = (await registered_fn("cache_get_items", ""))[0].text
+            assert "**Runtime status:**" in text
+            assert "Hit ratio: 90%" in text
+
+            text = (await registered_fn("test_cache", ""))[0].text
+            assert text == "### Cache\n- Hit ratio: 90%"
+        finally:
+            STATUS_PROVIDERS.pop("test_cache", None)
+            TOOL_REGISTRY.pop("cache_get_items", None)
+
 
 # ────────────────────────────────────────────────────────────────────
 # wrap_all_tools
@@ -0,0 +1,194 @@
+"""Tests for services/sprint/bot/execution_tracer.py - trace log and index."""
+
+import json
+import sqlite3
+
+import pytest
+import yaml
+
+from services.sprint.bot import execution_tracer
+from services.sprint.bot.execution_tracer import (
+    ExecutionTracer,
+    StepStatus,
+    WorkflowState,
+    delete_trace,
+    get_trace,
+    list_traces,
+)
+
+
+@pytest.fixture(autouse=True)
+def traces_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(execution_tracer, "TRACES_DIR", tmp_path)
+    monkeypatch.setattr(execution_tracer, "_prepared_dirs", set())
+    return tmp_path
+
+
+def _events(tracer):
+    return [json.loads(line) for line in tracer.trace_path.read_text().splitlines()]
+
+
+def _run(issue_key="AAP-1"):
+    tracer = ExecutionTracer(issue_key, workflow_type="code_change")
+    tracer.transition(WorkflowState.LOADING, trigger="start")
+    tracer.save()
+    tracer.log_step("load_issue", outputs={"status": "New"})
+    tracer.save()
+    tracer.transition(WorkflowState.ANALYZING)
+    tracer.log_step("analyze", status=StepStatus.FAILED, error="boom")
+    tracer.save()
+    return tracer
+
+
+class TestSave:
+    def test_appends_only_changes(self):
+        tracer = _run()
+
+        assert [e["type"] for e in _events(tracer)] == [
+            "trace",
+            "transition",
+            "step",
+            "trace",
+            "step",
+            "transition",
+        ]
+
+    def test_save_without_changes_writes_nothing(self):
+        tracer = _run()
+        size = tracer.trace_path.stat().st_size
+
+        tracer.save()
+
+        assert tracer.trace_path.stat().st_size == size
+
+    def test_updated_step_supersedes_earlier_record(self):
+        tracer = ExecutionTracer("AAP-1")
+        step_id = tracer.start_step("implement")
+        tracer.save()
+        tracer.end_step(step_id, outputs={"mr": 5})
+        tracer.save()
+
+        steps = ExecutionTracer.load("AAP-1").steps
+
+        assert [(s.name, s.status) for s in steps] == [
+            ("implement", StepStatus.SUCCESS)
+        ]
+        assert steps[0].outputs == {"mr": 5}
+
+
+class TestLoad:
+    def test_round_trip(self):
+        original = _run()
+
+        loaded = ExecutionTracer.load("AAP-1")
+
+        assert loaded.to_dict() == original.to_dict()
+        assert loaded.to_mermaid() == original.to_mermaid()
+
+    def test_steps_replayed_lazily(self, monkeypatch):
+        _run()
+        reads = []
+        real_read = execution_tracer._read_log
+        monkeypatch.setattr(
+            execution_tracer,
+            "_read_log",
+            lambda path: reads.append(path) or real_read(path),
+        )
+
+        tracer = ExecutionTracer.load("AAP-1")
+        assert tracer.current_state == WorkflowState.ANALYZING
+        assert reads == []
+
+        assert "analyze" in tracer.to_timeline_html()
+        assert len(reads) == 1
+
+    def test_continues_step_numbering(self):
+        _run()
+
+        tracer = ExecutionTracer.load("AAP-1")
+        step_id = tracer.log_step("next")
+        tracer.save()
+
+        assert step_id == "step_3"
+        assert len(ExecutionTracer.load("AAP-1").steps) == 3
+
+    def test_missing_trace(self):
+        assert ExecutionTracer.load("AAP-404") is None
+        assert get_trace("AAP-404") is None
+
+    def test_truncated_last_line_ignored(self):
+        tracer = _run()
+        with open(tracer.trace_path, "a") as f:
+            f.write('{"type": "step", "step_id": ')
+
+        assert len(ExecutionTracer.load("AAP-1").steps) == 2
+
+    def test_unreadable_index_replays_log(self, monkeypatch):
+        original = _run()
+
+        def locked(issue_key):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(execution_tracer, "_index_row", locked)
+        tracer = ExecutionTracer.load("AAP-1")
+
+        assert tracer.to_dict() == original.to_dict()
+        assert tracer.log_step("next") == "step_3"
+
+
+class TestIndex:
+    def test_list_from_index_newest_first(self, monkeypatch):
+        _run("AAP-1")
+        newer = ExecutionTracer("AAP-2")
+        newer.started_at = "2999-01-01T00:00:00Z"
+        newer.save()
+
+        def no_log_reads(path):
+            raise AssertionError("list_traces read an event log")
+
+        monkeypatch.setattr(execution_tracer, "_read_log", no_log_reads)
+        traces = list_traces()
+
+        assert [t["issue_key"] for t in traces] == ["AAP-2", "AAP-1"]
+        assert traces[1]["current_state"] == "analyzing"
+        assert traces[1]["summary"]["total_steps"] == 2
+        assert traces[1]["summary"]["failed_steps"] == 1
+
+    def test_rebuilt_from_logs(self, traces_dir, monkeypatch):
+        _run()
+        (traces_dir / execution_tracer.TRACE_INDEX_FILE).unlink()
+        monkeypatch.setattr(execution_tracer, "_prepared_dirs", set())
+
+        assert [t["issue_key"] for t in list_traces()] == ["AAP-1"]
+
+    def test_yaml_trace_migrated(self, traces_dir):
+        data = _run("AAP-9").to_dict()
+        delete_trace("AAP-9")
+        (traces_dir / "AAP-9.yaml").write_text(yaml.dump(data))
+        execution_tracer._prepared_dirs.clear()
+
+        assert [t["issue_key"] for t in list_traces()] == ["AAP-9"]
+        assert get_trace("AAP-9") == data
+        assert not (traces_dir / "AAP-9.yaml").exists()
+
+    def test_load_yaml_only_trace(self, traces_dir):
+        data = _run("AAP-9").to_dict()
+        delete_trace("AAP-9")
+        (traces_dir / "AAP-9.yaml").write_text(yaml.dump(data))
+        execution_tracer._prepared_dirs.clear()
+
+        tracer = ExecutionTracer.load("AAP-9")
+        assert tracer.to_dict() == data
+        tracer.log_step("new_step")
+        tracer.save()
+
+        steps = ExecutionTracer.load("AAP-9").steps
+        assert [s.name for s in steps] == ["load_issue", "analyze", "new_step"]
+        assert not (traces_dir / "AAP-9.yaml").exists()
+
+    def test_delete(self):
+        _run()
+
+        assert delete_trace("AAP-1")
+        assert list_traces() == []
+        assert not delete_trace("AAP-1")
@@ -0,0 +1,133 @@
+"""Tests for scripts/file_watcher.py - debounced hot-reload file watching."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from scripts import file_watcher
+from scripts.file_watcher import FileWatcher, is_skipped_dir, tool_module_for
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(file_watcher, "POLL_INTERVAL", 0.05)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "mod.py").write_text("x = 1\n")
+    (tmp_path / "src" / "node_modules").mkdir()
+    (tmp_path / "config.json").write_text("{}")
+    return tmp_path
+
+
+def _collect(watcher: FileWatcher, action, timeout: float = 5.0):
+    """Run the watcher in a thread, perform action, return the first batch."""
+    stop = threading.Event()
+    batches: list = []
+
+    def run():
+        for batch in watcher.watch(stop):
+            batches.append(batch)
+            stop.set()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    # Give the watcher time to take its baseline / register watches
+    time.sleep(0.3)
+    action()
+    thread.join(timeout)
+    stop.set()
+    thread.join(1)
+    return batches[0] if batches else None
+
+
+class TestHelpers:
+    def test_tool_module_for(self):
+        root = Path("/repo")
+        assert tool_module_for(root / "tool_modules/aa_git/src/tools.py", root) == (
+            "aa_git"
+        )
+        assert tool_module_for(root / "server/main.py", root) is None
+        assert tool_module_for(root / "tool_modules/README.md", root) is None
+
+    def test_is_skipped_dir(self):
+        assert is_skipped_dir("node_modules")
+        assert is_skipped_dir("pkg.egg-info")
+        assert not is_skipped_dir("src")
+
+    def test_snapshot_prunes_skip_dirs(self, tree):
+        (tree / "src" / "node_modules" / "dep.py").write_text("")
+        watcher = FileWatcher([tree / "src", tree / "config.json"], {".py", ".json"}, 0)
+
+        assert set(watcher.snapshot()) == {
+            tree / "src" / "mod.py",
+            tree / "config.json",
+        }
+
+    def test_skip_rules_ignore_components_above_root(self, tmp_path):
+        root = tmp_path / "build" / "repo"
+        root.mkdir(parents=True)
+        watcher = FileWatcher([root], {".py"}, 0)
+
+        assert watcher._wanted(root / "a.py")
+        assert not watcher._wanted(root / "__pycache__" / "a.py")
+        assert not watcher._wanted(root / "a.txt")
+
+
+@pytest.mark.parametrize("force_polling", [True, False], ids=["polling", "inotify"])
+class TestWatch:
+    def test_reports_debounced_batch(self, tree, force_polling):
+        watcher = FileWatcher(
+            [tree / "src"], {".py"}, debounce=0.2, force_polling=force_polling
+        )
+
+        def edit():
+            (tree / "src" / "mod.py").write_text("x = 2\n")
+            (tree / "src" / "new.py").write_text("")
+
+        batch = _collect(watcher, edit)
+
+        assert batch is not None
+        assert {p for _, p in batch} == {
+            tree / "src" / "mod.py",
+            tree / "src" / "new.py",
+        }
+        assert watcher.backend == ("polling" if force_polling else "inotify")
+
+    def test_ignores_skipped_dirs_and_extensions(self, tree, force_polling):
+        watcher = FileWatcher(
+            [tree / "src"], {".py"}, debounce=0.1, force_polling=force_polling
+        )
+
+        def edit():
+            (tree / "src" / "node_modules" / "dep.py").write_text("")
+            (tree / "src" / "notes.txt").write_text("")
+            time.sleep(0.3)
+            (tree / "src" / "mod.py").write_text("x = 3\n")
+
+        batch = _collect(watcher, edit)
+
+        assert [p for _, p in batch] == [tree / "src" / "mod.py"]
+
+    def test_loose_file_replaced_by_rename(self, tree, force_polling):
+        config = tree / "config.json"
+        watcher = FileWatcher(
+            [tree / "src", config],
+            {".py", ".json"},
+            debounce=0.1,
+            force_polling=force_polling,
+        )
+
+        def atomic_save():
+            tmp = tree / "config.json.tmp"
+            tmp.write_text('{"a": 1}')
+            time.sleep(0.05)  # Distinct mtime from the original
+            tmp.replace(config)
+
+        batch = _collect(watcher, atomic_save)
+
+        assert batch == [("modified", config)]
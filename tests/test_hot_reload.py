@@ -0,0 +1,96 @@
+"""Tests for server/hot_reload.py - in-process tool module reload requests."""
+
+import asyncio
+import json
+import os
+import signal
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from server import hot_reload  # noqa: E402
+from server.hot_reload import (  # noqa: E402
+    RELOAD_REQUEST_ENV,
+    handle_reload_request,
+    install_reload_handler,
+    ready_path,
+    result_path,
+)
+
+
+@pytest.fixture
+def request_file(tmp_path):
+    return tmp_path / "reload.json"
+
+
+@pytest.fixture
+def loader():
+    mock = MagicMock()
+    mock.reload_tool_packages = AsyncMock(
+        return_value={"success": True, "reloaded": {"git_basic": 12}, "errors": []}
+    )
+    with patch("server.persona_loader.get_loader", return_value=mock):
+        yield mock
+
+
+class TestHandleReloadRequest:
+    async def test_reloads_requested_packages(self, request_file, loader):
+        request_file.write_text(json.dumps({"id": 7, "packages": ["aa_git"]}))
+
+        await handle_reload_request(request_file)
+
+        loader.reload_tool_packages.assert_awaited_once_with({"aa_git"})
+        result = json.loads(result_path(request_file).read_text())
+        assert result["id"] == 7
+        assert result["success"] is True
+        assert result["reloaded"] == {"git_basic": 12}
+
+    async def test_bad_request_reports_failure(self, request_file, loader):
+        request_file.write_text("not json")
+
+        result = await handle_reload_request(request_file)
+
+        assert result["success"] is False
+        assert json.loads(result_path(request_file).read_text())["success"] is False
+
+    async def test_without_loader(self, request_file):
+        request_file.write_text(json.dumps({"id": 1, "packages": ["aa_git"]}))
+
+        with patch("server.persona_loader.get_loader", return_value=None):
+            result = await handle_reload_request(request_file)
+
+        assert result["success"] is False
+
+
+class TestInstallReloadHandler:
+    async def test_not_under_proxy(self, monkeypatch):
+        monkeypatch.delenv(RELOAD_REQUEST_ENV, raising=False)
+        assert install_reload_handler() is False
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGUSR1"), reason="needs SIGUSR1")
+    async def test_signal_triggers_reload(self, monkeypatch, request_file, loader):
+        monkeypatch.setenv(RELOAD_REQUEST_ENV, str(request_file))
+        monkeypatch.setattr(hot_reload, "_reload_lock", None)
+        loop = asyncio.get_running_loop()
+        try:
+            assert install_reload_handler() is True
+            assert json.loads(ready_path(request_file).read_text()) == {
+                "pid": os.getpid()
+            }
+
+            request_file.write_text(json.dumps({"id": 3, "packages": ["aa_git"]}))
+            os.kill(os.getpid(), signal.SIGUSR1)
+            for _ in range(100):
+                if result_path(request_file).exists():
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            loop.remove_signal_handler(signal.SIGUSR1)
+
+        assert json.loads(result_path(request_file).read_text())["id"] == 3
@@ -0,0 +1,174 @@
+"""Tests for server/http_cache.py - conditional-request response cache."""
+
+import json
+import stat
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from server.http_cache import ResponseCache, is_cacheable
+from server.http_client import APIClient
+
+
+class _Server(ThreadingHTTPServer):
+    """Stand-in API: /etag and /modified honour validators, /plain has none."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.version = 1
+        self.requests: list[tuple[str, int]] = []
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        etag = f'"v{server.version}"'
+        modified = f"Mon, 0{server.version} Jan 2024 00:00:00 GMT"
+        if self.path.startswith("/etag"):
+            validators = {"ETag": etag}
+            fresh = self.headers.get("If-None-Match") == etag
+        elif self.path.startswith("/modified"):
+            validators = {"Last-Modified": modified}
+            fresh = self.headers.get("If-Modified-Since") == modified
+        else:
+            validators, fresh = {}, False
+
+        status = 304 if fresh else 200
+        server.requests.append((self.path, status))
+        body = b"" if fresh else json.dumps({"version": server.version}).encode()
+        self.send_response(status)
+        for name, value in validators.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "http_cache")
+
+
+def _client(server, cache, token="token"):
+    return APIClient(
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        bearer_token=token,
+        response_cache=cache,
+    )
+
+
+class TestRevalidation:
+    @pytest.mark.parametrize("endpoint", ["/etag", "/modified"])
+    async def test_unchanged_response_served_from_304(self, server, cache, endpoint):
+        client = _client(server, cache)
+
+        assert await client.get(endpoint) == (True, {"version": 1})
+        assert await client.get(endpoint) == (True, {"version": 1})
+
+        assert [status for _, status in server.requests] == [200, 304]
+        assert cache.stats()["revalidated"] == 1
+
+    async def test_changed_response_replaces_entry(self, server, cache):
+        client = _client(server, cache)
+
+        await client.get("/etag")
+        server.version = 2
+        assert await client.get("/etag") == (True, {"version": 2})
+        assert await client.get("/etag") == (True, {"version": 2})
+
+        assert [status for _, status in server.requests] == [200, 200, 304]
+
+    async def test_max_stale_skips_request(self, server, cache):
+        client = _client(server, cache)
+
+        await client.get("/etag")
+        assert await client.get("/etag", max_stale=60) == (True, {"version": 1})
+
+        assert len(server.requests) == 1
+        assert cache.stats()["hits"] == 1
+
+    async def test_responses_without_validators_not_cached(self, server, cache):
+        client = _client(server, cache)
+
+        await client.get("/plain")
+        await client.get("/plain", max_stale=60)
+
+        assert len(server.requests) == 2
+        assert cache.stats()["entries"] == 0
+
+    async def test_entries_keyed_by_query_and_credentials(self, server, cache):
+        await _client(server, cache).get("/etag", params={"q": "a"})
+        await _client(server, cache).get("/etag", params={"q": "b"})
+        await _client(server, cache, token="other").get("/etag", params={"q": "a"})
+
+        assert [status for _, status in server.requests] == [200, 200, 200]
+        assert cache.stats()["entries"] == 3
+
+    async def test_entries_persist_across_instances(self, server, cache):
+        await _client(server, cache).get("/etag")
+
+        reopened = ResponseCache(cache.directory)
+        assert await _client(server, reopened).get("/etag") == (True, {"version": 1})
+        assert server.requests[-1][1] == 304
+
+
+class TestStorage:
+    def _response(self, body: bytes, **headers) -> httpx.Response:
+        request = httpx.Request("GET", "https://api.example.com/x")
+        return httpx.Response(200, headers=headers, content=body, request=request)
+
+    def test_evicts_least_recently_used_over_cap(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1000)
+        for name in ("a", "b", "c"):
+            assert cache.store(name, self._response(b"x" * 250, etag=name))
+        cache.get("a")
+        cache.store("d", self._response(b"x" * 250, etag="d"))
+        cache.store("e", self._response(b"x" * 250, etag="e"))
+
+        assert cache.total_bytes <= 1000
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_skips_oversized_and_no_store(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=1000)
+
+        assert not cache.store("big", self._response(b"x" * 600, etag="big"))
+        assert not is_cacheable(
+            self._response(b"{}", etag="x", **{"cache-control": "no-store"})
+        )
+
+    def test_unreadable_entry_dropped(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        cache.store("k", self._response(b"{}", etag="x"))
+        (tmp_path / "k.json").write_text("not json")
+
+        assert cache.get("k") is None
+        assert not (tmp_path / "k.body").exists()
+
+    def test_entries_private_to_user(self, tmp_path):
+        directory = tmp_path / "http_cache"
+        directory.mkdir(mode=0o755)
+        cache = ResponseCache(directory)
+        cache.store("k", self._response(b"{}", etag="x"))
+
+        assert stat.S_IMODE(directory.stat().st_mode) == 0o700
+        for path in directory.iterdir():
+            assert stat.S_IMODE(path.stat().st_mode) == 0o600
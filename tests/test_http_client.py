@@ -1,13 +1,21 @@
 """Tests for server.http_client module."""
 
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import AsyncMock
 
 import httpx
+import pytest
 
 from server.http_client import (
     APIClient,
+    ClientRegistry,
     alertmanager_client,
+    auth_identity,
+    get_host_stats,
+    get_shared_client,
     grafana_client,
+    http_client_status,
     kibana_client,
     prometheus_client,
     quay_client,
@@ -197,13 +205,14 @@ class TestClientLifecycle:
         assert c1 is c2
         await client.close()
 
-    async def test_get_client_recreates_after_close(self):
-        """_get_client creates new instance after close."""
+    async def test_close_keeps_shared_pool_open(self):
+        """close() releases the shared client without closing it."""
         client = APIClient()
         c1 = await client._get_client()
         await client.close()
         c2 = await client._get_client()
-        assert c1 is not c2
+        assert c1 is c2
+        assert not c1.is_closed
         await client.close()
 
     async def test_close_sets_client_none(self):
@@ -400,3 +409,89 @@ class TestAPIClientDefaults:
         client = APIClient(verify_ssl=False, follow_redirects=False)
         assert client.verify_ssl is False
         assert client.follow_redirects is False
+
+
+# ---------------------------------------------------------------------------
+# Tests for the shared client registry
+# ---------------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        status = 500 if self.path == "/fail" else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestClientRegistry:
+    """Tests for pooled clients shared by origin and identity."""
+
+    async def test_same_origin_and_identity_share_client(self):
+        registry = ClientRegistry()
+        try:
+            c1 = await registry.get("https://api.example.com/v1", identity="a")
+            c2 = await registry.get("https://api.example.com/other", identity="a")
+            c3 = await registry.get("https://api.example.com", identity="b")
+            c4 = await registry.get("https://api.example.com", verify=False)
+            assert c1 is c2
+            assert c3 is not c1
+            assert c4 is not c1
+            assert len(registry) == 3
+        finally:
+            await registry.close()
+        assert c1.is_closed
+
+    async def test_reaps_idle_clients(self):
+        registry = ClientRegistry(idle_seconds=0.0)
+        client = await registry.get("https://idle.example.com")
+        assert await registry.reap_idle() == 1
+        assert client.is_closed
+        assert len(registry) == 0
+
+    async def test_api_clients_share_pool(self):
+        a = APIClient(base_url="https://shared.example.com/api", bearer_token="t")
+        b = APIClient(base_url="https://shared.example.com/", bearer_token="t")
+        c = APIClient(base_url="https://shared.example.com/", bearer_token="u")
+        assert await a._get_client() is await b._get_client()
+        assert await c._get_client() is not await a._get_client()
+
+    async def test_counts_requests_per_host(self, local_server):
+        client = await get_shared_client(local_server, identity="stats")
+        host = httpx.URL(local_server).host
+        before = get_host_stats().get(host)
+        requests = before.requests if before else 0
+        errors = before.errors if before else 0
+
+        assert (await client.get(f"{local_server}/ok")).status_code == 200
+        assert (await client.get(f"{local_server}/fail")).status_code == 500
+
+        stats = get_host_stats()[host]
+        assert stats.requests == requests + 2
+        assert stats.errors == errors + 1
+        assert host in http_client_status()
+
+    def test_auth_identity_hides_secret(self):
+        identity = auth_identity("secret-token")
+        assert "secret" not in identity
+        assert identity == auth_identity("secret-token")
+        assert identity != auth_identity("secret-token", "cookie")
+        assert auth_identity(None) == ""
@@ -0,0 +1,221 @@
+"""Tests for tool_modules/aa_jira/src/jira_data.py - shared Jira data access."""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from server.http_client import APIClient
+from tool_modules.aa_jira.src import jira_data
+from tool_modules.aa_jira.src.jira_data import (
+    JiraData,
+    JiraUnavailable,
+    story_points_field,
+    to_sprint_issue,
+)
+
+SERVER_PAGE_CAP = 50
+
+
+def _issue(n: int) -> dict:
+    return {
+        "key": f"AAP-{n}",
+        "fields": {
+            "summary": f"Issue {n}",
+            "status": {"name": "In Review" if n % 2 else "In Progress"},
+            "assignee": {"displayName": "Dev"},
+            "issuetype": {"name": "Story"},
+            "priority": {"name": "Major"},
+            story_points_field(): 3,
+        },
+    }
+
+
+class _JiraServer(ThreadingHTTPServer):
+    """Stand-in for POST /rest/api/2/search over 120 sprint issues."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.issues = [_issue(n) for n in range(1, 121)]
+        self.searches: list[dict] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        server = self.server
+        query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.searches.append(query)
+        time.sleep(0.05)
+
+        keys = re.match(r"key in \((.*)\)", query["jql"])
+        if keys:
+            wanted = {k.strip() for k in keys.group(1).split(",")}
+            matches = [i for i in server.issues if i["key"] in wanted]
+        else:
+            matches = server.issues
+        page_size = min(query["maxResults"], SERVER_PAGE_CAP)
+        start = query["startAt"]
+        body = json.dumps(
+            {
+                "startAt": start,
+                "maxResults": page_size,
+                "total": len(matches),
+                "issues": [
+                    {
+                        "key": i["key"],
+                        "fields": {
+                            f: v for f, v in i["fields"].items() if f in query["fields"]
+                        },
+                    }
+                    for i in matches[start : start + page_size]
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def jira_server():
+    server = _JiraServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def jira(jira_server):
+    return JiraData(client=APIClient(base_url=jira_server.url, bearer_token="t"))
+
+
+class TestSearch:
+    async def test_fetches_all_pages_with_projection(self, jira, jira_server):
+        issues = await jira.search("sprint = 1", fields=("summary", "status"))
+
+        assert [i["key"] for i in issues] == [f"AAP-{n}" for n in range(1, 121)]
+        assert set(issues[0]["fields"]) == {"summary", "status"}
+        # First page, then the rest by the server's page size
+        assert [q["startAt"] for q in jira_server.searches] == [0, 50, 100]
+        assert jira_server.searches[0]["fields"] == ["status", "summary"]
+
+    async def test_pages_fetched_concurrently(self, jira_server):
+        jira_server.issues = [_issue(n) for n in range(1, 301)]
+        jira = JiraData(client=APIClient(base_url=jira_server.url, bearer_token="t"))
+
+        start = time.monotonic()
+        issues = await jira.search("sprint = 1")
+
+        assert len(issues) == 300
+        # 6 pages at 50ms each; serially this would take >= 0.3s
+        assert time.monotonic() - start < 0.28
+
+    async def test_max_results_limits_fetch(self, jira, jira_server):
+        issues = await jira.search("sprint = 1", max_results=10)
+
+        assert len(issues) == 10
+        assert len(jira_server.searches) == 1
+
+    async def test_concurrent_identical_searches_coalesce(self, jira, jira_server):
+        results = await asyncio.gather(*(jira.search("sprint = 1") for _ in range(5)))
+
+        assert all(len(r) == 120 for r in results)
+        assert len(jira_server.searches) == 3
+        assert jira.stats()["coalesced"] == 4
+
+    async def test_no_token_raises_unavailable(self, monkeypatch):
+        async def no_credentials():
+            return "https://jira.example.com", ""
+
+        monkeypatch.setattr(jira_data, "jira_credentials", no_credentials)
+
+        with pytest.raises(JiraUnavailable):
+            await JiraData().search("sprint = 1")
+
+
+class TestGetIssues:
+    async def test_bulk_fetch_then_cache(self, jira, jira_server):
+        keys = ["AAP-1", "AAP-2", "AAP-3", "AAP-999"]
+
+        first = await jira.get_issues(keys, fields=("status",))
+        again = await jira.get_issues(keys[:3], fields=("status",))
+
+        assert set(first) == {"AAP-1", "AAP-2", "AAP-3"}
+        assert again == {k: first[k] for k in keys[:3]}
+        assert len(jira_server.searches) == 1
+        assert jira.stats()["cache_hits"] == 3
+
+    async def test_search_results_fill_cache(self, jira, jira_server):
+        await jira.search("sprint = 1")
+        await jira.get_issues(["AAP-5", "AAP-6"], fields=("status",))
+
+        assert len(jira_server.searches) == 3
+
+    async def test_missing_fields_refetched(self, jira, jira_server):
+        await jira.get_issues(["AAP-1"], fields=("status",))
+        issues = await jira.get_issues(["AAP-1"], fields=("status", "summary"))
+
+        assert issues["AAP-1"]["fields"]["summary"] == "Issue 1"
+        assert len(jira_server.searches) == 2
+
+    async def test_expired_entries_refetched(self, jira_server):
+        jira = JiraData(
+            client=APIClient(base_url=jira_server.url, bearer_token="t"), ttl=0
+        )
+        await jira.get_issues(["AAP-1"], fields=("status",))
+        await jira.get_issues(["AAP-1"], fields=("status",))
+
+        assert len(jira_server.searches) == 2
+
+    async def test_expired_entries_evicted(self, jira_server):
+        client = APIClient(base_url=jira_server.url, bearer_token="t")
+        jira = JiraData(client=client, ttl=0)
+        await jira.get_issues(["AAP-1", "AAP-2"], fields=("status",))
+        await jira.get_issues(["AAP-3"], fields=("status",))
+
+        assert list(jira._issues) == ["AAP-3"]
+
+    async def test_cache_size_capped(self, jira_server):
+        client = APIClient(base_url=jira_server.url, bearer_token="t")
+        jira = JiraData(client=client, max_issues=2)
+        await jira.get_issues(["AAP-1", "AAP-2"], fields=("status",))
+        await jira.get_issues(["AAP-3"], fields=("status",))
+
+        assert list(jira._issues) == ["AAP-2", "AAP-3"]
+
+    async def test_keys_split_into_queries(self, jira, jira_server, monkeypatch):
+        monkeypatch.setattr(jira_data, "KEYS_PER_QUERY", 2)
+
+        issues = await jira.get_issues([f"AAP-{n}" for n in range(1, 6)])
+
+        assert len(issues) == 5
+        assert len(jira_server.searches) == 3
+
+
+def test_to_sprint_issue():
+    assert to_sprint_issue(_issue(1)) == {
+        "key": "AAP-1",
+        "issueType": "Story",
+        "jiraStatus": "In Review",
+        "priority": "Major",
+        "summary": "Issue 1",
+        "assignee": "Dev",
+        "storyPoints": 3,
+    }
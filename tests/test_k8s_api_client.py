@@ -0,0 +1,447 @@
+"""Tests for tool_modules/aa_k8s/src/api_client.py and informer.py against a
+fake API server."""
+
+import asyncio
+import json
+import os
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import yaml
+
+from tool_modules.aa_k8s.src import api_client, informer, tools_basic
+from tool_modules.aa_k8s.src.api_client import (
+    ClusterConfig,
+    KubeAPIClient,
+    UnsupportedKubeconfig,
+    get_api_client,
+    list_resources,
+)
+from tool_modules.aa_k8s.src.informer import (
+    InformerCache,
+    get_informer_cache,
+    informer_status,
+    parse_selector,
+)
+from tool_modules.aa_k8s.src.tables import render
+
+NOW = "2024-01-01T00:00:00Z"
+
+
+def _pod(name, phase="Running", waiting=None, ready=True):
+    state = {"waiting": {"reason": waiting}} if waiting else {"running": {}}
+    return {
+        "metadata": {"name": name, "namespace": "ns", "creationTimestamp": NOW},
+        "spec": {"containers": [{"name": "app"}], "nodeName": "node-1"},
+        "status": {
+            "phase": phase,
+            "podIP": "10.0.0.1",
+            "containerStatuses": [
+                {"ready": ready, "restartCount": 3 if waiting else 0, "state": state}
+            ],
+        },
+    }
+
+
+OBJECTS = {
+    "/api/v1/namespaces/ns/pods": [
+        _pod("web-1"),
+        _pod("web-2", waiting="CrashLoopBackOff", ready=False),
+        _pod("job-1", phase="Pending", ready=False),
+    ],
+    "/apis/apps/v1/namespaces/ns/deployments": [
+        {"metadata": {"name": "web"}, "spec": {"replicas": 2}, "status": {}},
+        {
+            "metadata": {"name": "api"},
+            "spec": {"replicas": 1},
+            "status": {"readyReplicas": 1},
+        },
+    ],
+    "/api/v1/namespaces/ns/services": [
+        {"metadata": {"name": "web"}, "spec": {"clusterIP": "172.30.0.1"}}
+    ],
+    "/api/v1/namespaces/ns/events": [
+        {
+            "metadata": {"name": "web-2.1", "namespace": "ns"},
+            "type": "Warning",
+            "reason": "BackOff",
+            "message": "Back-off restarting failed container",
+            "lastTimestamp": NOW,
+            "involvedObject": {"kind": "Pod", "name": "web-2"},
+        },
+        {
+            "metadata": {"name": "web-2.2", "namespace": "ns"},
+            "type": "Normal",
+            "reason": "Pulled",
+            "lastTimestamp": NOW,
+        },
+    ],
+    "/api/v1/namespaces": [
+        {"metadata": {"name": "your-app-stage"}},
+        {"metadata": {"name": "kube-system"}},
+    ],
+}
+
+# Server-side printed tables, served for Accept: ...;as=Table
+TABLES = {
+    "/api/v1/namespaces/ns/secrets": {
+        "kind": "Table",
+        "columnDefinitions": [
+            {"name": "Name", "priority": 0},
+            {"name": "Type", "priority": 0},
+            {"name": "Data", "priority": 0},
+            {"name": "Age", "priority": 0},
+            {"name": "Labels", "priority": 1},
+        ],
+        "rows": [{"cells": ["db-creds", "Opaque", 2, "5d", "app=db"]}],
+    },
+}
+
+
+class FakeAPIServer:
+    """Serves canned lists and records every request."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict, dict]] = []
+        self.status = 200
+        self.version = 0
+        # Events streamed to watch requests; None ends the current watch
+        self.watch_events: queue.Queue = queue.Queue()
+        self.stopped = False
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                fake.requests.append((url.path, query, dict(self.headers)))
+                fake.version += 1
+                if fake.status != 200:
+                    body = {"kind": "Status", "message": "Unauthorized"}
+                    self._send(fake.status, body)
+                elif query.get("watch") == "1":
+                    self._stream_watch()
+                elif "as=Table" in self.headers.get("Accept", ""):
+                    self._send(200, TABLES[url.path])
+                elif url.path in OBJECTS:
+                    metadata = {"resourceVersion": str(fake.version)}
+                    self._send(200, {"metadata": metadata, "items": OBJECTS[url.path]})
+                else:
+                    self._send(404, {"kind": "Status", "message": "not found"})
+
+            def _send(self, status, body):
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream_watch(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                while not fake.stopped:
+                    try:
+                        event = fake.watch_events.get(timeout=0.05)
+                    except queue.Empty:
+                        continue
+                    if event is None:
+                        break
+                    data = json.dumps(event).encode() + b"\n"
+                    self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def paths(self, watch=False):
+        return [
+            path
+            for path, query, _ in self.requests
+            if (query.get("watch") == "1") == watch
+        ]
+
+
+@pytest.fixture
+def server():
+    fake = FakeAPIServer()
+    yield fake
+    fake.stopped = True
+    fake.httpd.shutdown()
+
+
+def _write_kubeconfig(path, server_url, user):
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "current-context": "ctx",
+                "contexts": [{"name": "ctx", "context": {"cluster": "c", "user": "u"}}],
+                "clusters": [{"name": "c", "cluster": {"server": server_url}}],
+                "users": [{"name": "u", "user": user}],
+            }
+        )
+    )
+    return str(path)
+
+
+@pytest.fixture
+def kubeconfig(tmp_path, server):
+    return _write_kubeconfig(tmp_path / "config.s", server.url, {"token": "sha256~x"})
+
+
+@pytest.fixture
+def no_kubectl():
+    with patch.object(
+        api_client, "run_kubectl", AsyncMock(side_effect=AssertionError("kubectl"))
+    ) as mock:
+        yield mock
+
+
+class TestClusterConfig:
+    def test_reads_current_context(self, kubeconfig, server):
+        config = ClusterConfig.load(kubeconfig)
+        assert config.server == server.url
+        assert config.token == "sha256~x"
+
+    def test_exec_credentials_unsupported(self, tmp_path):
+        path = _write_kubeconfig(
+            tmp_path / "config", "https://api", {"exec": {"command": "oidc-login"}}
+        )
+        with pytest.raises(UnsupportedKubeconfig):
+            ClusterConfig.load(path)
+
+
+class TestKubeAPIClient:
+    async def test_conditional_relist(self, kubeconfig, server):
+        client = KubeAPIClient(kubeconfig)
+        try:
+            pods = await client.list_objects("pods", "ns", label_selector="app=web")
+            await client.list_objects("pods", "ns", label_selector="app=web")
+        finally:
+            await client.aclose()
+
+        assert len(pods) == 3
+        (_, first, headers), (_, second, _) = server.requests
+        assert headers["Authorization"] == "Bearer sha256~x"
+        assert first == {"labelSelector": "app=web"}
+        assert second == {
+            "labelSelector": "app=web",
+            "resourceVersion": "1",
+            "resourceVersionMatch": "NotOlderThan",
+        }
+
+    async def test_client_shared_until_kubeconfig_changes(self, kubeconfig):
+        client = get_api_client(kubeconfig)
+        assert get_api_client(kubeconfig) is client
+
+        os.utime(kubeconfig, ns=(0, 1))
+        assert get_api_client(kubeconfig) is not client
+        # the replaced client is closed in the background, not dropped
+        (closing,) = api_client._closing
+        await closing
+        assert not api_client._closing
+        assert client._client.is_closed
+
+
+class TestListResources:
+    async def test_lists_concurrently_via_api(self, kubeconfig, server, no_kubectl):
+        results = await list_resources(kubeconfig, ["pods", "services"], "ns")
+
+        assert [r.source for r in results.values()] == ["api", "api"]
+        assert len(results["pods"].items) == 3
+        assert sorted(server.paths()) == [
+            "/api/v1/namespaces/ns/pods",
+            "/api/v1/namespaces/ns/services",
+        ]
+
+    async def test_auth_error_falls_back_to_kubectl(self, kubeconfig, server):
+        server.status = 401
+        kubectl = AsyncMock(return_value=(True, json.dumps({"items": [_pod("a")]})))
+        with (
+            patch.object(api_client, "run_kubectl", kubectl),
+            patch.object(api_client, "invalidate_cluster_auth") as invalidate,
+        ):
+            results = await list_resources(kubeconfig, ["pods"], "ns")
+
+        assert results["pods"].source == "kubectl"
+        assert results["pods"].items[0]["metadata"]["name"] == "a"
+        assert kubectl.call_args.args[0] == ["get", "pods", "-o", "json"]
+        invalidate.assert_called_once_with(kubeconfig=kubeconfig)
+
+    async def test_missing_kubeconfig_uses_kubectl(self, tmp_path):
+        kubectl = AsyncMock(return_value=(False, "error: no config"))
+        with patch.object(api_client, "run_kubectl", kubectl):
+            results = await list_resources(str(tmp_path / "none"), ["pods"])
+
+        assert not results["pods"].ok
+        assert results["pods"].error == "error: no config"
+        assert "--all-namespaces" in kubectl.call_args.args[0]
+
+
+class TestTools:
+    @pytest.fixture(autouse=True)
+    def _kubeconfig(self, kubeconfig):
+        with patch.object(tools_basic, "get_kubeconfig", return_value=kubeconfig):
+            yield
+
+    async def test_namespace_health_single_round(self, server, no_kubectl):
+        report = await tools_basic._k8s_namespace_health_impl("ns", "stage")
+
+        assert len(server.requests) == 4
+        assert "- Total: 3" in report
+        assert "- Running: 1" in report
+        assert "- Pending: 1" in report
+        assert "- Failed/Error: 1" in report
+        assert "- Ready: 1" in report
+        assert "- Warnings: 1" in report
+        assert "BackOff pod/web-2" in report
+        assert "⚠️ Issues detected" in report
+
+    async def test_environment_summary(self, server, no_kubectl):
+        summary = await tools_basic._k8s_environment_summary_impl()
+
+        assert summary.count("- Namespaces: 1") == 2
+        assert "your-app-stage" in summary
+        assert "kube-system" not in summary
+
+    async def test_get_pods_renders_table(self, server, no_kubectl):
+        output = await tools_basic._kubectl_get_pods_impl("ns", "stage")
+
+        header, *rows = output.splitlines()
+        assert header.split()[:3] == ["NAME", "READY", "STATUS"]
+        assert rows[1].split()[:4] == ["web-2", "0/1", "CrashLoopBackOff", "3"]
+
+    async def test_secrets_listed_without_values(self, server, no_kubectl):
+        output = await tools_basic._kubectl_get_secrets_impl("ns", "stage")
+
+        assert output.splitlines()[3:5] == [
+            "NAME       TYPE     DATA   AGE",
+            "db-creds   Opaque   2      5d",
+        ]
+        ((path, query, headers),) = server.requests
+        assert query == {"includeObject": "None"}
+        assert "as=Table" in headers["Accept"]
+
+    async def test_secrets_fall_back_to_kubectl_table(self, server):
+        server.status = 401
+        kubectl = AsyncMock(return_value=(True, "NAME   TYPE   DATA   AGE"))
+        with (
+            patch.object(api_client, "run_kubectl", kubectl),
+            patch.object(api_client, "invalidate_cluster_auth"),
+        ):
+            output = await tools_basic._kubectl_get_secrets_impl("ns", "stage")
+
+        assert "NAME   TYPE" in output
+        assert kubectl.call_args.args[0] == ["get", "secrets"]
+
+
+def test_render_empty():
+    assert render("pods", []) == "No resources found."
+
+
+async def _until(condition, timeout=5.0):
+    for _ in range(int(timeout / 0.02)):
+        if condition():
+            return
+        await asyncio.sleep(0.02)
+    raise AssertionError("condition not reached")
+
+
+@pytest.fixture
+async def informers():
+    with patch.object(informer, "_settings", return_value={"enabled": True}):
+        cache = get_informer_cache()
+        yield cache
+        cache.close()
+        informer._caches.pop()
+        await asyncio.sleep(0)
+
+
+class TestInformer:
+    async def test_serves_from_watch_cache(self, kubeconfig, server, informers):
+        first = await list_resources(kubeconfig, ["pods"], "ns")
+        second = await list_resources(kubeconfig, ["pods"], "ns")
+
+        assert first["pods"].source == second["pods"].source == "informer"
+        assert len(second["pods"].items) == 3
+        assert server.paths() == ["/api/v1/namespaces/ns/pods"]
+        assert (informers.hits, informers.misses) == (1, 1)
+
+        new_pod = _pod("web-3")
+        new_pod["metadata"]["resourceVersion"] = "42"
+        server.watch_events.put({"type": "ADDED", "object": new_pod})
+        (live,) = informers.informers.values()
+        await _until(lambda: live.resource_version == "42")
+
+        third = await list_resources(kubeconfig, ["pods"], "ns")
+        assert [p["metadata"]["name"] for p in third["pods"].items] == [
+            "job-1",
+            "web-1",
+            "web-2",
+            "web-3",
+        ]
+        assert server.paths() == ["/api/v1/namespaces/ns/pods"]
+        _, query, _ = next(r for r in server.requests if r[1].get("watch"))
+        assert query["resourceVersion"] == "1"
+
+    async def test_selectors_matched_locally(self, kubeconfig, server, informers):
+        await list_resources(kubeconfig, ["events"], "ns")
+        results = await list_resources(
+            kubeconfig, ["events"], "ns", field_selector="type=Warning"
+        )
+
+        assert [e["reason"] for e in results["events"].items] == ["BackOff"]
+        assert server.paths() == ["/api/v1/namespaces/ns/events"]
+
+    async def test_expired_watch_relists(self, kubeconfig, server, informers):
+        await list_resources(kubeconfig, ["pods"], "ns")
+        server.watch_events.put(
+            {"type": "ERROR", "object": {"code": 410, "message": "too old"}}
+        )
+
+        await _until(lambda: len(server.paths()) == 2)
+
+    async def test_bounded(self, kubeconfig, server):
+        cache = InformerCache(max_informers=1, max_objects=2)
+        client = get_api_client(kubeconfig)
+        try:
+            assert await cache.lookup(client, "pods", "ns") is None
+            (pods,) = cache.informers.values()
+            assert pods.overflowed and not pods.objects
+
+            assert await cache.lookup(client, "services", "ns") is not None
+            assert [key[2] for key in cache.informers] == ["services"]
+            assert await cache.lookup(client, "secrets", "ns") is None
+        finally:
+            cache.close()
+
+    async def test_status(self, kubeconfig, server, informers):
+        await list_resources(kubeconfig, ["pods"], "ns")
+        await list_resources(kubeconfig, ["pods"], "ns")
+
+        status = informer_status()
+        assert "Hit ratio: 50% (1 hits, 1 misses)" in status
+        assert "| ns | pods | 3 | live | 0s |" in status
+
+
+def test_parse_selector():
+    assert parse_selector("app=web,tier!=db,canary,!legacy") == [
+        ("app", "=", "web"),
+        ("tier", "!=", "db"),
+        ("canary", "exists", ""),
+        ("legacy", "!", ""),
+    ]
+    assert parse_selector("env in (a,b)") is None
@@ -0,0 +1,32 @@
+"""Tests for server/loop_local.py - per-event-loop singletons."""
+
+import asyncio
+
+from server.loop_local import per_loop
+
+
+class _Thing:
+    pass
+
+
+async def test_one_object_per_loop():
+    things = per_loop(_Thing)
+    first = things()
+
+    assert things() is first
+    other = await asyncio.to_thread(lambda: asyncio.run(_get(things)))
+    assert other is not first
+    assert things.values() == [first]
+
+
+async def _get(things):
+    return things()
+
+
+async def test_pop_forgets_the_loop_object():
+    things = per_loop(_Thing)
+    assert things.pop() is None
+    first = things()
+
+    assert things.pop() is first
+    assert things() is not first
@@ -0,0 +1,165 @@
+"""
+Tests for the shared audio visualization helpers used by the video renderers.
+
+The vectorized paths are checked against straightforward per-bar loops
+(the renderers' previous implementation).
+
+Run with: pytest tests/test_meetbot_audio_visualizer.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("cv2")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tool_modules.aa_meet_bot.src.audio_visualizer import (  # noqa: E402
+    AUDIO_BAR_COLOR,
+    FFTBarAnalyzer,
+    WaveformPainter,
+    get_log_bin_map,
+)
+
+
+def _reference_bars(fft, n_bars):
+    """Per-bar loop the renderers used before the bin map was precomputed."""
+    n = len(fft)
+    out = np.zeros(n_bars, dtype=np.float32)
+    for i in range(n_bars):
+        low = int(n * (np.exp(i / n_bars * np.log(n)) - 1) / (n - 1))
+        high = int(n * (np.exp((i + 1) / n_bars * np.log(n)) - 1) / (n - 1))
+        high = max(high, low + 1)
+        if high <= n:
+            out[i] = np.mean(fft[low:high])
+    return out
+
+
+def _reference_draw(width, height, n_bars, pixel_heights, color):
+    """Per-bar loop the renderers used to paint the waveform."""
+    step = width / n_bars
+    bar_width = max(2, int(step) - 1)
+    img = np.zeros((height, width, 3), dtype=np.uint8)
+    img[:, :, 1] = 18
+    x_starts = (np.arange(n_bars) * step).astype(np.int32)
+    tops = (height - pixel_heights) // 2
+    bottoms = (height + pixel_heights) // 2
+    for idx in range(n_bars):
+        x = x_starts[idx]
+        img[tops[idx] : bottoms[idx], x : min(x + bar_width, width)] = color
+    return img
+
+
+def _painter(width, height, n_bars):
+    step = width / n_bars
+    return WaveformPainter(width, height, n_bars, step, max(2, int(step) - 1))
+
+
+class TestLogBinMap:
+    """Tests for the precomputed log-frequency bin map."""
+
+    @pytest.mark.parametrize("audio_len", [1600, 1024, 333])
+    @pytest.mark.parametrize("n_bars", [200, 150, 64])
+    def test_matches_per_bar_loop(self, audio_len, n_bars):
+        """Reduced bars should equal the per-bar mean of each FFT slice."""
+        rng = np.random.default_rng(0)
+        fft = np.abs(rng.standard_normal(audio_len // 2 + 1))
+        bin_map = get_log_bin_map(audio_len, n_bars)
+        padded = np.zeros(bin_map.n_fft_bins + 1, dtype=np.float32)
+        out = np.zeros(n_bars, dtype=np.float32)
+
+        bin_map.reduce(fft, padded, out)
+
+        np.testing.assert_allclose(
+            out, _reference_bars(fft, n_bars), rtol=1e-4, atol=1e-5
+        )
+
+    def test_cached_per_length_and_bar_count(self):
+        """The same (audio length, bar count) should reuse one table."""
+        assert get_log_bin_map(1600, 200) is get_log_bin_map(1600, 200)
+        assert get_log_bin_map(1600, 200) is not get_log_bin_map(1600, 100)
+
+    def test_tables_are_read_only(self):
+        """Cached tables are shared, so they must not be writable."""
+        bin_map = get_log_bin_map(1600, 200)
+        with pytest.raises(ValueError):
+            bin_map.reduce_indices[0] = 5
+
+
+class TestFFTBarAnalyzer:
+    """Tests for audio -> bar height conversion."""
+
+    def test_silence_returns_flat_bars(self):
+        """Audio below the noise gate should give minimal bars."""
+        analyzer = FFTBarAnalyzer(50)
+        bars = analyzer.compute(np.zeros(1600, dtype=np.float32))
+        assert bars.shape == (50,)
+        assert bars.min() >= 0.1
+        assert bars.max() <= 0.15
+
+    def test_tone_peaks_in_matching_bar(self):
+        """A pure tone should produce the tallest bar at its frequency."""
+        analyzer = FFTBarAnalyzer(64)
+        t = np.arange(1600) / 16000
+        audio = (0.2 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+
+        bars = analyzer.compute(audio)
+
+        bin_map = get_log_bin_map(1600, 64)
+        tone_bin = int(1000 / (16000 / 1600))
+        lows = bin_map.reduce_indices[0::2]
+        highs = bin_map.reduce_indices[1::2]
+        expected = np.nonzero((lows <= tone_bin) & (tone_bin < highs))[0]
+        assert int(np.argmax(bars)) in expected
+        assert bars.max() == pytest.approx(0.79)
+
+    def test_reuses_output_buffer(self):
+        """Each call should write into the same pre-allocated buffer."""
+        analyzer = FFTBarAnalyzer(32)
+        audio = np.random.default_rng(1).standard_normal(800).astype(np.float32)
+        assert analyzer.compute(audio) is analyzer.compute(audio)
+
+
+class TestWaveformPainter:
+    """Tests for vectorized bar drawing."""
+
+    @pytest.mark.parametrize(
+        "width,height,n_bars",
+        [(1000, 200, 200), (700, 70, 200), (666, 133, 150), (300, 100, 200)],
+    )
+    def test_matches_per_bar_loop(self, width, height, n_bars):
+        """Output should be pixel-identical to painting bars one by one."""
+        heights = (
+            np.random.default_rng(2).integers(4, height - 2, n_bars).astype(np.int32)
+        )
+        painter = _painter(width, height, n_bars)
+
+        expected = _reference_draw(width, height, n_bars, heights, (25, 200, 25))
+        np.testing.assert_array_equal(painter.draw(heights, (25, 200, 25)), expected)
+
+    def test_draws_into_provided_buffer(self):
+        """A passed-in buffer should be fully overwritten and returned."""
+        painter = _painter(400, 80, 100)
+        heights = np.full(100, 40, dtype=np.int32)
+        out = np.full((80, 400, 3), 7, dtype=np.uint8)
+
+        result = painter.draw(heights, (1, 2, 3), out)
+
+        assert result is out
+        np.testing.assert_array_equal(
+            out, _reference_draw(400, 80, 100, heights, (1, 2, 3))
+        )
+
+    def test_draw_audio_handles_nan(self):
+        """NaN heights should fall back to a small bar instead of failing."""
+        painter = _painter(400, 80, 100)
+        bars = np.full(100, np.nan, dtype=np.float32)
+
+        img = painter.draw_audio(bars)
+
+        assert img.shape == (80, 400, 3)
+        assert (img == AUDIO_BAR_COLOR).all(axis=2).any()
@@ -0,0 +1,178 @@
+"""
+Tests for caption delivery in the meet bot.
+
+The page is faked: expose_binding records the binding callback so tests can
+push captions the way the in-page observer would.
+
+Run with: pytest tests/test_meetbot_captions.py -v
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tool_modules.aa_meet_bot.src import meet_captions  # noqa: E402
+from tool_modules.aa_meet_bot.src.meet_captions import (  # noqa: E402
+    CAPTION_BINDING,
+    MeetCaptions,
+)
+
+
+class FakePage:
+    """Page double exposing a binding and an in-page caption array."""
+
+    def __init__(self, binding_error: Exception = None):
+        self.bindings = {}
+        self.binding_error = binding_error
+        self.polled_captions: list[dict] = []
+        self.evaluate_calls = 0
+
+    async def expose_binding(self, name, callback):
+        if self.binding_error:
+            raise self.binding_error
+        self.bindings[name] = callback
+
+    async def evaluate(self, script, *args):
+        self.evaluate_calls += 1
+        if "window._meetBotCaptions = [];\n                        return c" in script:
+            captions, self.polled_captions = self.polled_captions, []
+            return captions
+        return None
+
+    def push(self, caption: dict) -> None:
+        self.bindings[CAPTION_BINDING](None, caption)
+
+
+def _controller(page):
+    state = SimpleNamespace(caption_buffer=[], joined=True)
+    return SimpleNamespace(
+        page=page, state=state, _instance_id="test", _browser_closed=False
+    )
+
+
+def _cap(cap_id, text, is_update=False, speaker="Alice"):
+    return {
+        "id": cap_id,
+        "speaker": speaker,
+        "text": text,
+        "ts": 0,
+        "isUpdate": is_update,
+    }
+
+
+@pytest.fixture
+async def push_captions():
+    page = FakePage()
+    controller = _controller(page)
+    captions = MeetCaptions(controller)
+    received = []
+    await captions.start_caption_capture(received.append)
+    yield captions, page, controller, received
+    await captions.stop_caption_capture()
+
+
+class TestPushDelivery:
+    """Captions pushed through the exposed binding."""
+
+    async def test_uses_binding(self, push_captions):
+        captions, page, _, _ = push_captions
+        assert CAPTION_BINDING in page.bindings
+        assert captions.get_stats()["mode"] == "push"
+
+    async def test_pushed_caption_reaches_callback(self, push_captions):
+        _, page, controller, received = push_captions
+
+        page.push(_cap(1, "hello david"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert [e.text for e in received] == ["hello david"]
+        assert [e.text for e in controller.state.caption_buffer] == ["hello david"]
+
+    async def test_refinements_coalesce_before_dispatch(self, push_captions):
+        captions, page, controller, received = push_captions
+
+        page.push(_cap(1, "hello"))
+        page.push(_cap(1, "hello da", is_update=True))
+        page.push(_cap(1, "hello david", is_update=True))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert [(e.text, e.is_update) for e in received] == [("hello david", False)]
+        assert len(controller.state.caption_buffer) == 1
+        assert captions.get_stats()["coalesced"] == 2
+
+    async def test_update_after_dispatch_replaces_in_place(self, push_captions):
+        _, page, controller, received = push_captions
+
+        page.push(_cap(1, "hello"))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        page.push(_cap(1, "hello david", is_update=True))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert [e.is_update for e in received] == [False, True]
+        assert [e.text for e in controller.state.caption_buffer] == ["hello david"]
+
+    async def test_queue_is_bounded(self, push_captions, monkeypatch):
+        captions, _, _, _ = push_captions
+        monkeypatch.setattr(meet_captions, "MAX_PENDING_CAPTIONS", 3)
+
+        for cap_id in range(1, 6):
+            captions._enqueue_caption(_cap(cap_id, f"line {cap_id}"))
+
+        assert list(captions._pending_captions) == [3, 4, 5]
+        assert captions.get_stats()["dropped"] == 2
+
+    async def test_stop_delivers_pending(self):
+        page = FakePage()
+        captions = MeetCaptions(_controller(page))
+        received = []
+        await captions.start_caption_capture(received.append)
+
+        page.push(_cap(1, "last words"))
+        await captions.stop_caption_capture()
+
+        assert [e.text for e in received] == ["last words"]
+
+
+class TestPollingFallback:
+    """Evaluate-polling when the binding cannot be exposed."""
+
+    async def test_falls_back_to_polling(self, monkeypatch):
+        monkeypatch.setattr(meet_captions, "CAPTION_POLL_INTERVAL", 0.01)
+        page = FakePage(binding_error=RuntimeError("no bindings"))
+        captions = MeetCaptions(_controller(page))
+        received = []
+        await captions.start_caption_capture(received.append)
+        try:
+            page.polled_captions = [_cap(1, "polled caption")]
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await captions.stop_caption_capture()
+
+        assert [e.text for e in received] == ["polled caption"]
+        assert captions.get_stats()["mode"] == "polling"
+
+    async def test_poll_detects_browser_closed(self):
+        page = FakePage()
+        controller = _controller(page)
+        page.evaluate = AsyncMock(side_effect=Exception("Target closed"))
+        captions = MeetCaptions(controller)
+        captions._caption_observer_running = True
+
+        await captions._poll_captions(interval=0.01)
+
+        assert controller._browser_closed is True
+        assert controller.state.joined is False
@@ -0,0 +1,182 @@
+"""
+Tests for transcript storage in the meeting notes database.
+
+Run with: pytest tests/test_meetbot_notes_database.py -v
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tool_modules.aa_meet_bot.src.notes_database import (  # noqa: E402
+    MeetingNote,
+    MeetingNotesDB,
+    TranscriptEntry,
+)
+
+T0 = datetime(2025, 3, 1, 10, 0, 0)
+
+
+def _entry(text: str, minutes: int = 0, speaker: str = "Alice") -> TranscriptEntry:
+    return TranscriptEntry(
+        speaker=speaker, text=text, timestamp=T0 + timedelta(minutes=minutes)
+    )
+
+
+@pytest.fixture
+async def db(tmp_path):
+    database = MeetingNotesDB(tmp_path / "meetings.db", write_behind_interval=0.05)
+    await database.connect()
+    yield database
+    await database.close()
+
+
+@pytest.fixture
+async def meeting_id(db):
+    return await db.create_meeting(MeetingNote(title="Standup"))
+
+
+class TestWriteBehindQueue:
+    """Queued transcript entries and the background batch writer."""
+
+    async def test_queue_returns_without_writing(self, db, meeting_id):
+        db.queue_transcript_entries(meeting_id, [_entry("hello")])
+        assert db.pending_transcript_count == 1
+
+    async def test_background_writer_commits_batch(self, db, meeting_id):
+        db.queue_transcript_entries(meeting_id, [_entry(f"line {i}") for i in range(5)])
+
+        for _ in range(50):
+            if db.pending_transcript_count == 0:
+                break
+            await asyncio.sleep(0.02)
+
+        assert db.pending_transcript_count == 0
+        assert len(await db.get_transcript(meeting_id)) == 5
+
+    async def test_reads_see_queued_entries(self, db, meeting_id):
+        db.write_behind_interval = 60
+        db.queue_transcript_entries(meeting_id, [_entry("queued")])
+
+        transcript = await db.get_transcript(meeting_id)
+
+        assert [e.text for e in transcript] == ["queued"]
+        assert db.pending_transcript_count == 0
+
+    async def test_close_commits_queue(self, tmp_path):
+        path = tmp_path / "close.db"
+        first = MeetingNotesDB(path, write_behind_interval=60)
+        await first.connect()
+        mid = await first.create_meeting(MeetingNote(title="Sync"))
+        first.queue_transcript_entries(mid, [_entry("before close")])
+        await first.close()
+
+        second = MeetingNotesDB(path)
+        try:
+            assert [e.text for e in await second.get_transcript(mid)] == [
+                "before close"
+            ]
+        finally:
+            await second.close()
+
+    async def test_delete_meeting_discards_queued_entries(self, db, meeting_id):
+        db.write_behind_interval = 60
+        db.queue_transcript_entries(meeting_id, [_entry("gone")])
+
+        assert await db.delete_meeting(meeting_id)
+
+        assert db.pending_transcript_count == 0
+        assert (await db.get_stats())["transcript_entries"] == 0
+
+    async def test_add_entry_returns_row_id(self, db, meeting_id):
+        first = await db.add_transcript_entry(meeting_id, _entry("one"))
+        second = await db.add_transcript_entry(meeting_id, _entry("two"))
+        assert second == first + 1
+
+
+class TestTranscriptSearch:
+    """FTS indexing of batched inserts and search filters."""
+
+    async def test_batched_inserts_are_indexed(self, db, meeting_id):
+        await db.add_transcript_entries(
+            meeting_id,
+            [_entry("deploy the canary"), _entry("rollback plan", speaker="Bob")],
+        )
+
+        results = await db.search_transcripts("canary")
+
+        assert [r["text"] for r in results] == ["deploy the canary"]
+        assert results[0]["meeting_title"] == "Standup"
+
+    async def test_snippet_and_highlight(self, db, meeting_id):
+        await db.add_transcript_entries(
+            meeting_id, [_entry("we should deploy the canary today")]
+        )
+
+        (result,) = await db.search_transcripts("canary", highlight=("<b>", "</b>"))
+
+        assert "<b>canary</b>" in result["snippet"]
+        assert result["highlighted"] == "we should deploy the <b>canary</b> today"
+
+    async def test_date_range_filter(self, db, meeting_id):
+        await db.add_transcript_entries(
+            meeting_id,
+            [_entry("release early", 0), _entry("release late", 30)],
+        )
+
+        results = await db.search_transcripts(
+            "release", since=T0 + timedelta(minutes=10)
+        )
+        assert [r["text"] for r in results] == ["release late"]
+
+        results = await db.search_transcripts(
+            "release", until=T0 + timedelta(minutes=10)
+        )
+        assert [r["text"] for r in results] == ["release early"]
+
+    async def test_delete_keeps_index_in_sync(self, db, meeting_id):
+        await db.add_transcript_entries(meeting_id, [_entry("old words")])
+
+        await db.delete_meeting(meeting_id)
+
+        assert await db.search_transcripts("old") == []
+
+    async def test_drops_legacy_insert_trigger(self, tmp_path):
+        """Databases created with the per-row insert trigger get migrated."""
+        path = tmp_path / "legacy.db"
+        database = MeetingNotesDB(path)
+        await database.connect()
+        await database._db.execute(
+            """
+            CREATE TRIGGER transcripts_ai AFTER INSERT ON transcripts BEGIN
+                INSERT INTO transcripts_fts(rowid, speaker, text)
+                    VALUES (new.id, new.speaker, new.text);
+            END
+        """
+        )
+        await database._db.commit()
+        await database.close()
+
+        database = MeetingNotesDB(path)
+        try:
+            mid = await database.create_meeting(MeetingNote(title="Legacy"))
+            await database.add_transcript_entries(mid, [_entry("single index")])
+            cursor = await database._db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+            )
+            triggers = {row[0] for row in await cursor.fetchall()}
+            results = await database.search_transcripts("index")
+        finally:
+            await database.close()
+
+        assert "transcripts_ai" not in triggers
+        assert {"transcripts_ad", "transcripts_au"} <= triggers
+        assert len(results) == 1
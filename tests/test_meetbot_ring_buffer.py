@@ -0,0 +1,151 @@
+"""
+Tests for the SPSC audio RingBuffer in the meet bot audio capture.
+
+Run with: pytest tests/test_meetbot_ring_buffer.py -v
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tool_modules.aa_meet_bot.src.audio_capture import RingBuffer  # noqa: E402
+
+
+def _ring(capacity: int) -> RingBuffer:
+    # sample_rate=capacity with 1 second gives an exact sample capacity
+    return RingBuffer(max_seconds=1.0, sample_rate=capacity)
+
+
+def _samples(start: int, n: int) -> "np.ndarray":
+    return np.arange(start, start + n, dtype=np.float32)
+
+
+class TestRingBufferReadWrite:
+    """Basic producer/consumer behaviour."""
+
+    async def test_roundtrip(self):
+        """Written samples should come back in order."""
+        ring = _ring(100)
+        assert await ring.write(_samples(0, 30)) == 30
+        assert ring.available() == 30
+
+        data = await ring.read(20)
+        np.testing.assert_array_equal(data, _samples(0, 20))
+        assert ring.available() == 10
+
+    async def test_read_more_than_available(self):
+        """Reads should be truncated to what is available."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 5))
+        assert len(await ring.read(50)) == 5
+        assert len(await ring.read(50)) == 0
+
+    async def test_wraparound_read_is_contiguous_view(self):
+        """Reads across the wrap point should still be zero-copy views."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 80))
+        await ring.read(80)
+        await ring.write(_samples(80, 50))  # wraps at sample 100
+
+        view = ring.read_view(50)
+
+        np.testing.assert_array_equal(view, _samples(80, 50))
+        assert np.shares_memory(view, ring.buffer)
+
+    async def test_copy_read_is_independent(self):
+        """copy=True should detach the result from the ring."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 10))
+        data = await ring.read(10, copy=True)
+        assert not np.shares_memory(data, ring.buffer)
+
+    async def test_peek_does_not_consume(self):
+        """Peeking should leave the samples readable."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 10))
+        np.testing.assert_array_equal(await ring.peek(4), _samples(0, 4))
+        assert ring.available() == 10
+
+    async def test_clear(self):
+        """Clear should discard everything unread."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 10))
+        await ring.clear()
+        assert ring.available() == 0
+
+
+class TestRingBufferOverflow:
+    """Overflow accounting when the producer laps the consumer."""
+
+    async def test_overrun_keeps_newest_audio(self):
+        """The consumer should skip to the oldest intact sample."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 80))
+        await ring.write(_samples(80, 50))  # 30 unread samples overwritten
+
+        assert ring.overruns == 1
+        assert ring.available() == 100
+
+        data = await ring.read(100)
+        np.testing.assert_array_equal(data, _samples(30, 100))
+        assert ring.dropped_samples == 30
+
+    async def test_oversized_write_keeps_tail(self):
+        """A single write larger than capacity should keep only its tail."""
+        ring = _ring(100)
+        assert await ring.write(_samples(0, 250)) == 100
+        np.testing.assert_array_equal(await ring.read(100), _samples(150, 100))
+
+    async def test_stats(self):
+        """get_stats should report counters and fill level."""
+        ring = _ring(100)
+        await ring.write(_samples(0, 40))
+        stats = ring.get_stats()
+        assert stats["capacity"] == 100
+        assert stats["available"] == 40
+        assert stats["written"] == 40
+        assert stats["overruns"] == 0
+        assert stats["shared"] is False
+
+
+class TestRingBufferSharedMemory:
+    """Sharing the ring with another process through shared memory."""
+
+    async def test_attach_sees_producer_writes(self):
+        """An attached consumer should read what the creator writes."""
+        name = f"test_ring_{uuid.uuid4().hex[:8]}"
+        producer = RingBuffer(max_seconds=1.0, sample_rate=100, shm_name=name)
+        try:
+            consumer = RingBuffer.attach(name)
+            try:
+                assert consumer.max_samples == 100
+                await producer.write(_samples(0, 60))
+
+                np.testing.assert_array_equal(
+                    await consumer.read(60, copy=True), _samples(0, 60)
+                )
+                # Consumer progress is visible to the producer
+                assert producer.available() == 0
+            finally:
+                consumer.close()
+        finally:
+            producer.close()
+
+    def test_attach_rejects_foreign_segment(self):
+        """Attaching to non-ring shared memory should fail clearly."""
+        from multiprocessing import shared_memory
+
+        shm = shared_memory.SharedMemory(create=True, size=128)
+        try:
+            with pytest.raises(ValueError):
+                RingBuffer.attach(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,218 @@
+"""
+Tests for the out-of-process STT worker.
+
+The end-to-end tests spawn a real worker process with a stub backend defined
+in this module, so no Whisper model is needed.
+
+Run with: pytest tests/test_meetbot_stt_worker.py -v
+"""
+
+import sys
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from tool_modules.aa_meet_bot.src.audio_capture import RingBuffer  # noqa: E402
+from tool_modules.aa_meet_bot.src.stt_worker import (  # noqa: E402
+    STTWorkerClient,
+    STTWorkerStats,
+    _coalesce_requests,
+    get_meeting_stt_stats,
+)
+
+STUB_BACKEND = "tests.test_meetbot_stt_worker:StubBackend"
+
+
+class StubBackend:
+    """Reports the segment length and mean instead of running Whisper."""
+
+    def __init__(self, segments: int = 2):
+        self.segments = segments
+
+    def load(self) -> str:
+        return "STUB"
+
+    def transcribe(self, audio):
+        for i in range(self.segments):
+            yield f"seg{i} n={len(audio)} mean={float(audio.mean()):.0f}"
+
+
+def _req(rid, start, final):
+    return {
+        "op": "transcribe",
+        "id": rid,
+        "start": start,
+        "end": start + 10,
+        "final": final,
+    }
+
+
+class TestCoalesceRequests:
+    """Tests for dropping stale partial requests in the worker queue."""
+
+    def test_keeps_only_latest_partial_per_segment(self):
+        requests = [_req(1, 0, False), _req(2, 0, False), _req(3, 100, False)]
+        assert [r["id"] for r in _coalesce_requests(requests)] == [2, 3]
+
+    def test_never_drops_final(self):
+        requests = [_req(1, 0, True), _req(2, 0, False)]
+        assert [r["id"] for r in _coalesce_requests(requests)] == [1, 2]
+
+    def test_partial_superseded_by_final(self):
+        requests = [_req(1, 0, False), _req(2, 0, True), {"op": "stop"}]
+        assert [r.get("id") for r in _coalesce_requests(requests)] == [2, None]
+
+
+class TestSTTWorkerStats:
+    """Tests for per-meeting latency/RTF metrics."""
+
+    def test_averages(self):
+        stats = STTWorkerStats(results=2, total_latency=0.5)
+        stats.total_inference_time = 1.0
+        stats.total_audio_duration = 4.0
+        assert stats.avg_latency_ms == pytest.approx(250.0)
+        assert stats.avg_rtf == pytest.approx(0.25)
+
+    def test_empty(self):
+        stats = STTWorkerStats()
+        assert stats.avg_latency_ms == 0.0
+        assert stats.avg_rtf == 0.0
+
+
+class TestSTTWorkerClient:
+    """End-to-end tests against a spawned worker process."""
+
+    def test_rejects_unknown_backend(self):
+        ring = RingBuffer(max_seconds=1.0, sample_rate=100)
+        with pytest.raises(ValueError):
+            STTWorkerClient(ring, backend="nope")
+
+    def test_requires_shared_memory_ring(self):
+        ring = RingBuffer(max_seconds=1.0, sample_rate=100)
+        with pytest.raises(ValueError):
+            STTWorkerClient(ring, backend="openvino")
+
+    @pytest.mark.timeout(60)
+    async def test_transcribes_ring_range_and_streams_partials(self):
+        ring = RingBuffer(
+            max_seconds=1.0,
+            sample_rate=1000,
+            shm_name=f"test_stt_{uuid.uuid4().hex[:8]}",
+        )
+        partials, results = [], []
+        meeting_id = f"meeting-{uuid.uuid4().hex[:6]}"
+        client = STTWorkerClient(
+            ring,
+            backend=STUB_BACKEND,
+            meeting_id=meeting_id,
+            on_partial=partials.append,
+            on_result=lambda result, final: results.append((result.text, final)),
+        )
+        try:
+            assert await client.start(timeout=30)
+            ring.write_nowait(np.full(300, 7.0, dtype=np.float32))
+
+            result = await client.transcribe_range(100, 300, is_final=True)
+
+            assert result.text == "seg0 n=200 mean=7 seg1 n=200 mean=7"
+            assert result.end_time == pytest.approx(0.2)
+            assert partials == ["seg0 n=200 mean=7", result.text]
+            assert results == [(result.text, True)]
+
+            stats = get_meeting_stt_stats(meeting_id)
+            assert stats["device"] == "STUB"
+            assert stats["results"] == 1
+            assert stats["partials"] == 2
+            assert stats["audio_seconds"] == pytest.approx(0.2)
+        finally:
+            await client.stop()
+            ring.close()
+
+        assert not client.is_running
+
+    @pytest.mark.timeout(60)
+    async def test_overwritten_range_reports_error(self):
+        ring = RingBuffer(
+            max_seconds=1.0,
+            sample_rate=1000,
+            shm_name=f"test_stt_{uuid.uuid4().hex[:8]}",
+        )
+        client = STTWorkerClient(ring, backend=STUB_BACKEND)
+        try:
+            assert await client.start(timeout=30)
+            ring.write_nowait(np.zeros(1000, dtype=np.float32))
+            ring.write_nowait(np.zeros(500, dtype=np.float32))  # laps sample 0
+
+            result = await client.transcribe_range(0, 100)
+
+            assert result.text == ""
+            assert client.get_stats()["errors"] == 1
+        finally:
+            await client.stop()
+            ring.close()
+
+
+class _FakeEngine:
+    async def transcribe(self, audio, sample_rate):
+        return SimpleNamespace(text=f"local n={len(audio)}")
+
+    def get_stats(self):
+        return {}
+
+
+class TestWorkerFallback:
+    """The pipeline transcribes in-process when the worker is unavailable."""
+
+    def _pipeline(self, monkeypatch, transcripts):
+        from tool_modules.aa_meet_bot.src.audio_capture import RealtimeSTTPipeline
+
+        pipeline = RealtimeSTTPipeline(
+            source_name="test",
+            on_transcription=lambda text, final: transcripts.append(text),
+            use_worker=True,
+            stt_backend="openvino",
+        )
+
+        async def init_engine():
+            pipeline._stt = _FakeEngine()
+            return True
+
+        monkeypatch.setattr(pipeline, "_init_in_process_stt", init_engine)
+        return pipeline
+
+    async def test_crashed_worker_falls_back(self, monkeypatch):
+        transcripts = []
+        pipeline = self._pipeline(monkeypatch, transcripts)
+        worker = SimpleNamespace(is_running=False, stop=AsyncMock())
+        pipeline._worker = worker
+        pipeline._speech_buffer.append(np.zeros(160, dtype=np.float32))
+
+        await pipeline._transcribe_buffer(is_final=True)
+
+        assert transcripts == ["local n=160"]
+        worker.stop.assert_awaited_once()
+        assert pipeline._worker is None
+        assert pipeline.get_stats()["worker_fallback"] == "exited"
+
+    async def test_worker_start_failure_falls_back(self, monkeypatch):
+        from tool_modules.aa_meet_bot.src import audio_capture
+
+        capture = SimpleNamespace(start=AsyncMock(return_value=True), stop=AsyncMock())
+        monkeypatch.setattr(audio_capture, "PulseAudioCapture", lambda **kw: capture)
+        pipeline = self._pipeline(monkeypatch, [])
+        monkeypatch.setattr(pipeline, "_start_worker", AsyncMock(return_value=False))
+        monkeypatch.setattr(pipeline, "_process_loop", AsyncMock())
+
+        assert await pipeline.start()
+
+        assert isinstance(pipeline._stt, _FakeEngine)
+        assert pipeline._worker_fallback == "failed to start"
+        pipeline._running = False
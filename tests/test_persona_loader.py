@@ -3,6 +3,7 @@
 import sys
 from importlib.machinery import ModuleSpec
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastmcp import Context, FastMCP
@@ -1063,3 +1064,120 @@ class TestGetStatusPopulated:
         assert len(status["loaded_modules"]) == 2
         assert status["tool_count"] == 3
         assert sorted(status["tools"]) == ["tool_a", "tool_b", "tool_c"]
+
+
+# ---------------------------------------------------------------------------
+# Tests for PersonaLoader.reload_tool_packages
+# ---------------------------------------------------------------------------
+
+DEMO_TOOLS = '''
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import demo_helper
+
+
+def register_tools(server):
+    @server.tool(name=demo_helper.TOOL_NAME)
+    def _tool() -> str:
+        """Demo tool."""
+        return "ok"
+
+    return 1
+'''
+
+
+class _FakeToolServer:
+    """Minimal server with the tool registry API PersonaLoader uses."""
+
+    def __init__(self):
+        self.tools: dict = {}
+
+    def tool(self, name: str):
+        def decorator(fn):
+            self.tools[name] = fn
+            return fn
+
+        return decorator
+
+    def remove_tool(self, name: str) -> None:
+        del self.tools[name]
+
+    async def list_tools(self) -> list:
+        return [SimpleNamespace(name=n) for n in self.tools]
+
+
+def _write_demo_package(root: Path, tool_name: str) -> None:
+    src = root / "aa_demo" / "src"
+    src.mkdir(parents=True, exist_ok=True)
+    (src / "tools_basic.py").write_text(DEMO_TOOLS)
+    (src / "demo_helper.py").write_text(f"TOOL_NAME = {tool_name!r}\n")
+
+
+class TestReloadToolPackages:
+    """Tests for in-place reload of changed tool packages."""
+
+    async def test_reloads_module_and_helpers(self, tmp_path):
+        """Tools are re-registered from fresh source, including helper modules."""
+        _write_demo_package(tmp_path, "demo_ping")
+        server = _FakeToolServer()
+        loader = PersonaLoader(server)
+
+        with (
+            patch("server.persona_loader.TOOL_MODULES_DIR", tmp_path),
+            patch(
+                "server.persona_loader.get_tools_file_path",
+                return_value=tmp_path / "aa_demo" / "src" / "tools_basic.py",
+            ),
+            patch(
+                "server.persona_loader.get_module_dir",
+                return_value=tmp_path / "aa_demo",
+            ),
+        ):
+            try:
+                assert await loader._load_tool_module("demo_basic") == ["demo_ping"]
+
+                _write_demo_package(tmp_path, "demo_pong")
+                result = await loader.reload_tool_packages({"aa_demo"})
+            finally:
+                sys.modules.pop("demo_helper", None)
+
+        assert result == {
+            "success": True,
+            "reloaded": {"demo_basic": 1},
+            "errors": [],
+        }
+        assert set(server.tools) == {"demo_pong"}
+        assert loader._tool_to_module["demo_pong"] == "demo_basic"
+
+    async def test_unloaded_package_is_noop(self):
+        """Packages with no loaded modules reload nothing."""
+        loader = PersonaLoader(MagicMock(spec=FastMCP))
+        loader.loaded_modules = {"git_basic"}
+
+        result = await loader.reload_tool_packages({"aa_jira"})
+
+        assert result == {"success": True, "reloaded": {}, "errors": []}
+
+    async def test_excluded_package_needs_restart(self):
+        """Stateful packages are never reloaded in place."""
+        loader = PersonaLoader(MagicMock(spec=FastMCP))
+        loader.loaded_modules = {"workflow"}
+
+        result = await loader.reload_tool_packages({"aa_workflow"})
+
+        assert result["success"] is False
+        assert loader.loaded_modules == {"workflow"}
+
+    async def test_failed_reload_reports_error(self):
+        """A module that registers nothing after reload is reported."""
+        loader = PersonaLoader(MagicMock(spec=FastMCP))
+        loader.loaded_modules = {"git_basic"}
+        loader._unload_module_tools = AsyncMock(return_value=3)
+        loader._load_tool_module = AsyncMock(return_value=[])
+
+        result = await loader.reload_tool_packages({"aa_git"})
+
+        assert result["success"] is False
+        assert result["reloaded"] == {"git_basic": 0}
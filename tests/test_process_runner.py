@@ -0,0 +1,122 @@
+"""Tests for server/process_runner.py - asyncio subprocess pool."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from server.process_runner import ProcessPool, get_process_pool, run_process
+
+
+class TestRunProcess:
+    async def test_captures_output_and_exit_code(self):
+        result = await run_process(["sh", "-c", "echo out; echo err >&2; exit 3"])
+
+        assert result.returncode == 3
+        assert not result.ok
+        assert result.stdout == "out\n"
+        assert result.stderr == "err\n"
+
+    async def test_streams_lines_as_they_arrive(self):
+        seen = []
+
+        async def on_output(stream, line):
+            seen.append((stream, line, time.monotonic()))
+
+        start = time.monotonic()
+        result = await run_process(
+            ["sh", "-c", "echo one; sleep 0.3; printf two"], on_output=on_output
+        )
+
+        assert result.ok
+        assert [(s, line) for s, line, _ in seen] == [
+            ("stdout", "one"),
+            ("stdout", "two"),
+        ]
+        # The first line arrived before the command finished
+        assert seen[0][2] - start < 0.25
+
+    async def test_stdin(self):
+        result = await run_process(["cat"], stdin=b"hello")
+        assert result.stdout == "hello"
+
+    async def test_missing_binary_raises(self):
+        with pytest.raises(FileNotFoundError):
+            await run_process(["nonexistent_command_xyz_abc_123"])
+
+
+class TestOutputCap:
+    async def test_spills_to_file_and_keeps_tail(self):
+        result = await run_process(["sh", "-c", "seq 1 20000"], max_output=1000)
+
+        try:
+            assert result.ok
+            assert result.stdout_file is not None
+            with open(result.stdout_file) as f:
+                assert f.read().splitlines()[-1] == "20000"
+            assert result.stdout.startswith("[... ")
+            assert result.stdout.endswith("19999\n20000\n")
+            assert len(result.stdout) < 1200
+        finally:
+            os.unlink(result.stdout_file)
+
+    async def test_small_output_stays_in_memory(self):
+        result = await run_process(["echo", "hi"], max_output=1000)
+        assert result.stdout_file is None
+
+
+class TestTimeout:
+    async def test_kills_whole_process_group(self, tmp_path):
+        marker = tmp_path / "survived"
+        start = time.monotonic()
+
+        result = await run_process(
+            ["sh", "-c", f"(sleep 1; touch {marker}) & sleep 30"], timeout=0.3
+        )
+
+        assert result.timed_out
+        assert not result.ok
+        assert time.monotonic() - start < 5
+        await asyncio.sleep(1.2)
+        assert not marker.exists()
+
+
+class TestPool:
+    async def test_global_and_per_binary_limits(self):
+        pool = ProcessPool(max_processes=3, per_binary={"sleep": 1})
+        peak = {"sleep": 0, "all": 0}
+
+        async def run(argv):
+            task = asyncio.create_task(pool.run(argv))
+            while not task.done():
+                peak["all"] = max(peak["all"], pool.running)
+                await asyncio.sleep(0.01)
+            return await task
+
+        start = time.monotonic()
+        await asyncio.gather(
+            *(run(["sleep", "0.2"]) for _ in range(2)),
+            *(run(["sh", "-c", "sleep 0.2"]) for _ in range(4)),
+        )
+
+        # Two sleeps serialized (>= 0.4s); never more than 3 at once
+        assert time.monotonic() - start >= 0.4
+        assert peak["all"] <= 3
+
+    async def test_saturated_binary_does_not_block_others(self):
+        pool = ProcessPool(max_processes=4, per_binary={"sleep": 1})
+        sleeps = [asyncio.create_task(pool.run(["sleep", "1"])) for _ in range(4)]
+        await asyncio.sleep(0.1)
+
+        start = time.monotonic()
+        result = await pool.run(["true"])
+
+        assert result.returncode == 0
+        assert time.monotonic() - start < 0.5
+        for task in sleeps:
+            task.cancel()
+        await asyncio.gather(*sleeps, return_exceptions=True)
+
+    async def test_pool_per_event_loop(self):
+        assert get_process_pool() is get_process_pool()
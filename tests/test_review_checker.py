@@ -0,0 +1,195 @@
+"""Tests for services/sprint/review_checker.py - prefetched review checks."""
+
+import asyncio
+import time
+
+import pytest
+
+from services.sprint.review_checker import (
+    APPROVED_WITH_HOLD,
+    CHANGES_REQUESTED,
+    CI_FAILING,
+    CI_PENDING,
+    DEFAULT_HOLD_PATTERNS,
+    NEEDS_APPROVAL,
+    NO_MR,
+    READY_TO_MERGE,
+    MergeRequestData,
+    ReviewChecker,
+    ReviewDataUnavailable,
+    classify,
+    compile_hold_patterns,
+    find_hold,
+)
+
+HOLDS = compile_hold_patterns(DEFAULT_HOLD_PATTERNS)
+
+
+class TestHoldPatterns:
+    @pytest.mark.parametrize(
+        "comment",
+        ["WIP: still testing", "Please DON'T MERGE yet", "hold off until Monday"],
+    )
+    def test_matches_phrases_case_insensitively(self, comment):
+        assert find_hold([comment], HOLDS) == comment
+
+    @pytest.mark.parametrize("comment", ["wipe the cache first", "LGTM", ""])
+    def test_ignores_partial_words(self, comment):
+        assert find_hold([comment], HOLDS) is None
+
+    def test_longest_phrase_matches_first(self):
+        match = HOLDS.search("do not merge until the release")
+
+        assert match.group(0) == "do not merge until"
+
+    def test_no_patterns(self):
+        assert compile_hold_patterns(["", "  "]) is None
+        assert find_hold(["don't merge"], None) is None
+
+
+def _mr(**overrides) -> MergeRequestData:
+    values = dict(iid=7, title="AAP-1 fix", pipeline_status="success", approved=True)
+    values.update(overrides)
+    return MergeRequestData(**values)
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        "mr, status",
+        [
+            (None, NO_MR),
+            (_mr(), READY_TO_MERGE),
+            (_mr(pipeline_status="failed", approved=False), CI_FAILING),
+            (_mr(merge_status="requested_changes"), CHANGES_REQUESTED),
+            (_mr(approved=False, comments=("wip",)), NEEDS_APPROVAL),
+            (_mr(comments=("LGTM", "wip, one more test")), APPROVED_WITH_HOLD),
+            (_mr(draft=True), APPROVED_WITH_HOLD),
+            (_mr(pipeline_status="running"), CI_PENDING),
+        ],
+    )
+    def test_status(self, mr, status):
+        result = classify("AAP-1", mr, HOLDS)
+
+        assert result.status == status
+        assert result.mr_id == (mr.iid if mr else None)
+
+    def test_hold_reason_is_comment(self):
+        result = classify("AAP-1", _mr(comments=("WIP: waiting on QE",)), HOLDS)
+
+        assert result.hold_reason == "WIP: waiting on QE"
+
+
+def test_match_mrs_by_title_or_branch():
+    open_mrs = [
+        {"iid": 3, "title": "AAP-10 newer", "source_branch": "x"},
+        {"iid": 2, "title": "Fix things", "source_branch": "aap-2-fix"},
+        {"iid": 1, "title": "AAP-10 older", "source_branch": "y"},
+    ]
+
+    matched = ReviewChecker.match_mrs(["AAP-10", "AAP-2", "AAP-1"], open_mrs)
+
+    assert {key: mr["iid"] for key, mr in matched.items()} == {"AAP-10": 3, "AAP-2": 2}
+
+
+class _FakeGitLab(ReviewChecker):
+    """ReviewChecker answering API paths from canned data with 50ms latency."""
+
+    def __init__(self, **kwargs):
+        super().__init__(hold_regex=HOLDS, **kwargs)
+        self.paths: list[str] = []
+        self.mrs = {
+            1: ({"head_pipeline": {"status": "success"}}, True, ["LGTM"]),
+            2: ({"head_pipeline": {"status": "success"}}, True, ["don't merge yet"]),
+            3: ({"head_pipeline": {"status": "failed"}}, True, []),
+            4: ({"head_pipeline": None}, False, []),
+        }
+
+    async def _api(self, path, paginate=False):
+        self.paths.append(path)
+        async with self._slots:
+            await asyncio.sleep(0.05)
+        if path.endswith("merge_requests?state=opened&per_page=100"):
+            return [{"iid": n, "title": f"AAP-{n} change"} for n in self.mrs]
+        iid = int(path.split("merge_requests/")[1].split("/")[0].split("?")[0])
+        details, approved, comments = self.mrs[iid]
+        if path.endswith("/approvals"):
+            return {"approved": approved}
+        if "/notes" in path:
+            return [{"body": "added 1 commit", "system": True}] + [
+                {"body": body} for body in comments
+            ]
+        return details
+
+
+class TestCheck:
+    async def test_classifies_each_issue(self):
+        checker = _FakeGitLab()
+
+        results = await checker.check(["AAP-1", "AAP-2", "AAP-3", "AAP-4", "AAP-5"])
+
+        assert {key: r.status for key, r in results.items()} == {
+            "AAP-1": READY_TO_MERGE,
+            "AAP-2": APPROVED_WITH_HOLD,
+            "AAP-3": CI_FAILING,
+            "AAP-4": NEEDS_APPROVAL,
+            "AAP-5": NO_MR,
+        }
+        assert results["AAP-2"].hold_reason == "don't merge yet"
+        # One MR listing plus three requests per matched MR
+        assert len(checker.paths) == 1 + 3 * 4
+
+    async def test_mr_requests_run_concurrently(self):
+        checker = _FakeGitLab(concurrency=4)
+
+        start = time.monotonic()
+        await checker.check(["AAP-1", "AAP-2", "AAP-3", "AAP-4"])
+
+        # 13 requests at 50ms: serially >= 0.65s, four at a time ~0.2s
+        assert time.monotonic() - start < 0.5
+
+    async def test_failed_mr_fetch_skips_only_that_issue(self):
+        checker = _FakeGitLab()
+        checker.mrs[3] = None
+
+        results = await checker.check(["AAP-1", "AAP-3"])
+
+        assert set(results) == {"AAP-1"}
+
+    async def test_unavailable_when_listing_fails(self, monkeypatch):
+        async def failing(cmd, cwd=None, env=None, timeout=60):
+            return False, "", "glab: not logged in"
+
+        monkeypatch.setattr("server.utils.run_cmd_full", failing)
+        monkeypatch.setattr("server.utils.get_gitlab_host", lambda: "gitlab.example")
+
+        with pytest.raises(ReviewDataUnavailable):
+            await ReviewChecker().check(["AAP-1"])
+
+    async def test_open_mrs_and_notes_follow_pagination(self, monkeypatch):
+        commands = []
+        pages = {
+            "merge_requests?": '[{"iid": 1, "title": "AAP-1 x"}]\n'
+            '[{"iid": 2, "title": "AAP-2 y"}]',
+            "/notes": '[{"body": "LGTM"}][{"body": "do not merge yet"}]',
+            "/approvals": '{"approved": true}',
+        }
+
+        async def glab(cmd, cwd=None, env=None, timeout=60):
+            commands.append(cmd)
+            path = cmd[2]
+            for part, output in pages.items():
+                if part in path:
+                    return True, output, ""
+            return True, '{"head_pipeline": {"status": "success"}}', ""
+
+        monkeypatch.setattr("server.utils.run_cmd_full", glab)
+        monkeypatch.setattr("server.utils.get_gitlab_host", lambda: "gitlab.example")
+
+        results = await ReviewChecker(hold_regex=HOLDS).check(["AAP-2"])
+
+        assert results["AAP-2"].status == APPROVED_WITH_HOLD
+        assert results["AAP-2"].hold_reason == "do not merge yet"
+        paginated = [cmd[2] for cmd in commands if "--paginate" in cmd]
+        assert len(paginated) == 2
+        assert "merge_requests?state=opened" in paginated[0]
+        assert "/notes" in paginated[1]
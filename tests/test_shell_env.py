@@ -0,0 +1,115 @@
+"""Tests for server/shell_env.py - cached shell environment for run_cmd."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from server.shell_env import ShellEnvironment
+from server.utils import (
+    _build_invocation,
+    _build_shell_sources,
+    _prepare_shell_environment,
+    run_cmd,
+)
+
+
+@pytest.fixture
+def home(tmp_path):
+    (tmp_path / ".bashrc").write_text(
+        'echo "welcome banner"\n'
+        "export AA_TEST_TOKEN=secret-1\n"
+        "kube() { echo kube-called; }\n"
+    )
+    bashrc_d = tmp_path / ".bashrc.d"
+    bashrc_d.mkdir()
+    (bashrc_d / "10-kube.sh").write_text("kube-clean() { :; }\n")
+    return tmp_path
+
+
+@pytest.fixture
+def shell_env(home):
+    return ShellEnvironment(
+        home, sources=_build_shell_sources, base_env=_prepare_shell_environment
+    )
+
+
+class TestCapture:
+    def test_captures_env_and_functions(self, shell_env):
+        snapshot = shell_env.get()
+
+        assert snapshot.env["AA_TEST_TOKEN"] == "secret-1"
+        assert {"kube", "kube-clean"} <= snapshot.functions
+        assert "PWD" not in snapshot.env
+        assert snapshot.can_exec("ls")
+        assert not snapshot.can_exec("kube")
+        assert not snapshot.can_exec("no_such_binary_xyz")
+
+    def test_cached_until_rc_file_changes(self, shell_env, home):
+        with patch.object(shell_env, "_capture", wraps=shell_env._capture) as capture:
+            first = shell_env.get()
+            assert shell_env.get() is first
+            assert capture.call_count == 1
+
+            bashrc = home / ".bashrc"
+            bashrc.write_text("export AA_TEST_TOKEN=secret-2\n")
+            os.utime(bashrc, ns=(0, 1))
+            assert shell_env.is_stale()
+            assert shell_env.get().env["AA_TEST_TOKEN"] == "secret-2"
+            assert capture.call_count == 2
+
+    def test_new_bashrc_d_file_invalidates(self, shell_env, home):
+        shell_env.get()
+        (home / ".bashrc.d" / "20-new.sh").write_text("export AA_NEW=1\n")
+        assert shell_env.get().env["AA_NEW"] == "1"
+
+    def test_max_age(self, shell_env):
+        shell_env.max_age = -1
+        first = shell_env.get()
+        assert shell_env.get() is not first
+
+    def test_capture_failure_falls_back(self, shell_env):
+        with patch("server.shell_env.subprocess.run", side_effect=OSError("no bash")):
+            assert shell_env.get() is None
+            # Not retried until something changes
+            assert shell_env.get() is None
+
+
+class TestInvocation:
+    def test_binary_is_execed_directly(self, shell_env, tmp_path):
+        argv, env, cwd = _build_invocation(
+            ["git", "status"], str(tmp_path), True, shell_env.get()
+        )
+        assert argv == ["git", "status"]
+        assert cwd == str(tmp_path)
+        assert env["AA_TEST_TOKEN"] == "secret-1"
+        assert env["PWD"] == str(tmp_path)
+
+    def test_function_goes_through_bash(self, shell_env, home):
+        with patch.object(Path, "home", return_value=home):
+            argv, _, cwd = _build_invocation(["kube", "s"], None, True, shell_env.get())
+        assert argv[:2] == ["bash", "-c"]
+        assert "source" in argv[2] and argv[2].endswith("kube s")
+        assert cwd is None
+
+    def test_without_snapshot_sources_per_command(self, home):
+        with patch.object(Path, "home", return_value=home):
+            argv, _, _ = _build_invocation(["ls"], None, True, None)
+        assert argv[:2] == ["bash", "-c"]
+
+
+class TestRunCmd:
+    async def test_uses_snapshot_env_and_functions(self, home):
+        with patch.object(Path, "home", return_value=home):
+            ok, output = await run_cmd(["printenv", "AA_TEST_TOKEN"])
+            assert ok and output.strip() == "secret-1"
+
+            ok, output = await run_cmd(["kube", "s"])
+            assert ok and output.strip().endswith("kube-called")
+
+    async def test_missing_cwd(self, home, tmp_path):
+        with patch.object(Path, "home", return_value=home):
+            ok, output = await run_cmd(["ls"], cwd=str(tmp_path / "missing"))
+        assert not ok
+        assert "Directory not found" in output
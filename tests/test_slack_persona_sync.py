@@ -0,0 +1,236 @@
+"""Tests for tool_modules/aa_slack_persona/src/sync.py - streaming ingestion."""
+
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from tool_modules.aa_slack_persona.src.sync import IngestPipeline, SlackPersonaSync
+
+
+class FakeVectorStore:
+    """Records embed and write calls instead of using LanceDB."""
+
+    def __init__(self, fail_writes: int = 0):
+        self.embed_calls: list[int] = []
+        self.writes: list[tuple[int, bool]] = []
+        self.rows: dict[str, dict] = {}
+        self.fail_writes = fail_writes
+        self.compacted = 0
+
+    def embed_messages(self, messages, show_progress=True):
+        self.embed_calls.append(len(messages))
+        return [dict(m, vector=[0.0]) for m in messages]
+
+    def write_records(self, records, upsert=False):
+        if self.fail_writes:
+            self.fail_writes -= 1
+            raise OSError("disk full")
+        if not upsert:
+            assert not any(r["id"] in self.rows for r in records), "duplicate rows"
+        self.writes.append((len(records), upsert))
+        self.rows.update((r["id"], r) for r in records)
+        return len(records)
+
+    def compact(self):
+        self.compacted += 1
+        return True
+
+    def build_indexes(self):
+        return True
+
+    def get_stats(self):
+        return {"total_messages": len(self.rows)}
+
+    def clear(self):
+        self.rows.clear()
+
+
+def _messages(channel_id: str, date_str: str, count: int) -> list[dict]:
+    return [
+        {"id": f"{channel_id}_{date_str}_{i}", "text": "hi", "channel_id": channel_id}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def sync(tmp_path):
+    sync = SlackPersonaSync(
+        vector_dir=tmp_path / "vectors",
+        metadata_file=tmp_path / "meta.json",
+        channel_state_file=tmp_path / "state.json",
+    )
+    sync.fetched = []
+    sync.rate_limited = set()
+
+    async def conversations():
+        return [
+            {"id": f"C{i}", "type": "channel", "name": f"chan{i}"} for i in range(3)
+        ]
+
+    async def fetch_day(channel_id, target_date, **kwargs):
+        date_str = target_date.strftime("%Y-%m-%d")
+        sync.fetched.append((channel_id, date_str))
+        code = 429 if (channel_id, date_str) in sync.rate_limited else 200
+        return _messages(channel_id, date_str, 5), 0, code
+
+    sync._get_all_conversations = conversations
+    sync._fetch_channel_day = fetch_day
+    return sync
+
+
+def _days() -> list[str]:
+    """Dates a 4-day sync covers."""
+    today = datetime.now()
+    return [(today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(4)]
+
+
+def _run(sync, store, **kwargs):
+    sync._vector_store = store
+    return sync.full_sync_parallel(
+        days=4, resume=True, workers=2, request_delay=0, **kwargs
+    )
+
+
+class TestIngestPipeline:
+    async def test_batches_across_channels_and_buffers_writes(self):
+        store = FakeVectorStore()
+        written = []
+        pipeline = IngestPipeline(
+            store,
+            before_write=lambda days: False,
+            after_write=written.extend,
+            embed_batch=12,
+            write_buffer=24,
+        )
+
+        async def fetch(channel_id):
+            for day in range(4):
+                await pipeline.put(channel_id, f"d{day}", _messages(channel_id, day, 3))
+
+        await pipeline.run([fetch(c) for c in ("A", "B", "C")])
+
+        # 36 messages in encoder batches of 12, written as 24 + 12
+        assert store.embed_calls == [12, 12, 12]
+        assert [rows for rows, _ in store.writes] == [24, 12]
+        assert len(written) == 12
+        assert pipeline.rows_written == 36
+
+    async def test_flushes_slow_trickle_after_interval(self):
+        store = FakeVectorStore()
+        written = []
+        pipeline = IngestPipeline(
+            store,
+            before_write=lambda days: False,
+            after_write=written.extend,
+            flush_interval=0.01,
+        )
+
+        async def fetch():
+            await pipeline.put("A", "d0", _messages("A", 0, 2))
+            await asyncio.sleep(0.1)
+            assert written == [("A", "d0", True)]
+
+        await pipeline.run([fetch()])
+
+    async def test_write_failure_stops_fetchers(self):
+        store = FakeVectorStore(fail_writes=1)
+        pipeline = IngestPipeline(
+            store,
+            before_write=lambda days: False,
+            after_write=lambda days: None,
+            embed_batch=1,
+            write_buffer=1,
+            queue_size=1,
+        )
+
+        async def fetch():
+            for day in range(1000):
+                await pipeline.put("A", f"d{day}", _messages("A", day, 1))
+
+        with pytest.raises(OSError):
+            await pipeline.run([fetch()])
+
+    async def test_embed_failure_after_fetch_with_full_queue(self):
+        class FailingStore(FakeVectorStore):
+            def embed_messages(self, messages, show_progress=True):
+                time.sleep(0.1)  # fetchers finish and fill the queue meanwhile
+                raise RuntimeError("model crashed")
+
+        pipeline = IngestPipeline(
+            FailingStore(),
+            before_write=lambda days: False,
+            after_write=lambda days: None,
+            embed_batch=1,
+            queue_size=1,
+        )
+
+        async def fetch():
+            for day in range(2):
+                await pipeline.put("A", f"d{day}", _messages("A", day, 1))
+
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await asyncio.wait_for(pipeline.run([fetch()]), timeout=5)
+
+
+class TestResumableSync:
+    async def test_checkpoints_and_compacts(self, sync, tmp_path):
+        store = FakeVectorStore()
+
+        result = await _run(sync, store)
+
+        assert result["messages_synced"] == 60
+        assert len(store.rows) == 60
+        assert store.compacted == 1
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert all(len(state[c]["synced_days"]) == 4 for c in ("C0", "C1", "C2"))
+        assert not any("pending_days" in data for data in state.values())
+
+    async def test_crash_resumes_without_duplicates(self, sync, tmp_path):
+        with pytest.raises(OSError):
+            await _run(sync, FakeVectorStore(fail_writes=1))
+
+        state = json.loads((tmp_path / "state.json").read_text())
+        assert sum(len(d.get("pending_days", [])) for d in state.values()) == 12
+        assert not any(d["synced_days"] for d in state.values())
+
+        store = FakeVectorStore()
+        sync.fetched.clear()
+        await _run(sync, store)
+
+        assert len(sync.fetched) == 12
+        assert store.writes == [(60, True)]
+
+    async def test_resume_skips_synced_days_mid_channel(self, sync):
+        await _run(sync, FakeVectorStore())
+        state = sync._load_channel_state()
+        state["C1"]["synced_days"] = state["C1"]["synced_days"][:2]
+        sync._save_channel_state(state)
+
+        store = FakeVectorStore()
+        sync.fetched.clear()
+        await _run(sync, store)
+
+        assert {channel for channel, _ in sync.fetched} == {"C1"}
+        assert len(sync.fetched) == 2
+
+    async def test_failed_days_stay_pending_and_are_retried(self, sync):
+        first = FakeVectorStore()
+        sync.rate_limited = {("C0", day) for day in _days()}
+        await _run(sync, first)
+
+        assert sync._pending_days(sync._load_channel_state()) == {
+            ("C0", day) for day in _days()
+        }
+
+        sync.rate_limited = set()
+        sync.fetched.clear()
+        second = FakeVectorStore()
+        second.rows = dict(first.rows)
+        await _run(sync, second)
+
+        assert {channel for channel, _ in sync.fetched} == {"C0"}
+        assert second.writes == [(20, True)]
+        assert sync._pending_days(sync._load_channel_state()) == set()
@@ -0,0 +1,161 @@
+"""Tests for tool_modules/aa_slack_persona/src/vector_store.py - hybrid search."""
+
+from datetime import datetime
+
+import pytest
+
+from tool_modules.aa_slack_persona.src.vector_store import (
+    SlackVectorStore,
+    build_filter,
+    rrf_fuse,
+)
+
+
+class FakeQuery:
+    """Minimal LanceDB query builder over canned rows."""
+
+    def __init__(self, table, kind):
+        self.table = table
+        self.kind = kind
+        self._limit = None
+        self.where_clause = None
+        self.prefilter = False
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def where(self, clause, prefilter=False):
+        self.where_clause = clause
+        self.prefilter = prefilter
+        return self
+
+    def to_list(self):
+        self.table.queries.append(self)
+        if self.kind == "fts" and self.table.fts_rows is None:
+            raise ValueError("no fts index")
+        rows = self.table.vector_rows if self.kind == "vector" else self.table.fts_rows
+        return [dict(r) for r in rows[: self._limit]]
+
+
+class FakeTable:
+    def __init__(self, vector_rows, fts_rows=None):
+        self.vector_rows = vector_rows
+        self.fts_rows = fts_rows
+        self.queries: list[FakeQuery] = []
+        self.deleted: list[str] = []
+
+    def search(self, query, query_type=None):
+        return FakeQuery(self, "fts" if query_type == "fts" else "vector")
+
+    def count_rows(self, where=None):
+        return 3
+
+    def delete(self, where):
+        self.deleted.append(where)
+
+
+def _row(row_id, distance=None, vector=(0.0, 0.0)):
+    row = {"id": row_id, "text": row_id, "vector": list(vector)}
+    if distance is not None:
+        row["_distance"] = distance
+    return row
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = SlackVectorStore(tmp_path)
+    monkeypatch.setattr(store, "_generate_embedding", lambda text: [1.0, 0.0])
+    return store
+
+
+class TestRrfFuse:
+    def test_rows_in_both_lists_win(self):
+        vector = [{"id": "a"}, {"id": "b"}, {"id": "c"}]
+        text = [{"id": "c"}, {"id": "d"}]
+
+        fused = rrf_fuse([vector, text], k=60)
+
+        assert [r["id"] for r in fused] == ["c", "a", "b", "d"]
+        assert fused[0]["rrf_score"] == pytest.approx(1 / 63 + 1 / 61)
+
+    def test_empty(self):
+        assert rrf_fuse([[], []]) == []
+
+
+class TestBuildFilter:
+    def test_combines_and_escapes(self):
+        where = build_filter(channel_type="dm", user_id="U1'; --", since=1700000000)
+        assert where == (
+            "channel_type = 'dm' AND user_id = 'U1''; --' "
+            "AND timestamp >= '1700000000.000000'"
+        )
+
+    def test_datetime_and_slack_ts(self):
+        since = datetime(2024, 1, 1)
+        where = build_filter(since=since, until="1800000000.000100")
+        assert f"timestamp >= '{since.timestamp():.6f}'" in where
+        assert "timestamp < '1800000000.000100'" in where
+
+    def test_no_filters(self):
+        assert build_filter() is None
+
+
+class TestHybridSearch:
+    def test_fuses_text_hits_and_prefilters(self, store):
+        store._table = FakeTable(
+            vector_rows=[_row("a", 0.1), _row("b", 0.2)],
+            fts_rows=[_row("PROJ-123", vector=(1.0, 2.0)), _row("b")],
+        )
+
+        results = store.search("PROJ-123", limit=3, channel_type="dm", user_id="U1")
+
+        assert [r["id"] for r in results] == ["b", "a", "PROJ-123"]
+        # Text-only hits get a distance computed from their stored vector
+        assert results[2]["score"] == pytest.approx(4.0)
+        assert results[0]["score"] == pytest.approx(0.2)
+        for query in store._table.queries:
+            assert query.where_clause == "channel_type = 'dm' AND user_id = 'U1'"
+            assert query.prefilter
+            assert query._limit == 12
+
+    def test_falls_back_to_vector_without_fts_index(self, store):
+        store._table = FakeTable(vector_rows=[_row("a", 0.1), _row("b", 0.2)])
+
+        results = store.search("hello", limit=5)
+
+        assert [r["id"] for r in results] == ["a", "b"]
+
+    def test_vector_only(self, store):
+        store._table = FakeTable(vector_rows=[_row("a", 0.1)], fts_rows=[_row("z")])
+
+        results = store.search("hello", hybrid=False)
+
+        assert [r["id"] for r in results] == ["a"]
+        assert len(store._table.queries) == 1
+
+
+def test_delete_older_than_uses_timestamp_filter(store):
+    store._table = FakeTable(vector_rows=[])
+
+    assert store.delete_older_than("1700000000.000000") == 3
+    assert store._table.deleted == ["timestamp < '1700000000.000000'"]
+
+
+def test_delete_older_than_without_filtered_count(store):
+    class NoFilteredCount(FakeTable):
+        rows = 10
+
+        def count_rows(self, where=None):
+            if where is not None:
+                raise ValueError("filter not supported")
+            return self.rows
+
+        def delete(self, where):
+            super().delete(where)
+            self.rows = 6
+
+    store._table = NoFilteredCount(vector_rows=[])
+
+    assert store.delete_older_than("1700000000.000000") == 4
+    assert store._table.deleted == ["timestamp < '1700000000.000000'"]
@@ -0,0 +1,150 @@
+"""Tests for services/slop/database.py - bulk upserts and maintained stats."""
+
+import sqlite3
+
+import pytest
+
+from services.slop.database import SlopDatabase, finding_fingerprint
+
+
+def _finding(i: int, **overrides) -> dict:
+    finding = {
+        "loop": "zombie" if i % 2 else "leaky",
+        "file": f"src/mod{i % 10}.py",
+        "line": i,
+        "category": "dead_code",
+        "severity": "medium",
+        "description": f"unused function f{i}",
+    }
+    finding.update(overrides)
+    return finding
+
+
+@pytest.fixture
+async def db(tmp_path):
+    database = SlopDatabase(str(tmp_path / "slop.db"))
+    await database.initialize()
+    yield database
+    await database.close()
+
+
+async def _grouped_stats(db: SlopDatabase) -> dict:
+    """Stats computed the slow way, for comparison."""
+    stats = {"by_loop": {}, "by_category": {}, "by_severity": {}, "by_status": {}}
+    for column in ("loop", "category", "severity", "status"):
+        async with db._db.execute(
+            f"SELECT {column}, COUNT(*) AS n FROM findings GROUP BY {column}"
+        ) as cursor:
+            async for row in cursor:
+                stats[f"by_{column}"][row[0]] = row["n"]
+    return stats
+
+
+class TestBulkUpsert:
+    async def test_rescan_dedupes(self, db):
+        findings = [_finding(i) for i in range(2000)]
+        first_ids = await db.add_findings(findings)
+
+        rescan = [dict(f, description=f["description"].upper()) for f in findings]
+        second_ids = await db.add_findings(rescan)
+
+        assert second_ids == first_ids
+        assert (await db.get_stats())["total"] == 2000
+
+    async def test_rescan_refreshes_severity(self, db):
+        finding_id = await db.add_finding(_finding(1))
+        await db.add_finding(_finding(1, severity="high", suggestion="remove it"))
+
+        stored = await db.get_finding(finding_id)
+        assert stored["severity"] == "high"
+        assert stored["suggestion"] == "remove it"
+
+    async def test_duplicates_within_one_batch(self, db):
+        ids = await db.add_findings([_finding(1), _finding(1)])
+        assert ids[0] == ids[1]
+        assert (await db.get_stats())["total"] == 1
+
+    async def test_empty(self, db):
+        assert await db.add_findings([]) == []
+
+    def test_fingerprint_normalizes_description(self):
+        assert finding_fingerprint(
+            _finding(1, description="Unused  function f1 ")
+        ) == finding_fingerprint(_finding(1))
+        assert finding_fingerprint(_finding(1, line=2)) != finding_fingerprint(
+            _finding(1)
+        )
+
+
+class TestMaintainedStats:
+    async def test_counts_follow_inserts_updates_and_deletes(self, db):
+        ids = await db.add_findings([_finding(i) for i in range(50)])
+        await db.update_status(ids[0], "fixed")
+        await db.update_status(ids[1], "false_positive")
+        await db.add_finding(_finding(2, severity="critical"))
+        await db.delete_finding(ids[3])
+
+        stats = await db.get_stats()
+        expected = await _grouped_stats(db)
+
+        assert stats["total"] == 49
+        for key, value in expected.items():
+            assert stats[key] == value
+        assert stats["by_status"] == {"open": 47, "fixed": 1, "false_positive": 1}
+
+    async def test_emptied_groups_are_dropped(self, db):
+        finding_id = await db.add_finding(_finding(1, loop="ghost"))
+        await db.delete_finding(finding_id)
+
+        stats = await db.get_stats()
+        assert stats["total"] == 0
+        assert stats["by_loop"] == {}
+
+
+class TestMigration:
+    async def test_upgrades_old_database(self, tmp_path):
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            """
+            CREATE TABLE findings (
+                id TEXT PRIMARY KEY, loop TEXT NOT NULL, file TEXT NOT NULL,
+                line INTEGER DEFAULT 0, category TEXT NOT NULL,
+                severity TEXT NOT NULL, description TEXT NOT NULL,
+                suggestion TEXT DEFAULT '', tool TEXT DEFAULT '',
+                raw_output TEXT DEFAULT '{}',
+                detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status TEXT DEFAULT 'open', acknowledged_at TIMESTAMP,
+                fixed_at TIMESTAMP, git_commit TEXT,
+                UNIQUE(file, line, category, description)
+            );
+            CREATE INDEX idx_findings_loop ON findings(loop);
+            INSERT INTO findings (id, loop, file, line, category, severity, description)
+            VALUES ('a', 'zombie', 'x.py', 1, 'dead_code', 'low', 'unused f'),
+                   ('b', 'zombie', 'x.py', 1, 'dead_code', 'low', 'Unused  F'),
+                   ('c', 'leaky', 'y.py', 2, 'memory_leaks', 'high', 'cache');
+            """
+        )
+        conn.close()
+
+        db = SlopDatabase(str(path))
+        await db.initialize()
+        try:
+            stats = await db.get_stats()
+            assert stats["total"] == 2
+            assert stats["by_loop"] == {"zombie": 1, "leaky": 1}
+
+            finding_id = await db.add_finding(
+                {
+                    "loop": "zombie",
+                    "file": "x.py",
+                    "line": 1,
+                    "category": "dead_code",
+                    "severity": "low",
+                    "description": "unused f",
+                }
+            )
+            assert finding_id == "a"
+        finally:
+            await db.close()
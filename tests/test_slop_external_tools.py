@@ -0,0 +1,159 @@
+"""Tests for services/slop/external_tools.py - cached, batched tool runs."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from services.slop.external_tools import ExternalTools, Finding, ToolResultCache
+
+
+def _ruff_output(files: list[str]) -> str:
+    """Fake ruff JSON: one finding per file."""
+    return json.dumps(
+        [
+            {
+                "code": "F401",
+                "message": "unused import",
+                "filename": f,
+                "location": {"row": 1},
+            }
+            for f in files
+        ]
+    )
+
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(5):
+        (src / f"mod{i}.py").write_text(f"import os  # {i}\n")
+    (src / "notes.txt").write_text("")
+    (src / "__pycache__").mkdir()
+    (src / "__pycache__" / "mod0.py").write_text("")
+    return src
+
+
+@pytest.fixture
+def tools(tmp_path, monkeypatch):
+    tools = ExternalTools(cache_path=tmp_path / "cache.json")
+    tools._availability_cache = {name: True for name in ExternalTools.TOOLS}
+    tools._tool_versions = {"ruff": "ruff 0.5.0", "vulture": "vulture 2.11"}
+    tools._cache_time = datetime.now()
+    tools.calls = []
+
+    async def execute(tool, paths):
+        tools.calls.append((tool, list(paths)))
+        if tool == "ruff":
+            return _ruff_output(paths)
+        return "src/mod0.py:1: unused import 'os' (90% confidence)\n"
+
+    monkeypatch.setattr(tools, "_execute", execute)
+    return tools
+
+
+class TestPerFileCache:
+    async def test_only_changed_files_are_reanalyzed(self, tools, tree):
+        first = await tools.run_tool_on_files("ruff", [str(tree)])
+        assert len(first) == 5
+        assert len(tools.calls) == 1
+
+        changed = tree / "mod3.py"
+        changed.write_text("import sys\n")
+        second = await tools.run_tool_on_files("ruff", [str(tree)])
+
+        assert tools.calls[1] == ("ruff", [str(changed)])
+        assert sorted(f.file for f in second) == sorted(f.file for f in first)
+        assert len({f.id for f in first + second}) == 10
+
+    async def test_files_are_batched(self, tools, tree, monkeypatch):
+        monkeypatch.setitem(ExternalTools.TOOLS["ruff"], "batch_size", 2)
+
+        await tools.run_tool_on_files("ruff", [str(tree)])
+
+        assert sorted(len(paths) for _, paths in tools.calls) == [1, 2, 2]
+
+    async def test_version_change_invalidates(self, tools, tree):
+        await tools.run_tool_on_files("ruff", [str(tree)])
+        tools._tool_versions["ruff"] = "ruff 0.6.0"
+
+        await tools.run_tool_on_files("ruff", [str(tree)])
+
+        assert len(tools.calls) == 2
+
+    async def test_failed_run_is_not_cached(self, tools, tree, monkeypatch):
+        async def fail(tool, paths):
+            return None
+
+        monkeypatch.setattr(tools, "_execute", fail)
+        assert await tools.run_tool_on_files("ruff", [str(tree)]) == []
+        assert tools.result_cache.stats()["entries"] == 0
+
+    async def test_cache_persists_across_instances(self, tools, tree, tmp_path):
+        await tools.run_all_applicable(str(tree), files=[str(tree / "mod0.py")])
+
+        fresh = ExternalTools(cache_path=tmp_path / "cache.json")
+        fresh._tool_versions = dict(tools._tool_versions)
+        key = ToolResultCache.key(
+            "ruff",
+            "ruff 0.5.0",
+            str(tree / "mod0.py"),
+            fresh.content_hash(str(tree / "mod0.py")),
+        )
+        cached = fresh.result_cache.get(key)
+        assert cached[0]["description"] == "[F401] unused import"
+
+
+class TestCrossFileCache:
+    async def test_rerun_skipped_until_tree_changes(self, tools, tree):
+        await tools.run_tool_on_files("vulture", [str(tree)])
+        await tools.run_tool_on_files("vulture", [str(tree)])
+        assert len(tools.calls) == 1
+
+        (tree / "mod1.py").write_text("x = 1\n")
+        await tools.run_tool_on_files("vulture", [str(tree)])
+        assert tools.calls[-1] == ("vulture", [str(tree)])
+        assert len(tools.calls) == 2
+
+    async def test_concurrent_identical_runs_share_one_invocation(
+        self, tools, tree, monkeypatch
+    ):
+        async def slow(tool, paths):
+            tools.calls.append((tool, list(paths)))
+            await asyncio.sleep(0.1)
+            return ""
+
+        monkeypatch.setattr(tools, "_execute", slow)
+
+        await asyncio.gather(
+            tools.run_tool_on_files("vulture", [str(tree)]),
+            tools.run_tool_on_files("vulture", [str(tree)]),
+        )
+
+        assert len(tools.calls) == 1
+
+
+class TestHelpers:
+    def test_expand_files_skips_dirs_and_other_languages(self, tree):
+        files = ExternalTools()._expand_files("ruff", [str(tree)])
+        assert sorted(files) == sorted(str(tree / f"mod{i}.py") for i in range(5))
+
+    def test_finding_round_trip(self):
+        finding = Finding(
+            id="slop-ruff-0001",
+            category="style_issues",
+            severity="low",
+            file="a.py",
+            line=3,
+            description="x",
+        )
+        assert Finding.from_dict(finding.to_dict()) == finding
+
+    def test_cache_is_bounded(self):
+        cache = ToolResultCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, [])
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 2
@@ -0,0 +1,171 @@
+"""Tests for services/slop/scheduler.py and snapshot.py - shared scan work."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.base.ai_router import LLMResponse
+from services.slop.loops import LOOP_CONFIGS, AnalysisLoop, LoopMetrics
+from services.slop.scheduler import LoopScheduler
+from services.slop.snapshot import FileSnapshot
+
+
+@pytest.fixture
+def codebase(tmp_path):
+    for i in range(6):
+        (tmp_path / f"mod{i}.py").write_text("x = 1\n" * (10 + i))
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "cached.py").write_text("")
+    return tmp_path
+
+
+class FakeRouter:
+    """Records prompts; one finding per prompt, then done."""
+
+    def __init__(self, delay: float = 0.0, done: bool = True):
+        self.delay = delay
+        self.done = done
+        self.prompts: list[tuple[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def analyze(self, prompt: str, task: str = "analysis") -> LLMResponse:
+        self.prompts.append((task, prompt))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return LLMResponse(
+            text="{}",
+            findings=[{"file": "x.py", "line": len(self.prompts), "description": "d"}],
+            done=self.done,
+            latency_ms=10,
+        )
+
+
+def _loops(names, router, db):
+    return {
+        name: AnalysisLoop(name, dict(LOOP_CONFIGS[name], fast_tools=[]), db, router)
+        for name in names
+    }
+
+
+@pytest.fixture
+def db():
+    db = MagicMock()
+    db.add_findings = AsyncMock(return_value=[])
+    return db
+
+
+class TestFileSnapshot:
+    def test_build_skips_excluded_and_detects_changes(self, codebase):
+        first = FileSnapshot.build(str(codebase))
+        assert len(first.paths) == 6
+        assert len(first.changed_paths()) == 6
+
+        (codebase / "mod2.py").write_text("y = 2\n")
+        second = FileSnapshot.build(str(codebase), previous=first)
+
+        assert second.changed_paths() == [str(codebase / "mod2.py")]
+        assert second.get(str(codebase / "mod0.py")).language == "python"
+
+    def test_hasher_is_shared(self, codebase):
+        seen = []
+        FileSnapshot.build(str(codebase), hasher=lambda p: seen.append(p) or "h")
+        assert len(seen) == 6
+
+    def test_batches_respect_token_and_file_limits(self, codebase):
+        snapshot = FileSnapshot.build(str(codebase))
+        paths = sorted(snapshot.paths)
+
+        by_files = snapshot.batches(paths, max_tokens=10**6, max_files=4)
+        by_tokens = snapshot.batches(paths, max_tokens=30, max_files=100)
+
+        assert [len(b) for b in by_files] == [4, 2]
+        assert all(snapshot.tokens(b) <= 30 or len(b) == 1 for b in by_tokens)
+        assert sum(by_tokens, []) == paths
+
+
+class TestLoopScheduler:
+    async def test_batches_all_loops_on_shared_workers(self, codebase, db):
+        router = FakeRouter(delay=0.02)
+        loops = _loops(["leaker", "racer", "drifter"], router, db)
+        snapshot = FileSnapshot.build(str(codebase))
+        scheduler = LoopScheduler(max_workers=2, batch_tokens=10**6, batch_files=2)
+
+        results = await scheduler.run(loops, snapshot)
+
+        assert set(results) == {"leaker", "racer", "drifter"}
+        assert all(r.status == "done" for r in results.values())
+        # 3 loops x 3 batches, one LLM call each, never more than 2 at once
+        assert len(router.prompts) == 9
+        assert router.max_active == 2
+        assert results["racer"].metrics["batches"] == 3
+        assert results["racer"].metrics["files"] == 6
+        assert results["racer"].metrics["prompt_tokens"] > 0
+        assert results["racer"].findings_count == 3
+        db.add_findings.assert_awaited()
+
+    async def test_higher_value_batches_run_first(self, codebase, db):
+        router = FakeRouter()
+        loops = _loops(["leaker", "drifter"], router, db)
+        snapshot = FileSnapshot.build(str(codebase))
+        history = {"drifter": LoopMetrics(findings=1000, prompt_tokens=1000)}
+        scheduler = LoopScheduler(max_workers=1, batch_tokens=10**6, history=history)
+
+        await scheduler.run(loops, snapshot)
+
+        assert [task for task, _ in router.prompts] == ["verbosity", "security"]
+
+    async def test_failing_loop_does_not_stop_others(self, codebase, db):
+        router = FakeRouter()
+        loops = _loops(["leaker", "racer"], router, db)
+        loops["racer"].run_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        snapshot = FileSnapshot.build(str(codebase))
+
+        results = await LoopScheduler(max_workers=2, batch_files=2).run(loops, snapshot)
+
+        assert results["racer"].status == "error"
+        assert results["racer"].error == "boom"
+        assert results["leaker"].status == "done"
+
+    @pytest.mark.parametrize("batch_files", [1, 4])
+    async def test_iteration_budget_shared_by_batches(self, codebase, db, batch_files):
+        router = FakeRouter(done=False)
+        loops = _loops(["leaker"], router, db)
+        snapshot = FileSnapshot.build(str(codebase))
+        scheduler = LoopScheduler(batch_tokens=10**6, batch_files=batch_files)
+
+        result = (await scheduler.run(loops, snapshot))["leaker"]
+
+        # leaker allows 3 iterations for the whole run, whatever the batching
+        assert len(router.prompts) == 3
+        assert result.iterations == result.max_iterations == 3
+        assert result.metrics["files"] == 6
+        assert result.metrics["batches"] == (3 if batch_files == 1 else 2)
+
+    async def test_score_prefers_changed_files(self, codebase, db):
+        first = FileSnapshot.build(str(codebase))
+        (codebase / "mod0.py").write_text("x = 1\n" * 10 + "# edit\n")
+        snapshot = FileSnapshot.build(str(codebase), previous=first)
+        loop = _loops(["racer"], FakeRouter(), db)["racer"]
+        scheduler = LoopScheduler()
+
+        changed = scheduler.score(loop, [str(codebase / "mod0.py")], snapshot)
+        unchanged = scheduler.score(loop, [str(codebase / "mod1.py")], snapshot)
+
+        assert changed > unchanged
+
+
+class TestAnalysisLoopRun:
+    async def test_run_uses_snapshot_files(self, codebase, db):
+        router = FakeRouter()
+        loop = _loops(["racer"], router, db)["racer"]
+        snapshot = FileSnapshot.build(str(codebase))
+
+        result = await loop.run(snapshot=snapshot)
+
+        assert result.status == "done"
+        assert len(router.prompts) == 1
+        assert all(path in router.prompts[0][1] for path in snapshot.paths)
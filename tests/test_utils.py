@@ -1,5 +1,6 @@
 """Tests for shared utilities in server/utils.py."""
 
+import asyncio
 import os
 import subprocess
 from pathlib import Path
@@ -7,6 +8,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from server.process_runner import ProcessResult
 from server.utils import (
     _build_shell_sources,
     _prepare_shell_environment,
@@ -790,14 +792,13 @@ class TestCheckClusterAuth:
     async def test_auth_valid(self):
         from server.utils import check_cluster_auth
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "user@example.com\n"
-        mock_result.stderr = ""
+        mock_result = ProcessResult(
+            returncode=0, stdout="user@example.com\n", stderr=""
+        )
 
         with patch("server.utils.get_kubeconfig", return_value="/tmp/kube/config.s"):
             with patch("os.path.exists", return_value=True):
-                with patch("asyncio.to_thread", return_value=mock_result):
+                with patch("server.utils.run_process", return_value=mock_result):
                     result = await check_cluster_auth("stage")
                     assert result is True
 
@@ -805,14 +806,11 @@ class TestCheckClusterAuth:
     async def test_auth_failed(self):
         from server.utils import check_cluster_auth
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Unauthorized"
+        mock_result = ProcessResult(returncode=1, stdout="", stderr="Unauthorized")
 
         with patch("server.utils.get_kubeconfig", return_value="/tmp/kube/config.s"):
             with patch("os.path.exists", return_value=True):
-                with patch("asyncio.to_thread", return_value=mock_result):
+                with patch("server.utils.run_process", return_value=mock_result):
                     result = await check_cluster_auth("stage")
                     assert result is False
 
@@ -823,7 +821,8 @@ class TestCheckClusterAuth:
         with patch("server.utils.get_kubeconfig", return_value="/tmp/kube/config.s"):
             with patch("os.path.exists", return_value=True):
                 with patch(
-                    "asyncio.to_thread", side_effect=Exception("connection error")
+                    "server.utils.run_process",
+                    side_effect=Exception("connection error"),
                 ):
                     result = await check_cluster_auth("stage")
                     assert result is False
@@ -908,6 +907,92 @@ class TestEnsureClusterAuth:
                 assert "kube" in error.lower()
 
 
+class TestClusterAuthCache:
+    @pytest.fixture(autouse=True)
+    def kubeconfig(self, tmp_path):
+        from server import utils
+
+        utils.invalidate_cluster_auth()
+        path = tmp_path / "config.s"
+        path.write_text("apiVersion: v1\n")
+        with patch("server.utils.get_kubeconfig", return_value=str(path)):
+            yield path
+        utils.invalidate_cluster_auth()
+
+    @pytest.fixture
+    def probe(self):
+        async def whoami(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            return ProcessResult(returncode=0, stdout="me\n", stderr="")
+
+        with patch("server.utils.run_process", side_effect=whoami) as mock:
+            yield mock
+
+    async def test_success_is_cached(self, probe):
+        from server.utils import check_cluster_auth
+
+        assert await check_cluster_auth("stage")
+        assert await check_cluster_auth("stage")
+        assert probe.call_count == 1
+
+        assert await check_cluster_auth("stage", use_cache=False)
+        assert probe.call_count == 2
+
+    async def test_concurrent_checks_share_one_probe(self, probe):
+        from server.utils import check_cluster_auth
+
+        results = await asyncio.gather(*(check_cluster_auth("stage") for _ in range(5)))
+
+        assert all(results)
+        assert probe.call_count == 1
+
+    async def test_kubeconfig_change_invalidates(self, probe, kubeconfig):
+        from server.utils import check_cluster_auth
+
+        await check_cluster_auth("stage")
+        os.utime(kubeconfig, ns=(0, 1))
+        await check_cluster_auth("stage")
+
+        assert probe.call_count == 2
+
+    async def test_ttl_expiry(self, probe):
+        from server import utils
+
+        with patch.object(utils, "AUTH_CACHE_TTL", -1):
+            await utils.check_cluster_auth("stage")
+            await utils.check_cluster_auth("stage")
+
+        assert probe.call_count == 2
+
+    async def test_auth_error_invalidates(self, probe, kubeconfig):
+        from server.utils import check_cluster_auth, run_kubectl
+
+        await check_cluster_auth("stage")
+        with patch("server.utils.run_cmd", return_value=(False, "Unauthorized")):
+            await run_kubectl(["get", "pods"], kubeconfig=str(kubeconfig))
+        await check_cluster_auth("stage")
+
+        assert probe.call_count == 2
+
+    async def test_concurrent_refreshes_run_one_login(self):
+        from server.utils import ensure_cluster_auth
+
+        async def login(environment):
+            await asyncio.sleep(0.05)
+            return True
+
+        with patch("server.utils.check_cluster_auth", return_value=False):
+            with patch(
+                "server.utils.refresh_cluster_auth", side_effect=login
+            ) as refresh:
+                results = await asyncio.gather(
+                    *(ensure_cluster_auth("stage") for _ in range(4))
+                )
+
+        assert all(ok for ok, _ in results)
+        assert refresh.call_count == 1
+
+
 class TestRunKubectl:
     @pytest.mark.asyncio
     async def test_with_environment(self):
@@ -1249,7 +1334,7 @@ class TestRunCmdFullExtended:
     async def test_generic_exception(self):
         from server.utils import run_cmd_full
 
-        with patch("asyncio.to_thread", side_effect=RuntimeError("boom")):
+        with patch("server.utils.run_process", side_effect=RuntimeError("boom")):
             success, stdout, stderr = await run_cmd_full(
                 ["echo", "test"], use_shell=False
             )
@@ -1271,7 +1356,7 @@ class TestRunCmdWithEnvShellMode:
     async def test_generic_exception(self):
         from server.utils import run_cmd
 
-        with patch("asyncio.to_thread", side_effect=RuntimeError("async boom")):
+        with patch("server.utils.run_process", side_effect=RuntimeError("async boom")):
             success, output = await run_cmd(["echo", "test"], use_shell=False)
             assert success is False
             assert "async boom" in output
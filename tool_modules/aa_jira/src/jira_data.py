@@ -0,0 +1,353 @@
+"""Shared Jira data access for the sprint daemon, meet bot and tools.
+
+Reads go straight to the Jira REST API through the pooled
+``server.http_client.APIClient`` instead of one ``rh-issue`` process per
+query:
+
+- identical JQL searches running at the same time share one request;
+- searches request only the fields callers need and fetch the remaining
+  pages concurrently once the first page reports the total;
+- ``get_issues()`` fetches many issues in one ``key in (...)`` search per
+  ``KEYS_PER_QUERY`` keys, and serves issues fetched in the last
+  ``ISSUE_TTL_SECONDS`` from memory.
+
+Usage:
+    from tool_modules.aa_jira.src.jira_data import JiraUnavailable, get_jira_data
+
+    jira = get_jira_data()
+    issues = await jira.search("sprint = 123", fields=sprint_fields())
+    by_key = await jira.get_issues(["AAP-1", "AAP-2"], fields=("status",))
+
+Callers fall back to the rh-issue CLI when ``JiraUnavailable`` is raised
+(no token found, or the API request failed).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, cast
+
+from server.debuggable import register_status_provider
+from server.http_client import APIClient
+from server.loop_local import per_loop
+from server.utils import get_shell_environment, load_config
+
+logger = logging.getLogger(__name__)
+
+# Issues per search page (Jira may return fewer; its maxResults wins)
+PAGE_SIZE = 100
+
+# Pages of one search fetched at the same time
+MAX_CONCURRENT_PAGES = 4
+
+# Issue keys per "key in (...)" search
+KEYS_PER_QUERY = 100
+
+# Seconds a fetched issue is served from memory
+ISSUE_TTL_SECONDS = 60.0
+
+# Issues kept in memory at most (oldest dropped first)
+MAX_CACHED_ISSUES = 5000
+
+# Story points custom field on issues.redhat.com (jira.story_points_field overrides)
+DEFAULT_STORY_POINTS_FIELD = "customfield_12310243"
+
+
+class JiraUnavailable(Exception):
+    """The Jira API can't be used (no credentials, or the request failed)."""
+
+
+def story_points_field() -> str:
+    """Custom field holding story points."""
+    jira_config = cast(dict, load_config().get("jira", {}))
+    return jira_config.get("story_points_field", DEFAULT_STORY_POINTS_FIELD)
+
+
+def sprint_fields() -> tuple[str, ...]:
+    """Fields needed to build sprint issue dicts (see to_sprint_issue())."""
+    return (
+        "summary",
+        "status",
+        "assignee",
+        "issuetype",
+        "priority",
+        "labels",
+        story_points_field(),
+    )
+
+
+def _name(value: Any, attr: str = "name") -> str:
+    if isinstance(value, dict):
+        return str(value.get(attr, ""))
+    return str(value or "")
+
+
+def to_sprint_issue(issue: dict) -> dict:
+    """Sprint bot issue dict (same keys as the rh-issue table parser)."""
+    fields = issue.get("fields", {})
+    points = fields.get(story_points_field())
+    return {
+        "key": issue.get("key", ""),
+        "issueType": _name(fields.get("issuetype")),
+        "jiraStatus": _name(fields.get("status")),
+        "priority": _name(fields.get("priority")),
+        "summary": fields.get("summary", ""),
+        "assignee": _name(fields.get("assignee"), "displayName"),
+        "storyPoints": int(points) if isinstance(points, (int, float)) else 0,
+    }
+
+
+async def jira_credentials() -> tuple[str, str]:
+    """Jira base URL and token.
+
+    Looked up in the process environment, then the user's shell environment
+    (daemons don't inherit ~/.bashrc), then ~/.config/jira/config.json.
+
+    Returns:
+        Tuple of (base_url, token); token is empty if none was found
+    """
+    jira_config = cast(dict, load_config().get("jira", {}))
+    url = jira_config.get("url", "https://issues.redhat.com")
+
+    shell = get_shell_environment()
+    snapshot = await asyncio.to_thread(shell.get) if shell.is_stale() else shell.get()
+    for env in (os.environ, snapshot.env if snapshot else {}):
+        token = env.get("JIRA_JPAT") or env.get("JIRA_TOKEN")
+        if token:
+            return env.get("JIRA_URL") or url, token
+
+    config_path = Path.home() / ".config" / "jira" / "config.json"
+    try:
+        file_config = json.loads(config_path.read_text(encoding="utf-8"))
+        return file_config.get("url", url), file_config.get("token", "")
+    except (OSError, ValueError):
+        return url, ""
+
+
+@dataclass
+class _CachedIssue:
+    issue: dict
+    fields: frozenset[str]
+    expires_at: float
+
+
+class JiraData:
+    """Coalesced, cached Jira reads for one event loop."""
+
+    def __init__(
+        self,
+        client: APIClient | None = None,
+        page_size: int = PAGE_SIZE,
+        max_concurrent_pages: int = MAX_CONCURRENT_PAGES,
+        ttl: float = ISSUE_TTL_SECONDS,
+        max_issues: int = MAX_CACHED_ISSUES,
+    ):
+        self._client = client
+        self.page_size = page_size
+        self.ttl = ttl
+        self.max_issues = max_issues
+        self._page_slots = asyncio.Semaphore(max_concurrent_pages)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Ordered by expiry: entries are re-inserted when refreshed
+        self._issues: dict[str, _CachedIssue] = {}
+        self.requests = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+
+    async def _get_client(self) -> APIClient:
+        if self._client is None:
+            url, token = await jira_credentials()
+            if not token:
+                raise JiraUnavailable("No Jira token (set JIRA_JPAT)")
+            self._client = APIClient(
+                base_url=url.rstrip("/"),
+                bearer_token=token,
+                timeout=60.0,
+                auth_error_msg="Jira authentication failed (check JIRA_JPAT)",
+            )
+        return self._client
+
+    async def _coalesce(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fetch() once for concurrent callers with the same key."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # Shield: one caller giving up must not cancel the others' request
+        return await asyncio.shield(future)
+
+    async def _page(
+        self, jql: str, fields: tuple[str, ...], start_at: int, max_results: int
+    ) -> dict:
+        client = await self._get_client()
+        async with self._page_slots:
+            self.requests += 1
+            success, data = await client.post(
+                "/rest/api/2/search",
+                json={
+                    "jql": jql,
+                    "startAt": start_at,
+                    "maxResults": max_results,
+                    "fields": list(fields),
+                    # Unknown keys in "key in (...)" warn instead of failing
+                    "validateQuery": "warn",
+                },
+            )
+        if not success or not isinstance(data, dict):
+            raise JiraUnavailable(f"Jira search failed: {data}")
+        return data
+
+    async def _search(
+        self, jql: str, fields: tuple[str, ...], limit: int | None
+    ) -> list[dict]:
+        first_size = min(self.page_size, limit) if limit else self.page_size
+        first = await self._page(jql, fields, 0, first_size)
+        issues = list(first.get("issues", []))
+        total = first.get("total", len(issues))
+        if limit:
+            total = min(total, limit)
+        # Jira caps maxResults server-side; page by what it actually returned
+        step = first.get("maxResults") or len(issues) or self.page_size
+        if len(issues) < total and step > 0:
+            pages = await asyncio.gather(
+                *(
+                    self._page(jql, fields, start, min(step, total - start))
+                    for start in range(len(issues), total, step)
+                )
+            )
+            for page in pages:
+                issues.extend(page.get("issues", []))
+        self._remember(issues[:total], fields)
+        return issues[:total]
+
+    async def search(
+        self,
+        jql: str,
+        fields: Iterable[str] | None = None,
+        max_results: int | None = None,
+    ) -> list[dict]:
+        """Issues matching a JQL query.
+
+        Args:
+            jql: JQL query
+            fields: Fields to return (default: sprint_fields())
+            max_results: Stop after this many issues (default: all)
+
+        Returns:
+            Raw issues ({"key": ..., "fields": {...}}) in Jira's order
+
+        Raises:
+            JiraUnavailable: No credentials, or the API request failed
+        """
+        wanted = tuple(sorted(set(fields or sprint_fields())))
+        return await self._coalesce(
+            ("search", jql, wanted, max_results),
+            lambda: self._search(jql, wanted, max_results),
+        )
+
+    def _remember(self, issues: list[dict], fields: tuple[str, ...]) -> None:
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        for issue in issues:
+            if issue.get("key"):
+                self._issues.pop(issue["key"], None)
+                self._issues[issue["key"]] = _CachedIssue(
+                    issue, frozenset(fields), expires_at
+                )
+        # Oldest first: drop what has expired, then anything over the cap
+        for key, entry in list(self._issues.items()):
+            if entry.expires_at >= now and len(self._issues) <= self.max_issues:
+                break
+            del self._issues[key]
+
+    def _cached(self, key: str, fields: frozenset[str]) -> dict | None:
+        entry = self._issues.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._issues[key]
+            return None
+        if not fields <= entry.fields:
+            return None
+        return entry.issue
+
+    async def get_issues(
+        self, keys: Iterable[str], fields: Iterable[str] | None = None
+    ) -> dict[str, dict]:
+        """Issues by key, fetched in bulk (unknown keys are left out).
+
+        Raises:
+            JiraUnavailable: No credentials, or the API request failed
+        """
+        wanted = tuple(sorted(set(fields or sprint_fields())))
+        wanted_set = frozenset(wanted)
+        result: dict[str, dict] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            issue = self._cached(key, wanted_set)
+            if issue is not None:
+                self.cache_hits += 1
+                result[key] = issue
+            else:
+                missing.append(key)
+
+        chunks = [
+            missing[i : i + KEYS_PER_QUERY]
+            for i in range(0, len(missing), KEYS_PER_QUERY)
+        ]
+        for issues in await asyncio.gather(
+            *(self.search(f"key in ({', '.join(chunk)})", wanted) for chunk in chunks)
+        ):
+            for issue in issues:
+                result[issue["key"]] = issue
+        return result
+
+    def invalidate(self, *keys: str) -> None:
+        """Forget cached issues (all of them when no keys are given)."""
+        if not keys:
+            self._issues.clear()
+        for key in keys:
+            self._issues.pop(key, None)
+
+    def stats(self) -> dict:
+        """Request, coalescing and cache counters."""
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "cached_issues": len(self._issues),
+        }
+
+
+_instances = per_loop(JiraData)
+
+
+def get_jira_data() -> JiraData:
+    """Jira data access for the running event loop."""
+    return _instances()
+
+
+def jira_data_status() -> str:
+    """Markdown status of the Jira data layer, for debug_tool()."""
+    lines = ["### Jira data access", ""]
+    instances = _instances.values()
+    if not instances:
+        lines.append("No Jira reads yet.")
+    for instance in instances:
+        stats = instance.stats()
+        lines.append(
+            f"- {stats['requests']} API requests, {stats['coalesced']} coalesced, "
+            f"{stats['cache_hits']} cached issue hits, "
+            f"{stats['cached_issues']} issues cached"
+        )
+    return "\n".join(lines)
+
+
+register_status_provider("jira_data", jira_data_status)
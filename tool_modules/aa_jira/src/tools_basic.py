@@ -344,7 +344,22 @@ async def jira_get_active_sprint(project: str = "AAP") -> dict:
 
 
 async def jira_get_sprint_issues(sprint_id: int, max_results: int = 100) -> list[dict]:
-    """Get all issues in a sprint (for internal use by sprint_bot)."""
+    """Get all issues in a sprint (for internal use by sprint_bot).
+
+    Fetched in bulk from the Jira API (all pages, only the fields the sprint
+    bot uses); falls back to rh-issue when the API isn't available.
+    """
+    from tool_modules.aa_jira.src.jira_data import (
+        JiraUnavailable,
+        get_jira_data,
+        to_sprint_issue,
+    )
+
+    try:
+        issues = await get_jira_data().search(f"sprint = {sprint_id}")
+        return [to_sprint_issue(issue) for issue in issues]
+    except JiraUnavailable as e:
+        logger.info(f"Jira API unavailable, using rh-issue: {e}")
     return await _jira_get_sprint_issues_impl(sprint_id)
 
 
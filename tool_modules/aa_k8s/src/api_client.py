@@ -0,0 +1,584 @@
+"""In-process Kubernetes API client for the read-only aa_k8s tools.
+
+The getters and health summaries used to spawn one kubectl process per
+resource kind and re-parse its text tables; a namespace health check ran
+several of them back to back. This client talks to the API server directly:
+
+- reads the same kubeconfig files as kubectl (token, token file, client
+  certificates, CA data); exec/auth-provider users are not supported and
+  fall back to kubectl
+- keeps one pooled httpx client per kubeconfig (HTTP/2 when ``h2`` is
+  installed), rebuilt when the kubeconfig changes, e.g. after a login
+- lists several kinds concurrently, so a health summary costs one round trip
+- repeats a list with ``resourceVersion=<last seen>`` and
+  ``resourceVersionMatch=NotOlderThan``, which the API server can answer
+  from its watch cache instead of a quorum read from etcd
+
+``list_resources()`` is the entry point for tools: it serves warm informer
+caches (see informer.py, opt-in), then tries the API and falls back to
+``kubectl get -o json`` for any kind the API could not serve, so callers
+always get structured items. ``get_table()`` is for kinds whose objects must
+not be fetched (secrets): the API server renders kubectl's columns itself.
+
+Usage:
+    from tool_modules.aa_k8s.src.api_client import list_resources
+
+    results = await list_resources(kubeconfig, ["pods", "events"], namespace=ns)
+    if results["pods"].ok:
+        pods = results["pods"].items
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import logging
+import os
+import ssl
+import tempfile
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import httpx
+import yaml
+
+from server.loop_local import PerLoop, per_loop
+from server.utils import invalidate_cluster_auth, run_kubectl
+from tool_modules.aa_k8s.src.tables import format_table
+
+logger = logging.getLogger(__name__)
+
+# Kind -> (API group path, resource name)
+RESOURCES = {
+    "pods": ("/api/v1", "pods"),
+    "services": ("/api/v1", "services"),
+    "events": ("/api/v1", "events"),
+    "configmaps": ("/api/v1", "configmaps"),
+    "secrets": ("/api/v1", "secrets"),
+    "namespaces": ("/api/v1", "namespaces"),
+    "deployments": ("/apis/apps/v1", "deployments"),
+    "ingresses": ("/apis/networking.k8s.io/v1", "ingresses"),
+}
+
+CLUSTER_SCOPED = {"namespaces"}
+
+# Server-side printing: kubectl's columns, without the objects themselves
+TABLE_ACCEPT = "application/json;as=Table;g=meta.k8s.io;v=v1,application/json"
+
+REQUEST_TIMEOUT = 30.0
+CONNECT_TIMEOUT = 5.0
+
+# Server-side duration of one watch request; watchers reconnect after it
+WATCH_TIMEOUT_SECONDS = 60
+
+# Multiplex concurrent lists over one connection when h2 is available
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+class KubeAPIError(Exception):
+    """The API server rejected a request."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class KubeAuthError(KubeAPIError):
+    """The credentials in the kubeconfig were rejected (401)."""
+
+
+class UnsupportedKubeconfig(Exception):
+    """The kubeconfig uses auth this client cannot do (exec, auth-provider)."""
+
+
+@dataclass
+class ClusterConfig:
+    """Connection settings of a kubeconfig's current context."""
+
+    server: str
+    token: str | None = None
+    verify: ssl.SSLContext | bool = True
+    namespace: str | None = None
+
+    @classmethod
+    def load(cls, kubeconfig: str) -> "ClusterConfig":
+        """Read the current context of a kubeconfig file.
+
+        Raises:
+            OSError: The file (or a file it references) can't be read
+            UnsupportedKubeconfig: The context can't be used without kubectl
+        """
+        with open(kubeconfig) as f:
+            config = yaml.safe_load(f) or {}
+
+        context_name = config.get("current-context")
+        context = _named(config.get("contexts"), context_name)
+        if not context:
+            raise UnsupportedKubeconfig(f"No current context in {kubeconfig}")
+        cluster = _named(config.get("clusters"), context.get("cluster"))
+        user = _named(config.get("users"), context.get("user")) or {}
+        if not cluster or not cluster.get("server"):
+            raise UnsupportedKubeconfig(f"No cluster server in {kubeconfig}")
+
+        token = user.get("token")
+        if not token and user.get("tokenFile"):
+            with open(os.path.expanduser(user["tokenFile"])) as f:
+                token = f.read().strip()
+        has_cert = "client-certificate" in user or "client-certificate-data" in user
+        if not token and not has_cert and ("exec" in user or "auth-provider" in user):
+            raise UnsupportedKubeconfig(
+                f"{kubeconfig} uses exec/auth-provider credentials"
+            )
+
+        return cls(
+            server=cluster["server"].rstrip("/"),
+            token=token,
+            verify=_ssl_context(cluster, user),
+            namespace=context.get("namespace"),
+        )
+
+
+def _named(entries: list[dict] | None, name: str | None) -> dict | None:
+    """The body of the kubeconfig list entry with the given name."""
+    for entry in entries or []:
+        if entry.get("name") == name:
+            return entry.get("context") or entry.get("cluster") or entry.get("user")
+    return None
+
+
+def _ssl_context(cluster: dict, user: dict) -> ssl.SSLContext | bool:
+    """TLS settings for a cluster and (client certificate) user."""
+    has_cert = "client-certificate" in user or "client-certificate-data" in user
+    if cluster.get("insecure-skip-tls-verify"):
+        if not has_cert:
+            return False
+        ctx = ssl.create_default_context()
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    elif cluster.get("certificate-authority-data"):
+        cadata = base64.b64decode(cluster["certificate-authority-data"]).decode()
+        ctx = ssl.create_default_context(cadata=cadata)
+    elif cluster.get("certificate-authority"):
+        cafile = os.path.expanduser(cluster["certificate-authority"])
+        ctx = ssl.create_default_context(cafile=cafile)
+    elif not has_cert:
+        return True
+    else:
+        ctx = ssl.create_default_context()
+
+    if has_cert:
+        _load_client_cert(ctx, user)
+    return ctx
+
+
+def _load_client_cert(ctx: ssl.SSLContext, user: dict) -> None:
+    """Load a kubeconfig user's client certificate into an SSL context."""
+    if "client-certificate" in user:
+        ctx.load_cert_chain(
+            os.path.expanduser(user["client-certificate"]),
+            os.path.expanduser(user["client-key"]),
+        )
+        return
+
+    # load_cert_chain only reads files, so stage inline data privately
+    paths = []
+    try:
+        for key in ("client-certificate-data", "client-key-data"):
+            fd, path = tempfile.mkstemp(prefix="aa-kube-", suffix=".pem")
+            paths.append(path)
+            with os.fdopen(fd, "wb") as f:
+                f.write(base64.b64decode(user[key]))
+        ctx.load_cert_chain(*paths)
+    finally:
+        for path in paths:
+            os.unlink(path)
+
+
+class KubeAPIClient:
+    """Pooled client for one cluster's API server."""
+
+    def __init__(self, kubeconfig: str, config: ClusterConfig | None = None):
+        """Initialize the client.
+
+        Args:
+            kubeconfig: Kubeconfig path
+            config: Connection settings (default: read from the kubeconfig)
+        """
+        self.kubeconfig = kubeconfig
+        self.config = config or ClusterConfig.load(kubeconfig)
+        headers = {"Accept": "application/json"}
+        if self.config.token:
+            headers["Authorization"] = f"Bearer {self.config.token}"
+        self._client = httpx.AsyncClient(
+            base_url=self.config.server,
+            headers=headers,
+            verify=self.config.verify,
+            http2=HTTP2,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        )
+        # Last resourceVersion seen per (path, selectors)
+        self._versions: dict[tuple[str, str, str], str] = {}
+
+    @staticmethod
+    def path(kind: str, namespace: str | None = None) -> str:
+        """API path of a list; no namespace lists across all namespaces."""
+        if kind not in RESOURCES:
+            raise ValueError(f"Unsupported kind: {kind}")
+        group, resource = RESOURCES[kind]
+        if namespace and kind not in CLUSTER_SCOPED:
+            return f"{group}/namespaces/{namespace}/{resource}"
+        return f"{group}/{resource}"
+
+    async def list_objects(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str = "",
+        field_selector: str = "",
+    ) -> list[dict]:
+        """List objects of one kind.
+
+        Raises:
+            KubeAuthError: The credentials were rejected
+            KubeAPIError: Any other error status
+            httpx.HTTPError: The API server could not be reached
+        """
+        path = self.path(kind, namespace)
+        params = {}
+        if label_selector:
+            params["labelSelector"] = label_selector
+        if field_selector:
+            params["fieldSelector"] = field_selector
+
+        key = (path, label_selector, field_selector)
+        version = self._versions.get(key)
+        if version:
+            params["resourceVersion"] = version
+            params["resourceVersionMatch"] = "NotOlderThan"
+        try:
+            data = await self._get(path, params)
+        except KubeAPIError as e:
+            if not version or e.status != 410:
+                raise
+            # Our version was compacted away; fall back to a quorum read
+            self._versions.pop(key, None)
+            del params["resourceVersion"], params["resourceVersionMatch"]
+            data = await self._get(path, params)
+
+        new_version = (data.get("metadata") or {}).get("resourceVersion")
+        if new_version:
+            self._versions[key] = new_version
+        return data.get("items") or []
+
+    async def list_many(
+        self,
+        kinds: list[str],
+        namespace: str | None = None,
+        label_selector: str = "",
+        field_selector: str = "",
+    ) -> list[list[dict] | BaseException]:
+        """List several kinds concurrently; failures are returned, not raised."""
+        return await asyncio.gather(
+            *(
+                self.list_objects(kind, namespace, label_selector, field_selector)
+                for kind in kinds
+            ),
+            return_exceptions=True,
+        )
+
+    async def list_table(
+        self, kind: str, namespace: str | None = None
+    ) -> tuple[list[str], list[list[str]]]:
+        """Headers and rows of the table ``kubectl get`` prints for a kind.
+
+        Only the printed columns cross the wire (``includeObject=None``), so
+        listing secrets this way never transfers their values.
+
+        Raises:
+            KubeAuthError: The credentials were rejected
+            KubeAPIError: Any other error status
+            httpx.HTTPError: The API server could not be reached
+        """
+        response = await self._client.get(
+            self.path(kind, namespace),
+            params={"includeObject": "None"},
+            headers={"Accept": TABLE_ACCEPT},
+        )
+        _raise_for_status(response)
+        data = response.json()
+        if data.get("kind") != "Table":
+            raise KubeAPIError(response.status_code, "Table form not supported")
+        # priority > 0 columns are only shown by -o wide
+        columns = [
+            i
+            for i, column in enumerate(data.get("columnDefinitions") or [])
+            if not column.get("priority")
+        ]
+        headers = [data["columnDefinitions"][i]["name"].upper() for i in columns]
+        rows = [
+            [str(row["cells"][i]) for i in columns] for row in data.get("rows") or []
+        ]
+        return headers, rows
+
+    async def list_snapshot(
+        self, kind: str, namespace: str | None = None
+    ) -> tuple[list[dict], str | None]:
+        """Consistent list of one kind plus its resourceVersion, to start a watch."""
+        data = await self._get(self.path(kind, namespace), {})
+        return data.get("items") or [], (data.get("metadata") or {}).get(
+            "resourceVersion"
+        )
+
+    async def watch(
+        self,
+        kind: str,
+        namespace: str | None,
+        resource_version: str,
+        timeout_seconds: int = WATCH_TIMEOUT_SECONDS,
+    ) -> AsyncIterator[dict]:
+        """Stream watch events after a resourceVersion.
+
+        Yields ADDED/MODIFIED/DELETED/BOOKMARK events until the server ends
+        the watch (after about ``timeout_seconds``).
+
+        Raises:
+            KubeAPIError: The watch was rejected, or an ERROR event arrived
+                (410 when ``resource_version`` is too old)
+        """
+        params = {
+            "watch": "1",
+            "resourceVersion": resource_version,
+            "allowWatchBookmarks": "true",
+            "timeoutSeconds": str(timeout_seconds),
+        }
+        timeout = httpx.Timeout(
+            timeout_seconds + REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT
+        )
+        async with self._client.stream(
+            "GET", self.path(kind, namespace), params=params, timeout=timeout
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+                _raise_for_status(response)
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event.get("type") == "ERROR":
+                    status = event.get("object") or {}
+                    raise KubeAPIError(
+                        status.get("code", 500), status.get("message", "")
+                    )
+                yield event
+
+    async def _get(self, path: str, params: dict[str, str]) -> dict:
+        response = await self._client.get(path, params=params)
+        _raise_for_status(response)
+        return response.json()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+
+
+def _raise_for_status(response: httpx.Response) -> None:
+    if response.status_code < 400:
+        return
+    try:
+        message = response.json().get("message") or response.text
+    except ValueError:
+        message = response.text
+    error = KubeAuthError if response.status_code == 401 else KubeAPIError
+    raise error(response.status_code, message)
+
+
+@dataclass
+class ResourceList:
+    """Items of one kind, from the informer cache, the API or kubectl."""
+
+    kind: str
+    items: list[dict] | None = None
+    error: str = ""
+    source: str = "api"
+
+    @property
+    def ok(self) -> bool:
+        """True if the list succeeded (it may still be empty)."""
+        return self.items is not None
+
+
+@dataclass
+class _CachedClient:
+    mtime_ns: int
+    client: KubeAPIClient | None
+
+
+_clients: PerLoop[dict[str, _CachedClient]] = per_loop(dict)
+
+
+# Closes of replaced clients, referenced until they finish
+_closing: set[asyncio.Future] = set()
+
+
+def _closed(task: asyncio.Future) -> None:
+    _closing.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"Closing a replaced API client failed: {task.exception()}")
+
+
+def get_api_client(kubeconfig: str) -> KubeAPIClient | None:
+    """Shared client for a kubeconfig, or None if it needs kubectl.
+
+    The client is rebuilt when the kubeconfig file changes.
+    """
+    try:
+        mtime_ns = os.stat(kubeconfig).st_mtime_ns
+    except OSError:
+        return None
+
+    clients = _clients()
+    cached = clients.get(kubeconfig)
+    if cached is not None and cached.mtime_ns == mtime_ns:
+        return cached.client
+    if cached is not None and cached.client is not None:
+        task = asyncio.ensure_future(cached.client.aclose())
+        _closing.add(task)
+        task.add_done_callback(_closed)
+
+    try:
+        client = KubeAPIClient(kubeconfig)
+    except (OSError, ValueError, yaml.YAMLError, ssl.SSLError) as e:
+        logger.info(f"Using kubectl for {kubeconfig}: {e}")
+        client = None
+    except UnsupportedKubeconfig as e:
+        logger.debug(f"Using kubectl for {kubeconfig}: {e}")
+        client = None
+    clients[kubeconfig] = _CachedClient(mtime_ns, client)
+    return client
+
+
+async def close_api_clients() -> None:
+    """Close the clients of the running event loop."""
+    clients = _clients.pop() or {}
+    for cached in clients.values():
+        if cached.client is not None:
+            await cached.client.aclose()
+
+
+async def list_resources(
+    kubeconfig: str,
+    kinds: list[str],
+    namespace: str | None = None,
+    label_selector: str = "",
+    field_selector: str = "",
+) -> dict[str, ResourceList]:
+    """List several kinds concurrently, via the API with a kubectl fallback.
+
+    Args:
+        kubeconfig: Kubeconfig path
+        kinds: Kinds to list (keys of RESOURCES)
+        namespace: Namespace, or None for all namespaces
+        label_selector: Label selector applied to every kind
+        field_selector: Field selector applied to every kind
+
+    Returns:
+        ResourceList per kind
+    """
+    # informer imports this module
+    from tool_modules.aa_k8s.src.informer import get_informer_cache
+
+    results: dict[str, ResourceList] = {}
+    client = get_api_client(kubeconfig)
+    cache = get_informer_cache()
+    if client is not None and cache is not None:
+        cached = await asyncio.gather(
+            *(
+                cache.lookup(client, kind, namespace, label_selector, field_selector)
+                for kind in kinds
+            )
+        )
+        for kind, items in zip(kinds, cached):
+            if items is not None:
+                results[kind] = ResourceList(kind, items, source="informer")
+
+    remaining = [kind for kind in kinds if kind not in results]
+    if client is not None and remaining:
+        listed = await client.list_many(
+            remaining, namespace, label_selector, field_selector
+        )
+        for kind, result in zip(remaining, listed):
+            if isinstance(result, KubeAuthError):
+                invalidate_cluster_auth(kubeconfig=kubeconfig)
+            if isinstance(result, BaseException):
+                logger.info(f"API list of {kind} failed, using kubectl: {result}")
+                continue
+            results[kind] = ResourceList(kind, result)
+
+    missing = [kind for kind in kinds if kind not in results]
+    fallbacks = await asyncio.gather(
+        *(
+            _kubectl_list(kubeconfig, kind, namespace, label_selector, field_selector)
+            for kind in missing
+        )
+    )
+    results.update(zip(missing, fallbacks))
+    return {kind: results[kind] for kind in kinds}
+
+
+async def get_table(
+    kubeconfig: str, kind: str, namespace: str | None = None
+) -> tuple[bool, str]:
+    """``kubectl get`` output for one kind, printed by the API server.
+
+    Neither path fetches the objects, only their printed columns. Falls back
+    to plain ``kubectl get`` (which also asks for the Table form).
+
+    Returns:
+        (success, table text or error)
+    """
+    client = get_api_client(kubeconfig)
+    if client is not None:
+        try:
+            headers, rows = await client.list_table(kind, namespace)
+        except (KubeAPIError, httpx.HTTPError, ValueError) as e:
+            if isinstance(e, KubeAuthError):
+                invalidate_cluster_auth(kubeconfig=kubeconfig)
+            logger.info(f"API table of {kind} failed, using kubectl: {e}")
+        else:
+            return True, format_table(headers, rows) if rows else "No resources found."
+
+    args = ["get", kind]
+    if not namespace and kind not in CLUSTER_SCOPED:
+        args.append("--all-namespaces")
+    return await run_kubectl(args, kubeconfig=kubeconfig, namespace=namespace or None)
+
+
+async def _kubectl_list(
+    kubeconfig: str,
+    kind: str,
+    namespace: str | None,
+    label_selector: str,
+    field_selector: str,
+) -> ResourceList:
+    """List one kind with ``kubectl get -o json``."""
+    args = ["get", kind, "-o", "json"]
+    if label_selector:
+        args.extend(["-l", label_selector])
+    if field_selector:
+        args.extend(["--field-selector", field_selector])
+    if not namespace and kind not in CLUSTER_SCOPED:
+        args.append("--all-namespaces")
+
+    success, output = await run_kubectl(
+        args, kubeconfig=kubeconfig, namespace=namespace or None
+    )
+    if not success:
+        return ResourceList(kind, error=output, source="kubectl")
+    try:
+        data: dict[str, Any] = json.loads(output)
+    except ValueError as e:
+        return ResourceList(
+            kind, error=f"Invalid kubectl output: {e}", source="kubectl"
+        )
+    return ResourceList(kind, data.get("items") or [], source="kubectl")
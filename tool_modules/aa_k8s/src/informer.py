@@ -0,0 +1,455 @@
+"""Watch-backed informer cache for hot Kubernetes lists.
+
+Skills like investigate-alert and namespace-health list the same pods,
+events and deployments over and over within seconds. With informers enabled,
+the first list of a (cluster, namespace, kind) starts an informer: one list,
+then a watch from its resourceVersion that keeps a local copy current.
+Later lists are answered from that copy, filtered locally by label and
+field selector, without touching the API server.
+
+Memory is bounded: at most ``max_informers`` informers (least recently used
+evicted), each with at most ``max_objects`` objects (larger namespaces are
+not cached), ``managedFields`` stripped, and informers unused for
+``idle_seconds`` stop their watch.
+
+An informer only serves while its watch is live. When the watch drops it
+reconnects from its resourceVersion (or relists after a 410), and callers go
+to the API server until it is current again.
+
+Opt in via config.json::
+
+    "kubernetes": {"informers": {"enabled": true}}
+
+Staleness and the hit ratio are shown by ``debug_tool('k8s_informers')``.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+from server.loop_local import per_loop
+from server.utils import load_config
+from tool_modules.aa_k8s.src.api_client import (
+    KubeAPIClient,
+    KubeAPIError,
+    KubeAuthError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Kinds worth caching (secrets deliberately excluded)
+INFORMER_KINDS = frozenset({"pods", "events", "deployments", "services"})
+
+MAX_INFORMERS = 32
+MAX_OBJECTS = 5000
+IDLE_SECONDS = 600
+
+# How long a lookup waits for a new informer's first list
+SYNC_WAIT_SECONDS = 10.0
+
+# Backoff between failed watch reconnects
+RETRY_MAX_SECONDS = 30.0
+
+# Large and never needed for display
+_DROPPED_ANNOTATIONS = ("kubectl.kubernetes.io/last-applied-configuration",)
+
+InformerKey = tuple[str, str, str]
+
+
+class _Overflow(Exception):
+    """The namespace has more objects than an informer may hold."""
+
+
+def _slim(obj: dict) -> dict:
+    """Copy of an object without the fields that dominate its size."""
+    meta = dict(obj.get("metadata") or {})
+    meta.pop("managedFields", None)
+    annotations = meta.get("annotations")
+    if annotations and any(a in annotations for a in _DROPPED_ANNOTATIONS):
+        meta["annotations"] = {
+            k: v for k, v in annotations.items() if k not in _DROPPED_ANNOTATIONS
+        }
+    return {**obj, "metadata": meta}
+
+
+def _object_key(obj: dict) -> str:
+    meta = obj.get("metadata") or {}
+    return f"{meta.get('namespace', '')}/{meta.get('name', '')}"
+
+
+def parse_selector(selector: str) -> list[tuple[str, str, str]] | None:
+    """Parse an equality-based selector (``a=b,c!=d,e,!f``).
+
+    Returns:
+        (key, operator, value) requirements, or None for set-based
+        selectors (``in``/``notin``), which are left to the API server
+    """
+    requirements = []
+    for part in (p.strip() for p in selector.split(",")):
+        if not part:
+            continue
+        if "(" in part or " " in part:
+            return None
+        for op in ("!=", "==", "="):
+            if op in part:
+                key, value = part.split(op, 1)
+                requirements.append((key, "!=" if op == "!=" else "=", value))
+                break
+        else:
+            if part.startswith("!"):
+                requirements.append((part[1:], "!", ""))
+            else:
+                requirements.append((part, "exists", ""))
+    return requirements
+
+
+def _field_value(obj: dict, path: str) -> str:
+    value: Any = obj
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return "" if value is None else str(value)
+
+
+def _matches(
+    obj: dict,
+    labels: list[tuple[str, str, str]],
+    fields: list[tuple[str, str, str]],
+) -> bool:
+    obj_labels = (obj.get("metadata") or {}).get("labels") or {}
+    for key, op, value in labels:
+        if op == "=" and obj_labels.get(key) != value:
+            return False
+        if op == "!=" and obj_labels.get(key) == value:
+            return False
+        if op == "exists" and key not in obj_labels:
+            return False
+        if op == "!" and key in obj_labels:
+            return False
+    for key, op, value in fields:
+        if (_field_value(obj, key) == value) != (op == "="):
+            return False
+    return True
+
+
+class Informer:
+    """Local copy of one (cluster, namespace, kind), kept current by a watch."""
+
+    def __init__(
+        self,
+        client: KubeAPIClient,
+        kind: str,
+        namespace: str,
+        max_objects: int = MAX_OBJECTS,
+        idle_seconds: float = IDLE_SECONDS,
+    ):
+        self.client = client
+        self.kind = kind
+        self.namespace = namespace
+        self.max_objects = max_objects
+        self.idle_seconds = idle_seconds
+        self.objects: dict[str, dict] = {}
+        self.resource_version: str | None = None
+        self.connected = False
+        self.overflowed = False
+        self.error = ""
+        self.hits = 0
+        self.last_used = time.monotonic()
+        # Last moment the copy was known to match the server
+        self.current_at = self.last_used
+        self._synced = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def warm(self) -> bool:
+        """True if the copy is live and may be served."""
+        return self.connected and not self.overflowed
+
+    @property
+    def done(self) -> bool:
+        """True if the informer stopped (idle, auth error or too large)."""
+        return self._task is not None and self._task.done()
+
+    def staleness(self) -> float:
+        """Seconds the copy may lag the server (0 while the watch is live)."""
+        return 0.0 if self.connected else time.monotonic() - self.current_at
+
+    def idle_for(self) -> float:
+        return time.monotonic() - self.last_used
+
+    def start(self) -> None:
+        self._task = asyncio.ensure_future(self._run())
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self.objects = {}
+        self.connected = False
+
+    async def wait_synced(self, timeout: float) -> bool:
+        """Wait for the first list to finish (successfully or not)."""
+        try:
+            await asyncio.wait_for(self._synced.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.warm
+
+    def select(
+        self, label_selector: str = "", field_selector: str = ""
+    ) -> list[dict] | None:
+        """Objects matching the selectors, or None if they can't be matched locally."""
+        labels = parse_selector(label_selector)
+        fields = parse_selector(field_selector)
+        if labels is None or fields is None:
+            return None
+        if any(op not in ("=", "!=") for _, op, _ in fields):
+            return None
+        return [
+            obj
+            for _, obj in sorted(self.objects.items())
+            if _matches(obj, labels, fields)
+        ]
+
+    async def _run(self) -> None:
+        delay = 1.0
+        try:
+            while self.idle_for() < self.idle_seconds:
+                try:
+                    if self.resource_version is None:
+                        await self._relist()
+                    await self._watch()
+                    delay = 1.0
+                    continue
+                except _Overflow:
+                    logger.info(
+                        f"Not caching {self.kind} in {self.namespace}: "
+                        f"more than {self.max_objects} objects"
+                    )
+                    self.overflowed = True
+                    self.objects = {}
+                    return
+                except KubeAuthError as e:
+                    self._failed(e)
+                    return
+                except KubeAPIError as e:
+                    if e.status == 410:
+                        # Watch fell too far behind; start over with a list
+                        self.resource_version = None
+                        self.connected = False
+                        continue
+                    self._failed(e)
+                except (httpx.HTTPError, ValueError) as e:
+                    self._failed(e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_MAX_SECONDS)
+        finally:
+            self.connected = False
+            self._synced.set()
+
+    def _failed(self, error: Exception) -> None:
+        if self.connected:
+            self.current_at = time.monotonic()
+        self.connected = False
+        self.error = str(error) or type(error).__name__
+        self._synced.set()
+        logger.debug(f"Informer {self.kind}/{self.namespace}: {self.error}")
+
+    async def _relist(self) -> None:
+        items, version = await self.client.list_snapshot(self.kind, self.namespace)
+        if len(items) > self.max_objects:
+            raise _Overflow()
+        self.objects = {_object_key(obj): _slim(obj) for obj in items}
+        self.resource_version = version
+        self._current()
+        self._synced.set()
+
+    async def _watch(self) -> None:
+        async for event in self.client.watch(
+            self.kind, self.namespace, self.resource_version or "0"
+        ):
+            obj = event.get("object") or {}
+            event_type = event.get("type")
+            if event_type in ("ADDED", "MODIFIED"):
+                self.objects[_object_key(obj)] = _slim(obj)
+                if len(self.objects) > self.max_objects:
+                    raise _Overflow()
+            elif event_type == "DELETED":
+                self.objects.pop(_object_key(obj), None)
+            version = (obj.get("metadata") or {}).get("resourceVersion")
+            if version:
+                self.resource_version = version
+            self._current()
+        # The server ended the watch; we were current until now
+        self._current()
+
+    def _current(self) -> None:
+        self.connected = True
+        self.error = ""
+        self.current_at = time.monotonic()
+
+
+class InformerCache:
+    """Informers by (kubeconfig, namespace, kind), LRU-bounded."""
+
+    def __init__(
+        self,
+        max_informers: int = MAX_INFORMERS,
+        max_objects: int = MAX_OBJECTS,
+        idle_seconds: float = IDLE_SECONDS,
+    ):
+        self.max_informers = max_informers
+        self.max_objects = max_objects
+        self.idle_seconds = idle_seconds
+        self.informers: OrderedDict[InformerKey, Informer] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    async def lookup(
+        self,
+        client: KubeAPIClient,
+        kind: str,
+        namespace: str | None,
+        label_selector: str = "",
+        field_selector: str = "",
+    ) -> list[dict] | None:
+        """Serve a list from its informer, starting one if needed.
+
+        Returns:
+            Matching objects, or None if the caller must ask the API server
+        """
+        if kind not in INFORMER_KINDS or not namespace:
+            return None
+
+        self._reap()
+        key = (client.kubeconfig, namespace, kind)
+        informer = self.informers.get(key)
+        if informer is not None and informer.client is not client:
+            # The kubeconfig changed (e.g. new token); its old client is closed
+            self._evict(key)
+            informer = None
+        started = informer is None
+        if informer is None:
+            # Its first list answers this lookup, so that costs no extra call
+            informer = self._start(key, client, kind, namespace)
+            await informer.wait_synced(SYNC_WAIT_SECONDS)
+
+        self.informers.move_to_end(key)
+        informer.last_used = time.monotonic()
+        items = (
+            informer.select(label_selector, field_selector) if informer.warm else None
+        )
+        if items is None or started:
+            self.misses += 1
+        else:
+            self.hits += 1
+            informer.hits += 1
+        return items
+
+    def _start(
+        self, key: InformerKey, client: KubeAPIClient, kind: str, namespace: str
+    ) -> Informer:
+        informer = Informer(
+            client, kind, namespace, self.max_objects, self.idle_seconds
+        )
+        informer.start()
+        self.informers[key] = informer
+        while len(self.informers) > self.max_informers:
+            self._evict(next(iter(self.informers)))
+        return informer
+
+    def _reap(self) -> None:
+        """Drop idle informers and ones that stopped (except size markers)."""
+        for key, informer in list(self.informers.items()):
+            if informer.idle_for() > self.idle_seconds or (
+                informer.done and not informer.overflowed
+            ):
+                self._evict(key)
+
+    def _evict(self, key: InformerKey) -> None:
+        informer = self.informers.pop(key, None)
+        if informer is not None:
+            informer.cancel()
+
+    def close(self) -> None:
+        """Stop every informer."""
+        for key in list(self.informers):
+            self._evict(key)
+
+
+def _settings() -> dict:
+    return load_config().get("kubernetes", {}).get("informers", {})
+
+
+def _new_cache() -> InformerCache:
+    settings = _settings()
+    return InformerCache(
+        max_informers=settings.get("max_informers", MAX_INFORMERS),
+        max_objects=settings.get("max_objects", MAX_OBJECTS),
+        idle_seconds=settings.get("idle_seconds", IDLE_SECONDS),
+    )
+
+
+_caches = per_loop(_new_cache)
+
+
+def get_informer_cache() -> InformerCache | None:
+    """Informer cache of the running event loop, or None if not enabled."""
+    if not _settings().get("enabled"):
+        cache = _caches.pop()
+        if cache is not None:
+            cache.close()
+        return None
+    return _caches()
+
+
+def informer_status() -> str:
+    """Markdown status of the informer caches, for debug_tool()."""
+    lines = ["### Kubernetes informer cache", ""]
+    # Registered with debug_tool() by the aa_k8s register_tools()
+    if not _settings().get("enabled"):
+        lines.append(
+            "Disabled (set `kubernetes.informers.enabled` in config.json to enable)"
+        )
+        return "\n".join(lines)
+
+    caches = _caches.values()
+    hits = sum(c.hits for c in caches)
+    misses = sum(c.misses for c in caches)
+    ratio = hits / (hits + misses) if hits + misses else 0.0
+    informers = [i for c in caches for i in c.informers.values()]
+    lines.append(f"- Hit ratio: {ratio:.0%} ({hits} hits, {misses} misses)")
+    lines.append(f"- Informers: {len(informers)}")
+    if not informers:
+        return "\n".join(lines)
+
+    lines.extend(
+        [
+            "",
+            "| Cluster | Namespace | Kind | Objects | State | Stale for | Idle | Hits |",
+            "|---|---|---|---|---|---|---|---|",
+        ]
+    )
+    for informer in informers:
+        if informer.overflowed:
+            state = f"not cached (> {informer.max_objects} objects)"
+        elif informer.warm:
+            state = "live"
+        elif informer.error:
+            state = f"reconnecting: {informer.error[:60]}"
+        else:
+            state = "syncing"
+        lines.append(
+            f"| {informer.client.config.server} | {informer.namespace} "
+            f"| {informer.kind} | {len(informer.objects)} | {state} "
+            f"| {informer.staleness():.0f}s | {informer.idle_for():.0f}s "
+            f"| {informer.hits} |"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,217 @@
+"""kubectl-style tables for objects returned by the API client.
+
+The API client returns structured objects; these renderers print them in
+the columns ``kubectl get -o wide`` uses, so tool output looks the same
+whichever path served the list.
+"""
+
+from datetime import datetime, timezone
+from typing import Callable
+
+Row = list[str]
+
+
+def format_age(timestamp: str | None, now: datetime | None = None) -> str:
+    """Age of an RFC 3339 timestamp the way kubectl prints it (5d, 3h, 10m)."""
+    if not timestamp:
+        return "<unknown>"
+    try:
+        then = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return "<unknown>"
+    seconds = int(((now or datetime.now(timezone.utc)) - then).total_seconds())
+    if seconds < 0:
+        return "0s"
+    if seconds < 120:
+        return f"{seconds}s"
+    minutes = seconds // 60
+    if minutes < 180:
+        return f"{minutes}m"
+    hours = minutes // 60
+    if hours < 48:
+        return f"{hours}h"
+    days = hours // 24
+    if days < 730:
+        return f"{days}d"
+    return f"{days // 365}y"
+
+
+def format_table(headers: list[str], rows: list[Row]) -> str:
+    """Left-aligned columns separated by three spaces, like kubectl."""
+    widths = [len(h) for h in headers]
+    for row in rows:
+        widths = [max(w, len(cell)) for w, cell in zip(widths, row)]
+    lines = [
+        "   ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip()
+        for row in [headers, *rows]
+    ]
+    return "\n".join(lines)
+
+
+def pod_status(pod: dict) -> str:
+    """The STATUS column of ``kubectl get pods`` (CrashLoopBackOff, Error...)."""
+    status = pod.get("status") or {}
+    reason = status.get("reason") or status.get("phase") or "Unknown"
+    for container in status.get("containerStatuses") or []:
+        state = container.get("state") or {}
+        if (state.get("waiting") or {}).get("reason"):
+            reason = state["waiting"]["reason"]
+        elif (state.get("terminated") or {}).get("reason"):
+            reason = state["terminated"]["reason"]
+    if (pod.get("metadata") or {}).get("deletionTimestamp"):
+        reason = "Terminating"
+    return reason
+
+
+def _pod_row(pod: dict) -> Row:
+    meta = pod.get("metadata") or {}
+    status = pod.get("status") or {}
+    containers = status.get("containerStatuses") or []
+    total = len((pod.get("spec") or {}).get("containers") or containers)
+    ready = sum(1 for c in containers if c.get("ready"))
+    restarts = sum(c.get("restartCount", 0) for c in containers)
+    return [
+        meta.get("name", ""),
+        f"{ready}/{total}",
+        pod_status(pod),
+        str(restarts),
+        format_age(meta.get("creationTimestamp")),
+        status.get("podIP") or "<none>",
+        (pod.get("spec") or {}).get("nodeName") or "<none>",
+    ]
+
+
+def _deployment_row(deployment: dict) -> Row:
+    meta = deployment.get("metadata") or {}
+    spec = deployment.get("spec") or {}
+    status = deployment.get("status") or {}
+    containers = ((spec.get("template") or {}).get("spec") or {}).get(
+        "containers"
+    ) or []
+    return [
+        meta.get("name", ""),
+        f"{status.get('readyReplicas', 0)}/{spec.get('replicas', 1)}",
+        str(status.get("updatedReplicas", 0)),
+        str(status.get("availableReplicas", 0)),
+        format_age(meta.get("creationTimestamp")),
+        ",".join(c.get("name", "") for c in containers),
+        ",".join(c.get("image", "") for c in containers),
+    ]
+
+
+def _service_row(service: dict) -> Row:
+    meta = service.get("metadata") or {}
+    spec = service.get("spec") or {}
+    ingress = ((service.get("status") or {}).get("loadBalancer") or {}).get(
+        "ingress"
+    ) or []
+    external = [i.get("ip") or i.get("hostname", "") for i in ingress]
+    external += spec.get("externalIPs") or []
+    ports = [
+        f"{p.get('port')}"
+        + (f":{p['nodePort']}" if p.get("nodePort") else "")
+        + f"/{p.get('protocol', 'TCP')}"
+        for p in spec.get("ports") or []
+    ]
+    selector = spec.get("selector") or {}
+    return [
+        meta.get("name", ""),
+        spec.get("type", "ClusterIP"),
+        spec.get("clusterIP") or "<none>",
+        ",".join(external) or "<none>",
+        ",".join(ports) or "<none>",
+        format_age(meta.get("creationTimestamp")),
+        ",".join(f"{k}={v}" for k, v in selector.items()) or "<none>",
+    ]
+
+
+def event_time(event: dict) -> str:
+    """When an event last happened (for sorting, like --sort-by=.lastTimestamp)."""
+    return (
+        event.get("lastTimestamp")
+        or event.get("eventTime")
+        or (event.get("metadata") or {}).get("creationTimestamp")
+        or ""
+    )
+
+
+def _event_row(event: dict) -> Row:
+    obj = event.get("involvedObject") or {}
+    return [
+        format_age(event_time(event)),
+        event.get("type", ""),
+        event.get("reason", ""),
+        f"{obj.get('kind', '').lower()}/{obj.get('name', '')}",
+        " ".join((event.get("message") or "").split()),
+    ]
+
+
+def _configmap_row(configmap: dict) -> Row:
+    meta = configmap.get("metadata") or {}
+    data = len(configmap.get("data") or {}) + len(configmap.get("binaryData") or {})
+    return [
+        meta.get("name", ""),
+        str(data),
+        format_age(meta.get("creationTimestamp")),
+    ]
+
+
+def _ingress_row(ingress: dict) -> Row:
+    meta = ingress.get("metadata") or {}
+    spec = ingress.get("spec") or {}
+    lb = ((ingress.get("status") or {}).get("loadBalancer") or {}).get("ingress")
+    hosts = [r["host"] for r in spec.get("rules") or [] if r.get("host")]
+    return [
+        meta.get("name", ""),
+        spec.get("ingressClassName") or "<none>",
+        ",".join(hosts) or "*",
+        ",".join(i.get("ip") or i.get("hostname", "") for i in lb or []),
+        "80, 443" if spec.get("tls") else "80",
+        format_age(meta.get("creationTimestamp")),
+    ]
+
+
+# Kind -> (headers, row builder)
+COLUMNS: dict[str, tuple[list[str], Callable[[dict], Row]]] = {
+    "pods": (
+        ["NAME", "READY", "STATUS", "RESTARTS", "AGE", "IP", "NODE"],
+        _pod_row,
+    ),
+    "deployments": (
+        ["NAME", "READY", "UP-TO-DATE", "AVAILABLE", "AGE", "CONTAINERS", "IMAGES"],
+        _deployment_row,
+    ),
+    "services": (
+        ["NAME", "TYPE", "CLUSTER-IP", "EXTERNAL-IP", "PORT(S)", "AGE", "SELECTOR"],
+        _service_row,
+    ),
+    "events": (["LAST SEEN", "TYPE", "REASON", "OBJECT", "MESSAGE"], _event_row),
+    "configmaps": (["NAME", "DATA", "AGE"], _configmap_row),
+    "ingresses": (["NAME", "CLASS", "HOSTS", "ADDRESS", "PORTS", "AGE"], _ingress_row),
+}
+
+
+def render(kind: str, items: list[dict], all_namespaces: bool = False) -> str:
+    """Render objects of one kind as a kubectl-style table.
+
+    Args:
+        kind: Kind (key of COLUMNS)
+        items: Objects from the API
+        all_namespaces: Prefix each row with its namespace
+
+    Returns:
+        Table text, or kubectl's "No resources found" message
+    """
+    if not items:
+        return "No resources found."
+    headers, row = COLUMNS[kind]
+    if kind == "events":
+        items = sorted(items, key=event_time)
+    rows = [row(item) for item in items]
+    if all_namespaces:
+        headers = ["NAMESPACE", *headers]
+        rows = [
+            [(item.get("metadata") or {}).get("namespace", ""), *r]
+            for item, r in zip(items, rows)
+        ]
+    return format_table(headers, rows)
@@ -5,8 +5,13 @@ Authentication: Uses kubeconfig files in ~/.kube/
   - config.p = production
   - config.e = ephemeral
   - config.ap = App-SRE SaaS pipelines
+
+Read-only listings go through the in-process API client (api_client.py)
+and fall back to kubectl when the API can't serve them.
 """
 
+import asyncio
+
 from fastmcp import FastMCP
 
 # Setup project path for server imports (must be before server imports)
@@ -16,8 +21,12 @@ __project_root__ = PROJECT_ROOT  # Module initialization
 
 
 from server.auto_heal_decorator import auto_heal
+from server.debuggable import register_status_provider
 from server.tool_registry import ToolRegistry
 from server.utils import get_kubeconfig, run_kubectl, truncate_output
+from tool_modules.aa_k8s.src.api_client import ResourceList, get_table, list_resources
+from tool_modules.aa_k8s.src.informer import informer_status
+from tool_modules.aa_k8s.src.tables import event_time, pod_status, render
 
 # Setup project path for server imports
 
@@ -28,6 +37,25 @@ from server.utils import get_kubeconfig, run_kubectl, truncate_output
 # ==================== TOOL IMPLEMENTATIONS ====================
 
 
+async def _list_one(
+    environment: str,
+    namespace: str | None,
+    kind: str,
+    label_selector: str = "",
+    field_selector: str = "",
+) -> ResourceList:
+    """List one kind via the API client (kubectl fallback)."""
+    kubeconfig = get_kubeconfig(environment, namespace or "")
+    results = await list_resources(
+        kubeconfig,
+        [kind],
+        namespace=namespace,
+        label_selector=label_selector,
+        field_selector=field_selector,
+    )
+    return results[kind]
+
+
 @auto_heal()
 async def _k8s_environment_summary_impl(
     environment: str = "",
@@ -44,26 +72,24 @@ async def _k8s_environment_summary_impl(
     envs = [environment] if environment else ["stage", "production"]
     lines = ["## Environment Summary", ""]
 
-    for env in envs:
-        kubeconfig = get_kubeconfig(env)
-        lines.append(f"### {env.upper()}")
+    # Listing namespaces doubles as the connectivity check; query all
+    # environments at once
+    results = await asyncio.gather(
+        *(list_resources(get_kubeconfig(env), ["namespaces"]) for env in envs)
+    )
 
-        # Check connectivity
-        success, output = await run_kubectl(["cluster-info"], kubeconfig=kubeconfig)
-        if not success:
-            lines.append(f"⚠️ Not connected: {output[:50]}")
-            lines.append("")
-            continue
+    for env, result in zip(envs, results):
+        namespaces = result["namespaces"]
+        lines.append(f"### {env.upper()}")
 
-        # Get namespaces with our prefix
-        success, output = await run_kubectl(
-            ["get", "namespaces", "-o", "name"], kubeconfig=kubeconfig
-        )
-        if success:
+        if not namespaces.ok:
+            lines.append(f"⚠️ Not connected: {namespaces.error[:50]}")
+        else:
+            # Namespaces with our prefix
             ns_list = [
-                ln.replace("namespace/", "")
-                for ln in output.strip().split("\n")
-                if "your-app" in ln
+                ns["metadata"]["name"]
+                for ns in namespaces.items
+                if "your-app" in ns["metadata"]["name"]
             ]
             lines.append(f"- Namespaces: {len(ns_list)}")
             for ns in ns_list[:5]:
@@ -98,53 +124,77 @@ async def _k8s_namespace_health_impl(
     failed = 0
     pending = 0
 
-    # Get pods
-    success, output = await run_kubectl(
-        ["get", "pods", "-o", "wide"], kubeconfig=kubeconfig, namespace=namespace
+    # One concurrent round of list calls for everything the report needs
+    results = await list_resources(
+        kubeconfig, ["pods", "deployments", "services", "events"], namespace=namespace
     )
-    if success:
-        pod_lines = [ln for ln in output.strip().split("\n")[1:] if ln.strip()]
-        total = len(pod_lines)
-        running = len([ln for ln in pod_lines if "Running" in ln])
-        pending = len([ln for ln in pod_lines if "Pending" in ln])
+
+    pods = results["pods"]
+    if pods.ok:
+        statuses = [
+            (pod.get("status", {}).get("phase"), pod_status(pod)) for pod in pods.items
+        ]
+        running = len([1 for _, status in statuses if status == "Running"])
+        pending = len([1 for phase, _ in statuses if phase == "Pending"])
         failed = len(
             [
-                ln
-                for ln in pod_lines
-                if "Error" in ln or "Failed" in ln or "CrashLoop" in ln
+                1
+                for phase, status in statuses
+                if phase == "Failed"
+                or "Error" in status
+                or "Failed" in status
+                or "CrashLoop" in status
             ]
         )
 
         lines.append("### Pods")
-        lines.append(f"- Total: {total}")
+        lines.append(f"- Total: {len(statuses)}")
         lines.append(f"- Running: {running}")
         lines.append(f"- Pending: {pending}")
         lines.append(f"- Failed/Error: {failed}")
     else:
-        lines.append(f"⚠️ Could not get pods: {output[:100]}")
+        lines.append(f"⚠️ Could not get pods: {pods.error[:100]}")
 
-    # Get deployments
-    success, output = await run_kubectl(
-        ["get", "deployments", "-o", "wide"], kubeconfig=kubeconfig, namespace=namespace
-    )
-    if success:
-        dep_lines = [ln for ln in output.strip().split("\n")[1:] if ln.strip()]
-        total = len(dep_lines)
-        ready = 0
-        for ln in dep_lines:
-            parts = ln.split()
-            if len(parts) >= 2:
-                replicas = parts[1]  # READY column like "2/2"
-                if "/" in replicas:
-                    current, desired = replicas.split("/")
-                    if current == desired:
-                        ready += 1
+    deployments = results["deployments"]
+    if deployments.ok:
+        ready = len(
+            [
+                1
+                for dep in deployments.items
+                if dep.get("status", {}).get("readyReplicas", 0)
+                == dep.get("spec", {}).get("replicas", 1)
+            ]
+        )
 
         lines.append("")
         lines.append("### Deployments")
-        lines.append(f"- Total: {total}")
+        lines.append(f"- Total: {len(deployments.items)}")
         lines.append(f"- Ready: {ready}")
 
+    services = results["services"]
+    if services.ok:
+        lines.append("")
+        lines.append("### Services")
+        lines.append(f"- Total: {len(services.items)}")
+
+    events = results["events"]
+    if events.ok:
+        warnings = sorted(
+            (e for e in events.items if e.get("type") == "Warning"),
+            key=event_time,
+            reverse=True,
+        )
+        lines.append("")
+        lines.append("### Events")
+        lines.append(f"- Warnings: {len(warnings)}")
+        for event in warnings[:5]:
+            obj = event.get("involvedObject", {})
+            message = " ".join((event.get("message") or "").split())[:100]
+            lines.append(
+                f"  - {event.get('reason', '')} {obj.get('kind', '').lower()}/"
+                f"{obj.get('name', '')}: {message}"
+            )
+
     # Check for issues
     lines.append("")
     lines.append("### Status")
@@ -305,11 +355,12 @@ async def _kubectl_get_configmaps_impl(
     namespace: str, environment: str = "stage"
 ) -> str:
     """List configmaps in a namespace."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    success, output = await run_kubectl(
-        ["get", "configmaps"], kubeconfig=kubeconfig, namespace=namespace
+    result = await _list_one(environment, namespace, "configmaps")
+    return (
+        f"## ConfigMaps\n\n```\n{render('configmaps', result.items)}\n```"
+        if result.ok
+        else f"❌ Failed: {result.error}"
     )
-    return f"## ConfigMaps\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
 
 
 @auto_heal()
@@ -317,12 +368,11 @@ async def _kubectl_get_deployments_impl(
     namespace: str, environment: str = "stage"
 ) -> str:
     """List deployments in a namespace."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    success, output = await run_kubectl(
-        ["get", "deployments", "-o", "wide"], kubeconfig=kubeconfig, namespace=namespace
-    )
+    result = await _list_one(environment, namespace, "deployments")
     return (
-        f"## Deployments\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
+        f"## Deployments\n\n```\n{render('deployments', result.items)}\n```"
+        if result.ok
+        else f"❌ Failed: {result.error}"
     )
 
 
@@ -331,15 +381,12 @@ async def _kubectl_get_events_impl(
     namespace: str, environment: str = "stage", field_selector: str = ""
 ) -> str:
     """Get events in a namespace (useful for debugging)."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    args = ["get", "events", "--sort-by=.lastTimestamp"]
-    if field_selector:
-        args.extend(["--field-selector", field_selector])
-    success, output = await run_kubectl(
-        args, kubeconfig=kubeconfig, namespace=namespace
+    result = await _list_one(
+        environment, namespace, "events", field_selector=field_selector
     )
-    if not success:
-        return f"❌ Failed: {output}"
+    if not result.ok:
+        return f"❌ Failed: {result.error}"
+    output = render("events", result.items)
     lines = output.split("\n")
     if len(lines) > 50:
         output = "\n".join(lines[:50]) + f"\n\n... ({len(lines) - 50} more events)"
@@ -349,11 +396,12 @@ async def _kubectl_get_events_impl(
 @auto_heal()
 async def _kubectl_get_ingress_impl(namespace: str, environment: str = "stage") -> str:
     """List ingress resources in a namespace."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    success, output = await run_kubectl(
-        ["get", "ingress", "-o", "wide"], kubeconfig=kubeconfig, namespace=namespace
+    result = await _list_one(environment, namespace, "ingresses")
+    return (
+        f"## Ingress\n\n```\n{render('ingresses', result.items)}\n```"
+        if result.ok
+        else f"❌ Failed: {result.error}"
     )
-    return f"## Ingress\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
 
 
 @auto_heal()  # Cluster determined from environment param
@@ -364,16 +412,15 @@ async def _kubectl_get_pods_impl(
     all_namespaces: bool = False,
 ) -> str:
     """List pods in a namespace."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    args = ["get", "pods", "-o", "wide"]
-    if selector:
-        args.extend(["-l", selector])
-    if all_namespaces:
-        args.append("--all-namespaces")
-    success, output = await run_kubectl(
-        args, kubeconfig=kubeconfig, namespace=None if all_namespaces else namespace
+    result = await _list_one(
+        environment,
+        None if all_namespaces else namespace,
+        "pods",
+        label_selector=selector,
     )
-    return output if success else f"❌ Failed: {output}"
+    if not result.ok:
+        return f"❌ Failed: {result.error}"
+    return render("pods", result.items, all_namespaces=all_namespaces)
 
 
 @auto_heal()
@@ -426,20 +473,19 @@ async def _kubectl_get_secret_value_impl(
 async def _kubectl_get_secrets_impl(namespace: str, environment: str = "stage") -> str:
     """List secrets in a namespace (names only)."""
     kubeconfig = get_kubeconfig(environment, namespace)
-    success, output = await run_kubectl(
-        ["get", "secrets"], kubeconfig=kubeconfig, namespace=namespace
-    )
+    success, output = await get_table(kubeconfig, "secrets", namespace)
     return f"## Secrets\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
 
 
 @auto_heal()
 async def _kubectl_get_services_impl(namespace: str, environment: str = "stage") -> str:
     """List services in a namespace."""
-    kubeconfig = get_kubeconfig(environment, namespace)
-    success, output = await run_kubectl(
-        ["get", "services", "-o", "wide"], kubeconfig=kubeconfig, namespace=namespace
+    result = await _list_one(environment, namespace, "services")
+    return (
+        f"## Services\n\n```\n{render('services', result.items)}\n```"
+        if result.ok
+        else f"❌ Failed: {result.error}"
     )
-    return f"## Services\n\n```\n{output}\n```" if success else f"❌ Failed: {output}"
 
 
 @auto_heal()
@@ -903,4 +949,8 @@ def register_tools(server: "FastMCP") -> int:
     _register_rollout_tools(registry)
     _register_saas_tools(registry)
 
+    register_status_provider(
+        "k8s_informers", informer_status, tool_prefixes=("kubectl_get_", "k8s_")
+    )
+
     return registry.count
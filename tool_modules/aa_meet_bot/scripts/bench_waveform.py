@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-frame CPU cost of the audio waveform visualization.
+
+Measures the stages the video renderers run for every frame:
+FFT -> log-frequency bars, bars -> waveform image, and the nearest-neighbour
+resize into the waveform box. Reports CPU time (process_time) and wall time
+per frame for the 720p and 1080p layouts.
+
+Run from the project root:
+    python tool_modules/aa_meet_bot/scripts/bench_waveform.py
+    python tool_modules/aa_meet_bot/scripts/bench_waveform.py --frames 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project to path
+project_root = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import cv2  # noqa: E402
+import numpy as np  # noqa: E402
+
+from tool_modules.aa_meet_bot.src.audio_visualizer import (  # noqa: E402
+    SIMULATED_BAR_COLOR,
+    FFTBarAnalyzer,
+    WaveformPainter,
+    simulated_bar_heights,
+)
+from tool_modules.aa_meet_bot.src.video_generator import VideoConfig  # noqa: E402
+
+SAMPLE_RATE = 16000
+AUDIO_WINDOW = int(SAMPLE_RATE * 0.1)  # Same 100ms window as the renderer
+
+
+def _time_stage(fn, frames: int) -> tuple[float, float]:
+    """Run fn once per frame; return (cpu_ms, wall_ms) per frame."""
+    fn(0)  # Warm caches (bin map, hanning window, buffers)
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for i in range(frames):
+        fn(i)
+    cpu = (time.process_time() - cpu0) / frames * 1000
+    wall = (time.perf_counter() - wall0) / frames * 1000
+    return cpu, wall
+
+
+def bench_config(name: str, config: VideoConfig, frames: int) -> None:
+    """Benchmark one resolution preset."""
+    wave_w, wave_h, bars = config.wave_w, config.wave_h, config.num_bars
+    step = wave_w / bars
+    analyzer = FFTBarAnalyzer(bars)
+    painter = WaveformPainter(wave_w, wave_h, bars, step, max(2, int(step) - 1))
+    wave_buffer = np.zeros((wave_h, wave_w, 3), dtype=np.uint8)
+
+    rng = np.random.default_rng(42)
+    t = np.arange(AUDIO_WINDOW) / SAMPLE_RATE
+    # Speech-like signal: a few harmonics plus noise, varied per frame
+    audio_frames = [
+        (
+            0.05 * np.sin(2 * np.pi * (120 + 40 * k) * t)
+            + 0.02 * np.sin(2 * np.pi * (900 + 100 * k) * t)
+            + 0.01 * rng.standard_normal(AUDIO_WINDOW)
+        ).astype(np.float32)
+        for k in range(8)
+    ]
+    phases = rng.uniform(0, 6.28, bars)
+    speeds = rng.uniform(0.8, 1.2, bars)
+    i_arr = np.arange(bars)
+    fps = config.fps
+
+    def fft_stage(i: int) -> None:
+        analyzer.compute(audio_frames[i % len(audio_frames)])
+
+    def audio_draw_stage(i: int) -> None:
+        painter.draw_audio(analyzer.bar_heights, wave_buffer)
+
+    def simulated_draw_stage(i: int) -> None:
+        heights = simulated_bar_heights(i / fps, i_arr, phases, speeds, wave_h)
+        painter.draw(heights, SIMULATED_BAR_COLOR, wave_buffer)
+
+    def resize_stage(i: int) -> None:
+        cv2.resize(
+            wave_buffer, (wave_w - 4, wave_h - 4), interpolation=cv2.INTER_NEAREST
+        )
+
+    def full_audio_frame(i: int) -> None:
+        fft_stage(i)
+        audio_draw_stage(i)
+        resize_stage(i)
+
+    print(f"\n{name}: {config.width}x{config.height}, waveform {wave_w}x{wave_h}")
+    print(f"  {bars} bars, {frames} frames, frame budget {1000 / fps:.1f} ms")
+    print(f"  {'stage':<22} {'cpu ms':>9} {'wall ms':>9}")
+    for label, fn in (
+        ("fft -> bars", fft_stage),
+        ("draw (audio)", audio_draw_stage),
+        ("draw (simulated)", simulated_draw_stage),
+        ("resize", resize_stage),
+        ("full audio frame", full_audio_frame),
+    ):
+        cpu, wall = _time_stage(fn, frames)
+        print(f"  {label:<22} {cpu:>9.3f} {wall:>9.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--frames", type=int, default=500, help="frames per stage")
+    args = parser.parse_args()
+
+    # Single-threaded numbers are what matter next to a browser on a laptop
+    cv2.setNumThreads(1)
+
+    bench_config("720p", VideoConfig.hd_720p(), args.frames)
+    bench_config("1080p", VideoConfig.hd_1080p(), args.frames)
+
+
+if __name__ == "__main__":
+    main()
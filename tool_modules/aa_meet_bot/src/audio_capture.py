@@ -2,7 +2,8 @@
 Real-time Audio Capture for NPU STT.
 
 Zero-copy pipeline from PulseAudio/PipeWire sink monitor to NPU Whisper.
-Uses shared memory ring buffer for minimal latency.
+Uses a lock-free SPSC ring buffer (optionally in shared memory) for minimal
+latency.
 """
 
 import asyncio
@@ -29,93 +30,289 @@ class AudioChunk:
     timestamp: float
     sample_rate: int = 16000
     is_speech: bool = True  # VAD result
+    sample_index: int = -1  # Absolute ring buffer position of data[0]
+
+
+class _AttachedSegment:
+    """Read/write mapping of an existing POSIX shared memory segment.
+
+    Used instead of ``SharedMemory(create=False)``, which (before Python
+    3.13) registers the segment with the attaching process's resource
+    tracker and unlinks it from under the creator when that process exits.
+    """
+
+    def __init__(self, name: str):
+        import mmap
+
+        self.name = name.lstrip("/")
+        fd = os.open(f"/dev/shm/{self.name}", os.O_RDWR)
+        try:
+            self._mmap = mmap.mmap(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+        self.buf = memoryview(self._mmap)
+
+    def close(self) -> None:
+        self.buf.release()
+        self._mmap.close()
 
 
 class RingBuffer:
     """
-    Lock-free ring buffer for audio samples.
+    Single-producer/single-consumer ring buffer for audio samples.
+
+    The backing array is twice the capacity and every sample is written to
+    both halves, so any read of up to ``capacity`` samples is one contiguous
+    slice - reads return zero-copy numpy views, never a concatenation.
 
-    Uses numpy for zero-copy slicing operations.
+    Positions are monotonically increasing sample counters kept in a small
+    int64 header next to the samples. The producer only writes
+    ``write_count``/``overruns``, the consumer only writes
+    ``read_count``/``dropped_samples``, so no lock is needed - including when
+    the buffer lives in shared memory and the consumer is another process
+    (see ``shm_name`` and ``attach()``).
+
+    If the producer laps the consumer the oldest audio is overwritten: the
+    producer counts an overrun and the consumer skips ahead to the oldest
+    intact sample, adding the gap to ``dropped_samples``.
+
+    Views returned by ``read()``/``peek()`` stay valid until the producer has
+    written another ``capacity`` samples; copy them if they must live longer.
     """
 
-    def __init__(self, max_seconds: float = 30.0, sample_rate: int = 16000):
+    # Header layout (int64 slots)
+    _MAGIC = 0x52494E47  # "RING"
+    _H_MAGIC, _H_CAPACITY, _H_RATE = 0, 1, 2
+    _H_WRITE, _H_READ, _H_OVERRUNS, _H_DROPPED = 3, 4, 5, 6
+    _HEADER_SLOTS = 8
+    _HEADER_BYTES = _HEADER_SLOTS * 8
+
+    def __init__(
+        self,
+        max_seconds: float = 30.0,
+        sample_rate: int = 16000,
+        shm_name: Optional[str] = None,
+    ):
+        """
+        Create a ring buffer.
+
+        Args:
+            max_seconds: Capacity in seconds of audio
+            sample_rate: Sample rate of the stored audio
+            shm_name: If given, allocate the buffer in POSIX shared memory
+                under this name so another process can ``attach()`` to it
+        """
         self.sample_rate = sample_rate
         self.max_samples = int(max_seconds * sample_rate)
-        self.buffer = np.zeros(self.max_samples, dtype=np.float32)
-        self.write_pos = 0
-        self.read_pos = 0
-        self._lock = asyncio.Lock()
+        self._shm = None
+        self._owns_shm = False
+
+        nbytes = self._HEADER_BYTES + 2 * self.max_samples * 4
+        if shm_name:
+            from multiprocessing import shared_memory
+
+            self._shm = shared_memory.SharedMemory(
+                name=shm_name, create=True, size=nbytes
+            )
+            self._owns_shm = True
+            self._map(self._shm.buf)
+            self._header[:] = 0
+            self.buffer[:] = 0
+        else:
+            self._map(bytearray(nbytes))
+
+        self._header[self._H_MAGIC] = self._MAGIC
+        self._header[self._H_CAPACITY] = self.max_samples
+        self._header[self._H_RATE] = sample_rate
+
+    def _map(self, raw) -> None:
+        """Lay the header and mirrored sample array over a raw byte buffer."""
+        self._header = np.ndarray(
+            (self._HEADER_SLOTS,), dtype=np.int64, buffer=raw, offset=0
+        )
+        self.buffer = np.ndarray(
+            (2 * self.max_samples,),
+            dtype=np.float32,
+            buffer=raw,
+            offset=self._HEADER_BYTES,
+        )
+
+    @classmethod
+    def attach(cls, shm_name: str) -> "RingBuffer":
+        """Attach to a ring buffer created in another process.
+
+        The attaching side should act as the consumer; the creating process
+        remains the producer and owns (unlinks) the shared memory.
+        """
+        shm = _AttachedSegment(shm_name)
+        header = np.ndarray((cls._HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        if int(header[cls._H_MAGIC]) != cls._MAGIC:
+            del header
+            shm.close()
+            raise ValueError(f"Shared memory {shm_name!r} is not an audio ring buffer")
+
+        ring = cls.__new__(cls)
+        ring.sample_rate = int(header[cls._H_RATE])
+        ring.max_samples = int(header[cls._H_CAPACITY])
+        ring._shm = shm
+        ring._owns_shm = False
+        ring._map(shm.buf)
+        del header
+        return ring
+
+    @property
+    def shm_name(self) -> Optional[str]:
+        """Shared memory name, or None for a process-local buffer."""
+        return self._shm.name if self._shm else None
+
+    @property
+    def write_count(self) -> int:
+        """Total samples ever written."""
+        return int(self._header[self._H_WRITE])
+
+    @property
+    def read_count(self) -> int:
+        """Total samples ever consumed (including dropped ones)."""
+        return int(self._header[self._H_READ])
+
+    @property
+    def overruns(self) -> int:
+        """Number of writes that overwrote unread audio."""
+        return int(self._header[self._H_OVERRUNS])
+
+    @property
+    def dropped_samples(self) -> int:
+        """Unread samples lost because the producer lapped the consumer."""
+        return int(self._header[self._H_DROPPED])
+
+    def write_nowait(self, data: np.ndarray) -> int:
+        """Write audio data to buffer (producer side). Returns samples written."""
+        n = len(data)
+        if n == 0:
+            return 0
+        cap = self.max_samples
+        if n > cap:
+            # Only keep the last max_samples
+            data = data[-cap:]
+            n = cap
+
+        header = self._header
+        w = int(header[self._H_WRITE])
+        if w + n - int(header[self._H_READ]) > cap:
+            header[self._H_OVERRUNS] += 1
+
+        # Write into the primary span, then mirror into the other half so
+        # buffer[i] == buffer[i + cap] holds for every written sample.
+        p = w % cap
+        buf = self.buffer
+        buf[p : p + n] = data
+        first = min(n, cap - p)
+        buf[p + cap : p + cap + first] = data[:first]
+        if first < n:
+            buf[: n - first] = data[first:]
+
+        # Publish only after the samples are in place
+        header[self._H_WRITE] = w + n
+        return n
+
+    def _consume_start(self) -> tuple[int, int]:
+        """Return (read_count, available), skipping audio lost to overruns."""
+        header = self._header
+        w = int(header[self._H_WRITE])
+        r = int(header[self._H_READ])
+        if w - r > self.max_samples:
+            lost = w - r - self.max_samples
+            header[self._H_DROPPED] += lost
+            r = w - self.max_samples
+            header[self._H_READ] = r
+        return r, w - r
+
+    def peek_view(self, n_samples: int) -> np.ndarray:
+        """Zero-copy view of up to n unread samples without consuming them."""
+        r, available = self._consume_start()
+        n = min(n_samples, available)
+        p = r % self.max_samples
+        return self.buffer[p : p + n]
+
+    def read_view(self, n_samples: int) -> np.ndarray:
+        """Consume up to n samples and return them as a zero-copy view."""
+        view = self.peek_view(n_samples)
+        if len(view):
+            self._header[self._H_READ] += len(view)
+        return view
+
+    def view_range(self, start: int, end: int) -> Optional[np.ndarray]:
+        """Zero-copy view of absolute sample positions [start, end).
+
+        Does not consume anything, so a second reader (e.g. the STT worker
+        process) can pull segments the consumer has already seen. Returns
+        None if the range is not fully written yet or was overwritten.
+        """
+        w = self.write_count
+        if start < 0 or end < start or end > w or start < w - self.max_samples:
+            return None
+        p = start % self.max_samples
+        return self.buffer[p : p + (end - start)]
+
+    def skip(self, n_samples: int) -> int:
+        """Consume up to n samples without looking at them. Returns skipped."""
+        _, available = self._consume_start()
+        n = min(n_samples, available)
+        self._header[self._H_READ] += n
+        return n
 
     async def write(self, data: np.ndarray) -> int:
         """Write audio data to buffer. Returns samples written."""
-        async with self._lock:
-            n = len(data)
-            if n > self.max_samples:
-                # Only keep the last max_samples
-                data = data[-self.max_samples :]
-                n = len(data)
-
-            # Handle wrap-around
-            end_pos = self.write_pos + n
-            if end_pos <= self.max_samples:
-                self.buffer[self.write_pos : end_pos] = data
-            else:
-                # Split write
-                first_part = self.max_samples - self.write_pos
-                self.buffer[self.write_pos :] = data[:first_part]
-                self.buffer[: n - first_part] = data[first_part:]
-
-            self.write_pos = end_pos % self.max_samples
-            return n
-
-    async def read(self, n_samples: int) -> np.ndarray:
-        """Read n samples from buffer."""
-        async with self._lock:
-            available = self.available()
-            n = min(n_samples, available)
-            if n == 0:
-                return np.array([], dtype=np.float32)
-
-            end_pos = self.read_pos + n
-            if end_pos <= self.max_samples:
-                data = self.buffer[self.read_pos : end_pos].copy()
-            else:
-                # Split read
-                first_part = self.max_samples - self.read_pos
-                data = np.concatenate(
-                    [self.buffer[self.read_pos :], self.buffer[: n - first_part]]
-                )
+        return self.write_nowait(data)
 
-            self.read_pos = end_pos % self.max_samples
-            return data
+    async def read(self, n_samples: int, copy: bool = False) -> np.ndarray:
+        """Read up to n samples from buffer (a view unless ``copy``)."""
+        view = self.read_view(n_samples)
+        return view.copy() if copy else view
 
-    async def peek(self, n_samples: int) -> np.ndarray:
-        """Peek at n samples without consuming them."""
-        async with self._lock:
-            available = self.available()
-            n = min(n_samples, available)
-            if n == 0:
-                return np.array([], dtype=np.float32)
-
-            end_pos = self.read_pos + n
-            if end_pos <= self.max_samples:
-                return self.buffer[self.read_pos : end_pos].copy()
-            else:
-                first_part = self.max_samples - self.read_pos
-                return np.concatenate(
-                    [self.buffer[self.read_pos :], self.buffer[: n - first_part]]
-                )
+    async def peek(self, n_samples: int, copy: bool = False) -> np.ndarray:
+        """Peek at up to n samples without consuming them."""
+        view = self.peek_view(n_samples)
+        return view.copy() if copy else view
 
     def available(self) -> int:
         """Return number of samples available to read."""
-        if self.write_pos >= self.read_pos:
-            return self.write_pos - self.read_pos
-        return self.max_samples - self.read_pos + self.write_pos
+        available = self.write_count - self.read_count
+        return min(available, self.max_samples)
+
+    def get_stats(self) -> dict:
+        """Buffer fill level and overflow counters."""
+        return {
+            "capacity": self.max_samples,
+            "available": self.available(),
+            "written": self.write_count,
+            "overruns": self.overruns,
+            "dropped_samples": self.dropped_samples,
+            "shared": self._shm is not None,
+        }
 
     async def clear(self):
-        """Clear the buffer."""
-        async with self._lock:
-            self.read_pos = self.write_pos
+        """Clear the buffer (consumer side)."""
+        self._header[self._H_READ] = self._header[self._H_WRITE]
+
+    def close(self) -> None:
+        """Release shared memory (unlinking it if this side created it)."""
+        if self._shm is None:
+            return
+        # Drop numpy views before closing the mapping
+        self._header = np.zeros(self._HEADER_SLOTS, dtype=np.int64)
+        self.buffer = np.zeros(0, dtype=np.float32)
+        shm, self._shm = self._shm, None
+        try:
+            shm.close()
+        except BufferError:
+            # A caller still holds a view; the mapping goes away with it
+            logger.debug(f"Ring buffer {shm.name} still has exported views")
+        if self._owns_shm:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
 
 
 class PulseAudioCapture:
@@ -140,6 +337,8 @@ class PulseAudioCapture:
         sample_rate: int = 16000,
         chunk_ms: int = 100,  # 100ms chunks for low latency
         sink_input_index: Optional[int] = None,  # For monitor-stream method
+        buffer_seconds: float = 30.0,
+        shm_name: Optional[str] = None,  # Share the ring with another process
     ):
         """
         Initialize audio capture.
@@ -151,6 +350,9 @@ class PulseAudioCapture:
             chunk_ms: Chunk size in milliseconds
             sink_input_index: If provided, use parec --monitor-stream to capture
                              directly from this sink-input (bypasses broken monitors)
+            buffer_seconds: Ring buffer capacity in seconds
+            shm_name: If provided, the ring buffer is created in shared memory
+                      under this name (see RingBuffer.attach)
         """
         self.source_name = source_name
         self.sample_rate = sample_rate
@@ -163,7 +365,9 @@ class PulseAudioCapture:
         )
         self._process_pid: Optional[int] = None  # Track PID for cleanup
         self._running = False
-        self._buffer = RingBuffer(max_seconds=30.0, sample_rate=sample_rate)
+        self._buffer = RingBuffer(
+            max_seconds=buffer_seconds, sample_rate=sample_rate, shm_name=shm_name
+        )
         self._read_task: Optional[asyncio.Task] = None  # Track the read loop task
 
     async def start(self) -> bool:
@@ -267,7 +471,7 @@ class PulseAudioCapture:
 
                 # Convert to numpy (zero-copy view)
                 audio = np.frombuffer(data, dtype=np.float32)
-                await self._buffer.write(audio)
+                self._buffer.write_nowait(audio)
 
         except Exception as e:
             logger.error(f"Audio read error: {e}")
@@ -329,6 +533,7 @@ class PulseAudioCapture:
             logger.info(f"Removed PID {self._process_pid} from active captures")
 
         self._process_pid = None
+        self._buffer.close()
 
     @classmethod
     async def kill_all_captures(cls) -> int:
@@ -357,7 +562,11 @@ class PulseAudioCapture:
         return list(cls._active_captures.keys())
 
     async def read_chunk(self) -> Optional[AudioChunk]:
-        """Read a chunk of audio."""
+        """Read a chunk of audio.
+
+        ``data`` is a zero-copy view into the ring buffer, valid until the
+        capture has written another ``buffer_seconds`` of audio.
+        """
         if not self._running:
             return None
 
@@ -373,11 +582,12 @@ class PulseAudioCapture:
                 return None
             await asyncio.sleep(0.01)
 
-        data = await self._buffer.read(self.chunk_samples)
+        data = self._buffer.read_view(self.chunk_samples)
         return AudioChunk(
             data=data,
             timestamp=time.time(),
             sample_rate=self.sample_rate,
+            sample_index=self._buffer.read_count - len(data),
         )
 
     async def read_seconds(self, seconds: float) -> Optional[np.ndarray]:
@@ -392,7 +602,7 @@ class PulseAudioCapture:
                 return None
             await asyncio.sleep(0.01)
 
-        return await self._buffer.read(n_samples)
+        return await self._buffer.read(n_samples, copy=True)
 
     def get_buffer(self) -> RingBuffer:
         """Get the ring buffer for direct access."""
@@ -413,6 +623,12 @@ class RealtimeSTTPipeline:
     Architecture:
         PulseAudio Monitor → Ring Buffer → VAD → NPU Whisper → Text Callback
 
+    With ``use_worker`` the ring buffer lives in shared memory and inference
+    runs in a separate STT worker process (see stt_worker.py); VAD here only
+    sends sample ranges, so a slow transcription never blocks the event loop.
+    If the worker fails to start, exits or stops accepting requests, the
+    pipeline logs a warning and falls back to in-process STT.
+
     Features:
     - Zero-copy audio transfer via numpy views
     - Voice Activity Detection for smart chunking
@@ -430,6 +646,10 @@ class RealtimeSTTPipeline:
         silence_duration: float = 0.8,
         min_speech_duration: float = 0.3,
         max_speech_duration: float = 15.0,
+        use_worker: Optional[bool] = None,
+        stt_backend: Optional[str] = None,
+        backend_options: Optional[dict] = None,
+        meeting_id: str = "",
     ):
         """
         Initialize the STT pipeline.
@@ -443,7 +663,22 @@ class RealtimeSTTPipeline:
             silence_duration: Seconds of silence to trigger transcription
             min_speech_duration: Minimum speech to transcribe
             max_speech_duration: Maximum speech before forced transcription
+            use_worker: Run inference in an out-of-process STT worker
+                (default: voice_pipeline.stt_worker_enabled from config)
+            stt_backend: Worker backend - openvino, faster-whisper, whisper.cpp
+                (default: voice_pipeline.stt_backend from config)
+            backend_options: Extra keyword arguments for the worker backend
+            meeting_id: Meeting identifier used to label worker metrics
         """
+        if use_worker is None or stt_backend is None:
+            from tool_modules.aa_meet_bot.src.config import get_config
+
+            voice_config = get_config().voice_pipeline
+            if use_worker is None:
+                use_worker = voice_config.stt_worker_enabled
+            if stt_backend is None:
+                stt_backend = voice_config.stt_backend
+
         self.source_name = source_name
         self.on_transcription = on_transcription
         self.on_partial = on_partial
@@ -452,14 +687,22 @@ class RealtimeSTTPipeline:
         self.silence_duration = silence_duration
         self.min_speech_duration = min_speech_duration
         self.max_speech_duration = max_speech_duration
+        self.use_worker = use_worker
+        self.stt_backend = stt_backend
+        self.backend_options = backend_options or {}
+        self.meeting_id = meeting_id
 
         self._capture: Optional[PulseAudioCapture] = None
         self._stt = None  # Lazy load
+        self._worker = None  # STTWorkerClient when use_worker
+        self._worker_fallback: Optional[str] = None  # Why the worker was dropped
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
         # Speech detection state
         self._speech_buffer: deque = deque()
+        self._speech_start_sample = 0  # Ring positions of the current segment
+        self._speech_end_sample = 0
         self._speech_start_time: Optional[float] = None
         self._last_speech_time: float = 0
         self._in_speech = False
@@ -470,39 +713,123 @@ class RealtimeSTTPipeline:
             return True
 
         try:
-            # Initialize STT engine
-            from tool_modules.aa_meet_bot.src.stt_engine import NPUWhisperSTT
-
-            self._stt = NPUWhisperSTT(device="NPU")
-            if not await self._stt.initialize():
-                logger.error("Failed to initialize NPU STT")
-                return False
-
-            logger.info(
-                f"STT initialized on {self._stt.get_device_info()['actual_device']}"
-            )
-
-            # Start audio capture
+            # Start audio capture. Speech segments are kept as zero-copy views
+            # (or ring ranges for the worker), so the ring must hold more than
+            # one max-length utterance.
+            shm_name = None
+            if self.use_worker:
+                shm_name = f"meetbot_stt_{os.getpid()}_{id(self):x}"
             self._capture = PulseAudioCapture(
                 source_name=self.source_name,
                 sample_rate=self.sample_rate,
                 chunk_ms=100,  # 100ms chunks
+                buffer_seconds=max(
+                    30.0, 2 * (self.max_speech_duration + self.silence_duration)
+                ),
+                shm_name=shm_name,
             )
 
+            if self.use_worker:
+                if not await self._start_worker():
+                    if not await self._fall_back_to_in_process("failed to start"):
+                        await self._capture.stop()
+                        return False
+            elif not await self._init_in_process_stt():
+                return False
+
             if not await self._capture.start():
                 logger.error("Failed to start audio capture")
+                if self._worker:
+                    await self._worker.stop()
+                    self._worker = None
                 return False
 
             self._running = True
             self._task = asyncio.create_task(self._process_loop())
 
-            logger.info(f"STT pipeline started: {self.source_name} → NPU")
+            target = f"{self.stt_backend} worker" if self._worker else "NPU"
+            logger.info(f"STT pipeline started: {self.source_name} → {target}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to start STT pipeline: {e}")
             return False
 
+    async def _init_in_process_stt(self) -> bool:
+        """Initialize the in-process STT engine."""
+        from tool_modules.aa_meet_bot.src.stt_engine import NPUWhisperSTT
+
+        self._stt = NPUWhisperSTT(device="NPU")
+        if not await self._stt.initialize():
+            logger.error("Failed to initialize NPU STT")
+            self._stt = None
+            return False
+
+        logger.info(
+            f"STT initialized on {self._stt.get_device_info()['actual_device']}"
+        )
+        return True
+
+    async def _fall_back_to_in_process(self, reason: str) -> bool:
+        """Drop the STT worker and transcribe in this process instead."""
+        logger.warning(
+            f"STT worker {reason}, falling back to in-process STT"
+            f" ({self.meeting_id or self.source_name})"
+        )
+        self._worker_fallback = reason
+        worker, self._worker = self._worker, None
+        if worker:
+            try:
+                await worker.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping STT worker: {e}")
+        return await self._init_in_process_stt()
+
+    async def _start_worker(self) -> bool:
+        """Spawn the out-of-process STT worker on the shared ring buffer."""
+        from tool_modules.aa_meet_bot.src.config import get_config
+        from tool_modules.aa_meet_bot.src.stt_worker import STTWorkerClient
+
+        options = dict(self.backend_options)
+        if self.stt_backend == "openvino":
+            options.setdefault("device", get_config().voice_pipeline.stt_device)
+
+        self._worker = STTWorkerClient(
+            self._capture.get_buffer(),
+            backend=self.stt_backend,
+            backend_options=options,
+            meeting_id=self.meeting_id,
+            on_result=self._on_worker_result,
+            on_partial=self.on_partial,
+        )
+        if not await self._worker.start():
+            logger.error(f"Failed to start {self.stt_backend} STT worker")
+            self._worker = None
+            return False
+        return True
+
+    def _on_worker_result(self, result, is_final: bool) -> None:
+        """Deliver a worker transcription (runs on the event loop)."""
+        logger.info(
+            f'🎧 STT worker: ✅ [{result.processing_time:.2f}s] "{result.text}"'
+        )
+        self.on_transcription(result.text, is_final)
+        if not is_final and self.on_partial:
+            self.on_partial(result.text)
+
+    def get_stats(self) -> dict:
+        """Buffer, latency and real-time-factor metrics for this pipeline."""
+        stats: dict = {"meeting_id": self.meeting_id, "running": self._running}
+        if self._capture:
+            stats["buffer"] = self._capture.get_buffer().get_stats()
+        if self._worker:
+            stats["worker"] = self._worker.get_stats()
+        elif self._stt:
+            stats["engine"] = self._stt.get_stats()
+        if self._worker_fallback:
+            stats["worker_fallback"] = self._worker_fallback
+        return stats
+
     async def stop(self):
         """Stop the STT pipeline and ensure all resources are cleaned up."""
         logger.info("Stopping STT pipeline...")
@@ -528,6 +855,13 @@ class RealtimeSTTPipeline:
             finally:
                 self._capture = None
 
+        if self._worker:
+            try:
+                await self._worker.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping STT worker: {e}")
+            self._worker = None
+
         # Now cancel the processing task
         if self._task:
             self._task.cancel()
@@ -594,9 +928,11 @@ class RealtimeSTTPipeline:
                         self._in_speech = True
                         self._speech_start_time = now
                         self._speech_buffer.clear()
+                        self._speech_start_sample = chunk.sample_index
                         logger.info(f"🎧 NPU STT: 🎤 Speech STARTED (RMS: {rms:.4f})")
 
                     self._speech_buffer.append(chunk.data)
+                    self._speech_end_sample = chunk.sample_index + len(chunk.data)
                     self._last_speech_time = now
 
                     # Check max duration
@@ -608,6 +944,7 @@ class RealtimeSTTPipeline:
                         await self._transcribe_buffer(is_final=False)
                         self._speech_buffer.clear()
                         self._speech_start_time = now
+                        self._speech_start_sample = self._speech_end_sample
 
                 else:
                     # Silence
@@ -615,6 +952,7 @@ class RealtimeSTTPipeline:
                         self._speech_buffer.append(
                             chunk.data
                         )  # Include trailing silence
+                        self._speech_end_sample = chunk.sample_index + len(chunk.data)
 
                         silence_time = now - self._last_speech_time
                         if silence_time >= self.silence_duration:
@@ -652,6 +990,33 @@ class RealtimeSTTPipeline:
         if not self._speech_buffer:
             return
 
+        if self._worker:
+            if self._worker.is_running:
+                # Hand the ring range to the worker; the result arrives via
+                # _on_worker_result without blocking this loop
+                duration = (
+                    self._speech_end_sample - self._speech_start_sample
+                ) / self.sample_rate
+                try:
+                    self._worker.submit(
+                        self._speech_start_sample, self._speech_end_sample, is_final
+                    )
+                    logger.info(
+                        f"🎧 STT worker: 🔄 Queued {duration:.1f}s of audio"
+                        f" (final={is_final})"
+                    )
+                    return
+                except (OSError, RuntimeError) as e:
+                    reason = f"request failed ({e})"
+            else:
+                reason = "exited"
+            # Transcribe this segment (and the rest of the meeting) here
+            await self._fall_back_to_in_process(reason)
+
+        if self._stt is None:
+            logger.warning("🎧 NPU STT: No STT engine available, dropping audio")
+            return
+
         # Concatenate all chunks
         audio = np.concatenate(list(self._speech_buffer))
         duration = len(audio) / self.sample_rate
@@ -720,6 +1085,7 @@ async def create_meeting_stt_pipeline(
     pipeline = RealtimeSTTPipeline(
         source_name=monitor_source,
         on_transcription=on_transcription,
+        meeting_id=instance_id,
     )
 
     return pipeline
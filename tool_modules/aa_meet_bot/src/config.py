@@ -154,6 +154,9 @@ class VoicePipelineConfig:
     # STT settings (OpenVINO Whisper)
     stt_model: str = "base"  # tiny, base, small, medium, large-v3
     stt_device: str = "NPU"  # NPU, GPU, CPU
+    # Run STT in a separate worker process fed from a shared-memory ring buffer
+    stt_worker_enabled: bool = True
+    stt_backend: str = "openvino"  # openvino, faster-whisper, whisper.cpp
 
     # LLM settings
     llm_backend: str = "gemini"  # gemini (Vertex AI), ollama (local)
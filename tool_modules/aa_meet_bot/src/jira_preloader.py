@@ -4,27 +4,34 @@ Jira Context Preloader.
 Preloads sprint information before joining meetings so the bot
 can respond quickly to Jira-related questions.
 
-Uses the MCP Jira tools for reliable access.
+Reads Jira through the shared data layer in aa_jira/src/jira_data.py.
 """
 
 import asyncio
-import json
 import logging
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from pathlib import Path
 from typing import List, Optional
 
 from tool_modules.common import PROJECT_ROOT
 
 __project_root__ = PROJECT_ROOT
 
+from tool_modules.aa_jira.src.jira_data import (
+    JiraUnavailable,
+    get_jira_data,
+    sprint_fields,
+    story_points_field,
+)
 from tool_modules.aa_meet_bot.src.config import get_config
 from tool_modules.aa_meet_bot.src.llm_responder import get_llm_responder
 
 logger = logging.getLogger(__name__)
 
+# Story points field on Jira Cloud, read when the configured one is empty
+CLOUD_STORY_POINTS_FIELD = "customfield_10016"
+
 
 def _parse_jira_table(output: str) -> List[dict]:
     """Parse the table output from Jira MCP tools into a list of dicts."""
@@ -126,7 +133,7 @@ class JiraPreloader:
     """
     Preloads Jira context for meeting responses.
 
-    Uses the existing Jira MCP tools via subprocess to fetch data.
+    Fetches data through the shared Jira data layer.
     """
 
     def __init__(self):
@@ -152,11 +159,10 @@ class JiraPreloader:
         logger.info(f"Preloading Jira context for {project}...")
 
         try:
-            # Fetch my issues
-            my_issues = await self._fetch_my_issues()
-
-            # Fetch sprint issues
-            sprint_issues = await self._fetch_sprint_issues()
+            # Both searches share the pooled Jira connection
+            my_issues, sprint_issues = await asyncio.gather(
+                self._fetch_my_issues(), self._fetch_sprint_issues()
+            )
 
             # Update the LLM responder's context
             responder = get_llm_responder()
@@ -205,65 +211,22 @@ class JiraPreloader:
             return []
 
     async def _jql_search(self, jql: str, max_results: int = 50) -> List[JiraIssue]:
-        """Execute a JQL search using the Jira REST API directly."""
+        """Execute a JQL search through the shared Jira data layer."""
         try:
-            import os
-            import urllib.parse
-            import urllib.request
-
-            # Get Jira credentials from environment
-            jira_url = os.environ.get("JIRA_URL", "https://issues.redhat.com")
-            # Try JIRA_JPAT first (used by rh-issue), then JIRA_TOKEN
-            jira_token = os.environ.get("JIRA_JPAT", "") or os.environ.get(
-                "JIRA_TOKEN", ""
-            )
-
-            if not jira_token:
-                # Try to read from config file
-                config_path = Path.home() / ".config" / "jira" / "config.json"
-                if config_path.exists():
-                    with open(config_path, encoding="utf-8") as f:
-                        config = json.load(f)
-                        jira_token = config.get("token", "")
-                        jira_url = config.get("url", jira_url)
-
-            if not jira_token:
-                logger.warning("No Jira token found")
-                return []
-
-            # Build search URL
-            params = urllib.parse.urlencode(
-                {
-                    "jql": jql,
-                    "maxResults": max_results,
-                    "fields": "key,summary,status,assignee,issuetype,priority,customfield_10016,labels",
-                }
-            )
-            url = f"{jira_url}/rest/api/2/search?{params}"
-
-            # Make request
-            req = urllib.request.Request(url)
-            req.add_header("Authorization", f"Bearer {jira_token}")
-            req.add_header("Content-Type", "application/json")
-
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, lambda: urllib.request.urlopen(req, timeout=30)
+            issues = await get_jira_data().search(
+                jql,
+                fields=(*sprint_fields(), CLOUD_STORY_POINTS_FIELD),
+                max_results=max_results,
             )
-
-            data = json.loads(response.read().decode("utf-8"))
-
-            issues = []
-            for issue_data in data.get("issues", []):
-                issue = self._parse_issue(issue_data)
-                issues.append(issue)
-
-            return issues
-
+        except JiraUnavailable as e:
+            logger.warning(f"JQL search unavailable: {e}")
+            return []
         except Exception as e:
             logger.error(f"JQL search error: {e}")
             return []
 
+        return [self._parse_issue(issue_data) for issue_data in issues]
+
     def _parse_issue(self, data: dict) -> JiraIssue:
         """Parse a Jira issue from API response."""
         fields = data.get("fields", data)
@@ -291,7 +254,9 @@ class JiraPreloader:
                 if isinstance(fields.get("priority"), dict)
                 else str(fields.get("priority", ""))
             ),
-            story_points=fields.get("customfield_10016"),  # Story points field
+            story_points=(
+                fields.get(story_points_field()) or fields.get(CLOUD_STORY_POINTS_FIELD)
+            ),
             labels=fields.get("labels", []),
         )
 
@@ -5,13 +5,15 @@ Handles caption capture via DOM observation:
 - Injects JavaScript MutationObserver into the meeting page
 - Debounces caption text to wait for corrections to settle
 - Supports update-in-place for refined captions
-- Polls for new captions and dispatches via callback
+- Pushes settled captions to Python through a Playwright binding, coalescing
+  refinements of the same caption, with evaluate-polling as a fallback
 
 Extracted from GoogleMeetController to separate caption concerns.
 """
 
 import asyncio
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Callable, Optional
@@ -24,6 +26,17 @@ logger = logging.getLogger(__name__)
 
 MAX_CAPTION_BUFFER = 10000
 
+# Name of the page binding the observer pushes captions through
+CAPTION_BINDING = "__meetBotCaptionPush"
+
+# Distinct caption IDs waiting for dispatch; the oldest is dropped past this
+MAX_PENDING_CAPTIONS = 256
+
+# Evaluate-poll intervals: fallback mode, and the safety net in push mode
+# (catches captions whose push failed and detects browser closure)
+CAPTION_POLL_INTERVAL = 0.5
+PUSH_SAFETY_POLL_INTERVAL = 5.0
+
 
 @dataclass
 class CaptionEntry:
@@ -44,6 +57,11 @@ class MeetCaptions:
 
     Uses composition: receives a reference to the GoogleMeetController
     to access page and state.
+
+    Settled captions are pushed from the page through a Playwright binding
+    into a bounded queue keyed by caption ID, so repeated refinements of a
+    caption collapse into one dispatch. If the binding cannot be exposed,
+    captions are drained by polling ``window._meetBotCaptions`` instead.
     """
 
     def __init__(self, controller: "GoogleMeetController"):
@@ -52,6 +70,17 @@ class MeetCaptions:
         self._caption_observer_running = False
         self._caption_poll_task: Optional[asyncio.Task] = None
 
+        # Push delivery
+        self._push_enabled = False
+        self._binding_page = None  # Page the binding is registered on
+        self._pending_captions: OrderedDict[int, dict] = OrderedDict()
+        self._pending_event = asyncio.Event()
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+        # Caption ID -> index in state.caption_buffer, for update-in-place
+        self._caption_id_to_index: dict[int, int] = {}
+        self._stats = {"pushed": 0, "polled": 0, "coalesced": 0, "dropped": 0}
+
     @property
     def page(self):
         return self._controller.page
@@ -78,16 +107,25 @@ class MeetCaptions:
 
         self._caption_callback = callback
         self._caption_observer_running = True
+        self._caption_id_to_index = {}
+        self._pending_captions.clear()
+        self._push_enabled = await self._expose_caption_binding()
 
         # Inject DEBOUNCED caption observer with UPDATE-IN-PLACE support
         # Google Meet corrects text in-place, so we:
         # 1. Wait for text to "settle" (800ms no changes)
         # 2. Use UPDATE mode for refinements of the same utterance (not new entries)
         # 3. Only create NEW entries when speaker changes or it's clearly a new sentence
+        # Settled captions are pushed through the binding when it is available,
+        # otherwise (or if a push fails) queued in window._meetBotCaptions.
         await self.page.evaluate(
             """
-            () => {
+            (pushEnabled) => {
+                if (window._meetBotObserver) {
+                    window._meetBotObserver.disconnect();
+                }
                 window._meetBotCaptions = [];
+                window._meetBotPushEnabled = pushEnabled;
                 window._meetBotCurrentSpeaker = 'Unknown';
                 window._meetBotLastText = '';
                 window._meetBotDebounceTimer = null;
@@ -152,6 +190,15 @@ class MeetCaptions:
                     return null;
                 }
 
+                function deliverCaption(caption) {
+                    const push = window.__meetBotCaptionPush;
+                    if (window._meetBotPushEnabled && typeof push === 'function') {
+                        push(caption).catch(() => window._meetBotCaptions.push(caption));
+                    } else {
+                        window._meetBotCaptions.push(caption);
+                    }
+                }
+
                 // Normalize text for comparison (lowercase, collapse whitespace)
                 function normalizeText(text) {
                     return (text || '').toLowerCase().replace(/\\s+/g, ' ').trim();
@@ -196,7 +243,7 @@ class MeetCaptions:
 
                     if (lastId !== null && isRefinement(lastEmitted, text)) {
                         // UPDATE existing caption instead of creating new one
-                        window._meetBotCaptions.push({
+                        deliverCaption({
                             id: lastId,
                             speaker: speaker,
                             text: text,
@@ -207,7 +254,7 @@ class MeetCaptions:
                     } else {
                         // NEW caption entry
                         const newId = ++window._meetBotCaptionIdCounter;
-                        window._meetBotCaptions.push({
+                        deliverCaption({
                             id: newId,
                             speaker: speaker,
                             text: text,
@@ -270,20 +317,88 @@ class MeetCaptions:
                 });
 
                 window._meetBotObserver = observer;
-                console.log('[MeetBot] Caption observer started (800ms debounce, update-in-place mode)');
+                console.log('[MeetBot] Caption observer started '
+                    + '(400ms debounce, update-in-place mode, push=' + pushEnabled + ')');
             }
-        """
+        """,
+            self._push_enabled,
         )
 
-        # Start polling for new captions (track task for cleanup)
-        self._caption_poll_task = asyncio.create_task(self._poll_captions())
-        logger.info("Caption capture started")
+        if self._push_enabled:
+            self._dispatch_task = asyncio.create_task(self._dispatch_captions())
+            poll_interval = PUSH_SAFETY_POLL_INTERVAL
+        else:
+            poll_interval = CAPTION_POLL_INTERVAL
+
+        # Poll for captions the push path missed (track task for cleanup)
+        self._caption_poll_task = asyncio.create_task(
+            self._poll_captions(poll_interval)
+        )
+        logger.info(
+            f"Caption capture started ({'push' if self._push_enabled else 'polling'})"
+        )
+
+    async def _expose_caption_binding(self) -> bool:
+        """Expose the caption push binding on the current page.
+
+        Returns False if the binding is unavailable, in which case captions
+        are delivered by polling.
+        """
+        page = self.page
+        if self._binding_page is page:
+            return True
+        try:
+            await page.expose_binding(CAPTION_BINDING, self._on_caption_pushed)
+        except Exception as e:
+            logger.info(f"Caption push unavailable, falling back to polling: {e}")
+            return False
+        self._binding_page = page
+        return True
+
+    def _on_caption_pushed(self, source, caption) -> None:
+        """Binding callback: queue a caption pushed by the page observer."""
+        if not self._caption_observer_running or not isinstance(caption, dict):
+            return
+        self._stats["pushed"] += 1
+        self._enqueue_caption(caption)
+
+    def _enqueue_caption(self, caption: dict) -> None:
+        """Add a caption to the pending queue, coalescing by caption ID."""
+        cap_id = caption.get("id", 0)
+        pending = self._pending_captions.get(cap_id)
+        if pending is not None:
+            # Refined again before dispatch: keep the latest text, but a
+            # caption first seen as NEW must still be dispatched as NEW
+            caption = {**caption, "isUpdate": pending.get("isUpdate", False)}
+            self._stats["coalesced"] += 1
+        elif len(self._pending_captions) >= MAX_PENDING_CAPTIONS:
+            self._pending_captions.popitem(last=False)
+            self._stats["dropped"] += 1
+        self._pending_captions[cap_id] = caption
+        self._pending_event.set()
+
+    def _drain_pending_captions(self) -> None:
+        """Dispatch every queued caption in arrival order."""
+        while self._pending_captions:
+            _, caption = self._pending_captions.popitem(last=False)
+            self._handle_caption(caption)
+
+    async def _dispatch_captions(self) -> None:
+        """Dispatch pushed captions as they arrive."""
+        while self._caption_observer_running:
+            await self._pending_event.wait()
+            self._pending_event.clear()
+            try:
+                self._drain_pending_captions()
+            except Exception as e:
+                logger.debug(f"Caption dispatch error: {e}")
 
-    async def _poll_captions(self) -> None:
-        """Poll for settled/corrected captions from the JS observer buffer."""
-        # Track caption IDs to their index in buffer for updates
-        caption_id_to_index: dict[int, int] = {}
+    async def _poll_captions(self, interval: float = CAPTION_POLL_INTERVAL) -> None:
+        """Poll for settled/corrected captions from the JS observer buffer.
 
+        In push mode this only picks up captions whose push failed, so it
+        runs at a much longer interval. It also detects browser closure.
+        """
         while self._caption_observer_running and self.page:
             try:
                 # Fetch and clear the caption buffer - these are already debounced/corrected
@@ -297,61 +412,14 @@ class MeetCaptions:
                 """
                 )
 
-                for cap in captions:
-                    speaker = cap.get("speaker", "Unknown")
-                    text = cap.get("text", "")
-                    ts = cap.get("ts", 0)
-                    cap_id = cap.get("id", 0)
-                    is_update = cap.get("isUpdate", False)
-
-                    if not text.strip():
-                        continue
-
-                    # Determine if this is truly an update (JS says update AND we've seen this ID before)
-                    is_true_update = is_update and cap_id in caption_id_to_index
-
-                    entry = CaptionEntry(
-                        speaker=speaker,
-                        text=text.strip(),
-                        timestamp=(
-                            datetime.fromtimestamp(ts / 1000) if ts else datetime.now()
-                        ),
-                        caption_id=cap_id,
-                        is_update=is_true_update,
-                    )
+                if captions:
+                    self._stats["polled"] += len(captions)
+                    # Keep ordering with anything pushed but not yet dispatched
+                    self._drain_pending_captions()
+                    for cap in captions:
+                        self._handle_caption(cap)
 
-                    if entry.is_update:
-                        # UPDATE existing caption in buffer
-                        idx = caption_id_to_index[cap_id]
-                        if self.state and 0 <= idx < len(self.state.caption_buffer):
-                            self.state.caption_buffer[idx] = entry
-                            logger.debug(f"Caption UPDATE [{speaker}] {text[:50]}...")
-                        # Also notify callback with updated entry (for live display)
-                        if self._caption_callback:
-                            self._caption_callback(entry)
-                    else:
-                        # NEW caption entry
-                        if self.state:
-                            caption_id_to_index[cap_id] = len(self.state.caption_buffer)
-                            self.state.caption_buffer.append(entry)
-                            # Trim old entries when buffer exceeds max size
-                            if len(self.state.caption_buffer) > MAX_CAPTION_BUFFER:
-                                trim_count = (
-                                    len(self.state.caption_buffer) - MAX_CAPTION_BUFFER
-                                )
-                                self.state.caption_buffer = self.state.caption_buffer[
-                                    trim_count:
-                                ]
-                                # Rebuild index mapping after trim
-                                caption_id_to_index = {
-                                    e.caption_id: i
-                                    for i, e in enumerate(self.state.caption_buffer)
-                                }
-                        if self._caption_callback:
-                            self._caption_callback(entry)
-                        logger.debug(f"Caption NEW [{speaker}] {text[:50]}...")
-
-                await asyncio.sleep(0.5)  # Poll every 500ms
+                await asyncio.sleep(interval)
 
             except Exception as e:
                 error_msg = str(e)
@@ -371,25 +439,82 @@ class MeetCaptions:
                 logger.debug(f"Caption poll error: {e}")
                 await asyncio.sleep(1)
 
+    def _handle_caption(self, cap: dict) -> None:
+        """Apply one caption from the observer to the buffer and callback."""
+        speaker = cap.get("speaker", "Unknown")
+        text = cap.get("text", "")
+        ts = cap.get("ts", 0)
+        cap_id = cap.get("id", 0)
+        is_update = cap.get("isUpdate", False)
+
+        if not text.strip():
+            return
+
+        # Determine if this is truly an update (JS says update AND we've seen this ID before)
+        is_true_update = is_update and cap_id in self._caption_id_to_index
+
+        entry = CaptionEntry(
+            speaker=speaker,
+            text=text.strip(),
+            timestamp=(datetime.fromtimestamp(ts / 1000) if ts else datetime.now()),
+            caption_id=cap_id,
+            is_update=is_true_update,
+        )
+
+        if entry.is_update:
+            # UPDATE existing caption in buffer
+            idx = self._caption_id_to_index[cap_id]
+            if self.state and 0 <= idx < len(self.state.caption_buffer):
+                self.state.caption_buffer[idx] = entry
+                logger.debug(f"Caption UPDATE [{speaker}] {text[:50]}...")
+            # Also notify callback with updated entry (for live display)
+            if self._caption_callback:
+                self._caption_callback(entry)
+        else:
+            # NEW caption entry
+            if self.state:
+                self._caption_id_to_index[cap_id] = len(self.state.caption_buffer)
+                self.state.caption_buffer.append(entry)
+                # Trim old entries when buffer exceeds max size
+                if len(self.state.caption_buffer) > MAX_CAPTION_BUFFER:
+                    trim_count = len(self.state.caption_buffer) - MAX_CAPTION_BUFFER
+                    self.state.caption_buffer = self.state.caption_buffer[trim_count:]
+                    # Rebuild index mapping after trim
+                    self._caption_id_to_index = {
+                        e.caption_id: i for i, e in enumerate(self.state.caption_buffer)
+                    }
+            if self._caption_callback:
+                self._caption_callback(entry)
+            logger.debug(f"Caption NEW [{speaker}] {text[:50]}...")
+
     async def stop_caption_capture(self) -> None:
         """Stop capturing captions."""
+        # Deliver captions that were pushed but not yet dispatched
+        try:
+            self._drain_pending_captions()
+        except Exception as e:
+            logger.debug(f"Suppressed error draining pending captions: {e}")
+
         self._caption_observer_running = False
         self._caption_callback = None
 
-        # Cancel the polling task if it exists
-        if self._caption_poll_task and not self._caption_poll_task.done():
-            self._caption_poll_task.cancel()
-            try:
-                await asyncio.wait_for(self._caption_poll_task, timeout=2.0)
-            except (asyncio.CancelledError, asyncio.TimeoutError):
-                pass
-            self._caption_poll_task = None
+        # Cancel the dispatch and polling tasks if they exist
+        for task in (self._dispatch_task, self._caption_poll_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await asyncio.wait_for(task, timeout=2.0)
+                except (asyncio.CancelledError, asyncio.TimeoutError):
+                    pass
+        self._dispatch_task = None
+        self._caption_poll_task = None
 
         if self.page:
             try:
                 await self.page.evaluate(
                     """
                     () => {
+                        window._meetBotPushEnabled = false;
                         if (window._meetBotObserver) {
                             window._meetBotObserver.disconnect();
                         }
@@ -403,6 +528,14 @@ class MeetCaptions:
 
         logger.info("Caption capture stopped")
 
+    def get_stats(self) -> dict:
+        """Get caption delivery statistics."""
+        return {
+            "mode": "push" if self._push_enabled else "polling",
+            "pending": len(self._pending_captions),
+            **self._stats,
+        }
+
     async def get_captions(self) -> list[CaptionEntry]:
         """Get all captured captions."""
         if self.state:
@@ -957,6 +957,7 @@ class NotesBot:
                 silence_duration=0.8,
                 min_speech_duration=0.3,
                 max_speech_duration=15.0,
+                meeting_id=instance_id or "",
             )
 
             # Start the pipeline
@@ -1242,12 +1243,19 @@ class NotesBot:
             await asyncio.sleep(self.state.buffer_flush_interval)
             await self._flush_buffer()
 
-    async def _flush_buffer(self) -> None:
-        """Flush transcript buffer to database."""
+    async def _flush_buffer(self, durable: bool = False) -> None:
+        """Flush transcript buffer to database.
+
+        Entries are handed to the database's write-behind queue, which
+        commits them in batches. With durable=True, wait until they are
+        committed (used when leaving a meeting).
+        """
         if not self.db or not self.state.meeting_id:
             return
 
         if not self.state.transcript_buffer:
+            if durable:
+                await self.db.flush_transcripts()
             return
 
         try:
@@ -1259,8 +1267,8 @@ class NotesBot:
             # IDs are only used for update-in-place within the buffer
             self.state.caption_id_to_index.clear()
 
-            # Write to database
-            await self.db.add_transcript_entries(self.state.meeting_id, entries)
+            # Queue for the database's batched writer
+            self.db.queue_transcript_entries(self.state.meeting_id, entries)
             self.state.last_flush = datetime.now()
 
             logger.debug(f"Flushed {len(entries)} transcript entries")
@@ -1269,6 +1277,11 @@ class NotesBot:
             logger.error(f"Failed to flush transcript buffer: {e}")
             # Put entries back in buffer
             self.state.transcript_buffer = entries + self.state.transcript_buffer
+            return
+
+        if durable:
+            # On failure the entries stay queued in the database
+            await self.db.flush_transcripts()
 
     async def _monitor_browser_health(self) -> None:
         """Monitor browser health and trigger cleanup if browser closes."""
@@ -1431,7 +1444,7 @@ class NotesBot:
 
         # 5. Flush any remaining transcript buffer
         try:
-            await self._flush_buffer()
+            await self._flush_buffer(durable=True)
         except Exception as e:
             logger.warning(f"CLEANUP: Failed to flush buffer: {e}")
 
@@ -1575,7 +1588,7 @@ class NotesBot:
 
         # 5. Final buffer flush
         try:
-            await self._flush_buffer()
+            await self._flush_buffer(durable=True)
         except Exception as e:
             logger.warning(f"LEAVE: Failed to flush buffer: {e}")
 
@@ -157,18 +157,35 @@ class MeetingNotesDB:
     Thread-safe with async support via aiosqlite.
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        write_behind_interval: float = 1.0,
+        max_write_batch: int = 1000,
+    ):
         """
         Initialize the database.
 
         Args:
             db_path: Path to SQLite database file. Defaults to ~/.config/aa-workflow/meetings.db
+            write_behind_interval: Durability window in seconds for queued
+                transcript entries - how long they may sit in memory before
+                the background writer commits them.
+            max_write_batch: Queued entry count that triggers an early commit.
         """
         self.db_path = db_path or DEFAULT_DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db: Optional[aiosqlite.Connection] = None
         self._lock = asyncio.Lock()
 
+        # Write-behind transcript queue: rows are
+        # (meeting_id, speaker, text, timestamp) ready for executemany
+        self.write_behind_interval = write_behind_interval
+        self.max_write_batch = max_write_batch
+        self._pending_transcripts: list[tuple[int, str, str, str]] = []
+        self._batch_full = asyncio.Event()
+        self._writer_task: Optional[asyncio.Task] = None
+
     async def connect(self) -> None:
         """Connect to database and create tables."""
         async with self._lock:
@@ -183,16 +200,34 @@ class MeetingNotesDB:
             # Enable WAL mode for better concurrent access
             await self._db.execute("PRAGMA journal_mode=WAL")
             await self._db.execute("PRAGMA busy_timeout=30000")
+            # WAL keeps the DB consistent on crash with NORMAL; only the
+            # last commits can be lost, which the write-behind queue
+            # already accepts
+            await self._db.execute("PRAGMA synchronous=NORMAL")
             await self._create_tables()
             logger.info(f"Connected to meetings database: {self.db_path}")
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Commit queued transcript entries and close the connection."""
         async with self._lock:
+            if self._pending_transcripts:
+                try:
+                    await self._connect_internal()
+                    await self._flush_pending_internal()
+                except Exception as e:
+                    logger.error(
+                        f"Dropping {len(self._pending_transcripts)} queued "
+                        f"transcript entries on close: {e}"
+                    )
+                    self._pending_transcripts = []
             if self._db:
                 await self._db.close()
                 self._db = None
 
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+        self._writer_task = None
+
     async def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
         if not self._db:
@@ -280,6 +315,18 @@ class MeetingNotesDB:
             CREATE INDEX IF NOT EXISTS idx_transcripts_meeting ON transcripts(meeting_id)
         """
         )
+        # Date-range filters in search_transcripts()
+        await self._db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_transcripts_meeting_time
+                ON transcripts(meeting_id, timestamp)
+        """
+        )
+        await self._db.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_transcripts_timestamp ON transcripts(timestamp)
+        """
+        )
 
         # Full-text search for transcripts
         await self._db.execute(
@@ -290,14 +337,10 @@ class MeetingNotesDB:
         """
         )
 
-        # Triggers to keep FTS in sync
-        await self._db.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS transcripts_ai AFTER INSERT ON transcripts BEGIN
-                INSERT INTO transcripts_fts(rowid, speaker, text) VALUES (new.id, new.speaker, new.text);
-            END
-        """
-        )
+        # Triggers to keep FTS in sync. Inserts are indexed in bulk by
+        # _insert_transcripts_internal() instead of a per-row trigger, so
+        # drop the insert trigger older databases were created with.
+        await self._db.execute("DROP TRIGGER IF EXISTS transcripts_ai")
         await self._db.execute(
             """
             CREATE TRIGGER IF NOT EXISTS transcripts_ad AFTER DELETE ON transcripts BEGIN
@@ -609,6 +652,7 @@ class MeetingNotesDB:
             await self._connect_internal()
             if not self._db:
                 return []
+            await self._flush_before_read()
 
             # Query meetings with transcript counts
             query = """
@@ -699,6 +743,11 @@ class MeetingNotesDB:
             if not self._db:
                 return False
 
+            # Drop queued entries so they aren't written after the delete
+            self._pending_transcripts = [
+                row for row in self._pending_transcripts if row[0] != meeting_id
+            ]
+
             # Delete transcript first (cascade should handle this, but be explicit)
             await self._db.execute(
                 "DELETE FROM transcripts WHERE meeting_id = ?", (meeting_id,)
@@ -758,48 +807,180 @@ class MeetingNotesDB:
     async def add_transcript_entry(
         self, meeting_id: int, entry: TranscriptEntry
     ) -> int:
-        """Add a transcript entry to a meeting."""
+        """Add a transcript entry to a meeting and commit it immediately.
+
+        Any queued entries are committed in the same transaction.
+        Returns the new entry's row ID.
+        """
         async with self._lock:
             await self._connect_internal()
             if not self._db:
                 raise RuntimeError("Database not connected")
 
-            cursor = await self._db.execute(
-                """
-                INSERT INTO transcripts (meeting_id, speaker, text, timestamp)
-                VALUES (?, ?, ?, ?)
-            """,
-                (
-                    meeting_id,
-                    entry.speaker,
-                    entry.text,
-                    entry.timestamp.isoformat(),
-                ),
-            )
-            await self._db.commit()
-            return cursor.lastrowid or 0
+            self._pending_transcripts.append(self._transcript_row(meeting_id, entry))
+            return await self._flush_pending_internal()
 
     async def add_transcript_entries(
         self, meeting_id: int, entries: list[TranscriptEntry]
     ) -> int:
-        """Add multiple transcript entries efficiently."""
+        """Add multiple transcript entries in one transaction and commit them.
+
+        Any queued entries are committed in the same transaction.
+        """
+        async with self._lock:
+            await self._connect_internal()
+            if not self._db:
+                raise RuntimeError("Database not connected")
+
+            self._pending_transcripts.extend(
+                self._transcript_row(meeting_id, e) for e in entries
+            )
+            await self._flush_pending_internal()
+            return len(entries)
+
+    def queue_transcript_entries(
+        self, meeting_id: int, entries: list[TranscriptEntry]
+    ) -> int:
+        """Queue transcript entries for the background writer.
+
+        Returns immediately. Entries from every caller are grouped into one
+        transaction, committed within ``write_behind_interval`` seconds (or
+        sooner once ``max_write_batch`` entries are queued). Reads through
+        this instance always see queued entries. Call flush_transcripts()
+        when they must be on disk.
+
+        Must be called from a running event loop.
+        """
+        if not entries:
+            return 0
+
+        self._pending_transcripts.extend(
+            self._transcript_row(meeting_id, e) for e in entries
+        )
+        if len(self._pending_transcripts) >= self.max_write_batch:
+            self._batch_full.set()
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.get_running_loop().create_task(
+                self._write_behind_loop()
+            )
+        return len(entries)
+
+    async def flush_transcripts(self) -> int:
+        """Commit all queued transcript entries now.
+
+        Returns the number of entries written.
+        """
         async with self._lock:
             await self._connect_internal()
             if not self._db:
                 raise RuntimeError("Database not connected")
+            count = len(self._pending_transcripts)
+            await self._flush_pending_internal()
+            return count
+
+    @property
+    def pending_transcript_count(self) -> int:
+        """Number of transcript entries queued but not yet committed."""
+        return len(self._pending_transcripts)
+
+    async def _write_behind_loop(self) -> None:
+        """Commit queued transcript entries in timed batches until drained."""
+        while self._pending_transcripts:
+            if len(self._pending_transcripts) < self.max_write_batch:
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._batch_full.wait(), timeout=self.write_behind_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            try:
+                count = await self.flush_transcripts()
+                if count:
+                    logger.debug(f"Committed {count} queued transcript entries")
+            except Exception as e:
+                # Entries stay queued; retry after the durability window
+                logger.error(f"Failed to commit queued transcript entries: {e}")
+                await asyncio.sleep(self.write_behind_interval)
+
+    async def _flush_pending_internal(self) -> int:
+        """Commit queued transcript entries (caller must hold lock).
+
+        On failure the entries are put back at the front of the queue.
+        Returns the row ID of the last inserted entry (0 if none).
+        """
+        if not self._pending_transcripts or not self._db:
+            return 0
+
+        rows = self._pending_transcripts
+        self._pending_transcripts = []
+        try:
+            return await self._insert_transcripts_internal(rows)
+        except Exception:
+            self._pending_transcripts = rows + self._pending_transcripts
+            raise
+
+    async def _flush_before_read(self) -> None:
+        """Make queued entries visible to a read (caller must hold lock)."""
+        try:
+            await self._flush_pending_internal()
+        except Exception as e:
+            logger.warning(f"Reading without queued transcript entries: {e}")
+
+    async def _insert_transcripts_internal(
+        self, rows: list[tuple[int, str, str, str]]
+    ) -> int:
+        """Insert rows and index them in FTS in one transaction.
+
+        The FTS index is updated with a single INSERT ... SELECT over the new
+        row IDs rather than a trigger firing per row. BEGIN IMMEDIATE takes
+        the write lock up front so no other writer can interleave IDs.
+
+        Returns the row ID of the last inserted entry.
+        """
+        if not self._db:
+            raise RuntimeError("Database not connected")
+
+        if self._db.in_transaction:
+            await self._db.commit()
+        await self._db.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = await self._db.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM transcripts"
+            )
+            row = await cursor.fetchone()
+            last_id = row[0] if row else 0
 
             await self._db.executemany(
                 """
                 INSERT INTO transcripts (meeting_id, speaker, text, timestamp)
                 VALUES (?, ?, ?, ?)
             """,
-                [
-                    (meeting_id, e.speaker, e.text, e.timestamp.isoformat())
-                    for e in entries
-                ],
+                rows,
             )
+            await self._db.execute(
+                """
+                INSERT INTO transcripts_fts(rowid, speaker, text)
+                SELECT id, speaker, text FROM transcripts WHERE id > ?
+            """,
+                (last_id,),
+            )
+            cursor = await self._db.execute("SELECT MAX(id) FROM transcripts")
+            row = await cursor.fetchone()
             await self._db.commit()
-            return len(entries)
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        return row[0] if row and row[0] is not None else 0
+
+    @staticmethod
+    def _transcript_row(
+        meeting_id: int, entry: TranscriptEntry
+    ) -> tuple[int, str, str, str]:
+        return (meeting_id, entry.speaker, entry.text, entry.timestamp.isoformat())
 
     async def get_transcript(self, meeting_id: int) -> list[TranscriptEntry]:
         """Get full transcript for a meeting."""
@@ -815,6 +996,7 @@ class MeetingNotesDB:
             await self._connect_internal()
             if not self._db:
                 return []
+            await self._flush_before_read()
 
             cursor = await self._db.execute(
                 """
@@ -845,6 +1027,7 @@ class MeetingNotesDB:
         """Get transcript (caller must hold lock)."""
         if not self._db:
             return []
+        await self._flush_before_read()
 
         cursor = await self._db.execute(
             """
@@ -870,52 +1053,85 @@ class MeetingNotesDB:
         query: str,
         meeting_id: Optional[int] = None,
         limit: int = 50,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        highlight: tuple[str, str] = ("**", "**"),
+        snippet_tokens: int = 16,
     ) -> list[dict]:
         """
         Full-text search across transcripts.
 
-        Returns list of matches with meeting info.
+        Args:
+            query: FTS5 match expression
+            meeting_id: Restrict to one meeting
+            limit: Maximum number of matches
+            since: Only entries spoken at or after this time
+            until: Only entries spoken at or before this time
+            highlight: Markers placed around matched terms
+            snippet_tokens: Approximate snippet length in tokens
+
+        Returns list of matches with meeting info. Each match has the full
+        ``text``, a ``snippet`` around the match and the ``highlighted``
+        text, both with matched terms wrapped in the highlight markers.
         """
         async with self._lock:
             await self._connect_internal()
             if not self._db:
                 return []
+            await self._flush_before_read()
+
+            open_mark, close_mark = highlight
+            # snippet() and highlight() arguments come first in the SELECT
+            params: list = [
+                open_mark,
+                close_mark,
+                max(1, min(snippet_tokens, 64)),  # FTS5 caps snippets at 64
+                open_mark,
+                close_mark,
+                query,
+            ]
+            conditions = ["transcripts_fts MATCH ?"]
 
             if meeting_id:
-                # Search within a specific meeting
-                sql = """
-                    SELECT t.*, m.title as meeting_title, m.scheduled_start
-                    FROM transcripts_fts fts
-                    JOIN transcripts t ON fts.rowid = t.id
-                    JOIN meetings m ON t.meeting_id = m.id
-                    WHERE transcripts_fts MATCH ? AND t.meeting_id = ?
-                    ORDER BY rank
-                    LIMIT ?
-                """
-                params = (query, meeting_id, limit)
-            else:
-                # Search across all meetings
-                sql = """
-                    SELECT t.*, m.title as meeting_title, m.scheduled_start
-                    FROM transcripts_fts fts
-                    JOIN transcripts t ON fts.rowid = t.id
-                    JOIN meetings m ON t.meeting_id = m.id
-                    WHERE transcripts_fts MATCH ?
-                    ORDER BY rank
-                    LIMIT ?
-                """
-                params = (query, limit)
+                conditions.append("t.meeting_id = ?")
+                params.append(meeting_id)
+
+            # Timestamps are ISO strings, so ranges compare lexically and
+            # use idx_transcripts_timestamp / idx_transcripts_meeting_time
+            if since:
+                conditions.append("t.timestamp >= ?")
+                params.append(since.isoformat())
+
+            if until:
+                conditions.append("t.timestamp <= ?")
+                params.append(until.isoformat())
+
+            sql = f"""
+                SELECT t.*, m.title as meeting_title, m.scheduled_start,
+                    snippet(transcripts_fts, 1, ?, ?, '...', ?) as snippet,
+                    highlight(transcripts_fts, 1, ?, ?) as highlighted
+                FROM transcripts_fts fts
+                JOIN transcripts t ON fts.rowid = t.id
+                JOIN meetings m ON t.meeting_id = m.id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY rank
+                LIMIT ?
+            """
+            params.append(limit)
 
             cursor = await self._db.execute(sql, params)
             rows = await cursor.fetchall()
 
             return [
                 {
+                    "id": row["id"],
                     "meeting_id": row["meeting_id"],
                     "meeting_title": row["meeting_title"],
                     "meeting_date": row["scheduled_start"],
                     "speaker": row["speaker"],
                     "text": row["text"],
+                    "snippet": row["snippet"],
+                    "highlighted": row["highlighted"],
                     "timestamp": row["timestamp"],
                 }
                 for row in rows
@@ -929,6 +1145,7 @@ class MeetingNotesDB:
             await self._connect_internal()
             if not self._db:
                 return {}
+            await self._flush_before_read()
 
             stats = {}
 
@@ -365,6 +365,7 @@ class TranscriptionProcessor:
                 silence_duration=0.8,
                 min_speech_duration=0.3,
                 max_speech_duration=15.0,
+                meeting_id=instance_id or "",
             )
 
             # Start the pipeline
@@ -387,12 +388,19 @@ class TranscriptionProcessor:
             await asyncio.sleep(self._state.buffer_flush_interval)
             await self.flush_buffer()
 
-    async def flush_buffer(self) -> None:
-        """Flush transcript buffer to database."""
+    async def flush_buffer(self, durable: bool = False) -> None:
+        """Flush transcript buffer to database.
+
+        Entries are handed to the database's write-behind queue, which
+        commits them in batches. With durable=True, wait until they are
+        committed (used when leaving a meeting).
+        """
         if not self._db or not self._state.meeting_id:
             return
 
         if not self._state.transcript_buffer:
+            if durable:
+                await self._db.flush_transcripts()
             return
 
         try:
@@ -404,8 +412,8 @@ class TranscriptionProcessor:
             # IDs are only used for update-in-place within the buffer
             self._state.caption_id_to_index.clear()
 
-            # Write to database
-            await self._db.add_transcript_entries(self._state.meeting_id, entries)
+            # Queue for the database's batched writer
+            self._db.queue_transcript_entries(self._state.meeting_id, entries)
             self._state.last_flush = datetime.now()
 
             logger.debug(f"Flushed {len(entries)} transcript entries")
@@ -414,6 +422,11 @@ class TranscriptionProcessor:
             logger.error(f"Failed to flush transcript buffer: {e}")
             # Put entries back in buffer
             self._state.transcript_buffer = entries + self._state.transcript_buffer
+            return
+
+        if durable:
+            # On failure the entries stay queued in the database
+            await self._db.flush_transcripts()
 
     async def stop_npu_stt(self, context: str = "") -> None:
         """Stop the NPU STT pipeline.
@@ -0,0 +1,553 @@
+"""
+Out-of-process Speech-to-Text worker.
+
+Runs Whisper inference in a dedicated process so a slow transcription never
+stalls the bot's event loop (caption polling, browser control, video frames).
+
+Architecture:
+    PulseAudioCapture ──► RingBuffer (shared memory) ◄── STT worker process
+            │                                               ▲      │
+    RealtimeSTTPipeline (VAD) ── transcribe [start, end) ───┘      │
+            ▲                                                      │
+            └──────────── partial / final results ◄────────────────┘
+
+Audio never crosses the control channel: the parent sends absolute sample
+ranges over a multiprocessing Pipe and the worker reads them straight out of
+the shared ring buffer. Results stream back on the same pipe as they are
+produced (one ``partial`` message per decoded segment, then a ``result``).
+
+Backends (selected with ``backend=``):
+- ``openvino``: OpenVINO GenAI WhisperPipeline (NPU with CPU fallback, or CPU)
+- ``faster-whisper``: CTranslate2 Whisper, int8 on CPU
+- ``whisper.cpp``: pywhispercpp bindings, CPU
+- ``"package.module:Class"``: any importable class with ``load() -> device``
+  and ``transcribe(audio) -> Iterator[str]``
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+import numpy as np
+
+from tool_modules.aa_meet_bot.src.audio_capture import RingBuffer
+from tool_modules.aa_meet_bot.src.stt_engine import (
+    WHISPER_MODEL_DIR,
+    TranscriptionResult,
+)
+
+logger = logging.getLogger(__name__)
+
+STT_BACKENDS = ("openvino", "faster-whisper", "whisper.cpp")
+
+
+# ==================== BACKENDS (run inside the worker) ====================
+
+
+class _OpenVINOBackend:
+    """OpenVINO GenAI Whisper (same model as NPUWhisperSTT)."""
+
+    def __init__(self, device: str = "CPU", model_dir: Optional[str] = None):
+        self.device = device
+        self.model_dir = Path(model_dir) if model_dir else WHISPER_MODEL_DIR
+        self._pipeline = None
+
+    def load(self) -> str:
+        import openvino_genai as ov_genai
+
+        devices = [self.device, "CPU"] if self.device == "NPU" else [self.device]
+        for device in devices:
+            try:
+                self._pipeline = ov_genai.WhisperPipeline(str(self.model_dir), device)
+                return device
+            except Exception as e:
+                if device == devices[-1]:
+                    raise
+                logger.warning(f"STT worker: failed to load on {device}: {e}")
+        return self.device
+
+    def transcribe(self, audio: np.ndarray) -> Iterator[str]:
+        result = self._pipeline.generate(audio)
+        if hasattr(result, "texts") and result.texts:
+            yield result.texts[0].strip()
+        elif result:
+            yield str(result).strip()
+
+
+class _FasterWhisperBackend:
+    """faster-whisper (CTranslate2) on CPU."""
+
+    def __init__(
+        self, model: str = "base", compute_type: str = "int8", threads: int = 0
+    ):
+        self.model = model
+        self.compute_type = compute_type
+        self.threads = threads
+        self._model = None
+
+    def load(self) -> str:
+        from faster_whisper import WhisperModel
+
+        self._model = WhisperModel(
+            self.model,
+            device="cpu",
+            compute_type=self.compute_type,
+            cpu_threads=self.threads,
+        )
+        return "CPU"
+
+    def transcribe(self, audio: np.ndarray) -> Iterator[str]:
+        segments, _info = self._model.transcribe(audio, beam_size=1, language="en")
+        for segment in segments:
+            text = segment.text.strip()
+            if text:
+                yield text
+
+
+class _WhisperCppBackend:
+    """whisper.cpp via pywhispercpp on CPU."""
+
+    def __init__(self, model: str = "base.en", threads: int = 4):
+        self.model = model
+        self.threads = threads
+        self._model = None
+
+    def load(self) -> str:
+        from pywhispercpp.model import Model
+
+        self._model = Model(self.model, n_threads=self.threads, print_progress=False)
+        return "CPU"
+
+    def transcribe(self, audio: np.ndarray) -> Iterator[str]:
+        for segment in self._model.transcribe(audio):
+            text = segment.text.strip()
+            if text:
+                yield text
+
+
+_BACKEND_CLASSES = {
+    "openvino": _OpenVINOBackend,
+    "faster-whisper": _FasterWhisperBackend,
+    "whisper.cpp": _WhisperCppBackend,
+}
+
+
+def _load_backend_class(backend: str) -> type:
+    """Resolve a backend name or ``"module:Class"`` path."""
+    if backend in _BACKEND_CLASSES:
+        return _BACKEND_CLASSES[backend]
+    import importlib
+
+    module_name, _, class_name = backend.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _coalesce_requests(requests: list[dict]) -> list[dict]:
+    """Drop partial requests superseded by a later request for the same segment.
+
+    Partial requests re-transcribe a growing segment; when the worker falls
+    behind only the newest one (or the final) is worth running.
+    """
+    latest: dict[int, int] = {}
+    for i, req in enumerate(requests):
+        if req.get("op") == "transcribe":
+            latest[req["start"]] = i
+    kept = []
+    for i, req in enumerate(requests):
+        if (
+            req.get("op") == "transcribe"
+            and not req["final"]
+            and latest[req["start"]] != i
+        ):
+            continue
+        kept.append(req)
+    return kept
+
+
+def _worker_main(
+    shm_name: str, conn: Connection, backend: str, options: dict
+) -> None:  # pragma: no cover - runs in the child process
+    """Entry point of the STT worker process."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s [stt-worker] %(message)s"
+    )
+
+    try:
+        ring = RingBuffer.attach(shm_name)
+        engine = _load_backend_class(backend)(**options)
+        start = time.time()
+        device = engine.load()
+        conn.send(
+            {
+                "type": "ready",
+                "backend": backend,
+                "device": device,
+                "load_s": time.time() - start,
+            }
+        )
+    except Exception as e:
+        conn.send({"type": "fatal", "error": f"{type(e).__name__}: {e}"})
+        return
+
+    pending: list[dict] = []
+    try:
+        while True:
+            if not pending:
+                pending.append(conn.recv())
+            while conn.poll():
+                pending.append(conn.recv())
+            pending = _coalesce_requests(pending)
+
+            req = pending.pop(0)
+            op = req.get("op")
+            if op == "stop":
+                break
+            if op == "ping":
+                conn.send({"type": "pong"})
+                continue
+            if op != "transcribe":
+                continue
+
+            rid = req["id"]
+            view = ring.view_range(req["start"], req["end"])
+            # Copy out so the producer may keep writing during inference
+            audio = None if view is None else np.array(view, dtype=np.float32)
+            del view
+            if audio is None or ring.view_range(req["start"], req["end"]) is None:
+                conn.send(
+                    {"type": "error", "id": rid, "error": "audio no longer in buffer"}
+                )
+                continue
+
+            t0 = time.time()
+            texts = []
+            try:
+                for text in engine.transcribe(audio):
+                    texts.append(text)
+                    conn.send({"type": "partial", "id": rid, "text": " ".join(texts)})
+            except Exception as e:
+                conn.send({"type": "error", "id": rid, "error": str(e)})
+                continue
+
+            conn.send(
+                {
+                    "type": "result",
+                    "id": rid,
+                    "text": " ".join(texts).strip(),
+                    "final": req["final"],
+                    "inference_s": time.time() - t0,
+                    "audio_s": len(audio) / ring.sample_rate,
+                }
+            )
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        ring.close()
+
+
+# ==================== PARENT SIDE ====================
+
+
+@dataclass
+class STTWorkerStats:
+    """Latency and real-time-factor metrics for one meeting's STT worker."""
+
+    meeting_id: str = ""
+    backend: str = ""
+    device: str = ""
+    load_time: float = 0.0
+    requests: int = 0
+    results: int = 0
+    partials: int = 0
+    errors: int = 0
+    superseded: int = 0
+    total_latency: float = 0.0  # submit -> final result, seconds
+    max_latency: float = 0.0
+    last_latency: float = 0.0
+    first_partial_latency: float = 0.0  # last request's submit -> first partial
+    total_inference_time: float = 0.0
+    total_audio_duration: float = 0.0
+    last_rtf: float = 0.0
+    start_time: float = field(default_factory=time.time)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        if self.results == 0:
+            return 0.0
+        return self.total_latency / self.results * 1000
+
+    @property
+    def avg_rtf(self) -> float:
+        if self.total_audio_duration <= 0:
+            return 0.0
+        return self.total_inference_time / self.total_audio_duration
+
+    def to_dict(self) -> dict:
+        return {
+            "meeting_id": self.meeting_id,
+            "backend": self.backend,
+            "device": self.device,
+            "load_time_s": round(self.load_time, 3),
+            "requests": self.requests,
+            "results": self.results,
+            "partials": self.partials,
+            "errors": self.errors,
+            "superseded": self.superseded,
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency * 1000, 1),
+            "last_latency_ms": round(self.last_latency * 1000, 1),
+            "first_partial_ms": round(self.first_partial_latency * 1000, 1),
+            "last_rtf": round(self.last_rtf, 3),
+            "avg_rtf": round(self.avg_rtf, 3),
+            "audio_seconds": round(self.total_audio_duration, 1),
+        }
+
+
+# Per-meeting worker stats (kept after the worker stops for reporting)
+_meeting_stats: dict[str, STTWorkerStats] = {}
+
+
+def get_meeting_stt_stats(meeting_id: Optional[str] = None) -> dict:
+    """Get STT worker metrics for one meeting, or all meetings by id."""
+    if meeting_id is not None:
+        stats = _meeting_stats.get(meeting_id)
+        return stats.to_dict() if stats else {}
+    return {mid: stats.to_dict() for mid, stats in _meeting_stats.items()}
+
+
+class STTWorkerClient:
+    """
+    Parent-side handle for an STT worker process.
+
+    The worker attaches to ``ring`` (which must live in shared memory) and
+    transcribes absolute sample ranges on request. Results are delivered via
+    ``on_result(result, is_final)`` / ``on_partial(text)`` callbacks on the
+    event loop that called ``start()``, or awaited with ``transcribe_range``.
+    """
+
+    def __init__(
+        self,
+        ring: RingBuffer,
+        backend: str = "openvino",
+        backend_options: Optional[dict] = None,
+        meeting_id: str = "",
+        on_result: Optional[Callable[[TranscriptionResult, bool], None]] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ):
+        if backend not in STT_BACKENDS and ":" not in backend:
+            raise ValueError(
+                f"Unknown STT backend {backend!r} (expected one of {STT_BACKENDS})"
+            )
+        if not ring.shm_name:
+            raise ValueError("STT worker needs a shared-memory RingBuffer")
+
+        self.ring = ring
+        self.backend = backend
+        self.backend_options = backend_options or {}
+        self.meeting_id = meeting_id
+        self.on_result = on_result
+        self.on_partial = on_partial
+
+        self.stats = STTWorkerStats(meeting_id=meeting_id, backend=backend)
+        if meeting_id:
+            _meeting_stats[meeting_id] = self.stats
+
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Future] = None
+        self._ids = itertools.count(1)
+        # request id -> (submit time, is_final, got_partial)
+        self._inflight: dict[int, list] = {}
+        self._waiters: dict[int, asyncio.Future] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    async def start(self, timeout: float = 120.0) -> bool:
+        """Spawn the worker and wait until its model is loaded."""
+        if self.is_running:
+            return True
+
+        ctx = multiprocessing.get_context("spawn")
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        self._process = ctx.Process(
+            target=_worker_main,
+            args=(self.ring.shm_name, child_conn, self.backend, self.backend_options),
+            name=f"stt-worker-{self.meeting_id or self.backend}",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        self._conn = parent_conn
+        self._loop = asyncio.get_running_loop()
+        self._ready = self._loop.create_future()
+        self._loop.add_reader(self._conn.fileno(), self._on_readable)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(self._ready), timeout=timeout)
+        except (asyncio.TimeoutError, RuntimeError) as e:
+            logger.error(f"STT worker failed to start ({self.backend}): {e}")
+            await self.stop()
+            return False
+
+        logger.info(
+            f"STT worker ready: {self.backend} on {self.stats.device} "
+            f"(load {self.stats.load_time:.1f}s, pid {self._process.pid})"
+        )
+        return True
+
+    def submit(self, start: int, end: int, is_final: bool = True) -> int:
+        """Queue transcription of ring samples [start, end). Returns request id."""
+        if not self._conn:
+            raise RuntimeError("STT worker not started")
+        rid = next(self._ids)
+        self._inflight[rid] = [time.time(), is_final, False]
+        self.stats.requests += 1
+        self._conn.send(
+            {
+                "op": "transcribe",
+                "id": rid,
+                "start": start,
+                "end": end,
+                "final": is_final,
+            }
+        )
+        return rid
+
+    async def transcribe_range(
+        self, start: int, end: int, is_final: bool = True
+    ) -> TranscriptionResult:
+        """Transcribe ring samples [start, end) and wait for the result."""
+        rid = self.submit(start, end, is_final)
+        waiter = self._loop.create_future()
+        self._waiters[rid] = waiter
+        return await waiter
+
+    def _on_readable(self) -> None:
+        """Drain worker messages (called by the event loop)."""
+        try:
+            while self._conn and self._conn.poll():
+                self._handle_message(self._conn.recv())
+        except (EOFError, OSError):
+            self._on_worker_exit()
+
+    def _handle_message(self, msg: dict) -> None:
+        kind = msg.get("type")
+        now = time.time()
+
+        if kind == "ready":
+            self.stats.device = msg.get("device", "")
+            self.stats.load_time = msg.get("load_s", 0.0)
+            if self._ready and not self._ready.done():
+                self._ready.set_result(True)
+            return
+        if kind == "fatal":
+            logger.error(f"STT worker failed: {msg.get('error')}")
+            if self._ready and not self._ready.done():
+                self._ready.set_exception(RuntimeError(msg.get("error")))
+            return
+
+        rid = msg.get("id")
+        entry = self._inflight.get(rid)
+        if entry is None:
+            return
+        submitted, _is_final, got_partial = entry
+
+        if kind == "partial":
+            self.stats.partials += 1
+            if not got_partial:
+                entry[2] = True
+                self.stats.first_partial_latency = now - submitted
+            if self.on_partial:
+                self.on_partial(msg["text"])
+            return
+
+        self._inflight.pop(rid, None)
+        self._expire_superseded(rid)
+
+        if kind == "error":
+            self.stats.errors += 1
+            logger.warning(f"STT worker request {rid} failed: {msg.get('error')}")
+            result = TranscriptionResult(text="", confidence=0.0)
+        else:
+            latency = now - submitted
+            self.stats.results += 1
+            self.stats.total_latency += latency
+            self.stats.last_latency = latency
+            self.stats.max_latency = max(self.stats.max_latency, latency)
+            self.stats.total_inference_time += msg["inference_s"]
+            self.stats.total_audio_duration += msg["audio_s"]
+            if msg["audio_s"] > 0:
+                self.stats.last_rtf = msg["inference_s"] / msg["audio_s"]
+            result = TranscriptionResult(
+                text=msg["text"],
+                is_partial=not msg["final"],
+                end_time=msg["audio_s"],
+                processing_time=msg["inference_s"],
+            )
+            if result.text and self.on_result:
+                self.on_result(result, msg["final"])
+
+        waiter = self._waiters.pop(rid, None)
+        if waiter and not waiter.done():
+            waiter.set_result(result)
+
+    def _expire_superseded(self, rid: int) -> None:
+        """Forget earlier requests the worker coalesced away."""
+        for old in [i for i in self._inflight if i < rid]:
+            self._inflight.pop(old)
+            self.stats.superseded += 1
+            waiter = self._waiters.pop(old, None)
+            if waiter and not waiter.done():
+                waiter.set_result(TranscriptionResult(text="", is_partial=True))
+
+    def _on_worker_exit(self) -> None:
+        if self._loop and self._conn:
+            try:
+                self._loop.remove_reader(self._conn.fileno())
+            except (ValueError, OSError):
+                pass
+        for waiter in self._waiters.values():
+            if not waiter.done():
+                waiter.set_result(TranscriptionResult(text="", confidence=0.0))
+        self._waiters.clear()
+        self._inflight.clear()
+        if self._ready and not self._ready.done():
+            self._ready.set_exception(RuntimeError("STT worker exited"))
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        if self._conn:
+            try:
+                self._conn.send({"op": "stop"})
+            except (BrokenPipeError, OSError):
+                pass
+        if self._process:
+            deadline = time.time() + timeout
+            while self._process.is_alive() and time.time() < deadline:
+                await asyncio.sleep(0.05)
+            if self._process.is_alive():
+                logger.warning("STT worker did not exit, killing")
+                self._process.kill()
+            self._process.join(timeout=1.0)
+            self._process = None
+        self._on_worker_exit()
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    def get_stats(self) -> dict:
+        """Latency / RTF metrics plus current queue depth."""
+        stats = self.stats.to_dict()
+        stats["in_flight"] = len(self._inflight)
+        stats["running"] = self.is_running
+        return stats
@@ -1466,7 +1466,7 @@ async def _meet_notes_search_impl(query: str, meeting_id: int) -> str:
         lines.append("")
 
         for m in matches[:5]:  # Limit matches per meeting
-            lines.append(f"- **{m['speaker']}**: \"{m['text']}\"")
+            lines.append(f"- **{m['speaker']}**: \"{m['snippet']}\"")
 
         if len(matches) > 5:
             lines.append(f"  ... and {len(matches) - 5} more matches")
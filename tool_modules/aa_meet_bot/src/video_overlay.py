@@ -6,7 +6,7 @@ Handles all CPU-side frame rendering including:
 - Per-attendee base frame creation (GPU text + shapes via OpenGL)
 - Waveform generation (simulated and audio-reactive)
 - NPU stats panel rendering
-- FFT computation for audio visualization
+- FFT computation for audio visualization (via audio_visualizer)
 
 Extracted from video_generator.py to separate rendering concerns from
 device I/O and orchestration.
@@ -21,6 +21,13 @@ from typing import TYPE_CHECKING, Optional
 import cv2
 import numpy as np
 
+from .audio_visualizer import (
+    SIMULATED_BAR_COLOR,
+    FFTBarAnalyzer,
+    WaveformPainter,
+    simulated_bar_heights,
+)
+
 if TYPE_CHECKING:
     from .gpu_text import VideoTextRenderer
     from .video_generator import Attendee, VideoConfig
@@ -127,9 +134,15 @@ class VideoOverlayRenderer:
         self.wave_speeds = np.random.uniform(0.8, 1.2, self.wave_bars)
         self.wave_i_arr = np.arange(self.wave_bars)
 
-        # Audio analysis state
-        self._fft_smoothing = 0.3  # Smoothing factor for FFT
-        self._prev_fft_bars: Optional[np.ndarray] = None
+        # Audio analysis and bar drawing (shared with RealtimeVideoRenderer)
+        self._fft_analyzer = FFTBarAnalyzer(self.wave_bars)
+        self._wave_painter = WaveformPainter(
+            self.wave_width,
+            self.wave_height,
+            self.wave_bars,
+            self.wave_step,
+            self.wave_bar_width,
+        )
 
         # Pre-render static elements for performance
         self._static_cache: dict = {}
@@ -143,11 +156,6 @@ class VideoOverlayRenderer:
             (self.npu_height, self.npu_width, 3), dtype=np.uint8
         )
 
-        # Pre-allocate FFT computation buffers to avoid per-frame allocations
-        self._fft_bar_heights = np.zeros(self.wave_bars, dtype=np.float32)
-        self._fft_silence_bars = np.full(self.wave_bars, 0.12, dtype=np.float32)
-        self._fft_hanning = None  # Will be created on first use with correct size
-
     def _init_static_cache(self) -> None:
         """
         Pre-render static UI elements using OpenCV (much faster than PIL).
@@ -332,89 +340,9 @@ class VideoOverlayRenderer:
         """Compute FFT and convert to bar heights for visualization.
 
         Includes noise gate: when audio RMS is below threshold, returns
-        minimal bars to indicate silence/muted mic.
-
-        Args:
-            audio: Audio samples as float32 numpy array
-
-        Returns:
-            Bar heights as float32 numpy array (0-1 range)
+        minimal bars to indicate silence/muted mic. See FFTBarAnalyzer.
         """
-        # Noise gate: check if audio is essentially silent
-        rms = np.sqrt(np.mean(audio**2))
-        noise_threshold = 0.005  # Below this RMS, consider it silence/muted
-
-        if rms < noise_threshold:
-            # Return minimal flat bars for silence (reuse pre-allocated buffer)
-            np.copyto(self._fft_bar_heights, self._fft_silence_bars)
-            # Add small random variation in-place
-            self._fft_bar_heights += np.random.uniform(-0.02, 0.02, self.wave_bars)
-            np.clip(self._fft_bar_heights, 0.1, 0.15, out=self._fft_bar_heights)
-            if self._prev_fft_bars is None:
-                self._prev_fft_bars = self._fft_bar_heights.copy()
-            else:
-                np.copyto(self._prev_fft_bars, self._fft_bar_heights)
-            return self._fft_bar_heights
-
-        # Create/reuse hanning window (only allocate once per audio size)
-        if self._fft_hanning is None or len(self._fft_hanning) != len(audio):
-            self._fft_hanning = np.hanning(len(audio)).astype(np.float32)
-
-        # Apply window function to reduce spectral leakage (in-place multiply)
-        windowed = audio * self._fft_hanning
-
-        # Compute FFT
-        fft = np.abs(np.fft.rfft(windowed))
-
-        # We only care about frequencies up to ~8kHz (half of 16kHz sample rate)
-        n_fft_bins = len(fft)
-
-        # Use logarithmic frequency scaling - write directly to pre-allocated buffer
-        self._fft_bar_heights.fill(0)
-
-        for i in range(self.wave_bars):
-            # Logarithmic mapping: more resolution at low frequencies
-            low_freq = int(
-                n_fft_bins
-                * (np.exp(i / self.wave_bars * np.log(n_fft_bins)) - 1)
-                / (n_fft_bins - 1)
-            )
-            high_freq = int(
-                n_fft_bins
-                * (np.exp((i + 1) / self.wave_bars * np.log(n_fft_bins)) - 1)
-                / (n_fft_bins - 1)
-            )
-            high_freq = max(high_freq, low_freq + 1)
-
-            # Average the FFT bins for this bar
-            if high_freq <= n_fft_bins:
-                self._fft_bar_heights[i] = np.mean(fft[low_freq:high_freq])
-
-        # Normalize to 0-1 range with some headroom (in-place)
-        max_val = np.max(self._fft_bar_heights)
-        if max_val > 0:
-            self._fft_bar_heights /= max_val
-
-        # Scale by RMS (in-place)
-        rms_scale = min(1.0, (rms / 0.02) * 3.0)
-        self._fft_bar_heights *= rms_scale
-
-        # Apply smoothing with previous frame (in-place)
-        if self._prev_fft_bars is not None:
-            self._fft_bar_heights *= 0.7
-            self._fft_bar_heights += 0.3 * self._prev_fft_bars
-
-        # Update prev_fft_bars
-        if self._prev_fft_bars is None:
-            self._prev_fft_bars = self._fft_bar_heights.copy()
-        else:
-            np.copyto(self._prev_fft_bars, self._fft_bar_heights)
-
-        # Apply final scaling (in-place)
-        self._fft_bar_heights *= 0.64
-        self._fft_bar_heights += 0.15
-
-        return self._fft_bar_heights
+        return self._fft_analyzer.compute(audio)
 
     def generate_waveform_frame_from_audio(
         self, bar_heights: np.ndarray, out: np.ndarray = None
@@ -428,36 +356,7 @@ class VideoOverlayRenderer:
         Returns:
             numpy array (wave_height, wave_width, 3)
         """
-        # Use pre-allocated buffer or create new one
-        if out is None:
-            img = np.zeros((self.wave_height, self.wave_width, 3), dtype=np.uint8)
-        else:
-            img = out
-            img.fill(0)
-
-        img[:, :, 1] = 18  # Green channel background
-
-        # Convert normalized bar heights (0-1) to pixel heights
-        bar_heights = np.nan_to_num(bar_heights, nan=0.1, posinf=1.0, neginf=0.1)
-        pixel_heights = (bar_heights * self.wave_height).astype(np.int32)
-        pixel_heights = np.clip(pixel_heights, 4, self.wave_height - 2)
-
-        x_starts = (self.wave_i_arr * self.wave_step).astype(np.int32)
-        tops = ((self.wave_height - pixel_heights) // 2).astype(np.int32)
-        bottoms = ((self.wave_height + pixel_heights) // 2).astype(np.int32)
-
-        # Draw all bars
-        for idx in range(self.wave_bars):
-            x = int(x_starts[idx])
-            x_end = min(x + self.wave_bar_width, self.wave_width)
-            top = int(tops[idx])
-            bottom = int(bottoms[idx])
-            # Brighter green for audio-reactive mode
-            img[top:bottom, x:x_end, 0] = 30
-            img[top:bottom, x:x_end, 1] = 220
-            img[top:bottom, x:x_end, 2] = 30
-
-        return img
+        return self._wave_painter.draw_audio(bar_heights, out)
 
     def generate_waveform_frame(self, t: float, out: np.ndarray = None) -> np.ndarray:
         """Generate a single waveform frame at time t using numpy (fast).
@@ -469,51 +368,10 @@ class VideoOverlayRenderer:
         Returns:
             numpy array (wave_height, wave_width, 3) in RGB format
         """
-        # Use pre-allocated buffer or create new one
-        if out is None:
-            img = np.zeros((self.wave_height, self.wave_width, 3), dtype=np.uint8)
-        else:
-            img = out
-            img.fill(0)
-
-        img[:, :, 1] = 18  # Green channel background
-
-        # Vectorized height calculation (use cached arrays)
-        i = self.wave_i_arr
-        p = self.wave_phases
-        s = self.wave_speeds
-
-        heights = (
-            45
-            + 35 * np.sin(t * 4 * s + i * 0.12 + p)
-            + 20 * np.sin(t * 7 * s + i * 0.2 + p * 1.3)
-            + 12 * np.sin(t * 11 * s + i * 0.35 + p * 0.7)
-            + 15 * np.sin(t * 2.5 * s + i * 0.06)
+        heights = simulated_bar_heights(
+            t, self.wave_i_arr, self.wave_phases, self.wave_speeds, self.wave_height
         )
-
-        # Spike bursts
-        st = (t * 3 + i * 0.1) % 4
-        spike_mask = st < 0.3
-        heights[spike_mask] += np.sin(st[spike_mask] / 0.3 * np.pi) * 25
-
-        heights = np.clip(heights, 6, self.wave_height - 4).astype(np.int32)
-
-        x_starts = (i * self.wave_step).astype(np.int32)
-        tops = (self.wave_height - heights) // 2
-        bottoms = (self.wave_height + heights) // 2
-
-        # Draw all bars (loop is fast enough for 150 bars)
-        for idx in range(self.wave_bars):
-            x = x_starts[idx]
-            x_end = min(x + self.wave_bar_width, self.wave_width)
-            top = tops[idx]
-            bottom = bottoms[idx]
-            # Green bar (BGR format for OpenCV compatibility)
-            img[top:bottom, x:x_end, 0] = 25
-            img[top:bottom, x:x_end, 1] = 200
-            img[top:bottom, x:x_end, 2] = 25
-
-        return img
+        return self._wave_painter.draw(heights, SIMULATED_BAR_COLOR, out)
 
     def generate_npu_frame(
         self, t: float, frame_num: int, out: np.ndarray = None
@@ -13,13 +13,22 @@ import json
 import logging
 import os
 import random
+import sys
 import time
 import uuid
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import httpx
 
+# Scripts import this module directly; the shared HTTP pool lives in server/
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
+
+from server.http_client import auth_identity, get_shared_client  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -160,9 +169,11 @@ class SlackSession:
         )
 
     async def get_client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
+        """Get the shared pooled HTTP client for this session's credentials."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(
+            self._client = await get_shared_client(
+                self.BASE_URL,
+                identity=auth_identity(self.xoxc_token, self.d_cookie),
                 headers={
                     "User-Agent": self.USER_AGENT,
                     "Referer": self.REFERER,
@@ -180,10 +191,8 @@ class SlackSession:
         return self._client
 
     async def close(self):
-        """Close the HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the HTTP client (the shared pool closes it when idle)."""
+        self._client = None
 
     async def _request(
         self,
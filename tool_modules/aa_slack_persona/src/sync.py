@@ -2,7 +2,10 @@
 
 Handles:
 - Parallel channel processing with configurable workers
-- Per-channel day tracking to avoid re-syncing
+- Streaming ingestion: fetched days are embedded in cross-channel batches
+  and written in large fragments while fetching continues
+- Per-channel day tracking to avoid re-syncing, checkpointed as writes land
+  so an interrupted sync resumes mid-channel
 - Backwards (today -> past) or forwards (past -> today) sync direction
 - Thread reply fetching
 - Clean tabular progress output
@@ -11,10 +14,12 @@ Handles:
 import asyncio
 import json
 import logging
+import os
 import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +29,15 @@ DEFAULT_VECTOR_DIR = DEFAULT_CONFIG_DIR / "vectors" / "slack-persona"
 DEFAULT_METADATA_FILE = DEFAULT_CONFIG_DIR / "slack-persona-sync.json"
 DEFAULT_CHANNEL_STATE_FILE = DEFAULT_CONFIG_DIR / "slack-persona-channel-state.json"
 
+# Ingestion pipeline sizing
+FETCH_QUEUE_DAYS = 64  # Fetched channel-days waiting for the embedder
+EMBED_BATCH_MESSAGES = 1024  # Messages per encoder call, across channels
+WRITE_BUFFER_ROWS = 20_000  # Rows per LanceDB append (one data fragment)
+FLUSH_INTERVAL_SECONDS = 60.0  # Longest a fetched day waits to be written
+
+# A channel-day: (channel_id, date_str, complete)
+DayKey = tuple[str, str, bool]
+
 
 class ProgressDisplay:
     """Tabular progress display for parallel sync."""
@@ -145,6 +159,169 @@ class ProgressDisplay:
         print("-" * width)
 
 
+class IngestPipeline:
+    """Bounded fetch -> embed -> write pipeline for the vector store.
+
+    Fetchers ``put`` each channel-day as soon as it is fetched. The embedder
+    gathers messages from all channels into large encoder batches, and the
+    writer buffers the embedded records and appends them in large fragments.
+    Both hand-offs go through bounded queues, so fetchers wait when the
+    store falls behind instead of piling messages up in memory.
+
+    Around every write, ``before_write`` and ``after_write`` receive the
+    channel-days it covers, so day tracking can be checkpointed only once
+    the messages are stored. ``before_write`` returns True when the write
+    must upsert (the days may already be partly stored).
+    """
+
+    def __init__(
+        self,
+        vector_store,
+        before_write: Callable[[list[DayKey]], bool],
+        after_write: Callable[[list[DayKey]], None],
+        embed_batch: int = EMBED_BATCH_MESSAGES,
+        write_buffer: int = WRITE_BUFFER_ROWS,
+        queue_size: int = FETCH_QUEUE_DAYS,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+    ):
+        self.vector_store = vector_store
+        self.before_write = before_write
+        self.after_write = after_write
+        self.embed_batch = embed_batch
+        self.write_buffer = write_buffer
+        self.flush_interval = flush_interval
+
+        self._fetched: asyncio.Queue = asyncio.Queue(queue_size)
+        self._embedded: asyncio.Queue = asyncio.Queue(2)
+
+        self.embed_calls = 0
+        self.writes = 0
+        self.rows_written = 0
+
+    async def put(
+        self,
+        channel_id: str,
+        date_str: str,
+        messages: list[dict[str, Any]],
+        complete: bool = True,
+    ) -> None:
+        """Queue one fetched channel-day (waits while the queue is full)."""
+        await self._fetched.put(((channel_id, date_str, complete), messages))
+
+    async def run(self, producers: list) -> list:
+        """Run fetcher coroutines through the pipeline until all is written.
+
+        Args:
+            producers: Coroutines that ``put`` channel-days
+
+        Returns:
+            Producer results, exceptions included (as asyncio.gather)
+        """
+        consumer = asyncio.create_task(self._consume())
+        fetch = asyncio.ensure_future(
+            asyncio.gather(*producers, return_exceptions=True)
+        )
+
+        done, _ = await asyncio.wait(
+            {fetch, consumer}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if consumer in done:
+            # Embedding or writing failed - stop fetching data nobody stores
+            fetch.cancel()
+            await asyncio.gather(fetch, return_exceptions=True)
+            consumer.result()
+
+        results = await fetch
+        # The queue may be full; if the consumer fails now nothing drains it
+        end = asyncio.ensure_future(self._fetched.put(None))
+        await asyncio.wait({end, consumer}, return_when=asyncio.FIRST_COMPLETED)
+        if not end.done():
+            end.cancel()
+            await asyncio.gather(end, return_exceptions=True)
+        await consumer
+        return results
+
+    async def _consume(self) -> None:
+        tasks = [
+            asyncio.create_task(self._embedder()),
+            asyncio.create_task(self._writer()),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _next(self, queue: asyncio.Queue, deadline: float | None):
+        """Next queue item, or ``...`` if the deadline passes first."""
+        if deadline is None:
+            return await queue.get()
+        try:
+            return await asyncio.wait_for(
+                queue.get(), max(deadline - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError:
+            return ...
+
+    async def _embedder(self) -> None:
+        days: list[DayKey] = []
+        messages: list[dict[str, Any]] = []
+        deadline = None
+        while True:
+            item = await self._next(self._fetched, deadline)
+            if item is None:
+                break
+            if item is not ...:
+                day, day_messages = item
+                days.append(day)
+                messages.extend(day_messages)
+                deadline = deadline or time.monotonic() + self.flush_interval
+            if len(messages) >= self.embed_batch or (days and item is ...):
+                await self._embed(days, messages)
+                days, messages, deadline = [], [], None
+
+        if days:
+            await self._embed(days, messages)
+        await self._embedded.put(None)
+
+    async def _embed(self, days: list[DayKey], messages: list[dict[str, Any]]) -> None:
+        records = []
+        if messages:
+            self.embed_calls += 1
+            records = await asyncio.to_thread(
+                self.vector_store.embed_messages, messages, False
+            )
+        await self._embedded.put((days, records))
+
+    async def _writer(self) -> None:
+        days: list[DayKey] = []
+        records: list[dict[str, Any]] = []
+        deadline = None
+        while True:
+            item = await self._next(self._embedded, deadline)
+            if item is None:
+                break
+            if item is not ...:
+                days.extend(item[0])
+                records.extend(item[1])
+                deadline = deadline or time.monotonic() + self.flush_interval
+            if len(records) >= self.write_buffer or (days and item is ...):
+                await self._write(days, records)
+                days, records, deadline = [], [], None
+
+        if days:
+            await self._write(days, records)
+
+    async def _write(self, days: list[DayKey], records: list[dict[str, Any]]) -> None:
+        upsert = self.before_write(days)
+        if records:
+            await asyncio.to_thread(self.vector_store.write_records, records, upsert)
+            self.writes += 1
+            self.rows_written += len(records)
+        self.after_write(days)
+
+
 class SlackPersonaSync:
     """Sync Slack messages to persona vector store."""
 
@@ -242,9 +419,11 @@ class SlackPersonaSync:
         return {}
 
     def _save_channel_state(self, state: dict[str, Any]) -> None:
-        """Save per-channel sync state."""
-        with open(self.channel_state_file, "w", encoding="utf-8") as f:
+        """Save per-channel sync state (atomically - it is saved mid-sync)."""
+        tmp_file = self.channel_state_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
             json.dump(state, f, indent=2)
+        os.replace(tmp_file, self.channel_state_file)
 
     def _is_day_synced(
         self, channel_state: dict, channel_id: str, date_str: str
@@ -266,6 +445,52 @@ class SlackPersonaSync:
 
         channel_state[channel_id]["last_sync"] = datetime.now().isoformat()
 
+    def _pending_days(self, channel_state: dict) -> set[tuple[str, str]]:
+        """Channel-days whose write started but never finished."""
+        return {
+            (channel_id, date_str)
+            for channel_id, channel_data in channel_state.items()
+            for date_str in channel_data.get("pending_days", [])
+        }
+
+    def _begin_write(
+        self, channel_state: dict, recovering: set, days: list[DayKey]
+    ) -> bool:
+        """Checkpoint channel-days as pending before their messages are written.
+
+        Returns:
+            True if a day may already be partly stored (pending in an
+            interrupted sync), so the write must upsert
+        """
+        for channel_id, date_str, _ in days:
+            channel_data = channel_state.setdefault(
+                channel_id, {"synced_days": [], "last_sync": None}
+            )
+            pending = channel_data.setdefault("pending_days", [])
+            if date_str not in pending:
+                pending.append(date_str)
+        self._save_channel_state(channel_state)
+        return any(
+            (channel_id, date_str) in recovering for channel_id, date_str, _ in days
+        )
+
+    def _finish_write(self, channel_state: dict, days: list[DayKey]) -> None:
+        """Checkpoint written channel-days as synced.
+
+        Days whose fetch was cut short stay pending, so the next sync fetches
+        them again and upserts over what was stored.
+        """
+        for channel_id, date_str, complete in days:
+            if not complete:
+                continue
+            pending = channel_state[channel_id].get("pending_days", [])
+            if date_str in pending:
+                pending.remove(date_str)
+            if not pending:
+                channel_state[channel_id].pop("pending_days", None)
+            self._mark_day_synced(channel_state, channel_id, date_str)
+        self._save_channel_state(channel_state)
+
     # -------------------------------------------------------------------------
     # Conversation discovery
     # -------------------------------------------------------------------------
@@ -535,18 +760,21 @@ class SlackPersonaSync:
         channel_state: dict,
         state_lock: asyncio.Lock,
         progress: ProgressDisplay,
-    ) -> tuple[list[dict[str, Any]], int, int]:
-        """Process a single channel - fetch all days.
+        pipeline: IngestPipeline,
+    ) -> tuple[int, int, int]:
+        """Process a single channel - fetch all days into the pipeline.
+
+        Days are marked synced by the pipeline once they are written.
 
         Returns:
-            Tuple of (all_messages, days_synced, days_skipped)
+            Tuple of (message_count, days_synced, days_skipped)
         """
         channel_id = conv["id"]
         channel_type = conv["type"]
         channel_name = conv["name"]
         display_name = channel_name or channel_id[:12]
 
-        all_messages = []
+        total_messages = 0
         total_threads = 0
         days_synced = 0
         days_skipped = 0
@@ -583,26 +811,26 @@ class SlackPersonaSync:
                 progress=progress,
             )
 
-            all_messages.extend(messages)
+            total_messages += len(messages)
             total_threads += thread_count
             days_synced += 1
 
-            # Mark day as synced
-            async with state_lock:
-                self._mark_day_synced(channel_state, channel_id, date_str)
+            # Hand off for embedding; errors (e.g. rate limits) leave the
+            # day incomplete so it is fetched again next time
+            await pipeline.put(channel_id, date_str, messages, complete=http_code < 400)
 
         # Print channel completion
         await progress.print_channel_complete(
             worker_id=worker_id,
             channel=display_name,
             channel_type=channel_type,
-            total_msgs=len(all_messages),
+            total_msgs=total_messages,
             total_threads=total_threads,
             days_synced=days_synced,
             days_skipped=days_skipped,
         )
 
-        return all_messages, days_synced, days_skipped
+        return total_messages, days_synced, days_skipped
 
     # -------------------------------------------------------------------------
     # Main parallel sync
@@ -620,6 +848,11 @@ class SlackPersonaSync:
     ) -> dict[str, Any]:
         """Perform parallel full sync with day tracking.
 
+        Fetched days stream through an ``IngestPipeline`` while fetching
+        continues, and each day is checkpointed once its messages are
+        written, so rerunning with ``resume=True`` after a crash picks up
+        mid-channel. The table is compacted at the end.
+
         Args:
             days: Number of days to sync
             include_threads: Whether to include thread replies
@@ -659,13 +892,21 @@ class SlackPersonaSync:
         semaphore = asyncio.Semaphore(workers)
         state_lock = asyncio.Lock()
 
+        recovering = self._pending_days(channel_state)
+        if recovering:
+            logger.info(f"Recovering {len(recovering)} partly written channel-days")
+        pipeline = IngestPipeline(
+            vector_store,
+            before_write=lambda d: self._begin_write(channel_state, recovering, d),
+            after_write=lambda d: self._finish_write(channel_state, d),
+        )
+
         # Track totals
         total_messages = 0
         total_days_synced = 0
         total_days_skipped = 0
-        all_messages = []
 
-        async def worker_task(worker_id: int, conv: dict) -> tuple[list, int, int]:
+        async def worker_task(worker_id: int, conv: dict) -> tuple[int, int, int]:
             async with semaphore:
                 return await self._process_channel(
                     worker_id=worker_id,
@@ -677,6 +918,7 @@ class SlackPersonaSync:
                     channel_state=channel_state,
                     state_lock=state_lock,
                     progress=progress,
+                    pipeline=pipeline,
                 )
 
         # Create tasks for all channels
@@ -685,8 +927,8 @@ class SlackPersonaSync:
             worker_id = (i % workers) + 1
             tasks.append(worker_task(worker_id, conv))
 
-        # Run all tasks (semaphore limits concurrency)
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Run all tasks through the pipeline (semaphore limits concurrency)
+        results = await pipeline.run(tasks)
 
         # Collect results
         for result in results:
@@ -694,21 +936,25 @@ class SlackPersonaSync:
                 logger.error(f"Worker error: {result}")
                 continue
             messages, days_synced, days_skipped = result
-            all_messages.extend(messages)
-            total_messages += len(messages)
+            total_messages += messages
             total_days_synced += days_synced
             total_days_skipped += days_skipped
 
         progress.print_separator()
 
-        # Save channel state
+        # Channel state is checkpointed by the pipeline; save once more for
+        # runs that wrote nothing
         self._save_channel_state(channel_state)
-        logger.info(f"Saved state for {len(channel_state)} channels")
+        logger.info(
+            f"Indexed {pipeline.rows_written:,} messages in {pipeline.writes} "
+            f"writes ({pipeline.embed_calls} embedding batches); "
+            f"saved state for {len(channel_state)} channels"
+        )
 
-        # Insert all messages to vector store (single write, no race condition)
-        if all_messages:
-            print(f"\nIndexing {len(all_messages):,} messages to vector store...")
-            vector_store.add_messages(all_messages)
+        # Merge the appended fragments and index the new rows
+        if pipeline.writes:
+            await asyncio.to_thread(vector_store.compact)
+            await asyncio.to_thread(vector_store.build_indexes)
 
         # Get final stats
         vs_stats = vector_store.get_stats()
@@ -768,7 +1014,7 @@ class SlackPersonaSync:
         self,
         months: int = 6,
         include_threads: bool = True,
-        progress_callback: callable | None = None,
+        progress_callback: Callable | None = None,
         resume: bool = False,
     ) -> dict[str, Any]:
         """Legacy full sync - redirects to parallel sync."""
@@ -836,8 +1082,10 @@ class SlackPersonaSync:
         limit: int = 5,
         channel_type: str | None = None,
         my_messages_only: bool = False,
+        channel_id: str | None = None,
+        since: str | float | datetime | None = None,
     ) -> list[dict[str, Any]]:
-        """Search for similar messages."""
+        """Search for relevant messages (hybrid text + vector search)."""
         vector_store = self._get_vector_store()
         user_id = self._my_user_id if my_messages_only else None
         return vector_store.search(
@@ -845,6 +1093,8 @@ class SlackPersonaSync:
             limit=limit,
             channel_type=channel_type,
             user_id=user_id,
+            channel_id=channel_id,
+            since=since,
         )
 
     def get_status(self) -> dict[str, Any]:
@@ -2,17 +2,31 @@
 
 Handles:
 - Message embedding generation
-- Vector storage and retrieval
-- Similarity search for context
+- Vector storage and retrieval (bulk appends, upserts, compaction)
+- Hybrid search for context: a full-text (BM25) index and vector similarity,
+  fused by reciprocal rank, with channel/user/time filters applied inside
+  the index queries
 """
 
 import logging
+import math
 from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Reciprocal rank fusion constant (the usual k=60 from Cormack et al.)
+RRF_K = 60
+
+# Candidates fetched from each index per requested result
+CANDIDATES_PER_RESULT = 4
+
+# Columns with scalar indexes: timestamp for time ranges and pruning, the
+# others for the prefilters
+SCALAR_INDEX_COLUMNS = ("timestamp", "channel_id", "user_id", "channel_type")
+
 # Lazy imports for heavy dependencies
 _lancedb = None
 _model = None
@@ -39,6 +53,82 @@ def _get_embedding_model():
     return _model
 
 
+def rrf_fuse(
+    rankings: list[list[dict[str, Any]]], k: int = RRF_K, key: str = "id"
+) -> list[dict[str, Any]]:
+    """Fuse ranked result lists by reciprocal rank.
+
+    Each row scores ``sum(1 / (k + rank))`` over the lists it appears in
+    (rank starting at 1), so rows found by several retrievers rise to the
+    top without comparing their incompatible raw scores.
+
+    Args:
+        rankings: Result lists, each best-first
+        k: Damping constant; larger values flatten the rank weights
+        key: Row field identifying the same row across lists
+
+    Returns:
+        Rows (first occurrence wins) best-first, with ``rrf_score`` set
+    """
+    scores: dict[str, float] = {}
+    rows: dict[str, dict[str, Any]] = {}
+    for ranking in rankings:
+        for rank, row in enumerate(ranking, start=1):
+            row_id = row.get(key)
+            scores[row_id] = scores.get(row_id, 0.0) + 1.0 / (k + rank)
+            rows.setdefault(row_id, row)
+
+    fused = sorted(rows, key=lambda row_id: scores[row_id], reverse=True)
+    return [dict(rows[row_id], rrf_score=scores[row_id]) for row_id in fused]
+
+
+def _sql_str(value: str) -> str:
+    """Quote a value as a SQL string literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _slack_ts(value: str | float | datetime) -> str:
+    """Normalize a datetime, epoch or Slack ts to a Slack ts string."""
+    if isinstance(value, datetime):
+        value = value.timestamp()
+    if isinstance(value, (int, float)):
+        return f"{value:.6f}"
+    return str(value)
+
+
+def build_filter(
+    channel_type: str | None = None,
+    user_id: str | None = None,
+    channel_id: str | None = None,
+    since: str | float | datetime | None = None,
+    until: str | float | datetime | None = None,
+) -> str | None:
+    """Build the SQL filter pushed down into index queries.
+
+    Args:
+        channel_type: Channel type (dm, group_dm, channel)
+        user_id: Author's Slack user ID
+        channel_id: Channel ID
+        since: Oldest message time (datetime, epoch or Slack ts), inclusive
+        until: Newest message time, exclusive
+
+    Returns:
+        SQL WHERE clause, or None for no filter
+    """
+    clauses = []
+    if channel_type:
+        clauses.append(f"channel_type = {_sql_str(channel_type)}")
+    if user_id:
+        clauses.append(f"user_id = {_sql_str(user_id)}")
+    if channel_id:
+        clauses.append(f"channel_id = {_sql_str(channel_id)}")
+    if since is not None:
+        clauses.append(f"timestamp >= {_sql_str(_slack_ts(since))}")
+    if until is not None:
+        clauses.append(f"timestamp < {_sql_str(_slack_ts(until))}")
+    return " AND ".join(clauses) or None
+
+
 @dataclass
 class SlackMessage:
     """Represents a Slack message for vector storage."""
@@ -97,10 +187,14 @@ class SlackVectorStore:
         embedding = model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
-    def _generate_embeddings_batch(self, texts: list[str]) -> list[list[float]]:
+    def _generate_embeddings_batch(
+        self, texts: list[str], show_progress: bool = True
+    ) -> list[list[float]]:
         """Generate embeddings for multiple texts."""
         model = _get_embedding_model()
-        embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=True)
+        embeddings = model.encode(
+            texts, convert_to_numpy=True, show_progress_bar=show_progress
+        )
         return embeddings.tolist()
 
     def add_messages(self, messages: list[dict[str, Any]]) -> int:
@@ -115,9 +209,29 @@ class SlackVectorStore:
         if not messages:
             return 0
 
+        return self.write_records(self.embed_messages(messages))
+
+    def embed_messages(
+        self, messages: list[dict[str, Any]], show_progress: bool = True
+    ) -> list[dict[str, Any]]:
+        """Embed messages and build table records, without writing them.
+
+        Lets a caller batch embeddings across many fetches and write the
+        records later in large fragments (see ``write_records``).
+
+        Args:
+            messages: List of message dicts with required fields
+            show_progress: Show the encoder's progress bar
+
+        Returns:
+            Records ready for ``write_records``
+        """
+        if not messages:
+            return []
+
         # Generate embeddings in batch
         texts = [m.get("text", "") for m in messages]
-        embeddings = self._generate_embeddings_batch(texts)
+        embeddings = self._generate_embeddings_batch(texts, show_progress)
 
         # Prepare records
         records = []
@@ -138,57 +252,143 @@ class SlackVectorStore:
             }
             records.append(record)
 
-        # Add to table
+        return records
+
+    def write_records(self, records: list[dict[str, Any]], upsert: bool = False) -> int:
+        """Write embedded records to the table.
+
+        Each call appends one data fragment, so callers should pass large
+        batches.
+
+        Args:
+            records: Records from ``embed_messages``
+            upsert: Replace rows with the same id instead of appending
+                (for re-writing data that may already be stored)
+
+        Returns:
+            Number of records written
+        """
+        if not records:
+            return 0
+
         if self.table is None:
             # Create table with first batch
             self._table = self.db.create_table(self.table_name, records)
+        elif upsert:
+            (
+                self._table.merge_insert("id")
+                .when_matched_update_all()
+                .when_not_matched_insert_all()
+                .execute(records)
+            )
         else:
             self._table.add(records)
 
         logger.info(f"Added {len(records)} messages to vector store")
         return len(records)
 
+    def build_indexes(self) -> bool:
+        """Create the full-text and scalar indexes used by search and pruning.
+
+        Called after bulk writes; existing indexes are replaced, which also
+        brings them up to date with the new rows.
+
+        Returns:
+            True if all indexes were built
+        """
+        if self.table is None:
+            return False
+
+        ok = True
+        try:
+            self.table.create_fts_index("text", replace=True)
+        except Exception as e:
+            logger.warning(f"Full-text index on text failed: {e}")
+            ok = False
+
+        for column in SCALAR_INDEX_COLUMNS:
+            try:
+                self.table.create_scalar_index(column, replace=True)
+            except Exception as e:
+                logger.warning(f"Scalar index on {column} failed: {e}")
+                ok = False
+
+        if ok:
+            logger.info("Built vector store indexes")
+        return ok
+
+    def compact(self) -> bool:
+        """Merge small data fragments and drop old table versions.
+
+        Returns:
+            True if the table was compacted
+        """
+        if self.table is None:
+            return False
+
+        try:
+            if hasattr(self.table, "optimize"):
+                self.table.optimize()
+            else:
+                # Older LanceDB releases
+                self.table.compact_files()
+                self.table.cleanup_old_versions()
+        except Exception as e:
+            logger.warning(f"Vector store compaction failed: {e}")
+            return False
+
+        logger.info("Compacted vector store")
+        return True
+
     def search(
         self,
         query: str,
         limit: int = 10,
         channel_type: str | None = None,
         user_id: str | None = None,
+        channel_id: str | None = None,
+        since: str | float | datetime | None = None,
+        until: str | float | datetime | None = None,
+        hybrid: bool = True,
     ) -> list[dict[str, Any]]:
-        """Search for similar messages.
+        """Search for relevant messages.
+
+        Runs a vector query and, when ``hybrid``, a full-text (BM25) query,
+        then fuses both rankings with reciprocal rank fusion. Exact phrases,
+        names and ticket keys are found by the text index even when their
+        embeddings are not close. Filters are applied inside both queries,
+        before the limit.
 
         Args:
             query: Search query text
             limit: Max results to return
             channel_type: Filter by channel type (dm, group_dm, channel)
             user_id: Filter by user ID
+            channel_id: Filter by channel ID
+            since: Oldest message time (datetime, epoch or Slack ts)
+            until: Newest message time, exclusive
+            hybrid: Also query the full-text index
 
         Returns:
-            List of matching messages with scores
+            List of matching messages, best first. ``score`` is the vector
+            distance (lower is closer) and ``rrf_score`` the fused rank score.
         """
         if self.table is None:
             return []
 
+        where = build_filter(channel_type, user_id, channel_id, since, until)
+        candidates = limit * CANDIDATES_PER_RESULT
+
         # Generate query embedding
         query_embedding = self._generate_embedding(query)
 
-        # Build search
-        search = self.table.search(query_embedding).limit(
-            limit * 2
-        )  # Get extra for filtering
-
-        # Apply filters if specified
-        if channel_type:
-            search = search.where(f"channel_type = '{channel_type}'")
-        if user_id:
-            search = search.where(f"user_id = '{user_id}'")
-
-        # Execute search
-        results = search.to_list()
+        rankings = [self._vector_search(query_embedding, where, candidates)]
+        if hybrid:
+            rankings.append(self._text_search(query, where, candidates))
 
         # Format results
         formatted = []
-        for r in results[:limit]:
+        for r in rrf_fuse(rankings)[:limit]:
             formatted.append(
                 {
                     "id": r.get("id", ""),
@@ -201,12 +401,49 @@ class SlackVectorStore:
                     "timestamp": r.get("timestamp", ""),
                     "datetime_str": r.get("datetime_str", ""),
                     "is_thread_reply": r.get("is_thread_reply", False),
-                    "score": float(r.get("_distance", 0)),
+                    "score": self._distance(r, query_embedding),
+                    "rrf_score": r["rrf_score"],
                 }
             )
 
         return formatted
 
+    def _vector_search(
+        self, embedding: list[float], where: str | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """Nearest neighbours, filtered before the limit."""
+        search = self.table.search(embedding).limit(limit)
+        if where:
+            search = search.where(where, prefilter=True)
+        return search.to_list()
+
+    def _text_search(
+        self, query: str, where: str | None, limit: int
+    ) -> list[dict[str, Any]]:
+        """BM25 matches, or nothing if the full-text index is unavailable."""
+        try:
+            search = self.table.search(query, query_type="fts").limit(limit)
+            if where:
+                search = search.where(where, prefilter=True)
+            return search.to_list()
+        except Exception as e:
+            logger.debug(f"Full-text search unavailable: {e}")
+            return []
+
+    @staticmethod
+    def _distance(row: dict[str, Any], embedding: list[float]) -> float:
+        """Vector distance of a result (squared L2, as LanceDB reports it).
+
+        Rows found only by the text index have no ``_distance``, so it is
+        computed from their stored vector to keep ``score`` comparable.
+        """
+        if row.get("_distance") is not None:
+            return float(row["_distance"])
+        vector = row.get("vector")
+        if vector is None:
+            return math.inf
+        return float(sum((a - b) ** 2 for a, b in zip(vector, embedding)))
+
     def delete_older_than(self, cutoff_ts: str) -> int:
         """Delete messages older than cutoff timestamp.
 
@@ -219,22 +456,19 @@ class SlackVectorStore:
         if self.table is None:
             return 0
 
-        # Count before
+        # Both the count and the delete use the scalar index on timestamp
+        where = build_filter(until=cutoff_ts)
         try:
-            count_before = self.table.count_rows()
+            deleted = self.table.count_rows(where)
         except Exception:
-            count_before = 0
-
-        # Delete old messages
-        self.table.delete(f"timestamp < '{cutoff_ts}'")
-
-        # Count after
-        try:
-            count_after = self.table.count_rows()
-        except Exception:
-            count_after = 0
+            # Filtered count unsupported: delete anyway, count from the totals
+            before = self.table.count_rows()
+            self.table.delete(where)
+            deleted = before - self.table.count_rows()
+        else:
+            if deleted:
+                self.table.delete(where)
 
-        deleted = count_before - count_after
         logger.info(f"Deleted {deleted} messages older than {cutoff_ts}")
         return deleted
 
@@ -11,17 +11,31 @@ Tracks and persists agent activity metrics:
 Stats are persisted to: ~/.config/aa-workflow/agent_stats.json
 Daily stats are rolled up and historical data is kept for 30 days.
 
+Recording an event appends one compact JSON line to agent_stats.journal
+instead of rewriting the summary file. Each process keeps an in-memory
+aggregate (summary + journal) and tails the journal for other processes'
+events. The journal is periodically rolled up into agent_stats.json and
+truncated. Appends hold a shared flock and roll-ups an exclusive one, so
+several processes can record safely. Readers outside this module should use
+query_agent_stats() rather than reading agent_stats.json, which lags the
+journal by up to ROLLUP_INTERVAL_SECONDS.
+
 This module is workspace-aware: stats can be tracked per-workspace in addition
 to global stats. Use workspace_uri parameter to track workspace-specific stats.
 """
 
+import atexit
+import copy
+import fcntl
 import json
 import logging
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from threading import Lock
-from typing import Any
+from typing import Any, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -35,10 +49,24 @@ except ImportError:
     STATS_FILE = Path.home() / ".config" / "aa-workflow" / "agent_stats.json"
     STATS_DIR = STATS_FILE.parent
 
+# Roll the journal up into STATS_FILE this often, or once it grows this large
+ROLLUP_INTERVAL_SECONDS = 60.0
+ROLLUP_MAX_BYTES = 256 * 1024
+
 # Current workspace for tracking (set by tools)
 _current_workspace_uri: str = "default"
 
 
+def _journal_file() -> Path:
+    """Append-only event journal, next to the summary file."""
+    return STATS_FILE.with_suffix(".journal")
+
+
+def _journal_lock_file() -> Path:
+    """Lock file guarding journal appends and roll-ups."""
+    return STATS_FILE.with_suffix(".lock")
+
+
 def set_current_workspace(workspace_uri: str) -> None:
     """Set the current workspace for stats tracking."""
     global _current_workspace_uri
@@ -73,7 +101,21 @@ class AgentStats:
             return
         self._initialized = True
         self._stats_lock = Lock()
+
+        # Journal tailing state: the summary file we last loaded, how far into
+        # the journal we've applied, and where our own appends start (those
+        # events are already applied in memory)
+        self._summary_signature: tuple | None = None
+        self._journal_offset = 0
+        self._own_offsets: set[int] = set()
+        self._last_rollup = time.monotonic()
+
         self._stats = self._load_stats()
+        if self._persistence_enabled():
+            self._summary_signature = self._get_summary_signature()
+            with self._journal_lock(fcntl.LOCK_SH):
+                self._tail_journal()
+            atexit.register(self.flush)
         self._ensure_today()
 
     def _load_stats(self) -> dict[str, Any]:
@@ -120,9 +162,13 @@ class AgentStats:
             },
         }
 
-    def _ensure_today(self) -> str:
-        """Ensure today's entry exists and return today's date key."""
-        today = datetime.now().strftime("%Y-%m-%d")
+    def _ensure_today(self, today: str | None = None) -> str:
+        """Ensure a daily entry exists and return its date key.
+
+        Args:
+            today: Date key (YYYY-MM-DD). Defaults to the current date.
+        """
+        today = today or datetime.now().strftime("%Y-%m-%d")
         if today not in self._stats["daily"]:
             self._stats["daily"][today] = {
                 "tool_calls": 0,
@@ -151,14 +197,17 @@ class AgentStats:
         for date in old_dates:
             del self._stats["daily"][date]
 
-    def _save_stats(self) -> None:
+    def _save_stats(self) -> bool:
         """Save stats to disk.
 
         Skips writing when TESTING=1 to prevent test runs from polluting
         the real agent_stats.json.
+
+        Returns:
+            True if the summary file was written.
         """
-        if os.environ.get("TESTING") == "1":
-            return
+        if not self._persistence_enabled():
+            return False
         try:
             STATS_DIR.mkdir(parents=True, exist_ok=True)
             self._stats["last_updated"] = datetime.now().isoformat()
@@ -166,19 +215,228 @@ class AgentStats:
             with open(tmp_file, "w", encoding="utf-8") as f:
                 json.dump(self._stats, f, indent=2)
             tmp_file.rename(STATS_FILE)
+            return True
         except Exception as e:
             logger.warning(f"Failed to save stats: {e}")
+            return False
+
+    # =========================================================================
+    # Journal
+    # =========================================================================
+
+    @staticmethod
+    def _persistence_enabled() -> bool:
+        """Disk I/O is disabled when TESTING=1 (see _save_stats)."""
+        return os.environ.get("TESTING") != "1"
+
+    @contextmanager
+    def _journal_lock(self, mode: int, blocking: bool = True) -> Iterator[bool]:
+        """Hold a flock on the journal lock file.
+
+        Appends and reads take LOCK_SH; roll-ups take LOCK_EX so the journal
+        is never truncated under a writer. Yields False if a non-blocking
+        lock could not be acquired.
+        """
+        lock_path = _journal_lock_file()
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as lock_file:
+            try:
+                fcntl.flock(
+                    lock_file.fileno(), mode | (0 if blocking else fcntl.LOCK_NB)
+                )
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _get_summary_signature() -> tuple | None:
+        """Identify the summary file version; it changes on every roll-up."""
+        try:
+            st = STATS_FILE.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _append_event(self, event: dict[str, Any]) -> int:
+        """Append an event to the journal (caller must hold _stats_lock).
+
+        Returns the journal size after the append.
+        """
+        line = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._journal_lock(fcntl.LOCK_SH):
+            fd = os.open(_journal_file(), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                # A single O_APPEND write lands contiguously even with other
+                # writers; the offset afterwards is the end of our line
+                os.write(fd, line)
+                end = os.lseek(fd, 0, os.SEEK_CUR)
+            finally:
+                os.close(fd)
+        self._own_offsets.add(end - len(line))
+        return end
+
+    def _sync_from_disk(self) -> None:
+        """Bring the in-memory aggregate up to date (caller holds journal lock).
+
+        Reloads the summary if another process rolled it up, then applies
+        journal lines we haven't seen.
+        """
+        signature = self._get_summary_signature()
+        try:
+            journal_size = _journal_file().stat().st_size
+        except OSError:
+            journal_size = 0
+
+        if signature != self._summary_signature or journal_size < self._journal_offset:
+            # Rolled up since we last looked: the new summary already holds
+            # every event that was in the old journal, including ours
+            self._stats = self._load_stats()
+            self._summary_signature = signature
+            self._journal_offset = 0
+            self._own_offsets.clear()
+
+        self._tail_journal()
+
+    def _tail_journal(self) -> None:
+        """Apply journal lines written since the last read (caller holds lock)."""
+        try:
+            with open(_journal_file(), "rb") as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        # Ignore a trailing partial line; it is picked up next time
+        complete = data[: data.rfind(b"\n") + 1]
+        pos = self._journal_offset
+        for line in complete.splitlines(keepends=True):
+            if pos in self._own_offsets:
+                self._own_offsets.discard(pos)
+            else:
+                try:
+                    self._apply_event(json.loads(line))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.debug(f"Skipping bad stats journal line at {pos}: {e}")
+            pos += len(line)
+        self._journal_offset = pos
+
+    def _refresh(self) -> None:
+        """Pick up events recorded by other processes (caller holds _stats_lock)."""
+        if not self._persistence_enabled():
+            return
+        try:
+            with self._journal_lock(fcntl.LOCK_SH):
+                self._sync_from_disk()
+        except OSError as e:
+            logger.debug(f"Failed to refresh stats: {e}")
+
+    def _rollup(self, blocking: bool = True) -> bool:
+        """Fold the journal into the summary file and truncate it.
+
+        Caller must hold _stats_lock. Returns True if a roll-up happened.
+        """
+        if not self._persistence_enabled():
+            return False
+        with self._journal_lock(fcntl.LOCK_EX, blocking=blocking) as locked:
+            if not locked:
+                return False
+            self._sync_from_disk()
+            self._cleanup_old_daily()
+            if not self._save_stats():
+                return False
+            # Nobody can append while we hold LOCK_EX
+            with open(_journal_file(), "wb"):
+                pass
+            self._summary_signature = self._get_summary_signature()
+            self._journal_offset = 0
+            self._own_offsets.clear()
+        self._last_rollup = time.monotonic()
+        return True
+
+    def flush(self) -> None:
+        """Roll the journal up into agent_stats.json now."""
+        with self._stats_lock:
+            try:
+                self._rollup()
+            except OSError as e:
+                logger.warning(f"Failed to roll up stats journal: {e}")
+
+    def _record(self, event: dict[str, Any]) -> None:
+        """Journal an event and apply it to the in-memory aggregate."""
+        event["ts"] = datetime.now().isoformat(timespec="seconds")
+        with self._stats_lock:
+            journal_size = 0
+            if self._persistence_enabled():
+                try:
+                    journal_size = self._append_event(event)
+                except OSError as e:
+                    logger.warning(f"Failed to journal stats event: {e}")
+            self._apply_event(event)
+
+            if journal_size and (
+                journal_size >= ROLLUP_MAX_BYTES
+                or time.monotonic() - self._last_rollup >= ROLLUP_INTERVAL_SECONDS
+            ):
+                try:
+                    # Another process rolling up is as good as us doing it
+                    self._rollup(blocking=False)
+                except OSError as e:
+                    logger.warning(f"Failed to roll up stats journal: {e}")
+
+    def _apply_event(self, event: dict[str, Any]) -> None:
+        """Apply one journal event to the in-memory aggregate."""
+        kind = event["e"]
+        ts = event.get("ts") or datetime.now().isoformat(timespec="seconds")
+        today = self._ensure_today(ts[:10])
+
+        if kind == "tool":
+            self._apply_tool_call(
+                today,
+                ts,
+                event["n"],
+                bool(event["ok"]),
+                event.get("ms", 0),
+                event["ws"],
+            )
+        elif kind == "skill":
+            self._apply_skill_execution(
+                today, event["n"], bool(event["ok"]), event.get("ms", 0)
+            )
+        elif kind in ("mem_r", "mem_w"):
+            field = "memory_reads" if kind == "mem_r" else "memory_writes"
+            self._stats["lifetime"][field] += 1
+            self._stats["daily"][today][field] += 1
+            self._stats["current_session"]["memory_ops"] += 1
+        elif kind == "lines":
+            self._stats["lifetime"]["lines_written"] += event["n"]
+            self._stats["daily"][today]["lines_written"] += event["n"]
+        elif kind == "session":
+            self._stats["lifetime"]["sessions"] += 1
+            self._stats["daily"][today]["sessions"] += 1
+            self._stats["current_session"] = {
+                "started": ts,
+                "tool_calls": 0,
+                "skill_executions": 0,
+                "memory_ops": 0,
+            }
+        else:
+            raise KeyError(f"unknown event type {kind!r}")
 
     # =========================================================================
     # Tool Tracking
     # =========================================================================
 
-    def _ensure_workspace(self, workspace_uri: str) -> dict:
+    def _ensure_workspace(self, workspace_uri: str, now: str | None = None) -> dict:
         """Ensure workspace entry exists and return it."""
         if "workspaces" not in self._stats:
             self._stats["workspaces"] = {}
 
         if workspace_uri not in self._stats["workspaces"]:
+            now = now or datetime.now().isoformat()
             self._stats["workspaces"][workspace_uri] = {
                 "tool_calls": 0,
                 "tool_successes": 0,
@@ -189,8 +447,8 @@ class AgentStats:
                 "memory_reads": 0,
                 "memory_writes": 0,
                 "lines_written": 0,
-                "first_seen": datetime.now().isoformat(),
-                "last_active": datetime.now().isoformat(),
+                "first_seen": now,
+                "last_active": now,
             }
         return self._stats["workspaces"][workspace_uri]
 
@@ -209,61 +467,72 @@ class AgentStats:
             duration_ms: Duration in milliseconds.
             workspace_uri: Workspace URI for workspace-specific tracking.
         """
-        with self._stats_lock:
-            # Reload stats from disk to avoid overwriting changes from other processes
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-            ws_uri = workspace_uri or get_current_workspace()
-
-            # Lifetime stats
-            self._stats["lifetime"]["tool_calls"] += 1
-            self._stats["lifetime"]["tool_duration_ms"] += duration_ms
-            if success:
-                self._stats["lifetime"]["tool_successes"] += 1
-            else:
-                self._stats["lifetime"]["tool_failures"] += 1
-
-            # Daily stats
-            self._stats["daily"][today]["tool_calls"] += 1
-            self._stats["daily"][today]["tool_duration_ms"] += duration_ms
-            if success:
-                self._stats["daily"][today]["tool_successes"] += 1
-            else:
-                self._stats["daily"][today]["tool_failures"] += 1
-
-            # Workspace stats
-            ws_stats = self._ensure_workspace(ws_uri)
-            ws_stats["tool_calls"] += 1
-            ws_stats["last_active"] = datetime.now().isoformat()
-            if success:
-                ws_stats["tool_successes"] += 1
-            else:
-                ws_stats["tool_failures"] += 1
-
-            # Per-tool stats
-            if tool_name not in self._stats["tools"]:
-                self._stats["tools"][tool_name] = {
-                    "calls": 0,
-                    "successes": 0,
-                    "failures": 0,
-                    "duration_ms": 0,
-                }
-            self._stats["tools"][tool_name]["calls"] += 1
-            self._stats["tools"][tool_name]["duration_ms"] += duration_ms
-            if success:
-                self._stats["tools"][tool_name]["successes"] += 1
-            else:
-                self._stats["tools"][tool_name]["failures"] += 1
+        self._record(
+            {
+                "e": "tool",
+                "n": tool_name,
+                "ok": 1 if success else 0,
+                "ms": duration_ms,
+                "ws": workspace_uri or get_current_workspace(),
+            }
+        )
 
-            # Daily per-tool
-            if tool_name not in self._stats["daily"][today]["tools_used"]:
-                self._stats["daily"][today]["tools_used"][tool_name] = 0
-            self._stats["daily"][today]["tools_used"][tool_name] += 1
+    def _apply_tool_call(
+        self,
+        today: str,
+        ts: str,
+        tool_name: str,
+        success: bool,
+        duration_ms: int,
+        ws_uri: str,
+    ) -> None:
+        # Lifetime stats
+        self._stats["lifetime"]["tool_calls"] += 1
+        self._stats["lifetime"]["tool_duration_ms"] += duration_ms
+        if success:
+            self._stats["lifetime"]["tool_successes"] += 1
+        else:
+            self._stats["lifetime"]["tool_failures"] += 1
+
+        # Daily stats
+        self._stats["daily"][today]["tool_calls"] += 1
+        self._stats["daily"][today]["tool_duration_ms"] += duration_ms
+        if success:
+            self._stats["daily"][today]["tool_successes"] += 1
+        else:
+            self._stats["daily"][today]["tool_failures"] += 1
+
+        # Workspace stats
+        ws_stats = self._ensure_workspace(ws_uri, ts)
+        ws_stats["tool_calls"] += 1
+        ws_stats["last_active"] = ts
+        if success:
+            ws_stats["tool_successes"] += 1
+        else:
+            ws_stats["tool_failures"] += 1
+
+        # Per-tool stats
+        if tool_name not in self._stats["tools"]:
+            self._stats["tools"][tool_name] = {
+                "calls": 0,
+                "successes": 0,
+                "failures": 0,
+                "duration_ms": 0,
+            }
+        self._stats["tools"][tool_name]["calls"] += 1
+        self._stats["tools"][tool_name]["duration_ms"] += duration_ms
+        if success:
+            self._stats["tools"][tool_name]["successes"] += 1
+        else:
+            self._stats["tools"][tool_name]["failures"] += 1
 
-            # Session stats
-            self._stats["current_session"]["tool_calls"] += 1
+        # Daily per-tool
+        if tool_name not in self._stats["daily"][today]["tools_used"]:
+            self._stats["daily"][today]["tools_used"][tool_name] = 0
+        self._stats["daily"][today]["tools_used"][tool_name] += 1
 
-            self._save_stats()
+        # Session stats
+        self._stats["current_session"]["tool_calls"] += 1
 
     # =========================================================================
     # Skill Tracking
@@ -278,51 +547,56 @@ class AgentStats:
         total_steps: int = 0,
     ) -> None:
         """Record a skill execution."""
-        with self._stats_lock:
-            # Reload stats from disk to avoid overwriting changes from other processes
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-
-            # Lifetime stats
-            self._stats["lifetime"]["skill_executions"] += 1
-            self._stats["lifetime"]["skill_duration_ms"] += duration_ms
-            if success:
-                self._stats["lifetime"]["skill_successes"] += 1
-            else:
-                self._stats["lifetime"]["skill_failures"] += 1
-
-            # Daily stats
-            self._stats["daily"][today]["skill_executions"] += 1
-            self._stats["daily"][today]["skill_duration_ms"] += duration_ms
-            if success:
-                self._stats["daily"][today]["skill_successes"] += 1
-            else:
-                self._stats["daily"][today]["skill_failures"] += 1
-
-            # Per-skill stats
-            if skill_name not in self._stats["skills"]:
-                self._stats["skills"][skill_name] = {
-                    "executions": 0,
-                    "successes": 0,
-                    "failures": 0,
-                    "duration_ms": 0,
-                }
-            self._stats["skills"][skill_name]["executions"] += 1
-            self._stats["skills"][skill_name]["duration_ms"] += duration_ms
-            if success:
-                self._stats["skills"][skill_name]["successes"] += 1
-            else:
-                self._stats["skills"][skill_name]["failures"] += 1
+        self._record(
+            {
+                "e": "skill",
+                "n": skill_name,
+                "ok": 1 if success else 0,
+                "ms": duration_ms,
+            }
+        )
 
-            # Daily per-skill
-            if skill_name not in self._stats["daily"][today]["skills_run"]:
-                self._stats["daily"][today]["skills_run"][skill_name] = 0
-            self._stats["daily"][today]["skills_run"][skill_name] += 1
+    def _apply_skill_execution(
+        self, today: str, skill_name: str, success: bool, duration_ms: int
+    ) -> None:
+        # Lifetime stats
+        self._stats["lifetime"]["skill_executions"] += 1
+        self._stats["lifetime"]["skill_duration_ms"] += duration_ms
+        if success:
+            self._stats["lifetime"]["skill_successes"] += 1
+        else:
+            self._stats["lifetime"]["skill_failures"] += 1
+
+        # Daily stats
+        self._stats["daily"][today]["skill_executions"] += 1
+        self._stats["daily"][today]["skill_duration_ms"] += duration_ms
+        if success:
+            self._stats["daily"][today]["skill_successes"] += 1
+        else:
+            self._stats["daily"][today]["skill_failures"] += 1
+
+        # Per-skill stats
+        if skill_name not in self._stats["skills"]:
+            self._stats["skills"][skill_name] = {
+                "executions": 0,
+                "successes": 0,
+                "failures": 0,
+                "duration_ms": 0,
+            }
+        self._stats["skills"][skill_name]["executions"] += 1
+        self._stats["skills"][skill_name]["duration_ms"] += duration_ms
+        if success:
+            self._stats["skills"][skill_name]["successes"] += 1
+        else:
+            self._stats["skills"][skill_name]["failures"] += 1
 
-            # Session stats
-            self._stats["current_session"]["skill_executions"] += 1
+        # Daily per-skill
+        if skill_name not in self._stats["daily"][today]["skills_run"]:
+            self._stats["daily"][today]["skills_run"][skill_name] = 0
+        self._stats["daily"][today]["skills_run"][skill_name] += 1
 
-            self._save_stats()
+        # Session stats
+        self._stats["current_session"]["skill_executions"] += 1
 
     # =========================================================================
     # Memory Tracking
@@ -330,23 +604,11 @@ class AgentStats:
 
     def record_memory_read(self, key: str = "") -> None:
         """Record a memory read operation."""
-        with self._stats_lock:
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-            self._stats["lifetime"]["memory_reads"] += 1
-            self._stats["daily"][today]["memory_reads"] += 1
-            self._stats["current_session"]["memory_ops"] += 1
-            self._save_stats()
+        self._record({"e": "mem_r"})
 
     def record_memory_write(self, key: str = "") -> None:
         """Record a memory write operation."""
-        with self._stats_lock:
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-            self._stats["lifetime"]["memory_writes"] += 1
-            self._stats["daily"][today]["memory_writes"] += 1
-            self._stats["current_session"]["memory_ops"] += 1
-            self._save_stats()
+        self._record({"e": "mem_w"})
 
     # =========================================================================
     # Code Tracking
@@ -354,12 +616,7 @@ class AgentStats:
 
     def record_lines_written(self, lines: int) -> None:
         """Record lines of code written."""
-        with self._stats_lock:
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-            self._stats["lifetime"]["lines_written"] += lines
-            self._stats["daily"][today]["lines_written"] += lines
-            self._save_stats()
+        self._record({"e": "lines", "n": lines})
 
     # =========================================================================
     # Session Tracking
@@ -367,18 +624,7 @@ class AgentStats:
 
     def start_session(self) -> None:
         """Start a new session."""
-        with self._stats_lock:
-            self._stats = self._load_stats()
-            today = self._ensure_today()
-            self._stats["lifetime"]["sessions"] += 1
-            self._stats["daily"][today]["sessions"] += 1
-            self._stats["current_session"] = {
-                "started": datetime.now().isoformat(),
-                "tool_calls": 0,
-                "skill_executions": 0,
-                "memory_ops": 0,
-            }
-            self._save_stats()
+        self._record({"e": "session"})
 
     # =========================================================================
     # Getters
@@ -387,28 +633,33 @@ class AgentStats:
     def get_stats(self) -> dict[str, Any]:
         """Get all stats."""
         with self._stats_lock:
+            self._refresh()
             self._ensure_today()
             return self._stats.copy()
 
     def get_today_stats(self) -> dict[str, Any]:
         """Get today's stats."""
         with self._stats_lock:
+            self._refresh()
             today = self._ensure_today()
             return self._stats["daily"][today].copy()
 
     def get_lifetime_stats(self) -> dict[str, Any]:
         """Get lifetime stats."""
         with self._stats_lock:
+            self._refresh()
             return self._stats["lifetime"].copy()
 
     def get_session_stats(self) -> dict[str, Any]:
         """Get current session stats."""
         with self._stats_lock:
+            self._refresh()
             return self._stats["current_session"].copy()
 
     def get_top_tools(self, limit: int = 10) -> list[tuple[str, int]]:
         """Get top tools by call count."""
         with self._stats_lock:
+            self._refresh()
             tools = self._stats.get("tools", {})
             sorted_tools = sorted(
                 tools.items(),
@@ -420,6 +671,7 @@ class AgentStats:
     def get_top_skills(self, limit: int = 10) -> list[tuple[str, int]]:
         """Get top skills by execution count."""
         with self._stats_lock:
+            self._refresh()
             skills = self._stats.get("skills", {})
             sorted_skills = sorted(
                 skills.items(),
@@ -431,6 +683,7 @@ class AgentStats:
     def get_daily_trend(self, days: int = 7) -> list[dict[str, Any]]:
         """Get daily stats for the last N days."""
         with self._stats_lock:
+            self._refresh()
             result = []
             for i in range(days - 1, -1, -1):
                 date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
@@ -452,6 +705,7 @@ class AgentStats:
     def get_summary(self) -> dict[str, Any]:
         """Get a summary suitable for display."""
         with self._stats_lock:
+            self._refresh()
             today = self._ensure_today()
             lifetime = self._stats["lifetime"]
             today_stats = self._stats["daily"][today]
@@ -556,9 +810,23 @@ def get_workspace_stats(workspace_uri: str) -> dict:
     """Get stats for a specific workspace."""
     stats = get_agent_stats()
     with stats._stats_lock:
+        stats._refresh()
         return stats._ensure_workspace(workspace_uri).copy()
 
 
+def query_agent_stats() -> dict[str, Any]:
+    """Get the current aggregated stats (summary file plus journal).
+
+    This is the read API for other processes such as the stats daemon;
+    agent_stats.json alone lags the journal until the next roll-up.
+    """
+    stats = get_agent_stats()
+    with stats._stats_lock:
+        stats._refresh()
+        stats._ensure_today()
+        return copy.deepcopy(stats._stats)
+
+
 def start_session() -> None:
     """Start a new session."""
     get_agent_stats().start_session()
@@ -141,11 +141,15 @@ def release_lock() -> None:
         LOCK_FILE.unlink()
 
 
-async def fetch_sprint_issues(config: SprintBotConfig) -> list[dict[str, Any]]:
+async def fetch_sprint_issues(
+    config: SprintBotConfig, sprint_info: dict | None = None
+) -> list[dict[str, Any]]:
     """Fetch issues from the active sprint in Jira.
 
     Args:
         config: Bot configuration
+        sprint_info: Active sprint already looked up by the caller (skips
+            a second lookup)
 
     Returns:
         List of issue dicts from Jira
@@ -159,7 +163,9 @@ async def fetch_sprint_issues(config: SprintBotConfig) -> list[dict[str, Any]]:
         )
 
         # Get active sprint
-        sprint_result = await jira_get_active_sprint(project=config.jira_project)
+        sprint_result = sprint_info or await jira_get_active_sprint(
+            project=config.jira_project
+        )
         if not sprint_result or "error" in str(sprint_result).lower():
             logger.error(f"Failed to get active sprint: {sprint_result}")
             return []